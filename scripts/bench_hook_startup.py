@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""Benchmark hook startup against per-hook budgets.
+
+Hooks run as a fresh interpreter on every event, so import time is most of
+their cost. For each hook this imports the handler module under
+``python -X importtime`` and reports the cumulative import time, and checks
+that none of the heavy optional dependencies (YAML, detect-secrets,
+sqlite-vec, the embedding stack) are loaded before the hook decides it has
+work to do. UserPromptSubmit, which runs on every prompt, is also timed end
+to end through its hook script with a prompt that carries no signal.
+
+Each measurement is the median of ``--runs`` fresh processes. With
+``--check`` the script exits non-zero when a budget is exceeded, so it can
+guard against import-time regressions.
+
+Usage:
+    python scripts/bench_hook_startup.py [--runs=10] [--check]
+        [--format=text|json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PLUGIN_ROOT = Path(__file__).resolve().parent.parent
+
+# Handler module and import budget (ms) per hook; the import time includes
+# the standard library modules a handler needs (json, logging, dataclasses)
+HOOK_BUDGETS: dict[str, tuple[str, float]] = {
+    "SessionStart": ("git_notes_memory.hooks.session_start_handler", 80.0),
+    "UserPromptSubmit": ("git_notes_memory.hooks.user_prompt_handler", 80.0),
+    "PostToolUse": ("git_notes_memory.hooks.post_tool_use_handler", 85.0),
+    "PreCompact": ("git_notes_memory.hooks.pre_compact_handler", 95.0),
+    "Stop": ("git_notes_memory.hooks.stop_handler", 95.0),
+}
+
+# End-to-end budget (ms) for UserPromptSubmit on a prompt with no signal
+USER_PROMPT_NO_SIGNAL_BUDGET_MS = 50.0
+NO_SIGNAL_PROMPT = "Can you help me write a function to sort a list?"
+
+# Modules no hook may load at import time
+HEAVY_MODULES: frozenset[str] = frozenset(
+    {
+        "yaml",
+        "detect_secrets",
+        "sqlite_vec",
+        "numpy",
+        "sentence_transformers",
+        "onnxruntime",
+        "torch",
+        "urllib.request",
+    }
+)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments safely."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark hook import time against per-hook budgets"
+    )
+    parser.add_argument(
+        "--runs", type=int, default=10, help="Processes per measurement (default: 10)"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with status 1 if any budget is exceeded",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    return parser.parse_args()
+
+
+def hook_env() -> dict[str, str]:
+    """Build the environment hook subprocesses run with."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (str(PLUGIN_ROOT / "src"), env.get("PYTHONPATH", "")) if p
+    )
+    env["HOOK_USER_PROMPT_ENABLED"] = "true"
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Parse ``-X importtime`` output into cumulative microseconds per module."""
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # Column header
+        cumulative[parts[2].strip()] = int(parts[1])
+    return cumulative
+
+
+def import_profile(module: str, env: dict[str, str]) -> dict[str, int]:
+    """Import a module in a fresh interpreter and return its import profile."""
+    result = subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def measure_imports(runs: int, env: dict[str, str]) -> list[dict[str, object]]:
+    """Measure each hook handler's import time and heavy imports."""
+    report: list[dict[str, object]] = []
+    # Populate __pycache__ so compilation is not measured
+    for module, _budget in HOOK_BUDGETS.values():
+        import_profile(module, env)
+    for hook, (module, budget) in HOOK_BUDGETS.items():
+        samples: list[float] = []
+        heavy: set[str] = set()
+        for _ in range(runs):
+            profile = import_profile(module, env)
+            samples.append(profile[module] / 1000)
+            heavy.update(HEAVY_MODULES.intersection(profile))
+        median = statistics.median(samples)
+        report.append(
+            {
+                "hook": hook,
+                "module": module,
+                "import_ms": round(median, 1),
+                "budget_ms": budget,
+                "heavy_modules": sorted(heavy),
+                "ok": median <= budget and not heavy,
+            }
+        )
+    return report
+
+
+def measure_user_prompt(runs: int, env: dict[str, str]) -> dict[str, object]:
+    """Time the UserPromptSubmit hook script end to end on a no-signal prompt."""
+    script = PLUGIN_ROOT / "hooks" / "userpromptsubmit.py"
+    payload = json.dumps({"prompt": NO_SIGNAL_PROMPT, "cwd": str(PLUGIN_ROOT)})
+    baseline: list[float] = []
+    samples: list[float] = []
+    for _ in range(runs + 1):
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+            [sys.executable, "-c", "pass"], env=env, check=True
+        )
+        baseline.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        subprocess.run(  # noqa: S603 - fixed interpreter and arguments
+            [sys.executable, str(script)],
+            input=payload,
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        samples.append((time.perf_counter() - start) * 1000)
+    # The first run warms __pycache__ and the OS file cache
+    median = statistics.median(samples[1:])
+    return {
+        "hook": "UserPromptSubmit (no signal, end to end)",
+        "wall_ms": round(median, 1),
+        "interpreter_ms": round(statistics.median(baseline[1:]), 1),
+        "budget_ms": USER_PROMPT_NO_SIGNAL_BUDGET_MS,
+        "ok": median <= USER_PROMPT_NO_SIGNAL_BUDGET_MS,
+    }
+
+
+def main() -> int:
+    """Run the benchmark and report against the budgets."""
+    args = parse_args()
+    env = hook_env()
+
+    imports = measure_imports(args.runs, env)
+    end_to_end = measure_user_prompt(args.runs, env)
+    ok = all(row["ok"] for row in imports) and bool(end_to_end["ok"])
+
+    if args.format == "json":
+        print(json.dumps({"imports": imports, "end_to_end": end_to_end}, indent=2))
+    else:
+        print(f"{'hook':<18} {'import ms':>10} {'budget':>8}  heavy imports")
+        for row in imports:
+            heavy = ", ".join(row["heavy_modules"]) or "-"  # type: ignore[arg-type]
+            flag = "" if row["ok"] else "  OVER"
+            print(
+                f"{row['hook']:<18} {row['import_ms']:>10} "
+                f"{row['budget_ms']:>8}  {heavy}{flag}"
+            )
+        flag = "" if end_to_end["ok"] else "  OVER"
+        print(
+            f"\n{end_to_end['hook']}: {end_to_end['wall_ms']} ms "
+            f"(budget {end_to_end['budget_ms']} ms, bare interpreter "
+            f"{end_to_end['interpreter_ms']} ms){flag}"
+        )
+
+    return 1 if args.check and not ok else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Benchmark vector storage modes (float / bit) of the index.
+
+Builds one index per mode from the same synthetic, clustered unit vectors
+and reports on-disk size, recall@k against exact float search, and p50/p95
+search latency.
+
+Usage:
+    python scripts/bench_quantization.py [--count=N] [--queries=N] [--k=N]
+        [--format=text|json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments safely."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark float and bit vector storage modes"
+    )
+    parser.add_argument(
+        "--count", type=int, default=10000, help="Vectors to index (default: 10000)"
+    )
+    parser.add_argument(
+        "--queries", type=int, default=200, help="Queries to run (default: 200)"
+    )
+    parser.add_argument(
+        "--k", type=int, default=10, help="Neighbors per query (default: 10)"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Random seed (default: 42)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    return parser.parse_args()
+
+
+def _normalize(vec: list[float]) -> list[float]:
+    norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+    return [x / norm for x in vec]
+
+
+def make_vectors(
+    count: int, dimensions: int, rng: random.Random, clusters: int = 64
+) -> list[list[float]]:
+    """Generate unit vectors grouped around random centroids.
+
+    Real sentence embeddings are clustered by topic; uniform random vectors
+    would understate how well quantized search separates neighbors.
+    """
+    centroids = [
+        _normalize([rng.gauss(0.0, 1.0) for _ in range(dimensions)])
+        for _ in range(clusters)
+    ]
+    vectors = []
+    for _ in range(count):
+        centroid = centroids[rng.randrange(clusters)]
+        vectors.append(_normalize([c + rng.gauss(0.0, 0.05) for c in centroid]))
+    return vectors
+
+
+def run_mode(
+    mode: str,
+    directory: Path,
+    vectors: list[list[float]],
+    queries: list[list[float]],
+    k: int,
+) -> tuple[dict[str, float], list[list[str]]]:
+    """Build an index in one mode and time the queries against it."""
+    from git_notes_memory.index import IndexService
+    from git_notes_memory.models import Memory
+
+    db_path = directory / f"{mode}.db"
+    index = IndexService(db_path, quantization=mode)
+    index.initialize()
+    now = datetime.now(UTC)
+    memories = [
+        Memory(
+            id=f"learnings:bench{i}:0",
+            commit_sha=f"bench{i}",
+            namespace="learnings",
+            summary=f"Benchmark memory {i}",
+            content="",
+            timestamp=now,
+        )
+        for i in range(len(vectors))
+    ]
+    index.insert_batch(memories, vectors)
+    index.vacuum()
+
+    latencies: list[float] = []
+    results: list[list[str]] = []
+    for query in queries:
+        start = time.perf_counter()
+        hits = index.search_vector(query, k=k)
+        latencies.append((time.perf_counter() - start) * 1000)
+        results.append([memory.id for memory, _ in hits])
+    index.close()
+
+    cuts = statistics.quantiles(latencies, n=20)
+    stats = {
+        "size_mb": db_path.stat().st_size / (1024 * 1024),
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": cuts[18],
+    }
+    return stats, results
+
+
+def main() -> int:
+    """Run the benchmark for every storage mode."""
+    args = parse_args()
+
+    # Import after parsing to avoid slow imports if --help is used
+    from git_notes_memory.config import EMBEDDING_DIMENSIONS, VECTOR_QUANTIZATION_MODES
+
+    rng = random.Random(args.seed)  # noqa: S311 - synthetic benchmark data
+    vectors = make_vectors(args.count, EMBEDDING_DIMENSIONS, rng)
+    queries = [
+        _normalize(
+            [x + rng.gauss(0.0, 0.05) for x in vectors[rng.randrange(len(vectors))]]
+        )
+        for _ in range(args.queries)
+    ]
+
+    report: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="bench-quant-") as tmp:
+        exact: list[list[str]] = []
+        for mode in VECTOR_QUANTIZATION_MODES:
+            stats, results = run_mode(mode, Path(tmp), vectors, queries, args.k)
+            if mode == "float":
+                exact = results
+            stats["recall_at_k"] = statistics.fmean(
+                len(set(got) & set(want)) / max(len(want), 1)
+                for got, want in zip(results, exact, strict=True)
+            )
+            report[mode] = stats
+
+    if args.format == "json":
+        print(json.dumps({"count": args.count, "k": args.k, "modes": report}, indent=2))
+        return 0
+
+    print(f"{args.count} vectors, {args.queries} queries, k={args.k}")
+    print(f"{'mode':<6} {'size MB':>8} {'recall@k':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for mode, stats in report.items():
+        print(
+            f"{mode:<6} {stats['size_mb']:>8.2f} {stats['recall_at_k']:>9.3f} "
+            f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark the index write path used by reindex.
+
+Writes the same synthetic memories and embeddings into a fresh index twice:
+once one ``insert()`` per memory (a commit per row, the old reindex path) and
+once in ``INDEX_BULK_BATCH_SIZE`` chunks through ``insert_batch()`` inside
+``bulk_load()`` (the current path). Embeddings are precomputed so only
+SQLite work is timed.
+
+Usage:
+    python scripts/bench_reindex.py [--counts=1000,10000,100000]
+        [--format=text|json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from git_notes_memory.models import Memory
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments safely."""
+    parser = argparse.ArgumentParser(
+        description="Benchmark per-row vs bulk index writes for reindex"
+    )
+    parser.add_argument(
+        "--counts",
+        default="1000,10000,100000",
+        help="Comma-separated memory counts (default: 1000,10000,100000)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="Random seed (default: 42)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["text", "json"],
+        default="text",
+        help="Output format (default: text)",
+    )
+    return parser.parse_args()
+
+
+def make_data(
+    count: int, dimensions: int, rng: random.Random
+) -> tuple[list[Memory], list[list[float]]]:
+    """Generate memories and random embeddings."""
+    from git_notes_memory.models import Memory
+
+    now = datetime.now(UTC)
+    memories = [
+        Memory(
+            id=f"learnings:{i:07x}:0",
+            commit_sha=f"{i:040x}",
+            namespace="learnings",
+            summary=f"Benchmark memory {i}",
+            content=f"Synthetic content for memory {i}",
+            timestamp=now,
+        )
+        for i in range(count)
+    ]
+    embeddings = [[rng.random() for _ in range(dimensions)] for _ in range(count)]
+    return memories, embeddings
+
+
+def time_per_row(
+    db_path: Path, memories: list[Memory], embeddings: list[list[float]]
+) -> float:
+    """Write one memory per insert() call; return seconds."""
+    from git_notes_memory.index import IndexService
+
+    index = IndexService(db_path, quantization="float")
+    index.initialize()
+    start = time.perf_counter()
+    for memory, embedding in zip(memories, embeddings, strict=True):
+        index.insert(memory, embedding=embedding)
+    elapsed = time.perf_counter() - start
+    index.close()
+    return elapsed
+
+
+def time_bulk(
+    db_path: Path, memories: list[Memory], embeddings: list[list[float]]
+) -> float:
+    """Write chunks through insert_batch() in bulk_load(); return seconds."""
+    from git_notes_memory.config import INDEX_BULK_BATCH_SIZE
+    from git_notes_memory.index import IndexService
+
+    index = IndexService(db_path, quantization="float")
+    index.initialize()
+    start = time.perf_counter()
+    for offset in range(0, len(memories), INDEX_BULK_BATCH_SIZE):
+        with index.bulk_load():
+            index.insert_batch(
+                memories[offset : offset + INDEX_BULK_BATCH_SIZE],
+                embeddings[offset : offset + INDEX_BULK_BATCH_SIZE],
+            )
+    elapsed = time.perf_counter() - start
+    index.close()
+    return elapsed
+
+
+def main() -> int:
+    """Run the benchmark for each memory count."""
+    args = parse_args()
+
+    # Import after parsing to avoid slow imports if --help is used
+    from git_notes_memory.config import EMBEDDING_DIMENSIONS
+
+    counts = [int(c) for c in args.counts.split(",") if c.strip()]
+    rng = random.Random(args.seed)  # noqa: S311 - synthetic benchmark data
+
+    report: list[dict[str, float]] = []
+    for count in counts:
+        memories, embeddings = make_data(count, EMBEDDING_DIMENSIONS, rng)
+        with tempfile.TemporaryDirectory(prefix="bench-reindex-") as tmp:
+            per_row = time_per_row(Path(tmp) / "per_row.db", memories, embeddings)
+            bulk = time_bulk(Path(tmp) / "bulk.db", memories, embeddings)
+        report.append(
+            {
+                "count": count,
+                "per_row_s": per_row,
+                "bulk_s": bulk,
+                "speedup": per_row / bulk if bulk else 0.0,
+            }
+        )
+
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+        return 0
+
+    print(f"{'memories':>9} {'per-row s':>10} {'bulk s':>8} {'speedup':>8}")
+    for row in report:
+        print(
+            f"{row['count']:>9} {row['per_row_s']:>10.2f} "
+            f"{row['bulk_s']:>8.2f} {row['speedup']:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -41,6 +41,7 @@ __all__ = [
     "SpecContext",
     "IndexStats",
     "VerificationResult",
+    "CaptureRequest",
     "CaptureResult",
     "CaptureAccumulator",
     "Pattern",
@@ -99,6 +100,7 @@ def __getattr__(name: str) -> object:
         "SpecContext",
         "IndexStats",
         "VerificationResult",
+        "CaptureRequest",
         "CaptureResult",
         "CaptureAccumulator",
         "Pattern",
@@ -4,12 +4,23 @@ Orchestrates memory capture operations with concurrency safety, validation,
 and graceful degradation when embedding fails. The capture flow:
 
 1. Validate input (namespace, content length)
-2. Acquire file lock for concurrency
-3. Create YAML front matter metadata
+2. Create YAML front matter metadata
+3. Acquire the file lock for the (repository, namespace) notes ref
 4. Write to git notes (append for concurrency safety)
-5. Generate embedding (graceful degradation on failure)
-6. Insert into index
-7. Release lock
+5. Release lock
+6. Generate embedding (graceful degradation on failure)
+7. Insert into index (SQLite's own locking handles concurrent writers)
+
+Captures in different repositories or namespaces never wait on each other;
+wait time for the lock is exported as the ``capture_lock_wait_ms`` histogram.
+
+With ``defer_index=True`` steps 6 and 7 are replaced by queueing the memory
+in the index's persistent queue: the git note is the durable commit point,
+and SyncService.drain_index_queue() embeds and indexes queued memories
+later (the Stop hook drains before its index sync).
+
+capture_batch() runs the same flow for several memories, with one locked
+note append per namespace and one embedding/index batch.
 """
 
 from __future__ import annotations
@@ -19,8 +30,9 @@ import logging
 import os
 import random
 import time
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -30,17 +42,21 @@ from git_notes_memory.config import (
     MAX_SUMMARY_CHARS,
     NAMESPACES,
     get_lock_path,
+    get_project_index_path,
 )
+from git_notes_memory.embedding import memory_embedding_text
 from git_notes_memory.exceptions import (
     CaptureError,
     ValidationError,
 )
 from git_notes_memory.git_ops import GitOps
-from git_notes_memory.models import CaptureResult, Memory
-from git_notes_memory.note_parser import serialize_note
+from git_notes_memory.models import CaptureRequest, CaptureResult, Memory
+from git_notes_memory.note_parser import parse_multi_note, serialize_note
 from git_notes_memory.observability.decorators import measure_duration
 from git_notes_memory.observability.metrics import get_metrics
 from git_notes_memory.observability.tracing import trace_operation
+from git_notes_memory.security.exceptions import BlockedContentError
+from git_notes_memory.utils import make_memory_id, parse_memory_id
 
 if TYPE_CHECKING:
     from git_notes_memory.embedding import EmbeddingService
@@ -68,7 +84,9 @@ def _acquire_lock(lock_path: Path, timeout: float = 10.0) -> Iterator[None]:
     is automatically released when the context manager exits.
 
     Uses non-blocking lock with retry loop to implement timeout, preventing
-    indefinite blocking if another process holds the lock.
+    indefinite blocking if another process holds the lock. The time spent
+    waiting is recorded in the ``capture_lock_wait_ms`` histogram, labelled
+    by lock name (the namespace for per-namespace locks).
 
     Args:
         lock_path: Path to the lock file.
@@ -96,18 +114,34 @@ def _acquire_lock(lock_path: Path, timeout: float = 10.0) -> Iterator[None]:
         # Acquire exclusive lock with timeout using non-blocking retry loop
         # CRIT-001: Prevents indefinite blocking if lock is held
         # Uses exponential backoff with jitter to reduce contention under high concurrency
-        deadline = time.monotonic() + timeout
+        start_time = time.monotonic()
+        deadline = start_time + timeout
         base_interval = 0.05  # Start with 50ms
-        max_interval = 2.0  # Cap at 2 seconds
+        # Cap at 500ms: locks are held for one note append, so a longer
+        # sleep mostly waits on a lock that is already free
+        max_interval = 0.5
         attempt = 0
+        wait_labels = {"lock": lock_path.stem.lstrip(".")}
 
         while True:
             try:
                 fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
                 logger.debug("Acquired capture lock: %s", lock_path)
+                get_metrics().observe(
+                    "capture_lock_wait_ms",
+                    (time.monotonic() - start_time) * 1000,
+                    labels=wait_labels,
+                )
                 break
             except BlockingIOError:
                 if time.monotonic() >= deadline:
+                    metrics = get_metrics()
+                    metrics.observe(
+                        "capture_lock_wait_ms",
+                        (time.monotonic() - start_time) * 1000,
+                        labels=wait_labels,
+                    )
+                    metrics.increment("capture_lock_timeouts_total", labels=wait_labels)
                     raise CaptureError(
                         f"Lock acquisition timed out after {timeout}s",
                         "Another capture may be in progress, wait and retry",
@@ -208,6 +242,19 @@ def _validate_content(content: str) -> None:
         )
 
 
+@dataclass(frozen=True)
+class _PreparedCapture:
+    """A validated, filtered and serialized capture_batch() request."""
+
+    position: int
+    request: CaptureRequest
+    summary: str
+    content: str
+    note_content: str
+    timestamp: datetime
+    warnings: list[str]
+
+
 # =============================================================================
 # CaptureService
 # =============================================================================
@@ -264,7 +311,7 @@ class CaptureService:
         self._embedding_service = embedding_service
         self._secrets_service: SecretsFilteringService | None = secrets_service
         self._repo_path = repo_path
-        self._lock_path = get_lock_path()
+        self._local_index: IndexService | None = None
 
     @property
     def git_ops(self) -> GitOps:
@@ -453,6 +500,7 @@ class CaptureService:
         relates_to: list[str] | tuple[str, ...] | None = None,
         commit: str = "HEAD",
         skip_lock: bool = False,
+        defer_index: bool = False,
     ) -> CaptureResult:
         """Capture a memory to git notes with optional indexing.
 
@@ -470,6 +518,9 @@ class CaptureService:
             relates_to: IDs of related memories
             commit: Git commit to attach the note to (default HEAD)
             skip_lock: Skip file locking (use with caution)
+            defer_index: Queue the memory for indexing instead of embedding
+                and indexing it now, so capture costs only the git write.
+                Uses the project index when no index service is set.
 
         Returns:
             CaptureResult with success status and captured memory.
@@ -523,38 +574,22 @@ class CaptureService:
         # Use filtered_content in note body
         note_content = serialize_note(front_matter, filtered_content)
 
-        # Capture with or without locking
-        if skip_lock:
-            return self._do_capture(
-                namespace=namespace,
-                summary=filtered_summary,
-                content=filtered_content,
-                note_content=note_content,
-                timestamp=timestamp,
-                spec=spec,
-                phase=phase,
-                tags=tags_tuple,
-                status=status,
-                relates_to=relates_tuple,
-                commit=commit,
-                filter_warnings=filter_warnings,
-            )
-
-        with _acquire_lock(self._lock_path):
-            return self._do_capture(
-                namespace=namespace,
-                summary=filtered_summary,
-                content=filtered_content,
-                note_content=note_content,
-                timestamp=timestamp,
-                spec=spec,
-                phase=phase,
-                tags=tags_tuple,
-                status=status,
-                relates_to=relates_tuple,
-                commit=commit,
-                filter_warnings=filter_warnings,
-            )
+        return self._do_capture(
+            namespace=namespace,
+            summary=filtered_summary,
+            content=filtered_content,
+            note_content=note_content,
+            timestamp=timestamp,
+            spec=spec,
+            phase=phase,
+            tags=tags_tuple,
+            status=status,
+            relates_to=relates_tuple,
+            commit=commit,
+            filter_warnings=filter_warnings,
+            defer_index=defer_index,
+            lock=not skip_lock,
+        )
 
     def _do_capture(
         self,
@@ -571,13 +606,19 @@ class CaptureService:
         relates_to: tuple[str, ...],
         commit: str,
         filter_warnings: list[str] | None = None,
+        defer_index: bool = False,
+        lock: bool = True,
     ) -> CaptureResult:
-        """Execute the capture operation (called within lock).
+        """Execute the capture operation.
 
-        Internal method that performs the actual capture work.
+        Internal method that performs the actual capture work. Only the
+        note write holds the capture lock; index writes rely on SQLite's
+        own locking.
 
         Args:
             filter_warnings: Optional list of warnings from secrets filtering.
+            defer_index: Queue the memory instead of indexing it.
+            lock: Hold the (repository, namespace) lock for the note write.
         """
         metrics = get_metrics()
 
@@ -593,39 +634,18 @@ class CaptureService:
                         "Ensure you're in a git repository with valid commits",
                     ) from e
 
-            # Determine note index (count existing notes by "---" pairs)
-            with trace_operation("capture.count_existing"):
-                try:
-                    existing_note = self.git_ops.show_note(namespace, commit_sha)
-                    index = (
-                        existing_note.count("\n---\n") // 2 + 1 if existing_note else 0
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to count existing notes for %s:%s: %s",
-                        namespace,
-                        commit_sha[:8],
-                        e,
-                    )
-                    metrics.increment(
-                        "silent_failures_total",
-                        labels={"location": "capture.count_existing"},
-                    )
-                    index = 0
+            # Write to git notes (append for safety)
+            index = self._write_note(
+                namespace,
+                commit_sha,
+                note_content,
+                lock=lock,
+                local_index=defer_index,
+            )
 
             # Build memory ID
-            memory_id = f"{namespace}:{commit_sha}:{index}"
-
-            # Write to git notes (append for safety)
-            with trace_operation("capture.git_append"):
-                try:
-                    self.git_ops.append_note(namespace, note_content, commit_sha)
-                    logger.info("Captured memory: %s", memory_id)
-                except Exception as e:
-                    raise CaptureError(
-                        f"Failed to write git note: {e}",
-                        "Check git repository status and permissions",
-                    ) from e
+            memory_id = make_memory_id(namespace, commit_sha, index)
+            logger.info("Captured memory: %s", memory_id)
 
             # Create Memory object
             memory = Memory(
@@ -645,9 +665,21 @@ class CaptureService:
             # Try to index (graceful degradation)
             # Initialize warnings list with any filter warnings from secrets filtering
             indexed = False
+            queued = False
             warnings: list[str] = list(filter_warnings) if filter_warnings else []
 
-            if self._index_service is not None:
+            if defer_index:
+                with trace_operation("capture.enqueue"):
+                    try:
+                        self._get_local_index().enqueue(memory)
+                        queued = True
+                        logger.debug("Queued memory for indexing: %s", memory_id)
+                    except Exception as e:
+                        # The note is written; reindex picks it up
+                        warnings.append(f"Queueing for indexing failed: {e}")
+                        logger.warning("Queueing failed for %s: %s", memory_id, e)
+
+            elif self._index_service is not None:
                 with trace_operation("capture.index"):
                     try:
                         # Generate embedding if service available
@@ -655,8 +687,8 @@ class CaptureService:
                         if self._embedding_service is not None:
                             with trace_operation("capture.embed"):
                                 try:
-                                    # Combine summary and content for embedding
-                                    embed_text = f"{summary}\n\n{content}"
+                                    # Same text as reindex, so the cache hits
+                                    embed_text = memory_embedding_text(summary, content)
                                     embedding = self._embedding_service.embed(
                                         embed_text
                                     )
@@ -687,7 +719,419 @@ class CaptureService:
                 memory=memory,
                 indexed=indexed,
                 warning=combined_warning,
+                queued=queued,
+            )
+
+    def _note_lock_path(self, namespace: str) -> Path:
+        """Get the lock file guarding a namespace's notes ref in this repo.
+
+        Keyed on the common git directory, which every subdirectory,
+        symlinked path and worktree of a repository shares with its notes
+        refs; the repository path is used if it cannot be determined.
+        """
+        common_dir = self.git_ops.get_common_dir()
+        return get_lock_path(common_dir or self.git_ops.repo_path, namespace)
+
+    def _write_note(
+        self,
+        namespace: str,
+        commit_sha: str,
+        note_content: str,
+        *,
+        record_count: int = 1,
+        lock: bool,
+        local_index: bool = False,
+    ) -> int:
+        """Append records to a commit's note in one namespace.
+
+        Numbering the new records and appending must not interleave with
+        another capture into the same notes ref, so both run under the
+        (repository, namespace) lock.
+
+        Args:
+            namespace: Namespace whose note is appended to.
+            commit_sha: Commit the note is attached to.
+            note_content: One or more serialized records.
+            record_count: Number of records in note_content.
+            lock: Hold the lock (False when the caller has skipped locking).
+            local_index: Keep the note count in the project index when no
+                index service is configured (deferred captures use it).
+
+        Returns:
+            Index of the first appended record within the note.
+
+        Raises:
+            CaptureError: If the lock times out or the append fails.
+        """
+        counts = self._get_note_counts(local_index=local_index)
+        with _acquire_lock(self._note_lock_path(namespace)) if lock else nullcontext():
+            with trace_operation("capture.count_existing"):
+                index = self._next_note_index(namespace, commit_sha, counts)
+
+            with trace_operation("capture.git_append"):
+                try:
+                    self.git_ops.append_note(namespace, note_content, commit_sha)
+                except Exception as e:
+                    raise CaptureError(
+                        f"Failed to write git note: {e}",
+                        "Check git repository status and permissions",
+                    ) from e
+
+            self._record_note_count(namespace, commit_sha, index + record_count, counts)
+        return index
+
+    def _next_note_index(
+        self, namespace: str, commit_sha: str, counts: IndexService | None
+    ) -> int:
+        """Get the index the next record appended to a note will have.
+
+        PERF: The record count kept in the index is used while the note's
+        blob OID (one cat-file header read) still matches the one it was
+        counted at, so capture cost does not grow with the note. Otherwise
+        (no index, first capture here, or the note changed through sync or
+        another clone) the note is read and its records counted with the
+        parser sync numbers memories with, so IDs agree with reindex.
+
+        Args:
+            namespace: Namespace of the note.
+            commit_sha: Commit the note is attached to.
+            counts: Index the note counts are kept in, if any.
+
+        Returns:
+            Number of records already in the note; 0 if there is no note
+            or it cannot be read.
+        """
+        metrics = get_metrics()
+        try:
+            note_oid = self.git_ops.get_note_oid(namespace, commit_sha)
+            if note_oid is None:
+                return 0
+
+            cached = None
+            if counts is not None:
+                try:
+                    cached = counts.get_note_count(namespace, commit_sha)
+                except Exception as e:
+                    logger.debug("Note count lookup failed: %s", e)
+            if cached is not None and cached[0] == note_oid:
+                metrics.increment(
+                    "capture_note_count_total", labels={"source": "index"}
+                )
+                return cached[1]
+
+            existing_note = self.git_ops.show_note(namespace, commit_sha)
+        except Exception as e:
+            logger.warning(
+                "Failed to count existing notes for %s:%s: %s",
+                namespace,
+                commit_sha[:8],
+                e,
             )
+            metrics.increment(
+                "silent_failures_total",
+                labels={"location": "capture.count_existing"},
+            )
+            return 0
+
+        metrics.increment("capture_note_count_total", labels={"source": "parse"})
+        return len(parse_multi_note(existing_note)) if existing_note else 0
+
+    def _record_note_count(
+        self,
+        namespace: str,
+        commit_sha: str,
+        record_count: int,
+        counts: IndexService | None,
+    ) -> None:
+        """Record a note's record count at its current blob OID (within lock).
+
+        Failures only cost a recount on the next capture to this note.
+        """
+        if counts is None:
+            return
+        try:
+            note_oid = self.git_ops.get_note_oid(namespace, commit_sha)
+            if note_oid is not None:
+                counts.set_note_count(namespace, commit_sha, note_oid, record_count)
+        except Exception as e:
+            logger.debug(
+                "Failed to record note count for %s:%s: %s",
+                namespace,
+                commit_sha[:8],
+                e,
+            )
+
+    def _get_note_counts(self, *, local_index: bool) -> IndexService | None:
+        """Get the index that note record counts are kept in.
+
+        A service created without an index never creates one for counts;
+        the project index is only used when the capture queues into it
+        anyway.
+
+        Args:
+            local_index: Fall back to the project index.
+
+        Returns:
+            The index, or None if notes are counted by parsing them.
+        """
+        if self._index_service is not None:
+            return self._index_service
+        if not local_index:
+            return None
+        try:
+            return self._get_local_index()
+        except Exception as e:
+            logger.debug("Local index unavailable for note counts: %s", e)
+            return None
+
+    def _get_local_index(self) -> IndexService:
+        """Get the index for deferred captures.
+
+        The configured index service, or else the project index (opened
+        without loading the embedding model).
+        """
+        if self._index_service is not None:
+            return self._index_service
+        if self._local_index is None:
+            from git_notes_memory.index import IndexService
+
+            index = IndexService(get_project_index_path(self.git_ops.repo_path))
+            index.initialize()
+            self._local_index = index
+        return self._local_index
+
+    # =========================================================================
+    # Batch Capture
+    # =========================================================================
+
+    @measure_duration("memory_capture_batch")
+    def capture_batch(
+        self,
+        requests: Sequence[CaptureRequest],
+        *,
+        commit: str = "HEAD",
+        skip_lock: bool = False,
+        defer_index: bool = False,
+    ) -> list[CaptureResult]:
+        """Capture several memories to the same commit in one pass.
+
+        Equivalent to calling capture() once per request, but the commit
+        is resolved once, each namespace's lock is taken once while its
+        note is read and written with a single append, and the memories
+        are embedded with one embed_batch() call and indexed with one
+        insert_batch() call.
+
+        A request that fails validation or secrets filtering, or whose
+        note cannot be written (including a lock timeout), gets an
+        unsuccessful result with the reason in its warning; the rest of
+        the batch is still captured.
+
+        Args:
+            requests: Memories to capture.
+            commit: Git commit to attach the notes to (default HEAD)
+            skip_lock: Skip file locking (use with caution)
+            defer_index: Queue the memories for indexing instead of
+                embedding and indexing them now (see capture()).
+
+        Returns:
+            One CaptureResult per request, in request order.
+
+        Raises:
+            CaptureError: If the commit cannot be resolved.
+
+        Examples:
+            >>> results = service.capture_batch(
+            ...     [
+            ...         CaptureRequest("decisions", "Use REST", "Simplicity wins."),
+            ...         CaptureRequest("learnings", "TIL", "Fixtures can be scoped."),
+            ...     ]
+            ... )
+            >>> [r.success for r in results]
+            [True, True]
+        """
+        results: list[CaptureResult | None] = [None] * len(requests)
+        prepared: list[_PreparedCapture] = []
+
+        for position, request in enumerate(requests):
+            try:
+                self._validate_capture_input(
+                    request.namespace, request.summary, request.content
+                )
+                summary, content, filter_warnings = self._filter_content(
+                    request.summary, request.content, request.namespace
+                )
+            except (ValidationError, BlockedContentError) as e:
+                results[position] = CaptureResult(success=False, warning=str(e))
+                continue
+
+            timestamp = datetime.now(UTC)
+            front_matter = self._build_front_matter(
+                namespace=request.namespace,
+                summary=summary,
+                timestamp=timestamp,
+                spec=request.spec,
+                phase=request.phase,
+                tags=tuple(request.tags),
+                status=request.status,
+                relates_to=tuple(request.relates_to),
+            )
+            prepared.append(
+                _PreparedCapture(
+                    position=position,
+                    request=request,
+                    summary=summary,
+                    content=content,
+                    note_content=serialize_note(front_matter, content),
+                    timestamp=timestamp,
+                    warnings=filter_warnings,
+                )
+            )
+
+        if prepared:
+            captured = self._do_capture_batch(
+                prepared, commit, defer_index, lock=not skip_lock
+            )
+            for position, result in captured.items():
+                results[position] = result
+
+        return [r for r in results if r is not None]
+
+    def _do_capture_batch(
+        self,
+        prepared: list[_PreparedCapture],
+        commit: str,
+        defer_index: bool,
+        *,
+        lock: bool = True,
+    ) -> dict[int, CaptureResult]:
+        """Write and index prepared captures.
+
+        Each namespace's append holds that namespace's lock; index writes
+        rely on SQLite's own locking.
+
+        Returns:
+            Results keyed by request position.
+        """
+        metrics = get_metrics()
+        results: dict[int, CaptureResult] = {}
+
+        with trace_operation("capture.batch", labels={"count": str(len(prepared))}):
+            with trace_operation("capture.resolve_commit"):
+                try:
+                    commit_sha = self.git_ops.get_commit_info(commit).sha
+                except Exception as e:
+                    raise CaptureError(
+                        f"Failed to resolve commit '{commit}': {e}",
+                        "Ensure you're in a git repository with valid commits",
+                    ) from e
+
+            by_namespace: dict[str, list[_PreparedCapture]] = {}
+            for item in prepared:
+                by_namespace.setdefault(item.request.namespace, []).append(item)
+
+            # One append per namespace; git joins appended records with a
+            # blank line, so the combined note matches sequential appends
+            written: list[tuple[_PreparedCapture, Memory]] = []
+            for namespace, items in by_namespace.items():
+                try:
+                    first_index = self._write_note(
+                        namespace,
+                        commit_sha,
+                        "\n\n".join(item.note_content for item in items),
+                        record_count=len(items),
+                        lock=lock,
+                        local_index=defer_index,
+                    )
+                except CaptureError as e:
+                    logger.warning(
+                        "Failed to write %d %s note(s): %s",
+                        len(items),
+                        namespace,
+                        e.message,
+                    )
+                    for item in items:
+                        results[item.position] = CaptureResult(
+                            success=False, warning=e.message
+                        )
+                    continue
+
+                for offset, item in enumerate(items):
+                    request = item.request
+                    memory = Memory(
+                        id=make_memory_id(namespace, commit_sha, first_index + offset),
+                        commit_sha=commit_sha,
+                        namespace=namespace,
+                        summary=item.summary,
+                        content=item.content,
+                        timestamp=item.timestamp,
+                        spec=request.spec,
+                        phase=request.phase,
+                        tags=tuple(request.tags),
+                        status=request.status,
+                        relates_to=tuple(request.relates_to),
+                    )
+                    written.append((item, memory))
+                    logger.info("Captured memory: %s", memory.id)
+                    metrics.increment(
+                        "memories_captured_total",
+                        labels={"namespace": namespace},
+                    )
+
+            if not written:
+                return results
+
+            memories = [memory for _, memory in written]
+            indexed = False
+            queued = False
+            warnings: list[str] = []
+
+            if defer_index:
+                with trace_operation("capture.enqueue"):
+                    try:
+                        queue_index = self._get_local_index()
+                        with queue_index.bulk_load():
+                            for memory in memories:
+                                queue_index.enqueue(memory)
+                        queued = True
+                    except Exception as e:
+                        # The notes are written; reindex picks them up
+                        warnings.append(f"Queueing for indexing failed: {e}")
+                        logger.warning("Queueing failed for batch: %s", e)
+
+            elif self._index_service is not None:
+                with trace_operation("capture.index"):
+                    embeddings: list[list[float]] | None = None
+                    if self._embedding_service is not None:
+                        with trace_operation("capture.embed"):
+                            try:
+                                # Same text as reindex, so the cache hits
+                                embeddings = self._embedding_service.embed_batch(
+                                    [
+                                        memory_embedding_text(m.summary, m.content)
+                                        for m in memories
+                                    ]
+                                )
+                            except Exception as e:
+                                warnings.append(f"Embedding failed: {e}")
+                                logger.warning("Embedding generation failed: %s", e)
+                    try:
+                        self._index_service.insert_batch(memories, embeddings)
+                        indexed = True
+                    except Exception as e:
+                        warnings.append(f"Indexing failed: {e}")
+                        logger.warning("Indexing failed for batch: %s", e)
+
+            for item, memory in written:
+                item_warnings = [*item.warnings, *warnings]
+                results[item.position] = CaptureResult(
+                    success=True,
+                    memory=memory,
+                    indexed=indexed,
+                    warning="; ".join(item_warnings) if item_warnings else None,
+                    queued=queued,
+                )
+
+        return results
 
     # =========================================================================
     # Convenience Capture Methods
@@ -847,9 +1291,11 @@ class CaptureService:
         Returns:
             CaptureResult with the resolution memory.
         """
-        # Parse the memory ID to extract namespace and spec
-        parts = memory_id.split(":")
-        if len(parts) < 3 or parts[0] != "blockers":
+        try:
+            namespace, _commit, _index = parse_memory_id(memory_id)
+        except ValueError:
+            namespace = ""
+        if namespace != "blockers":
             raise ValidationError(
                 f"Invalid blocker memory ID: '{memory_id}'",
                 "Memory ID must be in format blockers:<commit>:<index>",
@@ -0,0 +1,360 @@
+"""Persistent ``git cat-file`` coprocesses.
+
+Spawning git dominates the cost of small object reads, and hydration,
+capture and sync issue dozens to hundreds of them per operation.
+CatFileProcess keeps one long-lived ``git cat-file --batch`` (object
+contents) or ``--batch-check`` (object headers) per repository and pipelines
+requests through it: every object name of a request is written before the
+responses are read, and each response is framed by the size in its header,
+so content is never scanned for delimiters.
+
+A process that has exited or whose pipes break is restarted and the request
+retried once. A request that exceeds its timeout kills the process and
+raises StorageError; the next request starts a fresh one.
+
+Processes are pooled per repository by get_cat_file() and closed at exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from git_notes_memory.config import (
+    GIT_CAT_FILE_MAX_PROCESSES,
+    GIT_CAT_FILE_TIMEOUT_SECONDS,
+)
+from git_notes_memory.exceptions import StorageError
+from git_notes_memory.observability.metrics import get_metrics
+
+__all__ = [
+    "CatFileObject",
+    "CatFileProcess",
+    "close_all",
+    "get_cat_file",
+    "read_batch_object",
+]
+
+logger = logging.getLogger(__name__)
+
+# Requests up to this size are written inline: the stdin pipe is empty
+# between requests, so the write cannot block on a full pipe
+_INLINE_WRITE_BYTES = 4096
+
+# Status words git prints instead of "<type> <size>" for unreadable names
+_MISSING_STATUSES = frozenset({b"missing", b"ambiguous"})
+
+
+@dataclass(frozen=True)
+class CatFileObject:
+    """An object read through ``git cat-file``.
+
+    Attributes:
+        oid: Object ID.
+        type: Object type ("blob", "tree", "commit" or "tag").
+        size: Object size in bytes.
+        content: Object content; empty for ``--batch-check`` reads.
+    """
+
+    oid: str
+    type: str
+    size: int
+    content: bytes = b""
+
+
+def read_batch_object(
+    stream: IO[bytes],
+    *,
+    with_content: bool = True,
+) -> CatFileObject | None:
+    """Read one response from ``git cat-file --batch`` output.
+
+    Args:
+        stream: The cat-file stdout pipe.
+        with_content: Whether the response carries content (``--batch``)
+            or only the header (``--batch-check``).
+
+    Returns:
+        The object, or None if git reported the name as missing.
+
+    Raises:
+        EOFError: If the stream ends before the response is complete.
+        ValueError: If the header is malformed.
+    """
+    header = stream.readline()
+    if not header:
+        raise EOFError("no object header")
+    parts = header.split()
+    if len(parts) != 3 or not parts[2].isdigit():
+        # "<name> missing" / "<name> ambiguous"; the name may contain spaces
+        if parts and parts[-1] in _MISSING_STATUSES:
+            return None
+        raise ValueError(f"malformed cat-file header: {header!r}")
+    oid, obj_type, size = parts[0].decode(), parts[1].decode(), int(parts[2])
+    if not with_content:
+        return CatFileObject(oid, obj_type, size)
+    content = stream.read(size)
+    # Content is followed by a single LF
+    if len(content) < size or stream.read(1) != b"\n":
+        raise EOFError(f"truncated object {oid}")
+    return CatFileObject(oid, obj_type, size, content)
+
+
+class CatFileProcess:
+    """A long-lived ``git cat-file --batch`` or ``--batch-check`` process.
+
+    The process is started on the first request. Requests are serialized
+    by a lock, so one instance can be shared between threads.
+
+    Attributes:
+        repo_path: Repository the process reads from.
+        check: True for ``--batch-check`` (headers only).
+        timeout: Maximum seconds a request may take.
+
+    Example:
+        >>> proc = CatFileProcess(Path("/path/to/repo"))
+        >>> [obj.type for obj in proc.request(["HEAD", "HEAD^{tree}"]) if obj]
+        ['commit', 'tree']
+    """
+
+    def __init__(
+        self,
+        repo_path: Path,
+        *,
+        check: bool = False,
+        timeout: float = GIT_CAT_FILE_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize without starting git.
+
+        Args:
+            repo_path: Repository to read from.
+            check: Read headers only (``--batch-check``).
+            timeout: Maximum seconds a request may take.
+        """
+        self.repo_path = repo_path
+        self.check = check
+        self.timeout = timeout
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def mode(self) -> str:
+        """The cat-file mode flag."""
+        return "--batch-check" if self.check else "--batch"
+
+    def request(self, names: Sequence[str]) -> list[CatFileObject | None]:
+        """Read objects by name.
+
+        Args:
+            names: Object names in any form git accepts (``<oid>``,
+                ``<rev>:<path>``, ``<rev>^{tree}``, ...).
+
+        Returns:
+            One entry per name, in order: the object, or None if missing.
+
+        Raises:
+            ValueError: If a name contains a newline.
+            StorageError: If the request times out, or git fails again
+                after a restart.
+        """
+        if not names:
+            return []
+        if any("\n" in name for name in names):
+            raise ValueError("object names cannot contain newlines")
+
+        payload = "".join(f"{name}\n" for name in names).encode()
+        metrics = get_metrics()
+        labels = {"command": "cat-file"}
+        start_time = time.perf_counter()
+        with self._lock:
+            for attempt in range(2):
+                timed_out = threading.Event()
+                timer: threading.Timer | None = None
+                try:
+                    proc = self._ensure_started()
+                    timer = threading.Timer(
+                        self.timeout, self._expire, (proc, timed_out)
+                    )
+                    timer.daemon = True
+                    timer.start()
+                    results = self._exchange(proc, payload, len(names))
+                except (OSError, EOFError, ValueError) as e:
+                    self._stop()
+                    if timed_out.is_set():
+                        metrics.increment(
+                            "git_commands_total", labels={**labels, "status": "timeout"}
+                        )
+                        raise StorageError(
+                            f"git cat-file timed out after {self.timeout}s",
+                            "Git operation is taking too long; check for a large "
+                            "or locked repository",
+                        ) from e
+                    if attempt:
+                        metrics.increment(
+                            "git_commands_total", labels={**labels, "status": "error"}
+                        )
+                        raise StorageError(
+                            f"git cat-file {self.mode} failed: {e}",
+                            "Check that the path is a git repository and try again",
+                        ) from e
+                    logger.debug("Restarting git cat-file %s: %s", self.mode, e)
+                    metrics.increment("git_cat_file_restarts_total")
+                    continue
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+
+                metrics.observe(
+                    "git_command_duration_ms",
+                    (time.perf_counter() - start_time) * 1000,
+                    labels=labels,
+                )
+                metrics.increment(
+                    "git_commands_total", labels={**labels, "status": "success"}
+                )
+                return results
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def close(self) -> None:
+        """Stop the git process; the next request starts a new one."""
+        with self._lock:
+            self._stop()
+
+    def _ensure_started(self) -> subprocess.Popen[bytes]:
+        """Return the running process, starting one if needed."""
+        if self._proc is not None and self._proc.poll() is None:
+            return self._proc
+        self._stop()
+        self._proc = subprocess.Popen(
+            ["git", "-C", str(self.repo_path), "cat-file", self.mode],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        return self._proc
+
+    def _exchange(
+        self,
+        proc: subprocess.Popen[bytes],
+        payload: bytes,
+        count: int,
+    ) -> list[CatFileObject | None]:
+        """Write a request and read its responses."""
+        stdin, stdout = proc.stdin, proc.stdout
+        assert stdin is not None and stdout is not None  # noqa: S101 - PIPE
+
+        def feed() -> None:
+            try:
+                stdin.write(payload)
+                stdin.flush()
+            except OSError:
+                # git exited; the reader sees EOF
+                pass
+
+        writer: threading.Thread | None = None
+        if len(payload) <= _INLINE_WRITE_BYTES:
+            stdin.write(payload)
+            stdin.flush()
+        else:
+            # Large requests are fed from a thread so neither side blocks
+            # on a full pipe while the other is writing
+            writer = threading.Thread(target=feed, daemon=True)
+            writer.start()
+        try:
+            return [
+                read_batch_object(stdout, with_content=not self.check)
+                for _ in range(count)
+            ]
+        except BaseException:
+            proc.kill()
+            raise
+        finally:
+            if writer is not None:
+                writer.join()
+
+    @staticmethod
+    def _expire(proc: subprocess.Popen[bytes], timed_out: threading.Event) -> None:
+        """Kill a process whose request ran past the timeout."""
+        timed_out.set()
+        proc.kill()
+
+    def _stop(self) -> None:
+        """Terminate the process, if any. Caller holds the lock."""
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        if proc.poll() is None:
+            proc.kill()
+        for stream in (proc.stdin, proc.stdout):
+            if stream is not None:
+                with contextlib.suppress(OSError):
+                    stream.close()
+        proc.wait()
+
+
+# =============================================================================
+# Process Pool
+# =============================================================================
+
+_pool: OrderedDict[tuple[str, bool], CatFileProcess] = OrderedDict()
+_pool_lock = threading.Lock()
+
+
+def get_cat_file(repo_path: Path, *, check: bool = False) -> CatFileProcess:
+    """Get the pooled cat-file process for a repository.
+
+    The pool keeps the most recently used GIT_CAT_FILE_MAX_PROCESSES
+    processes; older ones are closed.
+
+    Args:
+        repo_path: Repository to read from.
+        check: Headers-only (``--batch-check``) rather than ``--batch``.
+
+    Returns:
+        The shared CatFileProcess for (repo_path, check).
+    """
+    key = (os.path.abspath(repo_path), check)
+    evicted: list[CatFileProcess] = []
+    with _pool_lock:
+        proc = _pool.get(key)
+        if proc is None:
+            proc = CatFileProcess(Path(key[0]), check=check)
+            _pool[key] = proc
+            while len(_pool) > GIT_CAT_FILE_MAX_PROCESSES:
+                evicted.append(_pool.popitem(last=False)[1])
+        else:
+            _pool.move_to_end(key)
+    for old in evicted:
+        old.close()
+    return proc
+
+
+def close_all() -> None:
+    """Close every pooled cat-file process."""
+    with _pool_lock:
+        procs = list(_pool.values())
+        _pool.clear()
+    for proc in procs:
+        proc.close()
+
+
+def _forget_pool_in_child() -> None:
+    """Drop the parent's processes in a forked child without closing them."""
+    global _pool_lock
+    _pool.clear()
+    _pool_lock = threading.Lock()
+
+
+atexit.register(close_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool_in_child)
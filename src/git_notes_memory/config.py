@@ -7,6 +7,11 @@ Environment Variables:
     MEMORY_PLUGIN_DATA_DIR: Override the XDG data directory
     MEMORY_PLUGIN_GIT_NAMESPACE: Override the git notes namespace
     MEMORY_PLUGIN_EMBEDDING_MODEL: Override the embedding model name
+    MEMORY_PLUGIN_EMBEDDING_BACKEND: Inference backend (torch/onnx)
+    MEMORY_PLUGIN_ONNX_MODEL_FILE: ONNX file within the model repository
+    MEMORY_PLUGIN_EMBEDDING_MODEL_REVISION: Model repository commit to download
+    MEMORY_PLUGIN_VECTOR_QUANTIZATION: Vector storage mode (float/bit)
+    MEMORY_PLUGIN_EMBEDDING_CACHE: Enable/disable the embedding cache (default on)
     MEMORY_PLUGIN_AUTO_CAPTURE: Enable/disable auto-capture (1/true/yes/on)
 
 XDG Compliance:
@@ -21,13 +26,36 @@ XDG Compliance:
 from __future__ import annotations
 
 import os
+import sys
 from pathlib import Path
 
-from dotenv import load_dotenv
+
+def _find_dotenv() -> Path | None:
+    """Find the .env file python-dotenv's ``load_dotenv()`` would load.
+
+    Searches the same directories as ``dotenv.find_dotenv()``: upwards from
+    this package (or from the working directory in an interactive session).
+    Doing the search here means python-dotenv, which pulls in ``logging``
+    and ``tempfile``, is only imported when there is a file to load.
+    """
+    main = sys.modules.get("__main__")
+    if hasattr(sys, "ps1") or not hasattr(main, "__file__"):
+        start = Path.cwd()
+    else:
+        start = Path(__file__).resolve().parent
+    for directory in (start, *start.parents):
+        candidate = directory / ".env"
+        if candidate.is_file():
+            return candidate
+    return None
+
 
 # Load .env file early, before any environment variable access
-# This looks for .env in the current directory and parent directories
-load_dotenv()
+_dotenv_path = _find_dotenv()
+if _dotenv_path is not None:
+    from dotenv import load_dotenv
+
+    load_dotenv(_dotenv_path)
 
 __all__ = [
     # Namespaces
@@ -39,6 +67,9 @@ __all__ = [
     "INDEX_DB_NAME",
     "MODELS_DIR_NAME",
     "LOCK_FILE_NAME",
+    "LOCKS_DIR_NAME",
+    "SESSION_CONTEXT_DIR_NAME",
+    "TRANSCRIPT_STATE_DIR_NAME",
     "MEMORY_DIR_NAME",
     "find_git_root",
     "NotInGitRepositoryError",
@@ -49,23 +80,53 @@ __all__ = [
     "get_project_memory_dir",
     "get_models_path",
     "get_lock_path",
+    "DAEMON_SOCKET_NAME",
+    "get_daemon_socket_path",
     # Embedding Configuration
     "DEFAULT_EMBEDDING_MODEL",
+    "DEFAULT_EMBEDDING_MODEL_REVISION",
     "EMBEDDING_DIMENSIONS",
     "get_embedding_model",
+    "get_embedding_model_revision",
+    "EMBEDDING_BACKENDS",
+    "DEFAULT_EMBEDDING_BACKEND",
+    "get_embedding_backend",
+    "get_onnx_model_file",
+    "VECTOR_QUANTIZATION_MODES",
+    "DEFAULT_VECTOR_QUANTIZATION",
+    "VECTOR_RESCORE_FACTOR",
+    "get_vector_quantization",
+    "EMBEDDING_CACHE_DB_NAME",
+    "EMBEDDING_CACHE_MAX_ENTRIES",
+    "is_embedding_cache_enabled",
     # Limits and Thresholds
     "MAX_CONTENT_BYTES",
     "MAX_SUMMARY_CHARS",
     "MAX_HYDRATION_FILES",
     "MAX_FILE_SIZE",
+    "MAX_HYDRATION_TOTAL_BYTES",
+    "INDEX_BULK_BATCH_SIZE",
+    "INDEX_BULK_CACHE_KIB",
+    "INDEX_QUEUE_MAX_ATTEMPTS",
+    "INDEX_BUSY_TIMEOUT_SECONDS",
     # Performance Timeouts
     "SEARCH_TIMEOUT_MS",
     "CAPTURE_TIMEOUT_MS",
     "REINDEX_TIMEOUT_MS",
     "LOCK_TIMEOUT_SECONDS",
+    # Daemon
+    "DAEMON_IDLE_TIMEOUT_SECONDS",
+    "DAEMON_CLIENT_TIMEOUT_SECONDS",
+    "DAEMON_MAX_OPEN_INDEXES",
+    # Git Coprocesses
+    "GIT_CAT_FILE_TIMEOUT_SECONDS",
+    "GIT_CAT_FILE_MAX_PROCESSES",
+    "GIT_FETCH_TIMEOUT_SECONDS",
+    "GIT_NOTES_MERGE_MAX_WORKERS",
     # Cache Settings
     "CACHE_TTL_SECONDS",
     "CACHE_MAX_ENTRIES",
+    "COMMIT_INFO_CACHE_MAX_ENTRIES",
     # Lifecycle Settings
     "DECAY_HALF_LIFE_DAYS",
     "SECONDS_PER_DAY",
@@ -90,6 +151,9 @@ __all__ = [
     "HOOK_SESSION_START_TIMEOUT",
     "HOOK_USER_PROMPT_TIMEOUT",
     "HOOK_STOP_TIMEOUT",
+    "SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS",
+    "TRANSCRIPT_STATE_MAX_SIGNALS",
+    "TRANSCRIPT_STATE_MAX_AGE_SECONDS",
     "HOOK_BUDGET_SIMPLE",
     "HOOK_BUDGET_MEDIUM",
     "HOOK_BUDGET_COMPLEX",
@@ -159,6 +223,10 @@ def get_git_namespace() -> str:
 INDEX_DB_NAME = "index.db"
 MODELS_DIR_NAME = "models"
 LOCK_FILE_NAME = ".capture.lock"
+LOCKS_DIR_NAME = "locks"
+SESSION_CONTEXT_DIR_NAME = "session_context"
+TRANSCRIPT_STATE_DIR_NAME = "transcripts"
+DAEMON_SOCKET_NAME = "memoryd.sock"
 
 
 def get_data_path() -> Path:
@@ -373,13 +441,50 @@ def get_models_path() -> Path:
     return get_data_path() / MODELS_DIR_NAME
 
 
-def get_lock_path() -> Path:
-    """Get the path to the capture lock file.
+def get_lock_path(
+    repo_path: Path | str | None = None,
+    namespace: str | None = None,
+) -> Path:
+    """Get the path to a capture lock file.
+
+    Captures lock the notes ref they append to. Scoping the lock by
+    repository and namespace lets captures into different repositories
+    or namespaces run concurrently; without arguments the machine-wide
+    lock is returned.
+
+    Args:
+        repo_path: Repository the lock guards, normally its common git
+            directory (see GitOps.get_common_dir). The resolved path is
+            hashed.
+        namespace: Namespace whose notes ref the lock guards. If None, one
+            lock covers the whole repository.
 
     Returns:
-        Path to .capture.lock file.
+        Path to the lock file: data/.capture.lock, or
+        data/locks/<repo-hash>/<namespace>.lock.
     """
-    return get_data_path() / LOCK_FILE_NAME
+    if repo_path is None:
+        return get_data_path() / LOCK_FILE_NAME
+
+    import hashlib
+
+    repo_key = hashlib.sha256(os.path.realpath(repo_path).encode()).hexdigest()[:16]
+    name = f"{namespace}.lock" if namespace else LOCK_FILE_NAME
+    return get_data_path() / LOCKS_DIR_NAME / repo_key / name
+
+
+def get_daemon_socket_path() -> Path:
+    """Get the path to the memory daemon's Unix domain socket.
+
+    Environment override: MEMORY_PLUGIN_DAEMON_SOCKET
+
+    Returns:
+        Path to memoryd.sock in the data directory.
+    """
+    override = os.environ.get("MEMORY_PLUGIN_DAEMON_SOCKET")
+    if override:
+        return Path(override).expanduser()
+    return get_data_path() / DAEMON_SOCKET_NAME
 
 
 # =============================================================================
@@ -387,6 +492,9 @@ def get_lock_path() -> Path:
 # =============================================================================
 
 DEFAULT_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Hub commit of the default model that the onnx backend downloads, so an
+# upstream push cannot swap the weights under an existing index
+DEFAULT_EMBEDDING_MODEL_REVISION = "c9745ed1d9f207416be6d2e6f8de32d1f16199bf"
 EMBEDDING_DIMENSIONS = 384
 
 
@@ -401,6 +509,104 @@ def get_embedding_model() -> str:
     return os.environ.get("MEMORY_PLUGIN_EMBEDDING_MODEL", DEFAULT_EMBEDDING_MODEL)
 
 
+def get_embedding_model_revision(model_name: str) -> str | None:
+    """Get the model repository commit to download, with environment override.
+
+    Environment override: MEMORY_PLUGIN_EMBEDDING_MODEL_REVISION
+
+    Args:
+        model_name: The embedding model being loaded.
+
+    Returns:
+        The configured revision, DEFAULT_EMBEDDING_MODEL_REVISION for the
+        default model, or None (the repository's main branch) for any
+        other model.
+    """
+    revision = os.environ.get("MEMORY_PLUGIN_EMBEDDING_MODEL_REVISION")
+    if revision:
+        return revision
+    if model_name == DEFAULT_EMBEDDING_MODEL:
+        return DEFAULT_EMBEDDING_MODEL_REVISION
+    return None
+
+
+# "torch" runs sentence-transformers; "onnx" runs the int8-quantized ONNX
+# export with onnxruntime and never imports torch (requires the onnx extra)
+EMBEDDING_BACKENDS = ("torch", "onnx")
+DEFAULT_EMBEDDING_BACKEND = "torch"
+
+
+def get_embedding_backend() -> str:
+    """Get the embedding inference backend, with environment override.
+
+    Environment override: MEMORY_PLUGIN_EMBEDDING_BACKEND
+    Unknown values fall back to the default.
+
+    Returns:
+        One of EMBEDDING_BACKENDS.
+    """
+    value = os.environ.get("MEMORY_PLUGIN_EMBEDDING_BACKEND", "").strip().lower()
+    if value in EMBEDDING_BACKENDS:
+        return value
+    return DEFAULT_EMBEDDING_BACKEND
+
+
+def get_onnx_model_file() -> str | None:
+    """Get the ONNX file to load from the model repository.
+
+    Environment override: MEMORY_PLUGIN_ONNX_MODEL_FILE
+    (e.g. onnx/model_qint8_avx512.onnx, or onnx/model.onnx for fp32)
+
+    Returns:
+        The configured file, or None to pick the quantized export for
+        this CPU architecture.
+    """
+    return os.environ.get("MEMORY_PLUGIN_ONNX_MODEL_FILE") or None
+
+
+# Vector storage: "float" scans full-precision vectors; "bit" scans binary
+# quantized vectors and re-scores a shortlist of VECTOR_RESCORE_FACTOR * k
+# candidates against the full-precision ones. (An int8 mode was dropped: with
+# the full vectors kept for re-scoring it was larger and slower than float.)
+VECTOR_QUANTIZATION_MODES = ("float", "bit")
+DEFAULT_VECTOR_QUANTIZATION = "float"
+VECTOR_RESCORE_FACTOR = 8
+
+
+def get_vector_quantization() -> str:
+    """Get the vector storage mode, with environment override.
+
+    Environment override: MEMORY_PLUGIN_VECTOR_QUANTIZATION
+    Unknown values fall back to the default.
+
+    Returns:
+        One of VECTOR_QUANTIZATION_MODES.
+    """
+    value = os.environ.get("MEMORY_PLUGIN_VECTOR_QUANTIZATION", "").strip().lower()
+    if value in VECTOR_QUANTIZATION_MODES:
+        return value
+    return DEFAULT_VECTOR_QUANTIZATION
+
+
+# Embedding cache: sha256(model + text) -> vector, stored beside the model
+# files so reindexing unchanged text skips inference
+EMBEDDING_CACHE_DB_NAME = "embeddings.db"
+EMBEDDING_CACHE_MAX_ENTRIES = 200_000  # ~300MB at 384 dimensions
+
+
+def is_embedding_cache_enabled() -> bool:
+    """Check if the persistent embedding cache is enabled.
+
+    Environment variable: MEMORY_PLUGIN_EMBEDDING_CACHE
+    Enabled unless set to 0, false, no or off (case-insensitive).
+
+    Returns:
+        True if the embedding cache is enabled.
+    """
+    value = os.environ.get("MEMORY_PLUGIN_EMBEDDING_CACHE", "").lower()
+    return value not in {"0", "false", "no", "off"}
+
+
 # =============================================================================
 # Limits and Thresholds
 # =============================================================================
@@ -412,6 +618,19 @@ MAX_SUMMARY_CHARS = 100  # Max summary length
 # Hydration limits (PERF-003 performance requirement)
 MAX_HYDRATION_FILES = 20  # Max files to hydrate per memory
 MAX_FILE_SIZE = 102400  # 100KB max per file
+MAX_HYDRATION_TOTAL_BYTES = 1048576  # 1MB max file snapshots per hydration
+
+# Bulk index loads (reindex, repair): memories embedded and written per chunk,
+# and the SQLite page cache used while the load's transaction is open
+INDEX_BULK_BATCH_SIZE = 500
+INDEX_BULK_CACHE_KIB = 65536  # 64MB
+
+# Deferred indexing: drains before a queued memory is left for reindex
+INDEX_QUEUE_MAX_ATTEMPTS = 5
+
+# How long an index write waits on another connection's write lock
+# (SQLite busy timeout); captures rely on this rather than a file lock
+INDEX_BUSY_TIMEOUT_SECONDS = 10.0
 
 
 # =============================================================================
@@ -424,12 +643,32 @@ REINDEX_TIMEOUT_MS = 60000  # 60s target for full reindex
 LOCK_TIMEOUT_SECONDS = 5  # Lock acquisition timeout
 
 
+# =============================================================================
+# Daemon Settings
+# =============================================================================
+
+DAEMON_IDLE_TIMEOUT_SECONDS = 1800  # Daemon exits after 30 minutes idle
+DAEMON_CLIENT_TIMEOUT_SECONDS = 2.0  # Per-request socket timeout for hooks
+DAEMON_MAX_OPEN_INDEXES = 16  # Project indexes kept open by the daemon (LRU)
+
+
+# =============================================================================
+# Git Coprocess Settings
+# =============================================================================
+
+GIT_CAT_FILE_TIMEOUT_SECONDS = 30.0  # Per-request timeout for cat-file reads
+GIT_CAT_FILE_MAX_PROCESSES = 8  # Pooled cat-file processes before eviction
+GIT_FETCH_TIMEOUT_SECONDS = 120.0  # Single notes fetch for all namespaces
+GIT_NOTES_MERGE_MAX_WORKERS = 4  # Concurrent per-namespace notes merges
+
+
 # =============================================================================
 # Cache Settings
 # =============================================================================
 
 CACHE_TTL_SECONDS = 300.0  # 5 minutes cache lifetime
 CACHE_MAX_ENTRIES = 100  # Maximum cached search results
+COMMIT_INFO_CACHE_MAX_ENTRIES = 4096  # Commit metadata cached by SHA
 
 
 # =============================================================================
@@ -532,6 +771,15 @@ HOOK_SESSION_START_TIMEOUT = 5  # SessionStart hook timeout
 HOOK_USER_PROMPT_TIMEOUT = 2  # UserPromptSubmit hook timeout
 HOOK_STOP_TIMEOUT = 5  # Stop hook timeout
 
+# A SessionStart context snapshot is rebuilt once older than this even if
+# no memory changed, since "recent decisions" is relative to build time
+SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS = 3600
+
+# Signals kept between incremental transcript scans (Stop/PreCompact), and
+# how long a transcript's scan state is kept after its last update
+TRANSCRIPT_STATE_MAX_SIGNALS = 50
+TRANSCRIPT_STATE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
 # Token budget tiers (from architecture spec)
 HOOK_BUDGET_SIMPLE = 500  # Simple projects
 HOOK_BUDGET_MEDIUM = 1000  # Medium complexity projects
@@ -0,0 +1,768 @@
+"""Persistent memory daemon for warm hook services.
+
+Every hook invocation runs in a fresh Python process, so without a
+long-lived host each one pays for importing the service stack, opening the
+index and - worst of all - loading the sentence-transformer model. The
+daemon keeps EmbeddingService and one IndexService per project index warm
+behind a Unix domain socket. Hooks talk to it through DaemonClient and fall
+back to in-process services when it is not running: PostToolUse and novelty
+checks send whole searches, and any EmbeddingService that has not loaded the
+model itself (SessionStart's semantic context, Stop's index sync) sends the
+texts it needs embedded.
+
+Protocol:
+    One JSON object per line in each direction. Requests carry an ``op``
+    field plus op-specific parameters; responses carry ``ok`` and either
+    ``result`` or ``error``. Requests are served one at a time because the
+    underlying SQLite connections and the embedding model are not safe for
+    concurrent use.
+
+Supported operations:
+    - ping: Liveness check, returns pid, version and model state
+    - embed_batch: Generate embeddings with the warm model (optional
+      ``model`` / ``backend`` fields must match the daemon's)
+    - search: Vector or hybrid search against a project index
+    - search_batch: Vector search for several queries with one embed_batch
+    - shutdown: Stop the daemon after replying
+
+Usage::
+
+    # Start in the foreground (the SessionStart hook spawns it detached)
+    python -m git_notes_memory.daemon
+
+    # Query from a hook
+    client = get_daemon_client()
+    if client is not None:
+        results = client.search("database choice", index_path=path, k=5)
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from git_notes_memory.config import (
+    DAEMON_CLIENT_TIMEOUT_SECONDS,
+    DAEMON_IDLE_TIMEOUT_SECONDS,
+    DAEMON_MAX_OPEN_INDEXES,
+    INDEX_DB_NAME,
+    NotInGitRepositoryError,
+    get_daemon_socket_path,
+    get_index_path,
+    get_project_index_path,
+)
+from git_notes_memory.models import Memory, MemoryResult
+
+if TYPE_CHECKING:
+    from git_notes_memory.embedding import EmbeddingService
+    from git_notes_memory.index import IndexService
+
+__all__ = [
+    "DaemonClient",
+    "DaemonError",
+    "MemoryDaemon",
+    "get_daemon_client",
+    "spawn_daemon",
+]
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single request/response line (SEC: bound memory use)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+
+class DaemonError(Exception):
+    """Raised when the daemon cannot be reached or rejects a request.
+
+    Callers treat this as "daemon unavailable" and fall back to
+    in-process services.
+    """
+
+
+# =============================================================================
+# Serialization Helpers
+# =============================================================================
+
+
+def _memory_to_dict(memory: Memory) -> dict[str, Any]:
+    """Convert a Memory into a JSON-serializable dict."""
+    return {
+        "id": memory.id,
+        "commit_sha": memory.commit_sha,
+        "namespace": memory.namespace,
+        "summary": memory.summary,
+        "content": memory.content,
+        "timestamp": memory.timestamp.isoformat(),
+        "repo_path": memory.repo_path,
+        "spec": memory.spec,
+        "phase": memory.phase,
+        "tags": list(memory.tags),
+        "status": memory.status,
+        "relates_to": list(memory.relates_to),
+    }
+
+
+def _memory_from_dict(data: dict[str, Any]) -> Memory:
+    """Rebuild a Memory from its serialized dict form."""
+    return Memory(
+        id=data["id"],
+        commit_sha=data["commit_sha"],
+        namespace=data["namespace"],
+        summary=data["summary"],
+        content=data["content"],
+        timestamp=datetime.fromisoformat(data["timestamp"]),
+        repo_path=data.get("repo_path"),
+        spec=data.get("spec"),
+        phase=data.get("phase"),
+        tags=tuple(data.get("tags") or ()),
+        status=data.get("status") or "active",
+        relates_to=tuple(data.get("relates_to") or ()),
+    )
+
+
+# =============================================================================
+# Index Path Validation
+# =============================================================================
+
+
+def _is_index_location(path: Path) -> bool:
+    """Check that a resolved path is one the plugin itself would use.
+
+    Only the global index and ``<git-root>/.memory/index.db`` files are
+    accepted, so a client cannot point the daemon at arbitrary files.
+    """
+    if path.name != INDEX_DB_NAME:
+        return False
+    if path == get_index_path().resolve():
+        return True
+    try:
+        return get_project_index_path(path.parent.parent).resolve() == path
+    except NotInGitRepositoryError:
+        return False
+
+
+def _has_index_schema(path: Path) -> bool:
+    """Check read-only that a database already holds the index metadata table."""
+    try:
+        conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return False
+    try:
+        row = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'metadata'"
+        ).fetchone()
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
+    return row is not None
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads newline-delimited JSON requests from one client connection."""
+
+    server: _DaemonSocketServer
+
+    def handle(self) -> None:
+        while True:
+            line = self.rfile.readline(MAX_MESSAGE_BYTES + 1)
+            if not line:
+                return
+            if len(line) > MAX_MESSAGE_BYTES:
+                self._send({"ok": False, "error": "request too large"})
+                return
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("request must be a JSON object")
+            except ValueError as e:
+                self._send({"ok": False, "error": f"invalid request: {e}"})
+                continue
+            self._send(self.server.daemon.handle_request(request))
+
+    def _send(self, response: dict[str, Any]) -> None:
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+        self.wfile.flush()
+
+
+class _DaemonSocketServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Threaded Unix socket server bound to a MemoryDaemon."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, daemon: MemoryDaemon) -> None:
+        self.daemon = daemon
+        super().__init__(socket_path, _RequestHandler)
+
+
+class MemoryDaemon:
+    """Long-lived host for warm memory services.
+
+    Services are created lazily on first use and then kept for the
+    lifetime of the process. Index services are cached per index path so
+    a single daemon can serve every project of the current user; the least
+    recently used one is closed once max_indexes are open.
+
+    Attributes:
+        socket_path: Path of the Unix domain socket the daemon listens on.
+        idle_timeout: Seconds without requests before the daemon exits.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        *,
+        idle_timeout: float = DAEMON_IDLE_TIMEOUT_SECONDS,
+        embedding_service: EmbeddingService | None = None,
+        max_indexes: int = DAEMON_MAX_OPEN_INDEXES,
+    ) -> None:
+        """Initialize the daemon without binding the socket.
+
+        Args:
+            socket_path: Socket location. Defaults to get_daemon_socket_path().
+            idle_timeout: Seconds of inactivity before serve_forever returns.
+                Zero or negative disables the idle shutdown.
+            embedding_service: Optional pre-configured EmbeddingService.
+            max_indexes: Maximum number of project indexes kept open.
+        """
+        self.socket_path = socket_path or get_daemon_socket_path()
+        self.idle_timeout = idle_timeout
+        self._embedding_service = embedding_service
+        self.max_indexes = max(1, max_indexes)
+        self._indexes: OrderedDict[str, IndexService] = OrderedDict()
+        # Serializes request handling; sqlite3 connections and the model
+        # are shared across handler threads.
+        self._lock = threading.Lock()
+        self._server: _DaemonSocketServer | None = None
+        self._stopping = threading.Event()
+        self._started_at = time.monotonic()
+        self._last_activity = time.monotonic()
+
+    # -------------------------------------------------------------------------
+    # Warm Services
+    # -------------------------------------------------------------------------
+
+    def _get_embedding(self) -> EmbeddingService:
+        """Get or create the shared EmbeddingService."""
+        if self._embedding_service is None:
+            from git_notes_memory.embedding import EmbeddingService
+
+            # The daemon must not delegate embedding to itself
+            self._embedding_service = EmbeddingService(use_daemon=False)
+        return self._embedding_service
+
+    def _get_embedding_for(self, request: dict[str, Any]) -> EmbeddingService:
+        """Get the EmbeddingService, checking the model a client expects.
+
+        Raises:
+            ValueError: If the request names another model or backend.
+        """
+        embedding = self._get_embedding()
+        model = request.get("model")
+        if model is not None and model != embedding.model_name:
+            msg = f"daemon serves model {embedding.model_name!r}, not {model!r}"
+            raise ValueError(msg)
+        backend = request.get("backend")
+        if backend is not None and backend != embedding.backend:
+            msg = f"daemon serves backend {embedding.backend!r}, not {backend!r}"
+            raise ValueError(msg)
+        return embedding
+
+    def _get_index(self, index_path: str) -> IndexService:
+        """Get or open the IndexService for a project index.
+
+        Args:
+            index_path: Absolute path to the project's index.db.
+
+        Raises:
+            ValueError: If the path is not an existing plugin index, i.e. not
+                a location get_project_index_path() or get_index_path() would
+                return, or a database without the index metadata table.
+        """
+        path = Path(index_path)
+        if not path.is_absolute() or not path.is_file():
+            msg = f"index not found: {index_path}"
+            raise ValueError(msg)
+        path = path.resolve()
+        key = str(path)
+        index = self._indexes.get(key)
+        if index is not None:
+            self._indexes.move_to_end(key)
+            return index
+
+        if not _is_index_location(path):
+            msg = f"not a memory index location: {index_path}"
+            raise ValueError(msg)
+        if not _has_index_schema(path):
+            msg = f"not a memory index: {index_path}"
+            raise ValueError(msg)
+
+        from git_notes_memory.index import IndexService
+
+        index = IndexService(path)
+        index.initialize()
+        self._indexes[key] = index
+        while len(self._indexes) > self.max_indexes:
+            _, evicted = self._indexes.popitem(last=False)
+            with contextlib.suppress(Exception):
+                evicted.close()
+        return index
+
+    def prewarm(self) -> None:
+        """Load the embedding model ahead of the first request."""
+        self._get_embedding().prewarm()
+
+    # -------------------------------------------------------------------------
+    # Request Dispatch
+    # -------------------------------------------------------------------------
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Execute a single decoded request.
+
+        Args:
+            request: Decoded request object with an ``op`` field.
+
+        Returns:
+            Response object with ``ok`` and ``result`` or ``error``.
+        """
+        op = request.get("op")
+        handler = getattr(self, f"_op_{op}", None) if isinstance(op, str) else None
+        if handler is None:
+            return {"ok": False, "error": f"unknown op: {op!r}"}
+
+        with self._lock:
+            self._last_activity = time.monotonic()
+            try:
+                result = handler(request)
+            except Exception as e:
+                logger.warning("Daemon op %s failed: %s", op, e)
+                return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True, "result": result}
+
+    def _op_ping(self, _request: dict[str, Any]) -> dict[str, Any]:
+        from git_notes_memory import __version__
+
+        embedding = self._embedding_service
+        return {
+            "pid": os.getpid(),
+            "version": __version__,
+            "uptime": time.monotonic() - self._started_at,
+            "model_loaded": bool(embedding is not None and embedding.is_loaded),
+            "indexes": len(self._indexes),
+        }
+
+    def _op_embed_batch(self, request: dict[str, Any]) -> list[list[float]]:
+        embedding = self._get_embedding_for(request)
+        return embedding.embed_batch([str(t) for t in request.get("texts", [])])
+
+    def _op_search(self, request: dict[str, Any]) -> list[dict[str, Any]]:
+        from git_notes_memory.recall import RecallService
+
+        index = self._get_index(str(request["index_path"]))
+        recall = RecallService(
+            index.db_path,
+            index_service=index,
+            embedding_service=self._get_embedding(),
+        )
+        search = recall.search_hybrid if request.get("hybrid") else recall.search
+        results = search(
+            str(request["query"]),
+            k=int(request.get("k", 10)),
+            namespace=request.get("namespace"),
+            spec=request.get("spec"),
+            min_similarity=request.get("min_similarity"),
+        )
+        return [
+            {"memory": _memory_to_dict(r.memory), "distance": r.distance}
+            for r in results
+        ]
+
+    def _op_search_batch(self, request: dict[str, Any]) -> list[list[dict[str, Any]]]:
+        from git_notes_memory.recall import RecallService
+
+        index = self._get_index(str(request["index_path"]))
+        recall = RecallService(
+            index.db_path,
+            index_service=index,
+            embedding_service=self._get_embedding(),
+        )
+        batch = recall.search_batch(
+            [str(q) for q in request.get("queries", [])],
+            k=int(request.get("k", 10)),
+            namespaces=request.get("namespaces"),
+            spec=request.get("spec"),
+            min_similarity=request.get("min_similarity"),
+        )
+        return [
+            [
+                {"memory": _memory_to_dict(r.memory), "distance": r.distance}
+                for r in results
+            ]
+            for results in batch
+        ]
+
+    def _op_shutdown(self, _request: dict[str, Any]) -> bool:
+        self._stopping.set()
+        return True
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def bind(self) -> None:
+        """Bind the listening socket, replacing a stale socket file.
+
+        Raises:
+            DaemonError: If another daemon is already serving the socket.
+        """
+        path = self.socket_path
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if path.exists():
+            if DaemonClient(path, timeout=0.5).is_alive():
+                msg = f"daemon already running on {path}"
+                raise DaemonError(msg)
+            path.unlink()
+
+        old_umask = os.umask(0o177)
+        try:
+            self._server = _DaemonSocketServer(str(path), self)
+        finally:
+            os.umask(old_umask)
+        # Poll interval for shutdown/idle checks
+        self._server.timeout = 0.5
+
+    def serve_forever(self) -> None:
+        """Serve requests until shutdown is requested or the idle timeout hits."""
+        if self._server is None:
+            self.bind()
+        server = self._server
+        assert server is not None  # noqa: S101 - bind() guarantees it
+
+        logger.info("Memory daemon listening on %s", self.socket_path)
+        try:
+            while not self._stopping.is_set():
+                server.handle_request()
+                idle = time.monotonic() - self._last_activity
+                if 0 < self.idle_timeout < idle:
+                    logger.info("Memory daemon idle for %.0fs, exiting", idle)
+                    break
+        finally:
+            self.close()
+
+    def stop(self) -> None:
+        """Request the serve loop to exit."""
+        self._stopping.set()
+
+    def close(self) -> None:
+        """Close the socket and all cached index connections."""
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            with contextlib.suppress(OSError):
+                self.socket_path.unlink()
+        for index in self._indexes.values():
+            with contextlib.suppress(Exception):
+                index.close()
+        self._indexes.clear()
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+class DaemonClient:
+    """Thin client used by hooks to reach a running MemoryDaemon.
+
+    Each call opens a short-lived connection; connection setup over a
+    Unix socket costs microseconds compared to the work being delegated.
+
+    Examples:
+        >>> client = DaemonClient()
+        >>> if client.is_alive():
+        ...     vectors = client.embed_batch(["some text"])
+    """
+
+    def __init__(
+        self,
+        socket_path: Path | None = None,
+        *,
+        timeout: float = DAEMON_CLIENT_TIMEOUT_SECONDS,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Socket location. Defaults to get_daemon_socket_path().
+            timeout: Socket timeout in seconds for connect and each reply.
+        """
+        self.socket_path = socket_path or get_daemon_socket_path()
+        self.timeout = timeout
+
+    def request(self, op: str, **params: Any) -> Any:
+        """Send one request and return its result.
+
+        Args:
+            op: Operation name.
+            **params: Operation parameters (must be JSON-serializable).
+
+        Returns:
+            The ``result`` field of the daemon's response.
+
+        Raises:
+            DaemonError: If the daemon is unreachable, times out, or
+                reports an error.
+        """
+        payload = json.dumps({"op": op, **params}).encode("utf-8") + b"\n"
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(self.timeout)
+                sock.connect(str(self.socket_path))
+                sock.sendall(payload)
+                with sock.makefile("rb") as reader:
+                    line = reader.readline(MAX_MESSAGE_BYTES + 1)
+        except OSError as e:
+            msg = f"daemon unavailable: {e}"
+            raise DaemonError(msg) from e
+
+        if not line:
+            msg = "daemon closed connection without a response"
+            raise DaemonError(msg)
+        try:
+            response = json.loads(line)
+        except ValueError as e:
+            msg = f"invalid daemon response: {e}"
+            raise DaemonError(msg) from e
+        if not response.get("ok"):
+            msg = f"daemon error: {response.get('error', 'unknown')}"
+            raise DaemonError(msg)
+        return response.get("result")
+
+    def is_alive(self) -> bool:
+        """Check whether a compatible daemon answers on the socket."""
+        from git_notes_memory import __version__
+
+        if not self.socket_path.exists():
+            return False
+        try:
+            info = self.request("ping")
+        except DaemonError:
+            return False
+        return isinstance(info, dict) and info.get("version") == __version__
+
+    def embed_batch(
+        self,
+        texts: list[str],
+        *,
+        model: str | None = None,
+        backend: str | None = None,
+    ) -> list[list[float]]:
+        """Generate embeddings for several texts in one round trip.
+
+        Args:
+            texts: Texts to embed.
+            model: Model the vectors must come from, if it matters.
+            backend: Inference backend the vectors must come from.
+        """
+        vectors = self.request("embed_batch", texts=texts, model=model, backend=backend)
+        return [list(v) for v in vectors]
+
+    def search(
+        self,
+        query: str,
+        *,
+        index_path: Path,
+        k: int = 10,
+        namespace: str | None = None,
+        spec: str | None = None,
+        min_similarity: float | None = None,
+        hybrid: bool = False,
+    ) -> list[MemoryResult]:
+        """Run a search against a project index in the daemon.
+
+        Args:
+            query: Search query text.
+            index_path: Absolute path to the project's index.db.
+            k: Maximum number of results.
+            namespace: Optional namespace filter.
+            spec: Optional spec filter.
+            min_similarity: Optional minimum similarity (0-1).
+            hybrid: Use RecallService.search_hybrid() instead of search().
+
+        Returns:
+            MemoryResult list, same as the corresponding RecallService call.
+        """
+        rows = self.request(
+            "search",
+            query=query,
+            index_path=str(index_path),
+            k=k,
+            namespace=namespace,
+            spec=spec,
+            min_similarity=min_similarity,
+            hybrid=hybrid,
+        )
+        return [
+            MemoryResult(
+                memory=_memory_from_dict(row["memory"]),
+                distance=float(row["distance"]),
+            )
+            for row in rows
+        ]
+
+    def search_batch(
+        self,
+        queries: list[str],
+        *,
+        index_path: Path,
+        k: int = 10,
+        namespaces: list[str | None] | None = None,
+        spec: str | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list[MemoryResult]]:
+        """Run several searches against a project index in one round trip.
+
+        Args:
+            queries: Search query texts.
+            index_path: Absolute path to the project's index.db.
+            k: Maximum number of results per query.
+            namespaces: Optional namespace filter per query.
+            spec: Optional spec filter.
+            min_similarity: Optional minimum similarity (0-1).
+
+        Returns:
+            One MemoryResult list per query, same as
+            RecallService.search_batch().
+        """
+        batch = self.request(
+            "search_batch",
+            queries=queries,
+            index_path=str(index_path),
+            k=k,
+            namespaces=namespaces,
+            spec=spec,
+            min_similarity=min_similarity,
+        )
+        return [
+            [
+                MemoryResult(
+                    memory=_memory_from_dict(row["memory"]),
+                    distance=float(row["distance"]),
+                )
+                for row in rows
+            ]
+            for rows in batch
+        ]
+
+    def shutdown(self) -> None:
+        """Ask the daemon to exit."""
+        self.request("shutdown")
+
+
+def get_daemon_client() -> DaemonClient | None:
+    """Get a client for the running daemon, if any.
+
+    Only checks that the socket file exists so hooks pay nothing when the
+    daemon is not in use; callers must still handle DaemonError.
+
+    Returns:
+        A DaemonClient, or None when no daemon socket is present.
+    """
+    path = get_daemon_socket_path()
+    if not path.exists():
+        return None
+    return DaemonClient(path)
+
+
+def spawn_daemon(idle_timeout: float = DAEMON_IDLE_TIMEOUT_SECONDS) -> bool:
+    """Start a detached daemon process unless one is already running.
+
+    Args:
+        idle_timeout: Seconds of inactivity before the daemon exits.
+
+    Returns:
+        True if a new daemon process was started.
+    """
+    if DaemonClient(timeout=0.5).is_alive():
+        return False
+    subprocess.Popen(  # noqa: S603 - fixed argv built from sys.executable
+        [
+            sys.executable,
+            "-m",
+            "git_notes_memory.daemon",
+            "--idle-timeout",
+            str(idle_timeout),
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        close_fds=True,
+    )
+    return True
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the daemon in the foreground.
+
+    Args:
+        argv: Command-line arguments. Defaults to sys.argv[1:].
+
+    Returns:
+        Exit code (0 for clean shutdown, 1 if already running).
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m git_notes_memory.daemon",
+        description="Keep memory services warm for hook processes",
+    )
+    parser.add_argument("--socket", type=Path, default=None, help="Socket path")
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=DAEMON_IDLE_TIMEOUT_SECONDS,
+        help="Exit after this many idle seconds (0 disables)",
+    )
+    parser.add_argument(
+        "--no-prewarm",
+        action="store_true",
+        help="Load the embedding model on first request instead of at startup",
+    )
+    args = parser.parse_args(argv)
+
+    daemon = MemoryDaemon(args.socket, idle_timeout=args.idle_timeout)
+    try:
+        daemon.bind()
+    except DaemonError as e:
+        print(str(e), file=sys.stderr)
+        return 1
+
+    if not args.no_prewarm:
+        try:
+            daemon.prewarm()
+        except Exception as e:
+            logger.warning("Daemon prewarm failed: %s", e)
+
+    daemon.serve_forever()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
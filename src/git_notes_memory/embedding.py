@@ -1,12 +1,20 @@
 """Embedding service for generating semantic vectors.
 
 Uses sentence-transformers for generating text embeddings. The model is
-lazily loaded on first use to avoid slow startup times.
+lazily loaded on first use to avoid slow startup times. Setting
+MEMORY_PLUGIN_EMBEDDING_BACKEND=onnx swaps in an onnxruntime backend that
+runs an int8-quantized export of the same model without importing torch.
 
 The default model is 'all-MiniLM-L6-v2' which produces 384-dimensional vectors.
 This can be overridden via the MEMORY_PLUGIN_EMBEDDING_MODEL environment variable.
 
 Model files are cached in the XDG data directory (models/ subdirectory).
+Generated vectors are cached beside them (see embedding_cache), so text that
+was embedded before is never re-embedded and may not need the model at all.
+
+While a process has not loaded the model itself, texts that miss the cache
+are embedded by the memory daemon when one is running (see daemon.py), so
+short-lived hook processes never load the model when it is warm elsewhere.
 """
 
 from __future__ import annotations
@@ -19,10 +27,17 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from git_notes_memory.config import (
+    EMBEDDING_BACKENDS,
+    EMBEDDING_CACHE_DB_NAME,
     EMBEDDING_DIMENSIONS,
+    get_embedding_backend,
     get_embedding_model,
+    get_embedding_model_revision,
     get_models_path,
+    get_onnx_model_file,
+    is_embedding_cache_enabled,
 )
+from git_notes_memory.embedding_cache import EmbeddingCache
 from git_notes_memory.exceptions import EmbeddingError
 from git_notes_memory.observability.decorators import measure_duration
 from git_notes_memory.observability.metrics import get_metrics
@@ -31,13 +46,40 @@ from git_notes_memory.observability.tracing import trace_operation
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
 
+    from git_notes_memory.onnx_embedding import OnnxEmbeddingModel
+
 __all__ = [
     "EmbeddingService",
     "get_default_service",
+    "memory_embedding_text",
 ]
 
 logger = logging.getLogger(__name__)
 
+# Texts per daemon embedding request
+_DAEMON_EMBED_CHUNK = 64
+
+
+# =============================================================================
+# Embedding Text
+# =============================================================================
+
+
+def memory_embedding_text(summary: str, content: str) -> str:
+    """Build the text embedded for a memory.
+
+    Capture and reindex must embed identical text so the embedding cache
+    hits when a captured memory is later reindexed.
+
+    Args:
+        summary: The memory summary.
+        content: The memory content.
+
+    Returns:
+        Text to pass to EmbeddingService.embed/embed_batch.
+    """
+    return f"{summary}\n{content}"
+
 
 # =============================================================================
 # EmbeddingService
@@ -52,8 +94,10 @@ class EmbeddingService:
 
     Attributes:
         model_name: Name of the sentence-transformer model.
+        backend: Inference backend ("torch" or "onnx").
         cache_dir: Directory for caching model files.
         dimensions: Number of dimensions in the output vectors.
+        embedding_cache: Persistent vector cache, or None if disabled.
 
     Examples:
         >>> service = EmbeddingService()
@@ -70,6 +114,9 @@ class EmbeddingService:
         self,
         model_name: str | None = None,
         cache_dir: Path | None = None,
+        embedding_cache: EmbeddingCache | None = None,
+        backend: str | None = None,
+        use_daemon: bool = True,
     ) -> None:
         """Initialize the embedding service.
 
@@ -78,22 +125,66 @@ class EmbeddingService:
                 Defaults to the configured model (all-MiniLM-L6-v2).
             cache_dir: Directory for caching model files.
                 Defaults to the XDG data directory's models/ subdirectory.
+            embedding_cache: Persistent vector cache. Defaults to
+                embeddings.db in cache_dir unless disabled via
+                MEMORY_PLUGIN_EMBEDDING_CACHE.
+            backend: Inference backend, "torch" (sentence-transformers) or
+                "onnx" (onnxruntime, quantized). Defaults to the configured
+                backend.
+            use_daemon: Embed through a running memory daemon instead of
+                loading the model in this process. The daemon itself
+                passes False.
+
+        Raises:
+            EmbeddingError: If the backend is unknown.
         """
         self._model_name = model_name or get_embedding_model()
+        self._backend = backend or get_embedding_backend()
+        if self._backend not in EMBEDDING_BACKENDS:
+            raise EmbeddingError(
+                f"Unknown embedding backend: {self._backend}",
+                f"Use one of: {', '.join(EMBEDDING_BACKENDS)}",
+            )
+        self._onnx_model_file = get_onnx_model_file()
         self._cache_dir = cache_dir or get_models_path()
-        self._model: SentenceTransformer | None = None
+        if embedding_cache is None and is_embedding_cache_enabled():
+            embedding_cache = EmbeddingCache(self._cache_dir / EMBEDDING_CACHE_DB_NAME)
+        self._embedding_cache = embedding_cache
+        self._model: SentenceTransformer | OnnxEmbeddingModel | None = None
         self._dimensions: int | None = None
+        self._use_daemon = use_daemon
 
     @property
     def model_name(self) -> str:
         """Get the model name."""
         return self._model_name
 
+    @property
+    def backend(self) -> str:
+        """Get the inference backend."""
+        return self._backend
+
+    @property
+    def _cache_model_key(self) -> str:
+        """Model identity used for embedding cache keys.
+
+        Quantized ONNX vectors differ slightly from torch ones, so each
+        backend keeps its own cache entries.
+        """
+        if self._backend == "onnx":
+            return f"{self._model_name}@onnx:{self._onnx_model_file or 'default'}"
+        return self._model_name
+
     @property
     def cache_dir(self) -> Path:
         """Get the cache directory."""
         return self._cache_dir
 
+    @property
+    def embedding_cache(self) -> EmbeddingCache | None:
+        """Get the persistent embedding cache, if enabled."""
+        return self._embedding_cache
+
     @property
     def dimensions(self) -> int:
         """Get the embedding dimensions.
@@ -127,9 +218,6 @@ class EmbeddingService:
 
         with trace_operation("embedding.load", labels={"model": self._model_name}):
             try:
-                # Import here to defer the heavy import
-                from sentence_transformers import SentenceTransformer
-
                 # Ensure cache directory exists
                 self._cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -145,15 +233,22 @@ class EmbeddingService:
                 )
 
                 logger.info(
-                    "Loading embedding model '%s' (cache: %s)",
+                    "Loading embedding model '%s' with %s backend (cache: %s)",
                     self._model_name,
+                    self._backend,
                     self._cache_dir,
                 )
 
-                self._model = SentenceTransformer(
-                    self._model_name,
-                    cache_folder=str(self._cache_dir),
-                )
+                if self._backend == "onnx":
+                    self._model = self._load_onnx_model()
+                else:
+                    # Import here to defer the heavy import
+                    from sentence_transformers import SentenceTransformer
+
+                    self._model = SentenceTransformer(
+                        self._model_name,
+                        cache_folder=str(self._cache_dir),
+                    )
 
                 # Verify and cache the actual dimensions
                 self._dimensions = self._model.get_sentence_embedding_dimension()
@@ -174,6 +269,8 @@ class EmbeddingService:
                     load_time_ms,
                 )
 
+            except EmbeddingError:
+                raise
             except MemoryError as e:
                 raise EmbeddingError(
                     "Insufficient memory to load embedding model",
@@ -195,6 +292,27 @@ class EmbeddingService:
                     "Check model name and network connectivity",
                 ) from e
 
+    def _load_onnx_model(self) -> OnnxEmbeddingModel:
+        """Load the quantized ONNX model (imports neither torch nor transformers).
+
+        Raises:
+            EmbeddingError: If the onnx extra is not installed.
+        """
+        try:
+            from git_notes_memory.onnx_embedding import OnnxEmbeddingModel
+
+            return OnnxEmbeddingModel.from_pretrained(
+                self._model_name,
+                cache_dir=self._cache_dir,
+                model_file=self._onnx_model_file,
+                revision=get_embedding_model_revision(self._model_name),
+            )
+        except ImportError as e:
+            raise EmbeddingError(
+                f"ONNX embedding backend is not installed: {e}",
+                "Install with: pip install 'git-notes-memory[onnx]'",
+            ) from e
+
     @measure_duration("embedding_generate")
     def embed(self, text: str) -> list[float]:
         """Generate an embedding for a single text.
@@ -218,6 +336,22 @@ class EmbeddingService:
             # Return zero vector for empty text
             return [0.0] * self.dimensions
 
+        # A cache hit needs no model at all
+        if self._embedding_cache is not None:
+            cached = self._embedding_cache.get_many(
+                self._cache_model_key, [text], self._dimensions
+            )[0]
+            if cached is not None:
+                return cached
+
+        delegated = self._embed_via_daemon([text])
+        if delegated is not None:
+            if self._embedding_cache is not None:
+                self._embedding_cache.put_many(
+                    self._cache_model_key, {text: delegated[0]}
+                )
+            return delegated[0]
+
         self.load()
 
         metrics = get_metrics()
@@ -233,15 +367,16 @@ class EmbeddingService:
                 result: list[float] = embedding.tolist()
 
                 metrics.increment("embeddings_generated_total")
-
-                return result
-
             except Exception as e:
                 raise EmbeddingError(
                     f"Failed to generate embedding: {e}",
                     "Check input text and retry",
                 ) from e
 
+        if self._embedding_cache is not None:
+            self._embedding_cache.put_many(self._cache_model_key, {text: result})
+        return result
+
     @measure_duration("embedding_generate_batch")
     def embed_batch(
         self,
@@ -251,6 +386,9 @@ class EmbeddingService:
     ) -> list[list[float]]:
         """Generate embeddings for multiple texts.
 
+        Only texts missing from the embedding cache are run through the
+        model; the model is not loaded at all when every text is cached.
+
         Args:
             texts: Sequence of texts to embed.
             batch_size: Number of texts to process in each batch.
@@ -286,39 +424,113 @@ class EmbeddingService:
         if not non_empty_texts:
             return [[0.0] * self.dimensions for _ in texts]
 
-        self.load()
+        cached: list[list[float] | None] = [None] * len(non_empty_texts)
+        if self._embedding_cache is not None:
+            cached = self._embedding_cache.get_many(
+                self._cache_model_key, non_empty_texts, self._dimensions
+            )
 
-        metrics = get_metrics()
+        # Embed each distinct uncached text once
+        missing = list(
+            dict.fromkeys(
+                text
+                for text, vector in zip(non_empty_texts, cached, strict=True)
+                if vector is None
+            )
+        )
+        generated: dict[str, list[float]] = {}
+
+        delegated = self._embed_via_daemon(missing) if missing else None
+        if delegated is not None:
+            generated = dict(zip(missing, delegated, strict=True))
+            if self._embedding_cache is not None:
+                self._embedding_cache.put_many(self._cache_model_key, generated)
+        elif missing:
+            self.load()
 
-        with trace_operation(
-            "embedding.generate_batch", labels={"batch_size": str(len(texts))}
+            metrics = get_metrics()
+
+            with trace_operation(
+                "embedding.generate_batch", labels={"batch_size": str(len(missing))}
+            ):
+                try:
+                    assert self._model is not None  # For type checker
+                    embeddings = self._model.encode(
+                        missing,
+                        batch_size=batch_size,
+                        show_progress_bar=show_progress,
+                        convert_to_numpy=True,
+                        normalize_embeddings=True,
+                    )
+                    for text, embedding in zip(missing, embeddings, strict=True):
+                        generated[text] = embedding.tolist()
+
+                    metrics.increment(
+                        "embeddings_generated_total", amount=float(len(missing))
+                    )
+                except Exception as e:
+                    raise EmbeddingError(
+                        f"Failed to generate batch embeddings: {e}",
+                        "Check input texts and retry",
+                    ) from e
+
+            if self._embedding_cache is not None:
+                self._embedding_cache.put_many(self._cache_model_key, generated)
+
+        # Reconstruct the full result list
+        result: list[list[float]] = [[0.0] * self.dimensions for _ in texts]
+        for i, text, vector in zip(
+            non_empty_indices, non_empty_texts, cached, strict=True
         ):
-            try:
-                assert self._model is not None  # For type checker
-                embeddings = self._model.encode(
-                    non_empty_texts,
-                    batch_size=batch_size,
-                    show_progress_bar=show_progress,
-                    convert_to_numpy=True,
-                    normalize_embeddings=True,
-                )
+            result[i] = vector if vector is not None else generated[text]
+        return result
 
-                # Reconstruct the full result list
-                result: list[list[float]] = [[0.0] * self.dimensions for _ in texts]
-                for i, embedding in zip(non_empty_indices, embeddings, strict=True):
-                    result[i] = embedding.tolist()
+    def _embed_via_daemon(self, texts: list[str]) -> list[list[float]] | None:
+        """Embed texts with the memory daemon's warm model, if one is running.
 
-                metrics.increment(
-                    "embeddings_generated_total", amount=float(len(non_empty_texts))
-                )
+        Only used while this process has no model of its own. The daemon
+        refuses requests for a model or backend other than the one it
+        serves, so delegated vectors are interchangeable with local ones.
 
-                return result
+        Args:
+            texts: Non-empty texts to embed.
 
-            except Exception as e:
-                raise EmbeddingError(
-                    f"Failed to generate batch embeddings: {e}",
-                    "Check input texts and retry",
-                ) from e
+        Returns:
+            One vector per text, or None if the texts must be embedded
+            in-process (no daemon, or it failed).
+        """
+        if not self._use_daemon or self._model is not None:
+            return None
+
+        from git_notes_memory.daemon import DaemonError, get_daemon_client
+
+        client = get_daemon_client()
+        if client is None:
+            return None
+        vectors: list[list[float]] = []
+        try:
+            # Chunked so each request stays well inside the client timeout
+            for start in range(0, len(texts), _DAEMON_EMBED_CHUNK):
+                vectors.extend(
+                    client.embed_batch(
+                        texts[start : start + _DAEMON_EMBED_CHUNK],
+                        model=self._model_name,
+                        backend=self._backend,
+                    )
+                )
+        except DaemonError as e:
+            logger.debug("Daemon embedding unavailable, loading model: %s", e)
+            return None
+        if len(vectors) != len(texts):
+            logger.debug(
+                "Daemon returned %d vectors for %d texts", len(vectors), len(texts)
+            )
+            return None
+
+        if vectors and self._dimensions is None:
+            self._dimensions = len(vectors[0])
+        get_metrics().increment("embeddings_delegated_total", amount=float(len(texts)))
+        return vectors
 
     def similarity(
         self, embedding1: Sequence[float], embedding2: Sequence[float]
@@ -0,0 +1,248 @@
+"""Persistent cache of text embeddings keyed by content hash.
+
+Embedding inference dominates full reindexes, yet the text being embedded is
+almost always unchanged between runs. EmbeddingCache stores each vector under
+``sha256(model name + text)`` in a small SQLite database so EmbeddingService
+only runs the model for new or changed text, and can skip loading the model
+entirely when every text is a hit.
+
+Cache failures never break embedding: errors are logged, counted as silent
+failures, and treated as misses.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import struct
+import threading
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+
+from git_notes_memory.config import EMBEDDING_CACHE_MAX_ENTRIES
+from git_notes_memory.observability.metrics import get_metrics
+
+__all__ = [
+    "EmbeddingCache",
+    "cache_key",
+]
+
+logger = logging.getLogger(__name__)
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS embeddings (
+    key TEXT PRIMARY KEY,
+    embedding BLOB NOT NULL,
+    created_at TEXT NOT NULL
+)
+"""
+
+_CREATE_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_embeddings_created ON embeddings(created_at)"
+)
+
+# SQLite's default limit on host parameters is 999 on older builds
+_LOOKUP_CHUNK = 500
+
+
+def cache_key(model_name: str, text: str) -> str:
+    """Return the cache key for a text embedded by a given model.
+
+    Args:
+        model_name: Name of the embedding model.
+        text: The embedded text.
+
+    Returns:
+        Hex SHA-256 digest of the model name and text.
+    """
+    digest = hashlib.sha256(model_name.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed map from (model, text) hash to embedding vector.
+
+    The database is opened lazily on first use. When the number of entries
+    exceeds ``max_entries`` the oldest entries are evicted.
+
+    Attributes:
+        db_path: Path to the cache database.
+        max_entries: Maximum number of cached embeddings.
+
+    Example:
+        >>> cache = EmbeddingCache(Path("/tmp/embeddings.db"))
+        >>> cache.put_many("model", {"hello": [0.1, 0.2]})
+        >>> cache.get_many("model", ["hello", "world"])
+        [[0.1..., 0.2...], None]
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_entries: int = EMBEDDING_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            db_path: Path to the cache database (created on first use).
+            max_entries: Maximum number of cached embeddings.
+        """
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._conn: sqlite3.Connection | None = None
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating it if needed."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_CREATE_TABLE)
+            conn.execute(_CREATE_INDEX)
+            conn.commit()
+            row = conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+            self._count = int(row[0]) if row else 0
+            self._conn = conn
+        return self._conn
+
+    def get_many(
+        self,
+        model_name: str,
+        texts: Sequence[str],
+        dimensions: int | None = None,
+    ) -> list[list[float] | None]:
+        """Look up cached embeddings.
+
+        Args:
+            model_name: Name of the embedding model.
+            texts: Texts to look up.
+            dimensions: Expected vector length; entries of another length
+                are treated as misses.
+
+        Returns:
+            One entry per text: the cached vector, or None on a miss.
+        """
+        if not texts:
+            return []
+        keys = [cache_key(model_name, text) for text in texts]
+        found: dict[str, bytes] = {}
+        try:
+            with self._lock:
+                conn = self._connect()
+                unique = list(dict.fromkeys(keys))
+                for start in range(0, len(unique), _LOOKUP_CHUNK):
+                    chunk = unique[start : start + _LOOKUP_CHUNK]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, embedding FROM embeddings WHERE key IN ({placeholders})",  # nosec B608
+                        chunk,
+                    ).fetchall()
+                    found.update((key, blob) for key, blob in rows)
+        except sqlite3.Error as e:
+            self._record_failure("get", e)
+            return [None] * len(texts)
+
+        results: list[list[float] | None] = []
+        for key in keys:
+            blob = found.get(key)
+            count = len(blob) // 4 if blob is not None else 0
+            if blob is None or (dimensions is not None and count != dimensions):
+                results.append(None)
+            else:
+                results.append(list(struct.unpack(f"{count}f", blob)))
+
+        hits = sum(1 for r in results if r is not None)
+        metrics = get_metrics()
+        if hits:
+            metrics.increment("embedding_cache_hits_total", amount=float(hits))
+        if hits < len(results):
+            metrics.increment(
+                "embedding_cache_misses_total", amount=float(len(results) - hits)
+            )
+        return results
+
+    def put_many(
+        self,
+        model_name: str,
+        embeddings: Mapping[str, Sequence[float]],
+    ) -> None:
+        """Store embeddings, evicting the oldest entries beyond max_entries.
+
+        Args:
+            model_name: Name of the embedding model.
+            embeddings: Mapping of text to its embedding vector.
+        """
+        if not embeddings:
+            return
+        now = datetime.now(UTC).isoformat()
+        rows = [
+            (
+                cache_key(model_name, text),
+                struct.pack(f"{len(vector)}f", *vector),
+                now,
+            )
+            for text, vector in embeddings.items()
+        ]
+        try:
+            with self._lock:
+                conn = self._connect()
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO embeddings (key, embedding, created_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+                self._count += conn.total_changes - before
+                if self._count > self.max_entries:
+                    excess = self._count - self.max_entries
+                    conn.execute(
+                        "DELETE FROM embeddings WHERE key IN ("
+                        "SELECT key FROM embeddings ORDER BY created_at LIMIT ?)",
+                        (excess,),
+                    )
+                    self._count -= excess
+                conn.commit()
+        except sqlite3.Error as e:
+            self._record_failure("put", e)
+
+    def clear(self) -> None:
+        """Remove every cached embedding."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("DELETE FROM embeddings")
+                conn.commit()
+                self._count = 0
+        except sqlite3.Error as e:
+            self._record_failure("clear", e)
+
+    def __len__(self) -> int:
+        """Return the number of cached embeddings."""
+        with self._lock:
+            try:
+                self._connect()
+            except sqlite3.Error as e:
+                self._record_failure("count", e)
+            return self._count
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    @staticmethod
+    def _record_failure(operation: str, error: Exception) -> None:
+        logger.warning("Embedding cache %s failed: %s", operation, error)
+        get_metrics().increment(
+            "silent_failures_total",
+            labels={"location": f"embedding_cache.{operation}"},
+        )
@@ -1,7 +1,9 @@
 """Git operations wrapper for memory capture plugin.
 
 Provides a clean interface to Git notes commands with proper error handling.
-All operations use subprocess and parse Git output appropriately.
+Object reads (notes, commits, file snapshots) go through persistent
+``git cat-file`` coprocesses pooled per repository (see cat_file); writes,
+diffs and configuration run one git subprocess per call.
 
 Security:
 - All refs are validated via validate_git_ref() before use
@@ -17,15 +19,31 @@ Git Notes Architecture:
 
 from __future__ import annotations
 
+import codecs
+import itertools
 import logging
 import re
 import subprocess
+import threading
 import time
 import warnings
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from git_notes_memory.config import NAMESPACES, get_git_namespace
+from git_notes_memory.cat_file import CatFileObject, get_cat_file
+from git_notes_memory.config import (
+    COMMIT_INFO_CACHE_MAX_ENTRIES,
+    GIT_FETCH_TIMEOUT_SECONDS,
+    GIT_NOTES_MERGE_MAX_WORKERS,
+    MAX_FILE_SIZE,
+    MAX_HYDRATION_TOTAL_BYTES,
+    NAMESPACES,
+    get_git_namespace,
+)
 from git_notes_memory.exceptions import (
     INVALID_NAMESPACE_ERROR,
     StorageError,
@@ -54,6 +72,35 @@ __all__ = [
 # Core sync config keys that must be True for git notes sync to work
 SYNC_CORE_KEYS: tuple[str, ...] = ("push", "fetch", "rewrite", "merge")
 
+# Paths in a notes tree are the annotated commit's SHA (SHA-1 or SHA-256),
+# possibly split into fan-out directories (e.g. "ab/cdef...")
+_NOTE_PATH_PATTERN = re.compile(r"^(?:[0-9a-f]{40}|[0-9a-f]{64})$")
+
+# Fan-out subtree names in a notes tree (e.g. "ab")
+_FANOUT_DIR_PATTERN = re.compile(r"^[0-9a-f]{2}$")
+
+# Tree entry mode of a subtree
+_TREE_MODE = "40000"
+
+# Note paths tried per commit: flat, then one and two fan-out levels
+_NOTE_FANOUT_DEPTHS = 3
+
+# Commits looked up per cat-file request when streaming notes
+_NOTE_LOOKUP_CHUNK = 256
+
+# git treats a blob as binary if a NUL byte appears in its first 8000 bytes
+_BINARY_SNIFF_BYTES = 8000
+
+# Remote-tracking notes refs written by fetch, and the tracking commit last
+# merged into each namespace (sync skips namespaces where the two match)
+_TRACKING_REF_PREFIX = "refs/notes/origin/mem"
+_MERGED_REF_PREFIX = "refs/notes/origin/merged"
+
+# Commit objects are immutable, so parsed metadata is cached by full SHA
+# across GitOps instances and repositories (LRU)
+_commit_info_cache: OrderedDict[str, CommitInfo] = OrderedDict()
+_commit_info_cache_lock = threading.Lock()
+
 
 # =============================================================================
 # Git Version Detection
@@ -172,6 +219,122 @@ def validate_path(path: str) -> None:
         )
 
 
+# =============================================================================
+# Object Parsing
+# =============================================================================
+
+
+def _note_paths(commit_sha: str) -> list[str]:
+    """Candidate paths of a commit's note in a notes tree.
+
+    git stores notes flat ("<sha>") until the tree grows, then moves them
+    under fan-out directories ("ab/cdef...", "ab/cd/ef...").
+
+    Args:
+        commit_sha: Full annotated commit SHA.
+
+    Returns:
+        Paths to try, shallowest first.
+    """
+    return [
+        "/".join(
+            [commit_sha[i : i + 2] for i in range(0, 2 * depth, 2)]
+            + [commit_sha[2 * depth :]]
+        )
+        for depth in range(_NOTE_FANOUT_DEPTHS)
+    ]
+
+
+def _parse_tree(content: bytes, oid_size: int) -> list[tuple[str, str, str]]:
+    """Parse a raw tree object.
+
+    Entries are ``<mode> <name>\\0<binary oid>``.
+
+    Args:
+        content: Tree object content.
+        oid_size: Binary object ID length (20 for SHA-1, 32 for SHA-256).
+
+    Returns:
+        (mode, name, hex oid) per entry.
+    """
+    entries: list[tuple[str, str, str]] = []
+    pos = 0
+    while pos < len(content):
+        space = content.index(b" ", pos)
+        nul = content.index(b"\0", space)
+        end = nul + 1 + oid_size
+        entries.append(
+            (
+                content[pos:space].decode(),
+                content[space + 1 : nul].decode("utf-8", "replace"),
+                content[nul + 1 : end].hex(),
+            )
+        )
+        pos = end
+    return entries
+
+
+def _parse_commit(oid: str, content: bytes) -> CommitInfo | None:
+    """Parse a raw commit object into the fields of ``git log --format``.
+
+    The date matches ``%aI`` (strict ISO 8601 in the author's timezone) and
+    the message matches ``%s`` (the first paragraph, lines joined by spaces).
+
+    Args:
+        oid: Commit object ID.
+        content: Commit object content.
+
+    Returns:
+        The commit info, or None if the object has no author line.
+    """
+    raw_headers, _, raw_message = content.partition(b"\n\n")
+    encoding = "utf-8"
+    author = None
+    for header in raw_headers.split(b"\n"):
+        if header.startswith(b"author "):
+            author = header[len(b"author ") :]
+        elif header.startswith(b"encoding "):
+            encoding = header[len(b"encoding ") :].decode("ascii", "replace")
+    if author is None:
+        return None
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        encoding = "utf-8"
+
+    # "Name <email> <epoch seconds> <+hhmm>"
+    ident = author.decode(encoding, "replace")
+    lt = ident.find("<")
+    gt = ident.find(">", lt)
+    if lt < 0 or gt < 0:
+        return None
+    stamp = ident[gt + 1 :].split()
+    try:
+        seconds = int(stamp[0])
+        offset = stamp[1] if len(stamp) > 1 else "+0000"
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        tz = timezone(-delta if offset.startswith("-") else delta)
+    except (IndexError, ValueError):
+        return None
+
+    subject: list[str] = []
+    for line in raw_message.decode(encoding, "replace").split("\n"):
+        line = line.rstrip()
+        if not line:
+            if subject:
+                break
+            continue
+        subject.append(line)
+
+    return CommitInfo(
+        sha=oid,
+        author_name=ident[:lt].rstrip(),
+        author_email=ident[lt + 1 : gt],
+        date=datetime.fromtimestamp(seconds, tz).isoformat(),
+        message=" ".join(subject),
+    )
+
+
 # =============================================================================
 # GitOps Class
 # =============================================================================
@@ -199,6 +362,7 @@ class GitOps:
             repo_path: Path to git repository root. If None, uses cwd.
         """
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
+        self._common_dir: Path | None = None
 
     def _run_git(
         self,
@@ -207,6 +371,7 @@ class GitOps:
         check: bool = True,
         capture_output: bool = True,
         timeout: float = 30.0,
+        input: str | None = None,
     ) -> subprocess.CompletedProcess[str]:
         """Run a git command in the repository.
 
@@ -216,6 +381,7 @@ class GitOps:
             capture_output: Capture stdout/stderr.
             timeout: Maximum time to wait for command (seconds). Default 30.0.
                 HIGH-001: Prevents indefinite hangs on slow/unresponsive systems.
+            input: Text to feed to the command's stdin.
 
         Returns:
             CompletedProcess result.
@@ -238,6 +404,7 @@ class GitOps:
                     capture_output=capture_output,
                     text=True,
                     timeout=timeout,
+                    input=input,
                 )
 
             # Record git command execution time
@@ -318,6 +485,26 @@ class GitOps:
                 "Git operation is taking too long; check for network issues or large repository",
             ) from e
 
+    def _cat_file(
+        self,
+        names: Sequence[str],
+        *,
+        check: bool = False,
+    ) -> list[CatFileObject | None]:
+        """Read objects through the repository's pooled cat-file process.
+
+        Args:
+            names: Object names (``<oid>``, ``<rev>:<path>``, ...).
+            check: Read headers only (``--batch-check``).
+
+        Returns:
+            One entry per name: the object, or None if missing.
+
+        Raises:
+            StorageError: If git times out or keeps failing.
+        """
+        return get_cat_file(self.repo_path, check=check).request(names)
+
     def _note_ref(self, namespace: str) -> str:
         """Get the full ref name for a namespace.
 
@@ -461,30 +648,55 @@ class GitOps:
 
         Raises:
             ValidationError: If namespace or commit is invalid.
+            StorageError: If git cannot be read.
         """
         self._validate_namespace(namespace)
         self._validate_git_ref(commit)
 
-        result = self._run_git(
-            ["notes", f"--ref={self._note_ref(namespace)}", "show", commit],
-            check=False,
-        )
+        _sha, content = next(self.iter_notes_batch(namespace, [commit]))
+        return content
 
-        if result.returncode != 0:
-            return None
+    def get_note_oid(self, namespace: str, commit_sha: str) -> str | None:
+        """Get the blob OID of a commit's note without reading the note.
+
+        A single ``--batch-check`` request through the pooled cat-file
+        process looks the note up at its flat and fan-out paths. The OID
+        changes whenever the note's content does.
+
+        Args:
+            namespace: Memory namespace.
+            commit_sha: Full SHA of the annotated commit.
+
+        Returns:
+            The note blob OID, or None if the commit has no note.
+
+        Raises:
+            ValidationError: If namespace or commit SHA is invalid.
+            StorageError: If git cannot be read.
+        """
+        self._validate_namespace(namespace)
+        self._validate_git_ref(commit_sha)
+        if not _NOTE_PATH_PATTERN.match(commit_sha):
+            raise ValidationError(
+                f"Not a full commit SHA: {commit_sha}",
+                "Resolve the commit with get_commit_sha() first",
+            )
 
-        return result.stdout
+        ref = self._note_ref(namespace)
+        headers = self._cat_file(
+            [f"{ref}:{path}" for path in _note_paths(commit_sha)], check=True
+        )
+        return next((obj.oid for obj in headers if obj is not None), None)
 
     def show_notes_batch(
         self,
         namespace: str,
         commit_shas: list[str],
     ) -> dict[str, str | None]:
-        """Show multiple notes in a single subprocess call.
+        """Show multiple notes through the pooled cat-file process.
 
-        Uses `git cat-file --batch` for efficient bulk retrieval.
-        This is significantly faster than calling show_note() in a loop
-        when fetching many notes.
+        Collects iter_notes_batch() into a dict. This is significantly
+        faster than calling show_note() in a loop when fetching many notes.
 
         Args:
             namespace: Memory namespace.
@@ -495,100 +707,75 @@ class GitOps:
 
         Raises:
             ValidationError: If namespace is invalid.
+            StorageError: If git cannot be read.
         """
-        if not commit_shas:
-            return {}
+        return dict(self.iter_notes_batch(namespace, commit_shas))
 
-        self._validate_namespace(namespace)
-        for sha in commit_shas:
-            self._validate_git_ref(sha)
+    def iter_notes_batch(
+        self,
+        namespace: str,
+        commit_shas: Sequence[str],
+    ) -> Iterator[tuple[str, str | None]]:
+        """Stream notes for many commits through ``git cat-file --batch``.
+
+        The notes ref is resolved to its tree once, so every note of a call
+        comes from the same snapshot. Each note is looked up at its flat
+        path and at the fan-out paths git switches to as the tree grows
+        ("ab/cdef...", "ab/cd/ef..."), in pipelined requests of
+        _NOTE_LOOKUP_CHUNK commits, so only one chunk is held in memory at a
+        time. Content is framed by size, so notes containing CRLF or blank
+        lines round-trip unchanged; invalid UTF-8 is replaced rather than
+        failing the batch.
 
-        # Build object references: notes ref points to the note object for each commit
-        # Format: refs/notes/mem/namespace:commit_sha
-        ref = self._note_ref(namespace)
-        objects_input = "\n".join(f"{ref}:{sha}" for sha in commit_shas)
+        Args:
+            namespace: Memory namespace.
+            commit_shas: Commit SHAs (or refs) to get notes for.
 
-        # Run cat-file --batch to get all notes at once
-        cmd = ["git", "-C", str(self.repo_path), "cat-file", "--batch"]
+        Yields:
+            (commit_sha, note content or None if no note), in input order.
 
-        try:
-            result = subprocess.run(
-                cmd,
-                input=objects_input,
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-        except Exception:
-            # Fallback to sequential if batch fails
-            return {sha: self.show_note(namespace, sha) for sha in commit_shas}
-
-        # Parse batch output
-        # Format per object:
-        #   <sha> <type> <size>\n
-        #   <content>\n
-        # Or for missing:
-        #   <ref> missing\n
-        results: dict[str, str | None] = {}
-        lines: list[str] = result.stdout.split("\n")
-        i = 0
-        sha_index = 0
-
-        while i < len(lines) and sha_index < len(commit_shas):
-            line = lines[i]
-            current_sha = commit_shas[sha_index]
-
-            # Check for missing object (format: "<ref> missing")
-            header_parts = line.split()
-            if len(header_parts) == 2 and header_parts[1] == "missing":
-                results[current_sha] = None
-                i += 1
-                sha_index += 1
-            elif line and not line.startswith(" "):
-                # Header line: <object_sha> <type> <size>
-                parts = header_parts
-                if len(parts) >= 3:
-                    try:
-                        size = int(parts[2])
-                        # Content follows on next lines until size bytes consumed
-                        # Note: git cat-file --batch output format has content
-                        # followed by a newline separator. We track bytes consumed
-                        # including newlines between lines (but not trailing).
-                        content_lines: list[str] = []
-                        bytes_read = 0
-                        i += 1
-                        while bytes_read < size and i < len(lines):
-                            content_line = lines[i]
-                            line_bytes = len(content_line.encode("utf-8"))
-                            # Account for newline except after last content line
-                            if bytes_read + line_bytes >= size:
-                                # Last line of content
-                                content_lines.append(content_line)
-                                bytes_read += line_bytes
-                            else:
-                                # More content follows; add newline byte
-                                content_lines.append(content_line)
-                                bytes_read += line_bytes + 1
-                            i += 1
-                        results[current_sha] = "\n".join(content_lines)
-                        sha_index += 1
-                    except (ValueError, IndexError):
-                        results[current_sha] = None
-                        sha_index += 1
-                        i += 1
-                else:
-                    # Malformed header; treat as missing for current SHA
-                    results[current_sha] = None
-                    sha_index += 1
-                    i += 1
-            else:
-                i += 1
+        Raises:
+            ValidationError: If namespace or a commit SHA is invalid.
+            StorageError: If git cannot be read.
+        """
+        if not commit_shas:
+            return
 
-        # Fill in any remaining SHAs as None
-        for remaining_sha in commit_shas[sha_index:]:
-            results[remaining_sha] = None
+        self._validate_namespace(namespace)
+        for sha in commit_shas:
+            self._validate_git_ref(sha)
 
-        return results
+        # Resolve the notes tree and any abbreviated SHAs or refs in one request
+        unresolved = [sha for sha in commit_shas if not _NOTE_PATH_PATTERN.match(sha)]
+        headers = self._cat_file(
+            [f"{self._note_ref(namespace)}^{{tree}}", *unresolved], check=True
+        )
+        tree = headers[0]
+        if tree is None:
+            for sha in commit_shas:
+                yield sha, None
+            return
+        resolved = {
+            name: obj.oid
+            for name, obj in zip(unresolved, headers[1:], strict=True)
+            if obj is not None
+        }
+
+        for start in range(0, len(commit_shas), _NOTE_LOOKUP_CHUNK):
+            chunk = commit_shas[start : start + _NOTE_LOOKUP_CHUNK]
+            candidates = [
+                [f"{tree.oid}:{path}" for path in _note_paths(oid)]
+                if (oid := resolved.get(sha, sha)) and _NOTE_PATH_PATTERN.match(oid)
+                else []
+                for sha in chunk
+            ]
+            objects = iter(self._cat_file([n for names in candidates for n in names]))
+            for sha, names in zip(chunk, candidates, strict=True):
+                found = [obj for obj in itertools.islice(objects, len(names)) if obj]
+                yield (
+                    sha,
+                    found[0].content.decode("utf-8", "replace") if found else None,
+                )
 
     def list_notes(
         self,
@@ -596,34 +783,202 @@ class GitOps:
     ) -> list[tuple[str, str]]:
         """List all notes in a namespace.
 
+        Walks the notes tree (and its fan-out subtrees, one cat-file request
+        per level) rather than running ``git notes list``.
+
         Args:
             namespace: Memory namespace.
 
         Returns:
-            List of (note_object_sha, commit_sha) tuples.
+            List of (note_object_sha, commit_sha) tuples, sorted by commit.
 
         Raises:
             ValidationError: If namespace is invalid.
+            StorageError: If git cannot be read.
         """
         self._validate_namespace(namespace)
 
+        tree = f"{self._note_ref(namespace)}^{{tree}}"
+        return self._walk_notes_trees({namespace: tree}).get(namespace, [])
+
+    def list_notes_refs(self) -> dict[str, str]:
+        """Resolve every namespace's notes ref with one ``git for-each-ref``.
+
+        Returns:
+            Dict mapping namespace to its notes commit SHA, for namespaces
+            that have a notes ref.
+        """
+        base = get_git_namespace()
         result = self._run_git(
-            ["notes", f"--ref={self._note_ref(namespace)}", "list"],
+            ["for-each-ref", "--format=%(objectname) %(refname)", f"{base}/"],
             check=False,
         )
+        if result.returncode != 0:
+            return {}
+
+        refs: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            sha, _, refname = line.partition(" ")
+            namespace = refname.removeprefix(f"{base}/")
+            if namespace in NAMESPACES:
+                refs[namespace] = sha
+        return refs
 
-        if result.returncode != 0 or not result.stdout.strip():
-            return []
+    def list_all_notes(self) -> dict[str, list[tuple[str, str]]]:
+        """List the notes of every namespace in one pass.
 
-        notes = []
-        for line in result.stdout.strip().split("\n"):
-            parts = line.split()
-            if len(parts) >= 2:
-                note_sha, commit_sha = parts[0], parts[1]
-                notes.append((note_sha, commit_sha))
+        Enumerates the notes refs with list_notes_refs(), so namespaces
+        without notes cost nothing, then walks all notes trees together
+        with one cat-file request per tree level.
 
+        Returns:
+            Dict mapping namespace to (note_object_sha, commit_sha) tuples
+            sorted by commit. Namespaces without notes are omitted.
+
+        Raises:
+            StorageError: If git cannot be read.
+        """
+        refs = self.list_notes_refs()
+        listing = self._walk_notes_trees(
+            {namespace: f"{sha}^{{tree}}" for namespace, sha in refs.items()}
+        )
+        return {namespace: notes for namespace, notes in listing.items() if notes}
+
+    def iter_all_notes(self) -> Iterator[tuple[str, str, str | None]]:
+        """Stream every note of every namespace through one cat-file process.
+
+        Notes are listed with list_all_notes() and their bodies read by
+        blob ID in pipelined requests of _NOTE_LOOKUP_CHUNK notes.
+
+        Yields:
+            (namespace, commit_sha, note content or None if unreadable),
+            grouped by namespace and sorted by commit within each.
+
+        Raises:
+            StorageError: If git cannot be read.
+        """
+        entries = [
+            (namespace, note_sha, commit_sha)
+            for namespace, notes in self.list_all_notes().items()
+            for note_sha, commit_sha in notes
+        ]
+        for start in range(0, len(entries), _NOTE_LOOKUP_CHUNK):
+            chunk = entries[start : start + _NOTE_LOOKUP_CHUNK]
+            objects = self._cat_file([note_sha for _ns, note_sha, _commit in chunk])
+            for (namespace, _note_sha, commit_sha), obj in zip(
+                chunk, objects, strict=True
+            ):
+                yield (
+                    namespace,
+                    commit_sha,
+                    obj.content.decode("utf-8", "replace") if obj else None,
+                )
+
+    def _walk_notes_trees(
+        self,
+        roots: dict[str, str],
+    ) -> dict[str, list[tuple[str, str]]]:
+        """List the notes in several notes trees.
+
+        All trees are walked together, one cat-file request per level of
+        fan-out directories.
+
+        Args:
+            roots: Mapping of namespace to a name resolving to its notes tree.
+
+        Returns:
+            Dict mapping each namespace to (note_object_sha, commit_sha)
+            tuples sorted by commit.
+        """
+        notes: dict[str, list[tuple[str, str]]] = {ns: [] for ns in roots}
+        pending = [(namespace, "", name) for namespace, name in roots.items()]
+        while pending:
+            subtrees: list[tuple[str, str, str]] = []
+            objects = self._cat_file([name for _ns, _prefix, name in pending])
+            for (namespace, prefix, _name), obj in zip(pending, objects, strict=True):
+                if obj is None or obj.type != "tree":
+                    continue
+                for mode, name, oid in _parse_tree(obj.content, len(obj.oid) // 2):
+                    path = prefix + name
+                    if mode == _TREE_MODE and _FANOUT_DIR_PATTERN.match(name):
+                        subtrees.append((namespace, path, oid))
+                    elif _NOTE_PATH_PATTERN.match(path):
+                        notes[namespace].append((oid, path))
+            pending = subtrees
+
+        for namespace_notes in notes.values():
+            namespace_notes.sort(key=lambda note: note[1])
         return notes
 
+    def get_notes_ref_sha(self, namespace: str) -> str | None:
+        """Resolve the notes ref of a namespace to its current commit.
+
+        Args:
+            namespace: Memory namespace.
+
+        Returns:
+            The notes commit SHA, or None if the namespace has no notes ref.
+
+        Raises:
+            ValidationError: If namespace is invalid.
+            StorageError: If git cannot be read.
+        """
+        self._validate_namespace(namespace)
+
+        obj = self._cat_file([self._note_ref(namespace)], check=True)[0]
+        return obj.oid if obj is not None else None
+
+    def diff_notes(
+        self,
+        old_ref_sha: str,
+        new_ref_sha: str,
+    ) -> tuple[list[str], list[str]]:
+        """Find notes that differ between two commits of a notes ref.
+
+        Diffs the two notes trees with a single ``git diff-tree``, so the
+        cost is proportional to the number of changed notes rather than
+        the total. Fan-out reorganization (git moving "<sha>" to
+        "<sh>/<a...>") shows up as a delete plus an add of the same commit
+        and is reported as a change.
+
+        Args:
+            old_ref_sha: Notes commit previously seen.
+            new_ref_sha: Current notes commit.
+
+        Returns:
+            Tuple of (changed, removed) annotated commit SHAs, where changed
+            covers added and modified notes.
+
+        Raises:
+            ValidationError: If either SHA is invalid.
+            StorageError: If the diff fails (e.g. the old commit was pruned).
+        """
+        self._validate_git_ref(old_ref_sha)
+        self._validate_git_ref(new_ref_sha)
+
+        result = self._run_git(
+            [
+                "diff-tree",
+                "-r",
+                "--no-renames",
+                "--name-status",
+                old_ref_sha,
+                new_ref_sha,
+            ]
+        )
+
+        statuses: dict[str, set[str]] = {}
+        for line in result.stdout.splitlines():
+            status, _, path = line.partition("\t")
+            commit_sha = path.replace("/", "")
+            if not status or not _NOTE_PATH_PATTERN.match(commit_sha):
+                continue
+            statuses.setdefault(commit_sha, set()).add(status[0])
+
+        changed = [sha for sha, seen in statuses.items() if seen != {"D"}]
+        removed = [sha for sha, seen in statuses.items() if seen == {"D"}]
+        return changed, removed
+
     def remove_note(
         self,
         namespace: str,
@@ -668,12 +1023,20 @@ class GitOps:
             StorageError: If ref cannot be resolved.
         """
         self._validate_git_ref(ref)
-        result = self._run_git(["rev-parse", ref])
-        return result.stdout.strip()
+        obj = self._cat_file([ref], check=True)[0]
+        if obj is None:
+            raise StorageError(
+                f"Could not resolve ref {ref}",
+                "Verify the ref exists in the repository",
+            )
+        return obj.oid
 
     def get_commit_info(self, commit: str = "HEAD") -> CommitInfo:
         """Get metadata about a commit.
 
+        Reads the raw commit object through the pooled cat-file process;
+        see get_commit_info_batch().
+
         Args:
             commit: Commit ref.
 
@@ -684,32 +1047,62 @@ class GitOps:
             ValidationError: If commit format is invalid.
             StorageError: If commit cannot be found.
         """
-        self._validate_git_ref(commit)
-
-        # Get commit metadata in one call
-        result = self._run_git(
-            [
-                "log",
-                "-1",
-                "--format=%H%n%an%n%ae%n%aI%n%s",
-                commit,
-            ]
-        )
-
-        lines = result.stdout.strip().split("\n")
-        if len(lines) < 5:
+        info = self.get_commit_info_batch([commit]).get(commit)
+        if info is None:
             raise StorageError(
                 f"Could not parse commit info for {commit}",
                 "Verify the commit exists in the repository",
             )
+        return info
 
-        return CommitInfo(
-            sha=lines[0],
-            author_name=lines[1],
-            author_email=lines[2],
-            date=lines[3],
-            message=lines[4],
-        )
+    def get_commit_info_batch(self, commits: Sequence[str]) -> dict[str, CommitInfo]:
+        """Get metadata for many commits in one cat-file request.
+
+        Results for full SHAs are served from an LRU cache shared by all
+        GitOps instances (commit objects never change); the remaining
+        commits are read and parsed in a single pipelined request.
+
+        Args:
+            commits: Commit SHAs or refs.
+
+        Returns:
+            Dict mapping each requested commit to its CommitInfo. Commits
+            that cannot be found are omitted.
+
+        Raises:
+            ValidationError: If a commit format is invalid.
+            StorageError: If git cannot be read.
+        """
+        for commit in commits:
+            self._validate_git_ref(commit)
+
+        infos: dict[str, CommitInfo] = {}
+        with _commit_info_cache_lock:
+            for commit in commits:
+                cached = _commit_info_cache.get(commit)
+                if cached is not None:
+                    _commit_info_cache.move_to_end(commit)
+                    infos[commit] = cached
+
+        pending = list(dict.fromkeys(c for c in commits if c not in infos))
+        if pending:
+            objects = self._cat_file([f"{commit}^{{commit}}" for commit in pending])
+            parsed: list[CommitInfo] = []
+            for commit, obj in zip(pending, objects, strict=True):
+                info = _parse_commit(obj.oid, obj.content) if obj else None
+                if info is not None:
+                    infos[commit] = info
+                    parsed.append(info)
+
+            with _commit_info_cache_lock:
+                for info in parsed:
+                    _commit_info_cache[info.sha] = info
+                    _commit_info_cache.move_to_end(info.sha)
+                while len(_commit_info_cache) > COMMIT_INFO_CACHE_MAX_ENTRIES:
+                    _commit_info_cache.popitem(last=False)
+
+        # Keep the caller's order regardless of which commits were cached
+        return {commit: infos[commit] for commit in commits if commit in infos}
 
     def get_file_at_commit(
         self,
@@ -727,19 +1120,16 @@ class GitOps:
 
         Raises:
             ValidationError: If path or commit format is invalid.
+            StorageError: If git cannot be read.
         """
         validate_path(path)
         self._validate_git_ref(commit)
 
-        result = self._run_git(
-            ["show", f"{commit}:{path}"],
-            check=False,
-        )
-
-        if result.returncode != 0:
+        obj = self._cat_file([f"{commit}:{path}"])[0]
+        if obj is None or obj.type != "blob":
             return None
 
-        return result.stdout
+        return obj.content.decode("utf-8", "replace")
 
     def get_changed_files(self, commit: str = "HEAD") -> list[str]:
         """Get list of files changed in a commit.
@@ -759,6 +1149,122 @@ class GitOps:
 
         return [f for f in result.stdout.strip().split("\n") if f]
 
+    def get_changed_files_batch(self, commits: Sequence[str]) -> dict[str, list[str]]:
+        """Get the files changed by many commits from one ``git diff-tree``.
+
+        Lists the same paths as get_changed_files() (a root commit lists
+        every file, a merge its combined diff), but feeds all commits to a
+        single ``diff-tree --stdin``. Paths git would have to quote (control
+        characters) are skipped.
+
+        Args:
+            commits: Commit SHAs or refs.
+
+        Returns:
+            Dict mapping each requested commit to its changed paths.
+            Commits that cannot be resolved are omitted.
+
+        Raises:
+            ValidationError: If a commit format is invalid.
+            StorageError: If git fails.
+        """
+        for commit in commits:
+            self._validate_git_ref(commit)
+        unique = list(dict.fromkeys(commits))
+        if not unique:
+            return {}
+
+        # diff-tree echoes each commit's full SHA before its paths
+        headers = self._cat_file([f"{c}^{{commit}}" for c in unique], check=True)
+        oids = {c: obj.oid for c, obj in zip(unique, headers, strict=True) if obj}
+        if not oids:
+            return {}
+        expected = set(oids.values())
+
+        result = self._run_git(
+            [
+                "-c",
+                "core.quotePath=false",
+                "diff-tree",
+                "--stdin",
+                "-r",
+                "--root",
+                "--cc",
+                "--name-only",
+                "--always",
+            ],
+            input="".join(f"{oid}\n" for oid in dict.fromkeys(oids.values())),
+        )
+
+        by_oid: dict[str, list[str]] = {}
+        current: list[str] | None = None
+        for line in result.stdout.splitlines():
+            if line in expected and line not in by_oid:
+                current = by_oid[line] = []
+            elif current is not None and line and not line.startswith('"'):
+                current.append(line)
+
+        return {c: by_oid[oid] for c, oid in oids.items() if oid in by_oid}
+
+    def get_files_at_commits(
+        self,
+        paths: Sequence[tuple[str, str]],
+        *,
+        max_file_bytes: int = MAX_FILE_SIZE,
+        max_total_bytes: int = MAX_HYDRATION_TOTAL_BYTES,
+    ) -> dict[tuple[str, str], str]:
+        """Load many file snapshots through the pooled cat-file processes.
+
+        Every ``<commit>:<path>`` is resolved in one ``--batch-check``
+        request, then each distinct blob is read once in one ``--batch``
+        request, so snapshots of the same file version share a read.
+        Skipped: paths that are missing or not files, blobs larger than
+        max_file_bytes, binary blobs, and blobs that would take the total
+        past max_total_bytes (earlier pairs take priority).
+
+        Args:
+            paths: (commit, path) pairs, in priority order.
+            max_file_bytes: Largest blob to load.
+            max_total_bytes: Budget for all distinct blobs loaded.
+
+        Returns:
+            Dict mapping (commit, path) to file content for loaded files.
+
+        Raises:
+            ValidationError: If a path or commit format is invalid.
+            StorageError: If git cannot be read.
+        """
+        for commit, path in paths:
+            validate_path(path)
+            self._validate_git_ref(commit)
+        unique = list(dict.fromkeys(paths))
+        if not unique:
+            return {}
+
+        headers = self._cat_file([f"{c}:{p}" for c, p in unique], check=True)
+        blob_of: dict[tuple[str, str], str] = {}
+        budget = max_total_bytes
+        blobs: dict[str, str | None] = {}
+        for key, obj in zip(unique, headers, strict=True):
+            if obj is None or obj.type != "blob" or obj.size > max_file_bytes:
+                continue
+            if obj.oid not in blobs:
+                if obj.size > budget:
+                    continue
+                budget -= obj.size
+                blobs[obj.oid] = None
+            blob_of[key] = obj.oid
+
+        for oid, blob in zip(list(blobs), self._cat_file(list(blobs)), strict=True):
+            if blob is not None and b"\0" not in blob.content[:_BINARY_SNIFF_BYTES]:
+                blobs[oid] = blob.content.decode("utf-8", "replace")
+
+        return {
+            key: text
+            for key, oid in blob_of.items()
+            if (text := blobs.get(oid)) is not None
+        }
+
     # =========================================================================
     # Sync Configuration
     # =========================================================================
@@ -991,39 +1497,35 @@ class GitOps:
         Fetches notes from the remote to refs/notes/origin/mem/* tracking refs.
         This allows local notes to remain unchanged while remote state is captured.
 
+        All namespaces come down in one ``git fetch`` with a wildcard refspec,
+        so the sync costs a single network round trip and a namespace the
+        remote does not have yet is not an error.
+
         Args:
-            namespaces: Specific namespaces to fetch, or None for all.
+            namespaces: Specific namespaces to report, or None for all.
 
         Returns:
             Dict mapping namespace to fetch success.
         """
         base = get_git_namespace()
         ns_list = namespaces if namespaces is not None else list(NAMESPACES)
-        results: dict[str, bool] = {}
-        metrics = get_metrics()
 
-        for ns in ns_list:
-            try:
-                local_ref = f"{base}/{ns}"
-                tracking_ref = f"refs/notes/origin/mem/{ns}"
-                result = self._run_git(
-                    ["fetch", "origin", f"+{local_ref}:{tracking_ref}"],
-                    check=False,
-                )
-                results[ns] = result.returncode == 0
-            except Exception as e:
-                logger.warning(
-                    "Failed to fetch notes for namespace %s: %s",
-                    ns,
-                    e,
-                )
-                metrics.increment(
-                    "silent_failures_total",
-                    labels={"location": "git_ops.fetch_notes"},
-                )
-                results[ns] = False
+        try:
+            result = self._run_git(
+                ["fetch", "origin", f"+{base}/*:{_TRACKING_REF_PREFIX}/*"],
+                check=False,
+                timeout=GIT_FETCH_TIMEOUT_SECONDS,
+            )
+            success = result.returncode == 0
+        except Exception as e:
+            logger.warning("Failed to fetch notes from origin: %s", e)
+            get_metrics().increment(
+                "silent_failures_total",
+                labels={"location": "git_ops.fetch_notes"},
+            )
+            success = False
 
-        return results
+        return dict.fromkeys(ns_list, success)
 
     def merge_notes_from_tracking(
         self,
@@ -1043,29 +1545,120 @@ class GitOps:
         if namespace not in NAMESPACES:
             raise INVALID_NAMESPACE_ERROR
 
-        tracking_ref = f"refs/notes/origin/mem/{namespace}"
+        return self.merge_notes_from_tracking_batch([namespace])[namespace]
 
-        # Check if tracking ref exists
-        result = self._run_git(
-            ["rev-parse", tracking_ref],
-            check=False,
+    def merge_notes_from_tracking_batch(
+        self,
+        namespaces: list[str] | None = None,
+        *,
+        merged: set[str] | None = None,
+    ) -> dict[str, bool]:
+        """Merge the tracking refs of several namespaces into local notes.
+
+        Tracking refs and the tracking commit last merged into each
+        namespace are read with one ``git for-each-ref``. Namespaces whose
+        tracking ref has not moved since their last merge are skipped; the
+        rest are merged concurrently (namespaces are independent notes
+        refs) and the merged commits recorded with one ``git update-ref``.
+
+        Args:
+            namespaces: Namespaces to merge, or None for all.
+            merged: Optional set that receives the namespaces actually
+                merged, i.e. not skipped, so callers can tell whether local
+                notes may have changed.
+
+        Returns:
+            Dict mapping namespace to True if it was merged, skipped or has
+            no tracking ref, False if the merge failed.
+
+        Raises:
+            ValidationError: If a namespace is invalid.
+        """
+        ns_list = namespaces if namespaces is not None else list(NAMESPACES)
+        for ns in ns_list:
+            self._validate_namespace(ns)
+
+        refs = self._list_sync_refs()
+        results = dict.fromkeys(ns_list, True)
+        pending = [
+            (ns, tracking_sha)
+            for ns in ns_list
+            if (tracking_sha := refs.get(f"{_TRACKING_REF_PREFIX}/{ns}"))
+            and (
+                tracking_sha != refs.get(f"{_MERGED_REF_PREFIX}/{ns}")
+                or self._note_ref(ns) not in refs
+            )
+        ]
+        if not pending:
+            return results
+
+        workers = min(len(pending), GIT_NOTES_MERGE_MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = executor.map(lambda item: self._merge_notes(*item), pending)
+            for (ns, _tracking_sha), success in zip(pending, outcomes, strict=True):
+                results[ns] = success
+                if success and merged is not None:
+                    merged.add(ns)
+
+        updates = "".join(
+            f"update {_MERGED_REF_PREFIX}/{ns} {tracking_sha}\n"
+            for ns, tracking_sha in pending
+            if results[ns]
         )
-        if result.returncode != 0:
-            # No tracking ref to merge - not an error
-            return True
+        if updates:
+            # Not recording a merge only costs a redundant merge next sync
+            self._run_git(["update-ref", "--stdin"], check=False, input=updates)
+        return results
+
+    def _list_sync_refs(self) -> dict[str, str]:
+        """Read local notes, tracking and last-merged refs in one call.
 
-        # Merge using configured cat_sort_uniq strategy
+        Returns:
+            Dict mapping full ref name to commit SHA.
+        """
         result = self._run_git(
             [
-                "notes",
-                f"--ref=mem/{namespace}",
-                "merge",
-                "-s",
-                "cat_sort_uniq",
-                tracking_ref,
+                "for-each-ref",
+                "--format=%(objectname) %(refname)",
+                f"{get_git_namespace()}/",
+                f"{_TRACKING_REF_PREFIX}/",
+                f"{_MERGED_REF_PREFIX}/",
             ],
             check=False,
         )
+        if result.returncode != 0:
+            return {}
+        refs: dict[str, str] = {}
+        for line in result.stdout.splitlines():
+            sha, _, refname = line.partition(" ")
+            refs[refname] = sha
+        return refs
+
+    def _merge_notes(self, namespace: str, tracking_sha: str) -> bool:
+        """Merge one tracking commit into a namespace's notes ref.
+
+        Args:
+            namespace: Namespace to merge into.
+            tracking_sha: Tracking commit to merge.
+
+        Returns:
+            True if the merge succeeded.
+        """
+        try:
+            result = self._run_git(
+                [
+                    "notes",
+                    f"--ref={self._note_ref(namespace)}",
+                    "merge",
+                    "-s",
+                    "cat_sort_uniq",
+                    tracking_sha,
+                ],
+                check=False,
+            )
+        except StorageError as e:
+            logger.warning("Failed to merge notes for namespace %s: %s", namespace, e)
+            return False
         return result.returncode == 0
 
     def push_notes_to_remote(self) -> bool:
@@ -1089,46 +1682,71 @@ class GitOps:
         namespaces: list[str] | None = None,
         *,
         push: bool = True,
+        merged: set[str] | None = None,
     ) -> dict[str, bool]:
         """Sync notes with remote using fetch → merge → push workflow.
 
         This is the primary method for synchronizing notes between local
         and remote repositories. It:
-        1. Fetches remote notes to tracking refs
-        2. Merges tracking refs into local notes using cat_sort_uniq
-        3. Pushes merged notes back to remote (optional)
+        1. Fetches remote notes to tracking refs (one fetch for all namespaces)
+        2. Merges changed tracking refs into local notes using cat_sort_uniq,
+           concurrently across namespaces
+        3. Pushes merged notes back to remote (optional), unless every local
+           notes ref already matches the remote
 
         Args:
             namespaces: Specific namespaces to sync, or None for all.
             push: Whether to push after merging.
+            merged: Optional set that receives the namespaces whose remote
+                notes were merged (see merge_notes_from_tracking_batch).
 
         Returns:
             Dict mapping namespace to sync success.
         """
         ns_list = namespaces if namespaces is not None else list(NAMESPACES)
-        results: dict[str, bool] = {}
 
         # Step 1: Fetch notes to tracking refs
         fetch_results = self.fetch_notes_from_remote(ns_list)
 
-        # Step 2: Merge each namespace
-        for ns in ns_list:
-            if fetch_results.get(ns, False):
-                results[ns] = self.merge_notes_from_tracking(ns)
-            else:
-                # Fetch failed - mark as failed but continue with other namespaces
-                results[ns] = False
+        # Step 2: Merge namespaces whose fetch succeeded
+        fetched = [ns for ns in ns_list if fetch_results.get(ns, False)]
+        results = dict.fromkeys(ns_list, False)
+        if fetched:
+            results.update(self.merge_notes_from_tracking_batch(fetched, merged=merged))
 
-        # Step 3: Push (if requested and any merges succeeded)
+        # Step 3: Push (if requested and any merges succeeded). A failed push
+        # leaves the merged notes safe locally, just not pushed
         if push and any(results.values()):
-            push_success = self.push_notes_to_remote()
-            if not push_success:
-                # Push failed - note that merges still succeeded locally
-                # The notes are safe locally, just not pushed
-                pass
+            unpushed = self._unpushed_notes()
+            if unpushed and self.push_notes_to_remote():
+                # The remote now holds these commits: record them as fetched
+                # and merged so the next sync does not merge them back
+                updates = "".join(
+                    f"update {prefix}/{ns} {sha}\n"
+                    for ns, sha in unpushed.items()
+                    for prefix in (_TRACKING_REF_PREFIX, _MERGED_REF_PREFIX)
+                )
+                self._run_git(["update-ref", "--stdin"], check=False, input=updates)
 
         return results
 
+    def _unpushed_notes(self) -> dict[str, str]:
+        """Find local notes refs that differ from their tracking refs.
+
+        Tracking refs hold the remote state as of the last fetch, so after
+        fetch and merge a push is needed only where the two differ.
+
+        Returns:
+            Dict mapping namespace to its local notes commit SHA.
+        """
+        refs = self._list_sync_refs()
+        return {
+            ns: sha
+            for ns in NAMESPACES
+            if (sha := refs.get(self._note_ref(ns)))
+            and sha != refs.get(f"{_TRACKING_REF_PREFIX}/{ns}")
+        }
+
     def ensure_sync_configured(self) -> bool:
         """Ensure git notes sync is configured for this repository.
 
@@ -1200,6 +1818,28 @@ class GitOps:
             return None
         return Path(result.stdout.strip())
 
+    def get_common_dir(self) -> Path | None:
+        """Get the git directory shared by all worktrees of the repository.
+
+        Notes refs live here, so it identifies the repository regardless of
+        the subdirectory, symlinked path or worktree it is reached through.
+        The result is cached.
+
+        Returns:
+            Resolved path of the common git directory, or None if not in a
+            repository.
+        """
+        if self._common_dir is None:
+            result = self._run_git(
+                ["rev-parse", "--git-common-dir"],
+                check=False,
+            )
+            if result.returncode != 0:
+                return None
+            # Printed relative to the repository path unless it is elsewhere
+            self._common_dir = (self.repo_path / result.stdout.strip()).resolve()
+        return self._common_dir
+
     def has_commits(self) -> bool:
         """Check if the repository has any commits.
 
@@ -72,6 +72,7 @@ class CaptureDecider:
         suggest_threshold: Confidence threshold for SUGGEST.
         novelty_threshold: Minimum novelty score to capture.
         check_novelty_enabled: Whether to check for duplicates.
+        load_model: Whether the novelty check may load the embedding model.
     """
 
     def __init__(
@@ -83,6 +84,7 @@ class CaptureDecider:
         check_novelty_enabled: bool = True,
         novelty_checker: NoveltyChecker | None = None,
         config: HookConfig | None = None,
+        load_model: bool = True,
     ) -> None:
         """Initialize the capture decider.
 
@@ -101,6 +103,11 @@ class CaptureDecider:
             novelty_checker: Optional pre-configured NoveltyChecker.
                 If not provided, one will be created lazily.
             config: Optional HookConfig to override default thresholds.
+            load_model: Whether the novelty check may load the embedding
+                model in this process. If False, signals whose check would
+                need it are not checked and are at most suggested, never
+                captured automatically (explicit signals are exempt).
+                Applies to the lazily created NoveltyChecker.
         """
         # Apply config overrides if provided
         if config is not None:
@@ -112,6 +119,7 @@ class CaptureDecider:
         self.suggest_threshold = suggest_threshold
         self.novelty_threshold = novelty_threshold
         self.check_novelty_enabled = check_novelty_enabled
+        self.load_model = load_model
 
         self._novelty_checker = novelty_checker
 
@@ -122,6 +130,7 @@ class CaptureDecider:
 
             self._novelty_checker = NoveltyChecker(
                 novelty_threshold=self.novelty_threshold,
+                load_model=self.load_model,
             )
         return self._novelty_checker
 
@@ -170,12 +179,12 @@ class CaptureDecider:
             check_novelty if check_novelty is not None else self.check_novelty_enabled
         )
 
-        # Process each signal
+        # Process each signal; novelty is checked for all signals at once
         novel_signals: list[tuple[CaptureSignal, NoveltyResult | None]] = []
 
-        for signal in signals:
-            if should_check:
-                novelty = self._check_signal_novelty(signal)
+        if should_check:
+            novelties = self._get_novelty_checker().batch_check_novelty(signals)
+            for signal, novelty in zip(signals, novelties, strict=True):
                 if novelty.is_novel:
                     novel_signals.append((signal, novelty))
                 else:
@@ -184,8 +193,8 @@ class CaptureDecider:
                         signal.match[:30],
                         novelty.novelty_score,
                     )
-            else:
-                novel_signals.append((signal, None))
+        else:
+            novel_signals = [(signal, None) for signal in signals]
 
         if not novel_signals:
             return CaptureDecision(
@@ -198,7 +207,19 @@ class CaptureDecider:
         # Determine action based on highest confidence among novel signals
         highest_confidence = max(s.confidence for s, _ in novel_signals)
 
-        if highest_confidence >= self.auto_threshold:
+        # A deferred check never ran, so the signal may duplicate a memory
+        unchecked = any(
+            novelty is not None
+            and novelty.deferred
+            and signal.type != SignalType.EXPLICIT
+            and signal.confidence >= self.suggest_threshold
+            for signal, novelty in novel_signals
+        )
+
+        if highest_confidence >= self.auto_threshold and unchecked:
+            action = CaptureAction.SUGGEST
+            reason = f"High confidence signal detected ({highest_confidence:.2f}), novelty not checked"
+        elif highest_confidence >= self.auto_threshold:
             action = CaptureAction.AUTO
             reason = f"High confidence signal detected ({highest_confidence:.2f} >= {self.auto_threshold})"
         elif highest_confidence >= self.suggest_threshold:
@@ -231,18 +252,6 @@ class CaptureDecider:
             reason=reason,
         )
 
-    def _check_signal_novelty(self, signal: CaptureSignal) -> NoveltyResult:
-        """Check novelty of a signal.
-
-        Args:
-            signal: The capture signal to check.
-
-        Returns:
-            NoveltyResult with novelty score and similar memory info.
-        """
-        checker = self._get_novelty_checker()
-        return checker.check_signal_novelty(signal)
-
     def _generate_suggestion(
         self,
         signal: CaptureSignal,
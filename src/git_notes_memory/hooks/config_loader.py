@@ -16,6 +16,7 @@ Environment Variables:
     HOOK_SESSION_START_MAX_MEMORIES: Maximum memories to retrieve (default: 30)
     HOOK_SESSION_START_AUTO_EXPAND_THRESHOLD: Relevance threshold for auto-expand hints (default: 0.85)
     HOOK_SESSION_START_FETCH_REMOTE: Fetch notes from remote on session start (default: false)
+    HOOK_SESSION_START_SNAPSHOT: Serve SessionStart context from a cached snapshot (default: true)
     HOOK_CAPTURE_DETECTION_ENABLED: Enable capture signal detection
     HOOK_CAPTURE_DETECTION_MIN_CONFIDENCE: Minimum confidence for suggestions
     HOOK_CAPTURE_DETECTION_AUTO_THRESHOLD: Confidence for auto-capture
@@ -31,6 +32,7 @@ Environment Variables:
     HOOK_POST_TOOL_USE_MIN_SIMILARITY: Minimum similarity for memory recall
     HOOK_POST_TOOL_USE_MAX_RESULTS: Maximum memories to inject
     HOOK_POST_TOOL_USE_TIMEOUT: PostToolUse timeout in seconds
+    HOOK_POST_TOOL_USE_DRAIN_LIMIT: Deferred captures indexed per PostToolUse run (default: 10)
     HOOK_PRE_COMPACT_ENABLED: Enable PreCompact hook
     HOOK_PRE_COMPACT_AUTO_CAPTURE: Auto-capture without user prompt
     HOOK_PRE_COMPACT_PROMPT_FIRST: Show suggestions before capturing (suggestion mode)
@@ -38,6 +40,8 @@ Environment Variables:
     HOOK_PRE_COMPACT_MAX_CAPTURES: Maximum memories to auto-capture
     HOOK_PRE_COMPACT_TIMEOUT: PreCompact timeout in seconds
     HOOK_TIMEOUT: Default hook timeout in seconds
+    HOOK_DAEMON_ENABLED: Start the warm memory daemon on session start (default: false)
+    HOOK_DAEMON_IDLE_TIMEOUT: Seconds before an idle daemon exits (default: 1800)
 """
 
 from __future__ import annotations
@@ -94,6 +98,8 @@ class HookConfig:
         session_start_max_budget: Maximum budget cap.
         session_start_include_guidance: Include response guidance in SessionStart.
         session_start_guidance_detail: Guidance detail level (minimal/standard/detailed).
+        session_start_snapshot: Serve context from the precomputed snapshot
+            while it is current, rebuilding only the stale sections.
         capture_detection_enabled: Enable signal detection in prompts.
         capture_detection_min_confidence: Minimum confidence for SUGGEST.
         capture_detection_auto_threshold: Confidence for AUTO capture.
@@ -105,6 +111,8 @@ class HookConfig:
         post_tool_use_min_similarity: Minimum similarity for memory recall.
         post_tool_use_max_results: Maximum memories to inject per tool use.
         post_tool_use_timeout: PostToolUse hook timeout in seconds.
+        post_tool_use_drain_limit: Queued deferred captures to index per
+            PostToolUse run (0 leaves the queue to the Stop hook).
         pre_compact_enabled: Enable PreCompact hook for memory preservation.
         pre_compact_auto_capture: Auto-capture without user prompt.
         pre_compact_prompt_first: Suggestion mode - show what would be captured via stderr
@@ -114,6 +122,8 @@ class HookConfig:
         pre_compact_timeout: PreCompact hook timeout in seconds.
         timeout: Default timeout for hook operations (seconds).
         debug: Enable debug logging.
+        daemon_enabled: Spawn the warm memory daemon from SessionStart.
+        daemon_idle_timeout: Seconds before an idle daemon exits.
     """
 
     # Master control
@@ -133,6 +143,7 @@ class HookConfig:
     session_start_fetch_remote: bool = (
         False  # Fetch notes from remote on start (opt-in)
     )
+    session_start_snapshot: bool = True  # Serve context from the cached snapshot
 
     # Capture detection settings
     capture_detection_enabled: bool = True  # Enabled by default when plugin is active
@@ -161,6 +172,7 @@ class HookConfig:
     post_tool_use_timeout: int = 5
     post_tool_use_auto_capture: bool = True  # Auto-capture signals in written content
     post_tool_use_auto_capture_min_confidence: float = 0.8  # Min confidence for capture
+    post_tool_use_drain_limit: int = 10  # Deferred captures indexed per run
 
     # PreCompact hook settings
     pre_compact_enabled: bool = True
@@ -176,6 +188,10 @@ class HookConfig:
     timeout: int = 30
     debug: bool = False
 
+    # Memory daemon settings (hooks use a running daemon regardless)
+    daemon_enabled: bool = False  # Spawn daemon from SessionStart (opt-in)
+    daemon_idle_timeout: int = 1800  # Seconds before an idle daemon exits
+
     # Budget tier thresholds (for adaptive mode)
     # Note: total must >= working_memory + semantic_context + commands (default 100)
     budget_tiers: tuple[tuple[str, int, int, int], ...] = field(
@@ -363,6 +379,10 @@ def load_hook_config(env: dict[str, str] | None = None) -> HookConfig:
         kwargs["session_start_fetch_remote"] = _parse_bool(
             env["HOOK_SESSION_START_FETCH_REMOTE"]
         )
+    if "HOOK_SESSION_START_SNAPSHOT" in env:
+        kwargs["session_start_snapshot"] = _parse_bool(
+            env["HOOK_SESSION_START_SNAPSHOT"]
+        )
 
     # Capture detection settings
     if "HOOK_CAPTURE_DETECTION_ENABLED" in env:
@@ -440,6 +460,11 @@ def load_hook_config(env: dict[str, str] | None = None) -> HookConfig:
             env["HOOK_POST_TOOL_USE_AUTO_CAPTURE_MIN_CONFIDENCE"],
             defaults.post_tool_use_auto_capture_min_confidence,
         )
+    if "HOOK_POST_TOOL_USE_DRAIN_LIMIT" in env:
+        kwargs["post_tool_use_drain_limit"] = _parse_int(
+            env["HOOK_POST_TOOL_USE_DRAIN_LIMIT"],
+            defaults.post_tool_use_drain_limit,
+        )
 
     # PreCompact hook settings
     if "HOOK_PRE_COMPACT_ENABLED" in env:
@@ -474,4 +499,13 @@ def load_hook_config(env: dict[str, str] | None = None) -> HookConfig:
     if "HOOK_DEBUG" in env:
         kwargs["debug"] = _parse_bool(env["HOOK_DEBUG"])
 
+    # Memory daemon settings
+    if "HOOK_DAEMON_ENABLED" in env:
+        kwargs["daemon_enabled"] = _parse_bool(env["HOOK_DAEMON_ENABLED"])
+    if "HOOK_DAEMON_IDLE_TIMEOUT" in env:
+        kwargs["daemon_idle_timeout"] = _parse_int(
+            env["HOOK_DAEMON_IDLE_TIMEOUT"],
+            defaults.daemon_idle_timeout,
+        )
+
     return HookConfig(**kwargs)
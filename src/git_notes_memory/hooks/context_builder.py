@@ -10,20 +10,38 @@ The context is structured into:
 - Working Memory: Active blockers, recent decisions, pending actions
 - Semantic Context: Relevant learnings, related patterns
 - Commands: Available memory commands hint
+
+get_context() serves the context from a precomputed snapshot while no
+memory it draws from has changed (see context_snapshot).
 """
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING
 
-from git_notes_memory.config import TOKENS_PER_CHAR, get_project_index_path
+from git_notes_memory.config import (
+    SESSION_CONTEXT_DIR_NAME,
+    SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS,
+    TOKENS_PER_CHAR,
+    get_project_index_path,
+)
 from git_notes_memory.exceptions import MemoryIndexError
 from git_notes_memory.hooks.config_loader import (
     BudgetMode,
     HookConfig,
     load_hook_config,
 )
+from git_notes_memory.hooks.context_snapshot import (
+    ContextSnapshot,
+    load_snapshot,
+    read_index_state,
+    save_snapshot,
+    snapshot_path,
+)
 from git_notes_memory.hooks.models import (
     MemoryContext,
     SemanticContext,
@@ -32,6 +50,7 @@ from git_notes_memory.hooks.models import (
 )
 from git_notes_memory.hooks.xml_formatter import XMLBuilder
 from git_notes_memory.observability import get_logger
+from git_notes_memory.observability.metrics import get_metrics
 
 if TYPE_CHECKING:
     from git_notes_memory.index import IndexService
@@ -42,6 +61,9 @@ __all__ = ["ContextBuilder"]
 
 logger = get_logger(__name__)
 
+# A section's memories, with relevance scores for semantic sections
+_SectionEntries = list[tuple["Memory", float | None]]
+
 
 class ContextBuilder:
     """Builds XML-structured memory context for session injection.
@@ -74,6 +96,7 @@ class ContextBuilder:
         recall_service: RecallService | None = None,
         index_service: IndexService | None = None,
         config: HookConfig | None = None,
+        index_path: Path | None = None,
     ) -> None:
         """Initialize the context builder.
 
@@ -84,12 +107,20 @@ class ContextBuilder:
                 If not provided, one will be created lazily.
             config: Optional hook configuration. If not provided, will be
                 loaded from environment variables.
+            index_path: Project index the context snapshot is checked
+                against and stored beside. Defaults to the current
+                project's index.
         """
         self._recall_service = recall_service
         self._index_service = index_service
+        self._index_path = index_path
         self.config = config or load_hook_config()
         # Track relevance scores for memories (populated during semantic context building)
         self._relevance_map: dict[str, float] = {}
+        # Memory IDs each namespace's section was built from, and sections
+        # of a stale snapshot that can be reused (see get_context)
+        self._sections: dict[str, list[tuple[str, float | None]]] = {}
+        self._reusable: dict[str, list[tuple[str, float | None]]] = {}
 
     # -------------------------------------------------------------------------
     # Lazy-loaded Dependencies
@@ -154,6 +185,7 @@ class ContextBuilder:
 
         # Clear relevance map for fresh build
         self._relevance_map = {}
+        self._sections = {}
 
         # Calculate token budget
         budget = self.calculate_budget(project)
@@ -184,6 +216,90 @@ class ContextBuilder:
         # Serialize to XML
         return self.to_xml(context)
 
+    def get_context(
+        self,
+        project: str,
+        session_source: str = "startup",
+        *,
+        spec_id: str | None = None,
+    ) -> str:
+        """Get the session context, served from its snapshot while current.
+
+        The snapshot for (project, spec_id) is returned as is when no
+        memory in the namespaces it draws from has changed, the budget tier
+        and settings are the same and it is younger than
+        SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS. Otherwise the context is
+        rebuilt, reusing the sections whose namespace did not change, and
+        the snapshot replaced. With snapshots disabled, or no index yet,
+        this is build_context().
+
+        Args:
+            project: Project identifier (usually from cwd detection).
+            session_source: How the session started ("startup", "resume",
+                "clear", "compact").
+            spec_id: Optional spec identifier for project-specific filtering.
+
+        Returns:
+            XML string suitable for Claude's additionalContext field.
+        """
+        if not self.config.session_start_snapshot:
+            return self.build_context(project, session_source, spec_id=spec_id)
+
+        index_path = self._index_path or get_project_index_path()
+        state = read_index_state(index_path)
+        if state is None:
+            # No index yet, or one predating namespace versions; building
+            # opens (and so migrates) it for the next session
+            return self.build_context(project, session_source, spec_id=spec_id)
+
+        path = snapshot_path(
+            index_path.parent / SESSION_CONTEXT_DIR_NAME, project, spec_id
+        )
+        snapshot = load_snapshot(path)
+        config_key = self._snapshot_config_key()
+        tier = self._snapshot_tier(state.total_memories)
+        metrics = get_metrics()
+        if snapshot is not None and snapshot.is_current(
+            state,
+            config_key=config_key,
+            tier=tier,
+            max_age_seconds=SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS,
+        ):
+            metrics.increment(
+                "session_context_snapshot_total", labels={"result": "hit"}
+            )
+            return snapshot.xml
+
+        if snapshot is not None:
+            self._reusable = snapshot.reusable_sections(state, config_key=config_key)
+        try:
+            xml = self.build_context(project, session_source, spec_id=spec_id)
+        finally:
+            reused, self._reusable = self._reusable, {}
+        metrics.increment(
+            "session_context_snapshot_total",
+            labels={"result": "partial" if reused else "rebuilt"},
+        )
+
+        try:
+            save_snapshot(
+                path,
+                ContextSnapshot(
+                    project=project,
+                    spec_id=spec_id,
+                    config_key=config_key,
+                    index_id=state.index_id,
+                    versions=state.versions,
+                    tier=tier,
+                    built_at=datetime.now(UTC),
+                    xml=xml,
+                    sections=self._sections,
+                ),
+            )
+        except OSError as e:
+            logger.debug("Could not save context snapshot %s: %s", path, e)
+        return xml
+
     def calculate_budget(self, project: str) -> TokenBudget:
         """Calculate token budget based on project complexity.
 
@@ -364,21 +480,32 @@ class ContextBuilder:
         action_limit = max(2, max_memories // 6)  # ~17%
 
         # Get active blockers (most recent first)
-        blockers = recall.get_by_namespace(
-            "blockers", spec=spec_id, limit=blocker_limit
+        blockers = self._section(
+            "blockers",
+            lambda: _unscored(
+                recall.get_by_namespace("blockers", spec=spec_id, limit=blocker_limit)
+            ),
         )
         blockers = self.filter_memories(blockers, blocker_budget)
 
         # Get recent decisions (last 7 days)
-        decisions = recall.get_by_namespace(
-            "decisions", spec=spec_id, limit=decision_limit
+        decisions = self._section(
+            "decisions",
+            lambda: _unscored(
+                recall.get_by_namespace("decisions", spec=spec_id, limit=decision_limit)
+            ),
         )
         recent_cutoff = datetime.now(UTC) - timedelta(days=7)
         decisions = [d for d in decisions if d.timestamp >= recent_cutoff]
         decisions = self.filter_memories(decisions, decision_budget)
 
         # Get pending actions (from progress namespace)
-        actions = recall.get_by_namespace("progress", spec=spec_id, limit=action_limit)
+        actions = self._section(
+            "progress",
+            lambda: _unscored(
+                recall.get_by_namespace("progress", spec=spec_id, limit=action_limit)
+            ),
+        )
         actions = [a for a in actions if a.status in ("pending", "in-progress")]
         actions = self.filter_memories(actions, action_budget)
 
@@ -410,25 +537,26 @@ class ContextBuilder:
         learning_limit = max(5, max_memories // 2)  # ~50% for learnings
         pattern_limit = max(2, max_memories // 6)  # ~17% for patterns
 
+        def search(namespace: str, limit: int) -> _SectionEntries:
+            # Convert distance to similarity (lower distance = higher similarity)
+            # Using 1/(1+distance) for bounded [0,1] range
+            results = recall.search(project, k=limit, namespace=namespace)
+            return [(r.memory, 1.0 / (1.0 + r.distance)) for r in results]
+
         # Search for relevant learnings and track relevance scores
         learnings: list[Memory] = []
         if project:
-            results = recall.search(project, k=learning_limit, namespace="learnings")
-            for r in results:
-                # Convert distance to similarity (lower distance = higher similarity)
-                # Using 1/(1+distance) for bounded [0,1] range
-                self._relevance_map[r.memory.id] = 1.0 / (1.0 + r.distance)
-            learnings = [r.memory for r in results]
+            learnings = self._section(
+                "learnings", lambda: search("learnings", learning_limit)
+            )
         learnings = self.filter_memories(learnings, learning_budget)
 
         # Search for relevant patterns and track relevance scores
         patterns: list[Memory] = []
         if project:
-            results = recall.search(project, k=pattern_limit, namespace="patterns")
-            for r in results:
-                # Convert distance to similarity (lower distance = higher similarity)
-                self._relevance_map[r.memory.id] = 1.0 / (1.0 + r.distance)
-            patterns = [r.memory for r in results]
+            patterns = self._section(
+                "patterns", lambda: search("patterns", pattern_limit)
+            )
         patterns = self.filter_memories(patterns, pattern_budget)
 
         return SemanticContext(
@@ -436,6 +564,45 @@ class ContextBuilder:
             related_patterns=tuple(patterns),
         )
 
+    def _section(
+        self,
+        namespace: str,
+        fetch: Callable[[], _SectionEntries],
+    ) -> list[Memory]:
+        """Get the memories of one namespace's section.
+
+        A section reusable from the previous snapshot is re-read by ID;
+        otherwise fetch() queries it. Either way the section's memory IDs
+        are recorded for the next snapshot and relevance scores tracked.
+
+        Args:
+            namespace: Namespace the section draws from.
+            fetch: Queries the section's memories with their relevance.
+
+        Returns:
+            The section's memories, before budget filtering.
+        """
+        reusable = self._reusable.get(namespace)
+        if reusable is not None:
+            found = {
+                memory.id: memory
+                for memory in self._get_recall_service().get_batch(
+                    [memory_id for memory_id, _ in reusable]
+                )
+            }
+            entries = [
+                (found[memory_id], score)
+                for memory_id, score in reusable
+                if memory_id in found
+            ]
+        else:
+            entries = fetch()
+        self._sections[namespace] = [(memory.id, score) for memory, score in entries]
+        for memory, score in entries:
+            if score is not None:
+                self._relevance_map[memory.id] = score
+        return [memory for memory, _ in entries]
+
     def _get_command_hints(self) -> tuple[str, ...]:
         """Get brief hints about available memory commands."""
         return (
@@ -545,23 +712,43 @@ class ContextBuilder:
         try:
             index = self._get_index_service()
             stats = index.get_stats()
-
-            # Heuristics for complexity
-            total_memories = stats.total_memories
-
-            if total_memories < 10:
-                return "simple"
-            if total_memories < 50:
-                return "medium"
-            if total_memories < 200:
-                return "complex"
-            return "full"
+            return self._complexity_tier(stats.total_memories)
 
         # QUAL-002: Catch specific exceptions instead of bare Exception
         except (MemoryIndexError, OSError) as e:
             logger.debug("Failed to analyze complexity for %s: %s", project, e)
             return "medium"  # Default to medium on error
 
+    @staticmethod
+    def _complexity_tier(total_memories: int) -> str:
+        """Map a memory count to a complexity tier."""
+        if total_memories < 10:
+            return "simple"
+        if total_memories < 50:
+            return "medium"
+        if total_memories < 200:
+            return "complex"
+        return "full"
+
+    def _snapshot_tier(self, total_memories: int) -> str:
+        """Budget tier a snapshot is built with ("" outside ADAPTIVE mode)."""
+        if self.config.session_start_budget_mode != BudgetMode.ADAPTIVE:
+            return ""
+        return self._complexity_tier(total_memories)
+
+    def _snapshot_config_key(self) -> str:
+        """Fingerprint of the settings that shape the context."""
+        config = self.config
+        settings = (
+            config.session_start_budget_mode.value,
+            config.session_start_fixed_budget,
+            config.session_start_max_budget,
+            config.session_start_max_memories,
+            config.session_start_auto_expand_threshold,
+            config.budget_tiers,
+        )
+        return hashlib.sha256(repr(settings).encode()).hexdigest()[:16]
+
     def _estimate_memory_tokens(self, memory: Memory) -> int:
         """Estimate token count for a memory at summary hydration level.
 
@@ -576,3 +763,8 @@ class ContextBuilder:
         if memory.tags:
             chars += sum(len(t) for t in memory.tags) + len(memory.tags) * 2
         return int(chars * TOKENS_PER_CHAR)
+
+
+def _unscored(memories: list[Memory]) -> _SectionEntries:
+    """Pair memories with no relevance score."""
+    return [(memory, None) for memory in memories]
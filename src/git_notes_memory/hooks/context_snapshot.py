@@ -0,0 +1,262 @@
+"""Precomputed SessionStart context.
+
+Building the SessionStart context queries the index several times and runs
+two semantic searches, which load the embedding model. The result only
+changes when memories in the namespaces it draws from change, so it is
+materialized per (project, spec) as a JSON snapshot next to the project
+index and served from disk while it is current.
+
+A snapshot records the state it was built from: the index's identity, the
+write counter of each namespace it reads (maintained by triggers in the
+index, see IndexService.get_namespace_versions) and the memory count that
+selects the adaptive budget tier. read_index_state() reads that state with
+plain sqlite3, without loading sqlite-vec, so checking a snapshot costs one
+file read and three small queries.
+
+The snapshot also keeps the memory IDs each section was built from, so a
+stale snapshot is rebuilt incrementally: sections whose namespace did not
+change are re-read by ID rather than re-queried.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from git_notes_memory.hooks.state_file import (
+    load_state_file,
+    save_state_file,
+    state_file_path,
+)
+from git_notes_memory.observability import get_logger
+
+__all__ = [
+    "SNAPSHOT_NAMESPACES",
+    "ContextSnapshot",
+    "IndexState",
+    "load_snapshot",
+    "read_index_state",
+    "save_snapshot",
+    "snapshot_path",
+]
+
+logger = get_logger(__name__)
+
+# Bumped when the snapshot layout changes; older files are ignored
+_SNAPSHOT_FORMAT = 1
+
+# Namespaces the SessionStart context draws from
+SNAPSHOT_NAMESPACES: tuple[str, ...] = (
+    "blockers",
+    "decisions",
+    "progress",
+    "learnings",
+    "patterns",
+)
+
+
+@dataclass(frozen=True)
+class IndexState:
+    """The parts of an index a SessionStart context depends on.
+
+    Attributes:
+        index_id: Identity of the index database (changes if it is rebuilt).
+        versions: Write counter per namespace in SNAPSHOT_NAMESPACES.
+        total_memories: Number of memories (selects the budget tier).
+    """
+
+    index_id: str
+    versions: dict[str, int]
+    total_memories: int
+
+
+@dataclass(frozen=True)
+class ContextSnapshot:
+    """A materialized SessionStart context.
+
+    Attributes:
+        project: Project the context was built for.
+        spec_id: Spec the context was built for, if any.
+        config_key: Fingerprint of the settings that shape the context.
+        index_id: Identity of the index it was built from.
+        versions: Namespace write counters it was built from.
+        tier: Budget tier it was built with.
+        built_at: When it was built.
+        xml: The rendered context.
+        sections: Memory IDs (with relevance, for semantic sections) each
+            namespace's section was built from, before budget filtering.
+    """
+
+    project: str
+    spec_id: str | None
+    config_key: str
+    index_id: str
+    versions: dict[str, int]
+    tier: str
+    built_at: datetime
+    xml: str
+    sections: dict[str, list[tuple[str, float | None]]] = field(default_factory=dict)
+
+    def is_current(
+        self,
+        state: IndexState,
+        *,
+        config_key: str,
+        tier: str,
+        max_age_seconds: float,
+    ) -> bool:
+        """Check whether the snapshot still matches the index.
+
+        Args:
+            state: Current index state.
+            config_key: Fingerprint of the current settings.
+            tier: Budget tier the current index selects.
+            max_age_seconds: Maximum age before the snapshot is rebuilt.
+
+        Returns:
+            True if the snapshot can be served as is.
+        """
+        age = (datetime.now(UTC) - self.built_at).total_seconds()
+        return (
+            self.index_id == state.index_id
+            and self.config_key == config_key
+            and self.tier == tier
+            and self.versions == state.versions
+            and 0 <= age < max_age_seconds
+        )
+
+    def reusable_sections(
+        self,
+        state: IndexState,
+        *,
+        config_key: str,
+    ) -> dict[str, list[tuple[str, float | None]]]:
+        """Get the sections whose namespace has not changed since the build.
+
+        Args:
+            state: Current index state.
+            config_key: Fingerprint of the current settings.
+
+        Returns:
+            Dict of namespace to section entries; empty if nothing can be
+            reused.
+        """
+        if self.index_id != state.index_id or self.config_key != config_key:
+            return {}
+        return {
+            namespace: entries
+            for namespace, entries in self.sections.items()
+            if self.versions.get(namespace) == state.versions.get(namespace)
+        }
+
+
+def snapshot_path(directory: Path, project: str, spec_id: str | None) -> Path:
+    """Get the snapshot file for a (project, spec).
+
+    Args:
+        directory: Snapshot directory.
+        project: Project name.
+        spec_id: Spec identifier, if any.
+
+    Returns:
+        Path of the snapshot file.
+    """
+    return state_file_path(directory, f"{project}\0{spec_id or ''}")
+
+
+def read_index_state(index_path: Path) -> IndexState | None:
+    """Read the index state a snapshot is checked against.
+
+    Uses a plain sqlite3 connection (no sqlite-vec) so the check stays
+    cheap on the SessionStart hot path.
+
+    Args:
+        index_path: Path to the project index database.
+
+    Returns:
+        The state, or None if the index does not exist or predates
+        namespace versions.
+    """
+    if not index_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(str(index_path))
+    except sqlite3.Error:
+        return None
+    try:
+        row = conn.execute(
+            "SELECT value FROM metadata WHERE key = 'index_id'"
+        ).fetchone()
+        if row is None:
+            return None
+        versions = dict.fromkeys(SNAPSHOT_NAMESPACES, 0)
+        for namespace, version in conn.execute(
+            "SELECT namespace, version FROM namespace_versions"
+        ):
+            if namespace in versions:
+                versions[namespace] = version
+        (total,) = conn.execute("SELECT COUNT(*) FROM memories").fetchone()
+        return IndexState(index_id=row[0], versions=versions, total_memories=total)
+    except sqlite3.Error as e:
+        logger.debug("Could not read index state from %s: %s", index_path, e)
+        return None
+    finally:
+        conn.close()
+
+
+def load_snapshot(path: Path) -> ContextSnapshot | None:
+    """Load a snapshot file.
+
+    Args:
+        path: Snapshot file.
+
+    Returns:
+        The snapshot, or None if it is missing, unreadable or from another
+        format version.
+    """
+    return load_state_file(path, _SNAPSHOT_FORMAT, _snapshot_from_data)
+
+
+def _snapshot_from_data(data: dict[str, Any]) -> ContextSnapshot:
+    """Build a snapshot from the data of a snapshot file."""
+    return ContextSnapshot(
+        project=data["project"],
+        spec_id=data["spec_id"],
+        config_key=data["config_key"],
+        index_id=data["index_id"],
+        versions={k: int(v) for k, v in data["versions"].items()},
+        tier=data["tier"],
+        built_at=datetime.fromisoformat(data["built_at"]),
+        xml=data["xml"],
+        sections={
+            namespace: [(memory_id, score) for memory_id, score in entries]
+            for namespace, entries in data["sections"].items()
+        },
+    )
+
+
+def save_snapshot(path: Path, snapshot: ContextSnapshot) -> None:
+    """Write a snapshot file atomically.
+
+    Concurrent sessions may rebuild the same snapshot; the file is replaced
+    in one rename, so readers see either the old or the new snapshot.
+
+    Args:
+        path: Snapshot file.
+        snapshot: Snapshot to write.
+    """
+    data = {
+        "project": snapshot.project,
+        "spec_id": snapshot.spec_id,
+        "config_key": snapshot.config_key,
+        "index_id": snapshot.index_id,
+        "versions": snapshot.versions,
+        "tier": snapshot.tier,
+        "built_at": snapshot.built_at.isoformat(),
+        "xml": snapshot.xml,
+        "sections": snapshot.sections,
+    }
+    save_state_file(path, _SNAPSHOT_FORMAT, data)
@@ -40,12 +40,10 @@ import signal
 import sys
 import time
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
 from git_notes_memory.observability import get_logger
-from git_notes_memory.observability.metrics import get_metrics
 
 __all__ = [
     "setup_logging",
@@ -109,6 +107,9 @@ def get_hook_logger(hook_name: str) -> logging.Logger:
 
     # Avoid duplicate handlers
     if not hook_logger.handlers:
+        # Deferred: logging.handlers imports socket, pickle and queue
+        from logging.handlers import RotatingFileHandler
+
         # Create rotating file handler
         log_file = LOG_DIR / f"{hook_name.lower()}.log"
         handler = RotatingFileHandler(
@@ -255,6 +256,8 @@ def setup_timeout(
         logger.warning("%s hook timed out after %d seconds", hook_name, timeout)
 
         # Track timeout event via metrics
+        from git_notes_memory.observability.metrics import get_metrics
+
         metrics = get_metrics()
         metrics.increment(
             "hook_timeouts_total",
@@ -343,6 +346,8 @@ class timed_hook_execution:
             self._status = "error"
 
         # Record metrics
+        from git_notes_memory.observability.metrics import get_metrics
+
         metrics = get_metrics()
         metrics.observe(
             "hook_execution_duration_ms",
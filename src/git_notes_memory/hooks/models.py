@@ -126,12 +126,16 @@ class NoveltyResult:
         is_novel: Whether the content passes the novelty threshold.
         similar_memory_ids: IDs of similar existing memories.
         highest_similarity: Highest similarity score found.
+        deferred: Whether the check was skipped to avoid loading the
+            embedding model. The score is then a placeholder, and
+            CaptureDecider suggests such content instead of capturing it.
     """
 
     novelty_score: float
     is_novel: bool
     similar_memory_ids: list[str] = field(default_factory=list)
     highest_similarity: float = 0.0
+    deferred: bool = False
 
     def __post_init__(self) -> None:
         """Validate novelty score is in valid range."""
@@ -10,6 +10,15 @@ The novelty score ranges from 0.0 (duplicate) to 1.0 (completely new):
 - 0.3-0.7: Partial novelty, consider suggesting capture
 - 0.7-1.0: High novelty, recommend capture
 
+Several signals are checked together by batch_check_novelty(): their texts
+are embedded in one batch and looked up in one index pass.
+
+Latency-critical hooks create the checker with ``load_model=False``: the
+check then runs only where it is cheap (in a running daemon, or with the
+model already loaded in-process) and otherwise returns deferred results
+instead of loading the model. A deferred result was not checked, so
+CaptureDecider only suggests its signal.
+
 Example::
 
     checker = NoveltyChecker()
@@ -27,6 +36,7 @@ from git_notes_memory.observability import get_logger
 
 if TYPE_CHECKING:
     from git_notes_memory.embedding import EmbeddingService
+    from git_notes_memory.models import MemoryResult
     from git_notes_memory.recall import RecallService
 
 __all__ = ["NoveltyChecker"]
@@ -34,6 +44,27 @@ __all__ = ["NoveltyChecker"]
 logger = get_logger(__name__)
 
 
+def _fully_novel() -> NoveltyResult:
+    """Result for text with nothing to compare against."""
+    return NoveltyResult(
+        novelty_score=1.0,
+        is_novel=True,
+        similar_memory_ids=[],
+        highest_similarity=0.0,
+    )
+
+
+def _deferred() -> NoveltyResult:
+    """Result for text whose check was skipped to avoid a model load."""
+    return NoveltyResult(
+        novelty_score=1.0,
+        is_novel=True,
+        similar_memory_ids=[],
+        highest_similarity=0.0,
+        deferred=True,
+    )
+
+
 class NoveltyChecker:
     """Checker for novelty of detected capture signals.
 
@@ -63,6 +94,7 @@ class NoveltyChecker:
         novelty_threshold: Minimum novelty score to consider content novel.
         similarity_threshold: Similarity above which content is duplicate.
         k: Number of similar memories to check.
+        load_model: Whether a check may load the embedding model.
     """
 
     def __init__(
@@ -73,6 +105,7 @@ class NoveltyChecker:
         *,
         recall_service: RecallService | None = None,
         embedding_service: EmbeddingService | None = None,
+        load_model: bool = True,
     ) -> None:
         """Initialize the novelty checker.
 
@@ -86,12 +119,17 @@ class NoveltyChecker:
                 novelty. More memories = more accurate but slower.
             recall_service: Optional pre-configured RecallService instance.
                 If not provided, one will be created lazily.
-            embedding_service: Optional pre-configured EmbeddingService.
-                If not provided, one will be created lazily.
+            embedding_service: Optional pre-configured EmbeddingService,
+                used by the RecallService created when recall_service is
+                not provided.
+            load_model: Whether a check may load the embedding model in
+                this process. If False and neither the daemon nor a loaded
+                model is available, results are marked deferred instead.
         """
         self.novelty_threshold = novelty_threshold
         self.similarity_threshold = similarity_threshold
         self.k = k
+        self.load_model = load_model
 
         self._recall_service = recall_service
         self._embedding_service = embedding_service
@@ -99,18 +137,76 @@ class NoveltyChecker:
     def _get_recall_service(self) -> RecallService:
         """Get or create the RecallService instance."""
         if self._recall_service is None:
-            from git_notes_memory.recall import get_default_service
+            if self._embedding_service is not None:
+                from git_notes_memory.recall import RecallService
 
-            self._recall_service = get_default_service()
+                self._recall_service = RecallService(
+                    embedding_service=self._embedding_service
+                )
+            else:
+                from git_notes_memory.recall import get_default_service
+
+                self._recall_service = get_default_service()
         return self._recall_service
 
-    def _get_embedding_service(self) -> EmbeddingService:
-        """Get or create the EmbeddingService instance."""
-        if self._embedding_service is None:
-            from git_notes_memory.embedding import get_default_service
+    def _model_ready(self) -> bool:
+        """Check whether an in-process search can run without a model load.
+
+        A caller-supplied RecallService is trusted to search as it likes.
+        Otherwise the embedding service the search would use must already
+        have its model loaded.
+        """
+        if self._recall_service is not None and self._embedding_service is None:
+            return True
+        if self._embedding_service is not None:
+            return self._embedding_service.is_loaded
+
+        from git_notes_memory.embedding import get_default_service
+
+        return get_default_service().is_loaded
+
+    def _search_via_daemon(
+        self,
+        texts: list[str],
+        namespaces: list[str | None],
+    ) -> list[list[MemoryResult]] | None:
+        """Search for similar memories through the memory daemon.
 
-            self._embedding_service = get_default_service()
-        return self._embedding_service
+        Only used when no services were injected, so tests and callers
+        that supply their own services are unaffected.
+
+        Args:
+            texts: The texts to search for.
+            namespaces: Namespace filter per text.
+
+        Returns:
+            Search results per text, or None if the daemon is unavailable.
+        """
+        if self._recall_service is not None or self._embedding_service is not None:
+            return None
+
+        from git_notes_memory.config import get_project_index_path
+        from git_notes_memory.daemon import DaemonError, get_daemon_client
+
+        client = get_daemon_client()
+        if client is None:
+            return None
+        try:
+            index_path = get_project_index_path()
+            if not index_path.exists():
+                return [[] for _ in texts]
+            return client.search_batch(
+                texts,
+                index_path=index_path,
+                k=self.k,
+                namespaces=namespaces,
+                min_similarity=0.0,
+            )
+        except DaemonError as e:
+            logger.debug("Daemon novelty search unavailable: %s", e)
+        except Exception as e:
+            logger.debug("Daemon novelty search skipped: %s", e)
+        return None
 
     def check_novelty(
         self,
@@ -139,98 +235,118 @@ class NoveltyChecker:
             if result.similar_memory_ids:
                 print(f"Similar to: {result.similar_memory_ids}")
         """
-        if not text or not text.strip():
-            # Empty text is considered fully novel (nothing to duplicate)
-            return NoveltyResult(
-                novelty_score=1.0,
-                is_novel=True,
-                similar_memory_ids=[],
-                highest_similarity=0.0,
-            )
+        return self._check_batch([text], [namespace])[0]
 
-        try:
-            # Check if embedding model is loaded to avoid blocking hooks
-            # If not loaded, assume novel (safe default) rather than block
-            embedding = self._get_embedding_service()
-            if not embedding.is_loaded:
-                logger.debug(
-                    "Embedding model not loaded, skipping novelty check "
-                    "(assuming novel to avoid blocking hook execution)"
-                )
-                return NoveltyResult(
-                    novelty_score=1.0,
-                    is_novel=True,
-                    similar_memory_ids=[],
-                    highest_similarity=0.0,
-                )
+    def _check_batch(
+        self,
+        texts: list[str],
+        namespaces: list[str | None],
+    ) -> list[NoveltyResult]:
+        """Check novelty of several texts with one search.
 
-            recall = self._get_recall_service()
-            results = recall.search(
-                text,
-                k=self.k,
-                namespace=namespace,
-                min_similarity=0.0,  # Get all results, filter ourselves
-            )
+        All non-empty texts are searched together (one embedding batch and
+        one index pass, in the daemon when it runs), and the novelty scores
+        are computed for the whole batch at once. With load_model False and
+        no daemon or loaded model, the texts are returned as deferred.
 
-            if not results:
-                # No similar memories found = completely novel
-                logger.debug("No similar memories found for: %s...", text[:50])
-                return NoveltyResult(
-                    novelty_score=1.0,
-                    is_novel=True,
-                    similar_memory_ids=[],
-                    highest_similarity=0.0,
-                )
+        Args:
+            texts: The texts to check.
+            namespaces: Namespace to limit the search to, per text.
 
-            # Calculate similarity from distance
-            # RecallService returns MemoryResult with distance attribute
-            similarities: list[tuple[str, float]] = []
-            for result in results:
-                # Convert distance to similarity (1 / (1 + distance))
-                distance = result.distance
-                similarity = 1.0 / (1.0 + distance) if distance >= 0 else 0.0
-                similarities.append((result.memory.id, similarity))
+        Returns:
+            NoveltyResult per text, in input order.
+        """
+        # Empty text is considered fully novel (nothing to duplicate)
+        results = [_fully_novel() for _ in texts]
+        positions = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not positions:
+            return results
 
-            # Get highest similarity
-            highest_similarity = max(sim for _, sim in similarities)
+        queries = [texts[i] for i in positions]
+        try:
+            # A running daemon has the model warm; ask it first
+            neighbors = self._search_via_daemon(
+                queries, [namespaces[i] for i in positions]
+            )
+            if neighbors is None:
+                if not self.load_model and not self._model_ready():
+                    logger.debug(
+                        "Embedding model not loaded, deferring novelty check "
+                        "for %d texts",
+                        len(queries),
+                    )
+                    for i in positions:
+                        results[i] = _deferred()
+                    return results
+                neighbors = self._get_recall_service().search_batch(
+                    queries,
+                    k=self.k,
+                    namespaces=[namespaces[i] for i in positions],
+                    min_similarity=0.0,  # Get all results, filter ourselves
+                )
+            scored = self._score(neighbors)
+        except Exception as e:
+            # On error, assume novel to avoid blocking captures
+            logger.warning("Novelty check failed: %s", e)
+            return results
 
-            # Calculate novelty score (inverse of highest similarity)
-            # If highest_similarity = 0.9, novelty = 0.1
-            novelty_score = 1.0 - highest_similarity
+        for i, text, result in zip(positions, queries, scored, strict=True):
+            logger.debug(
+                "Novelty check: score=%.2f, highest_sim=%.2f, similar_count=%d, "
+                "is_novel=%s for: %s...",
+                result.novelty_score,
+                result.highest_similarity,
+                len(result.similar_memory_ids),
+                result.is_novel,
+                text[:50],
+            )
+            results[i] = result
+        return results
 
-            # Collect IDs of similar memories above threshold
-            similar_ids = [
-                mem_id
-                for mem_id, sim in similarities
-                if sim >= self.similarity_threshold
-            ]
+    def _score(self, neighbors: list[list[MemoryResult]]) -> list[NoveltyResult]:
+        """Compute novelty from the similar memories found for each text.
 
-            is_novel = novelty_score >= self.novelty_threshold
+        Similarity is 1 / (1 + distance) and novelty is one minus the
+        highest similarity; a text with no similar memories is fully
+        novel. Distances are laid out in a (texts x k) matrix padded with
+        infinity, so the scores for the whole batch are computed at once.
 
-            logger.debug(
-                "Novelty check: score=%.2f, highest_sim=%.2f, similar_count=%d, is_novel=%s",
-                novelty_score,
-                highest_similarity,
-                len(similar_ids),
-                is_novel,
-            )
+        Args:
+            neighbors: Similar memories per text.
 
-            return NoveltyResult(
-                novelty_score=novelty_score,
-                is_novel=is_novel,
-                similar_memory_ids=similar_ids,
-                highest_similarity=highest_similarity,
-            )
+        Returns:
+            NoveltyResult per text.
+        """
+        import numpy as np
 
-        except Exception as e:
-            # On error, assume novel to avoid blocking captures
-            logger.warning("Novelty check failed: %s", e)
-            return NoveltyResult(
-                novelty_score=1.0,
-                is_novel=True,
-                similar_memory_ids=[],
-                highest_similarity=0.0,
+        width = max((len(row) for row in neighbors), default=0)
+        distances = np.full((len(neighbors), max(width, 1)), np.inf)
+        for i, row in enumerate(neighbors):
+            distances[i, : len(row)] = [result.distance for result in row]
+
+        # Convert distance to similarity; padding (inf) becomes 0.0
+        similarities = np.where(
+            distances >= 0, 1.0 / (1.0 + np.maximum(distances, 0.0)), 0.0
+        )
+        highest = similarities.max(axis=1)
+        # If highest_similarity = 0.9, novelty = 0.1
+        novelty = 1.0 - highest
+        is_novel = novelty >= self.novelty_threshold
+        similar = (similarities >= self.similarity_threshold) & np.isfinite(distances)
+
+        return [
+            NoveltyResult(
+                novelty_score=float(novelty[i]),
+                is_novel=bool(is_novel[i]),
+                similar_memory_ids=[
+                    result.memory.id
+                    for result, hit in zip(row, similar[i], strict=False)
+                    if hit
+                ],
+                highest_similarity=float(highest[i]),
             )
+            for i, row in enumerate(neighbors)
+        ]
 
     def check_signal_novelty(
         self,
@@ -271,8 +387,9 @@ class NoveltyChecker:
     ) -> list[NoveltyResult]:
         """Check novelty for multiple signals.
 
-        Checks each signal individually and returns results in the
-        same order as the input signals.
+        Embeds all signal texts in one batch and looks them up in one
+        index pass, instead of a search per signal. Results are the same
+        as check_signal_novelty() for each signal, in input order.
 
         Args:
             signals: List of capture signals to check.
@@ -289,4 +406,7 @@ class NoveltyChecker:
                 if result.is_novel:
                     process_novel_signal(signal)
         """
-        return [self.check_signal_novelty(signal) for signal in signals]
+        return self._check_batch(
+            [signal.context or signal.match for signal in signals],
+            [signal.suggested_namespace for signal in signals],
+        )
@@ -28,6 +28,7 @@ Environment Variables:
     HOOK_POST_TOOL_USE_MAX_RESULTS: Max memories to inject (default: 3)
     HOOK_POST_TOOL_USE_AUTO_CAPTURE: Auto-capture from written content (default: true)
     HOOK_POST_TOOL_USE_AUTO_CAPTURE_MIN_CONFIDENCE: Min confidence (default: 0.8)
+    HOOK_POST_TOOL_USE_DRAIN_LIMIT: Deferred captures indexed per run (default: 10)
     HOOK_DEBUG: Enable debug logging (default: false)
 """
 
@@ -215,6 +216,74 @@ def _auto_capture_signals(
     return captured
 
 
+def _drain_index_queue(limit: int) -> int:
+    """Index some of the memories queued by deferred captures.
+
+    UserPromptSubmit and Stop captures defer indexing; draining a few per
+    tool use makes them searchable during the session instead of only
+    after the Stop hook's sync.
+
+    Args:
+        limit: Maximum number of queued memories to index.
+
+    Returns:
+        Number of memories indexed.
+    """
+    if limit <= 0:
+        return 0
+    try:
+        from git_notes_memory.config import get_project_index_path
+
+        if not get_project_index_path().exists():
+            return 0
+
+        from git_notes_memory.sync import get_sync_service
+
+        return get_sync_service().drain_index_queue(limit=limit)
+    except Exception as e:
+        logger.debug("Index queue drain skipped: %s", e)
+        return 0
+
+
+def _search_via_daemon(
+    query: str,
+    max_results: int,
+    min_similarity: float,
+) -> list[MemoryResult] | None:
+    """Search through the memory daemon if one is running.
+
+    Args:
+        query: Search query text.
+        max_results: Maximum number of results to return.
+        min_similarity: Minimum similarity score threshold.
+
+    Returns:
+        List of memory results, or None if the daemon is unavailable.
+    """
+    from git_notes_memory.config import get_project_index_path
+    from git_notes_memory.daemon import DaemonError, get_daemon_client
+
+    try:
+        client = get_daemon_client()
+        if client is None:
+            return None
+        index_path = get_project_index_path()
+        if not index_path.exists():
+            return []
+        return client.search(
+            query,
+            index_path=index_path,
+            k=max_results,
+            min_similarity=min_similarity,
+            hybrid=True,
+        )
+    except DaemonError as e:
+        logger.debug("Daemon search unavailable, using in-process: %s", e)
+    except Exception as e:
+        logger.debug("Daemon search skipped: %s", e)
+    return None
+
+
 def _search_related_memories(
     terms: list[str],
     max_results: int,
@@ -230,16 +299,22 @@ def _search_related_memories(
     Returns:
         List of memory results.
     """
+    # Join terms for semantic search
+    query = " ".join(terms)
+    logger.debug("Searching for: %s", query)
+
+    # Prefer the warm daemon; fall back to in-process services
+    daemon_results = _search_via_daemon(query, max_results, min_similarity)
+    if daemon_results is not None:
+        return daemon_results
+
     try:
         from git_notes_memory.recall import get_default_service
 
         recall = get_default_service()
 
-        # Join terms for semantic search
-        query = " ".join(terms)
-        logger.debug("Searching for: %s", query)
-
-        results = recall.search(
+        # Domain terms are keywords; hybrid search catches exact identifiers
+        results = recall.search_hybrid(
             query=query,
             k=max_results,
             min_similarity=min_similarity,
@@ -284,7 +359,7 @@ def _format_memories_xml(
             "root",
             "memory",
             namespace=memory.namespace,
-            similarity=f"{1 - result.distance:.2f}",
+            similarity=f"{1.0 / (1.0 + result.distance):.2f}",
         )
 
         builder.add_element(memory_key, "summary", text=memory.summary)
@@ -422,6 +497,11 @@ def main() -> None:
                         logger.debug("Detected %d signals in content", len(signals))
                         captured = _auto_capture_signals(signals, file_path)
 
+            # Index captures deferred earlier in the session before searching
+            drained = _drain_index_queue(config.post_tool_use_drain_limit)
+            if drained:
+                logger.debug("Indexed %d deferred captures", drained)
+
             # Search for related memories based on file path
             if file_path:
                 logger.debug("Processing file: %s", file_path)
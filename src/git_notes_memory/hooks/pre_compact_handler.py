@@ -90,57 +90,61 @@ def _extract_summary(signal: CaptureSignal) -> str:
     return text
 
 
-def _capture_memory(
-    signal: CaptureSignal,
-    namespace: str,
-) -> dict[str, Any]:
-    """Capture a signal as a memory.
+def _capture_memories(signals: list[CaptureSignal]) -> list[dict[str, Any]]:
+    """Capture signals as memories in a single batch.
+
+    Each signal is captured in its suggested namespace.
 
     Args:
-        signal: The capture signal with content.
-        namespace: Target namespace for the memory.
+        signals: The capture signals with content.
 
     Returns:
-        Dict with capture result (success, memory_id, or error).
+        One dict per signal with its capture result (success, memory_id,
+        or error).
     """
     try:
         from git_notes_memory.capture import get_default_service
+        from git_notes_memory.models import CaptureRequest
 
         capture = get_default_service()
 
-        # Extract summary and content
-        summary = _extract_summary(signal)
-        content = signal.context if signal.context else signal.match
-
-        result = capture.capture(
-            namespace=namespace,
-            summary=summary,
-            content=content,
-            tags=["auto-captured", "pre-compact"],
+        results = capture.capture_batch(
+            [
+                CaptureRequest(
+                    namespace=signal.suggested_namespace,
+                    summary=_extract_summary(signal),
+                    content=signal.context if signal.context else signal.match,
+                    tags=("auto-captured", "pre-compact"),
+                )
+                for signal in signals
+            ]
         )
 
-        if result.success and result.memory:
-            return {
-                "success": True,
-                "memory_id": result.memory.id,
-                "summary": result.memory.summary,
-            }
-        return {
-            "success": False,
-            "error": result.warning or "Capture failed",
-        }
+        captured: list[dict[str, Any]] = []
+        for result in results:
+            if result.success and result.memory:
+                captured.append(
+                    {
+                        "success": True,
+                        "memory_id": result.memory.id,
+                        "summary": result.memory.summary,
+                    }
+                )
+            else:
+                captured.append(
+                    {
+                        "success": False,
+                        "error": result.warning or "Capture failed",
+                    }
+                )
+        return captured
 
     except ImportError:
-        return {
-            "success": False,
-            "error": "git-notes-memory library not installed",
-        }
+        error = "git-notes-memory library not installed"
     except Exception as e:
-        logger.debug("Failed to capture memory: %s", e, exc_info=True)
-        return {
-            "success": False,
-            "error": str(e),
-        }
+        logger.debug("Failed to capture memories: %s", e, exc_info=True)
+        error = str(e)
+    return [{"success": False, "error": error} for _ in signals]
 
 
 def _report_captures(captured: list[dict[str, Any]]) -> None:
@@ -283,10 +287,17 @@ def main() -> None:
 
             hook_logger.info("Analyzing transcript for uncaptured signals...")
 
-            # Analyze transcript for uncaptured signals
+            from git_notes_memory.config import (
+                TRANSCRIPT_STATE_DIR_NAME,
+                get_data_path,
+            )
+
+            # Analyze transcript for uncaptured signals; only the lines
+            # appended since the previous analysis are scanned
             analyzer = SessionAnalyzer(
                 min_confidence=config.pre_compact_min_confidence,
                 max_signals=config.pre_compact_max_captures,
+                state_dir=get_data_path() / TRANSCRIPT_STATE_DIR_NAME,
             )
 
             signals = analyzer.analyze(transcript_path, check_novelty=True)
@@ -317,12 +328,9 @@ def main() -> None:
             hook_logger.info("Auto-capturing signals...")
 
             # Capture the signals
-            captured: list[dict[str, Any]] = []
-
-            for signal in signals:
-                result = _capture_memory(signal, signal.suggested_namespace)
-                captured.append(result)
+            captured = _capture_memories(signals)
 
+            for result in captured:
                 if result.get("success"):
                     hook_logger.info("  Captured: %s", result)
                 else:
@@ -10,6 +10,10 @@ The analyzer:
 3. Filters out already-captured memories via novelty checking
 4. Ranks remaining signals by importance
 
+Given a state directory, JSONL transcripts are analyzed incrementally: the
+transcript is streamed from where the previous analysis stopped, and only
+the appended lines are parsed and scanned (see transcript_state).
+
 Example::
 
     analyzer = SessionAnalyzer()
@@ -21,6 +25,7 @@ Example::
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -83,6 +88,7 @@ class SessionAnalyzer:
         min_confidence: Minimum confidence for signal inclusion.
         max_signals: Maximum signals to return.
         novelty_threshold: Minimum novelty score for inclusion.
+        state_dir: Directory for incremental scan state, if any.
     """
 
     # Pattern for extracting user messages from transcript
@@ -107,6 +113,7 @@ class SessionAnalyzer:
         *,
         signal_detector: SignalDetector | None = None,
         novelty_checker: NoveltyChecker | None = None,
+        state_dir: Path | None = None,
     ) -> None:
         """Initialize the session analyzer.
 
@@ -116,10 +123,14 @@ class SessionAnalyzer:
             novelty_threshold: Minimum novelty score for inclusion.
             signal_detector: Optional pre-configured SignalDetector.
             novelty_checker: Optional pre-configured NoveltyChecker.
+            state_dir: Directory for incremental scan state. If set, analyze()
+                only scans the lines appended to a JSONL transcript since
+                its previous analysis.
         """
         self.min_confidence = min_confidence
         self.max_signals = max_signals
         self.novelty_threshold = novelty_threshold
+        self.state_dir = state_dir
 
         self._signal_detector = signal_detector
         self._novelty_checker = novelty_checker
@@ -160,15 +171,8 @@ class SessionAnalyzer:
             Path validation is performed to prevent path traversal attacks.
             Only absolute paths are accepted, and '..' sequences are rejected.
         """
-        try:
-            # Validate path for security (prevents path traversal)
-            path = validate_file_path(transcript_path, must_exist=False)
-        except ValueError as e:
-            logger.warning("Invalid transcript path: %s", e)
-            return None
-
-        if not path.exists():
-            logger.warning("Transcript file not found: %s", path)
+        path = self._resolve_transcript_path(transcript_path)
+        if path is None:
             return None
 
         try:
@@ -187,6 +191,27 @@ class SessionAnalyzer:
         else:
             return self._parse_plain_text_transcript(raw_content)
 
+    def _resolve_transcript_path(self, transcript_path: str | Path) -> Path | None:
+        """Validate a transcript path.
+
+        Args:
+            transcript_path: Path to the transcript file.
+
+        Returns:
+            The validated path, or None if it is invalid or does not exist.
+        """
+        try:
+            # Validate path for security (prevents path traversal)
+            path = validate_file_path(transcript_path, must_exist=False)
+        except ValueError as e:
+            logger.warning("Invalid transcript path: %s", e)
+            return None
+
+        if not path.exists():
+            logger.warning("Transcript file not found: %s", path)
+            return None
+        return path
+
     def _parse_jsonl_transcript(
         self, lines: list[str], raw_content: str
     ) -> TranscriptContent:
@@ -212,49 +237,14 @@ class SessionAnalyzer:
             except json.JSONDecodeError:
                 continue
 
-            # Skip non-message entries (summaries, snapshots, etc.)
-            entry_type = entry.get("type", "")
-            if entry_type in ("summary", "snapshot", "isSnapshotUpdate"):
-                continue
-
-            # Extract message content
-            message = entry.get("message", "")
-            if not message:
-                continue
-
-            # Handle message as string or structured content
-            if isinstance(message, dict):
-                # Message might be structured with 'content' field
-                content = message.get("content", "")
-                if isinstance(content, list):
-                    # Claude message format: content is list of {type, text} blocks
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text = block.get("text", "")
-                            if text:
-                                text_parts.append(text)
-                    message = "\n".join(text_parts)
-                elif isinstance(content, str):
-                    message = content
-                else:
-                    message = str(message)
-            message = str(message).strip()
-
-            if not message:
+            parsed = self._parse_jsonl_entry(entry)
+            if parsed is None:
                 continue
-
-            # Classify by userType field
-            user_type = entry.get("userType", "").lower()
-            if user_type in ("human", "user"):
+            is_user, message = parsed
+            if is_user:
                 user_messages.append(message)
-            elif user_type == "assistant":
-                assistant_messages.append(message)
             else:
-                # Default: treat as assistant if has message but unknown userType
-                # This catches tool responses and other content
-                if entry_type == "assistant" or "tool" in entry_type.lower():
-                    assistant_messages.append(message)
+                assistant_messages.append(message)
 
         total_turns = max(len(user_messages), len(assistant_messages))
 
@@ -271,6 +261,63 @@ class SessionAnalyzer:
             total_turns=total_turns,
         )
 
+    def _parse_jsonl_entry(self, entry: object) -> tuple[bool, str] | None:
+        """Extract the message from one JSONL transcript entry.
+
+        Args:
+            entry: Decoded JSON value of one transcript line.
+
+        Returns:
+            (is_user, message) tuple, or None if the entry carries no
+            user or assistant message.
+        """
+        if not isinstance(entry, dict):
+            return None
+
+        # Skip non-message entries (summaries, snapshots, etc.)
+        entry_type = entry.get("type", "")
+        if entry_type in ("summary", "snapshot", "isSnapshotUpdate"):
+            return None
+
+        # Extract message content
+        message = entry.get("message", "")
+        if not message:
+            return None
+
+        # Handle message as string or structured content
+        if isinstance(message, dict):
+            # Message might be structured with 'content' field
+            content = message.get("content", "")
+            if isinstance(content, list):
+                # Claude message format: content is list of {type, text} blocks
+                text_parts = []
+                for block in content:
+                    if isinstance(block, dict) and block.get("type") == "text":
+                        text = block.get("text", "")
+                        if text:
+                            text_parts.append(text)
+                message = "\n".join(text_parts)
+            elif isinstance(content, str):
+                message = content
+            else:
+                message = str(message)
+        message = str(message).strip()
+
+        if not message:
+            return None
+
+        # Classify by userType field
+        user_type = entry.get("userType", "").lower()
+        if user_type in ("human", "user"):
+            return True, message
+        if user_type == "assistant":
+            return False, message
+        # Default: treat as assistant if has message but unknown userType
+        # This catches tool responses and other content
+        if entry_type == "assistant" or "tool" in entry_type.lower():
+            return False, message
+        return None
+
     def _parse_plain_text_transcript(self, raw_content: str) -> TranscriptContent:
         """Parse plain text format transcript.
 
@@ -309,7 +356,8 @@ class SessionAnalyzer:
         """Analyze transcript for uncaptured memorable content.
 
         Parses the transcript, detects signals in user messages, and filters
-        out already-captured content via novelty checking.
+        out already-captured content via novelty checking. With a state_dir,
+        JSONL transcripts are scanned incrementally (see _detect_incremental).
 
         Args:
             transcript_path: Path to the transcript file.
@@ -319,6 +367,80 @@ class SessionAnalyzer:
             List of CaptureSignal objects for uncaptured content,
             sorted by confidence (highest first), limited to max_signals.
         """
+        filtered_signals: list[CaptureSignal] | None = None
+        if self.state_dir is not None:
+            path = self._resolve_transcript_path(transcript_path)
+            if path is None:
+                return []
+            filtered_signals = self._detect_incremental(
+                path, self.state_dir, check_novelty=check_novelty
+            )
+        if filtered_signals is None:
+            filtered_signals = self._select(
+                self._detect_full(transcript_path), check_novelty=check_novelty
+            )
+
+        # Sort by confidence (highest first) and limit
+        filtered_signals.sort(key=lambda s: s.confidence, reverse=True)
+        result = filtered_signals[: self.max_signals]
+
+        logger.debug("Returning %d uncaptured signals", len(result))
+        return result
+
+    def _select(
+        self, signals: list[CaptureSignal], *, check_novelty: bool
+    ) -> list[CaptureSignal]:
+        """Keep the signals analyze() reports, in their original order.
+
+        Args:
+            signals: Detected signals.
+            check_novelty: Whether to drop signals that are already captured.
+
+        Returns:
+            Signals at or above min_confidence that, if checked, are novel.
+        """
+        if not signals:
+            return []
+
+        # Filter by minimum confidence
+        filtered_signals = [s for s in signals if s.confidence >= self.min_confidence]
+
+        logger.debug(
+            "After confidence filter (>= %.2f): %d signals",
+            self.min_confidence,
+            len(filtered_signals),
+        )
+
+        # Filter by novelty if enabled
+        if check_novelty and filtered_signals:
+            checker = self._get_novelty_checker()
+            novel_signals = []
+
+            novelties = checker.batch_check_novelty(filtered_signals)
+            for signal, novelty in zip(filtered_signals, novelties, strict=True):
+                if novelty.is_novel:
+                    novel_signals.append(signal)
+                else:
+                    logger.debug(
+                        "Signal filtered (duplicate): %s... (novelty=%.2f)",
+                        signal.match[:30],
+                        novelty.novelty_score,
+                    )
+
+            filtered_signals = novel_signals
+            logger.debug("After novelty filter: %d signals", len(filtered_signals))
+
+        return filtered_signals
+
+    def _detect_full(self, transcript_path: str | Path) -> list[CaptureSignal]:
+        """Detect signals in every message of a transcript.
+
+        Args:
+            transcript_path: Path to the transcript file.
+
+        Returns:
+            Signals from user messages, then assistant messages.
+        """
         transcript = self.parse_transcript(transcript_path)
 
         if transcript is None:
@@ -349,46 +471,138 @@ class SessionAnalyzer:
             len(transcript.user_messages),
             len(transcript.assistant_messages),
         )
+        return all_signals
 
-        if not all_signals:
-            return []
+    def _detect_incremental(
+        self, path: Path, state_dir: Path, *, check_novelty: bool
+    ) -> list[CaptureSignal] | None:
+        """Select signals in a JSONL transcript, scanning only new lines.
 
-        # Filter by minimum confidence
-        filtered_signals = [
-            s for s in all_signals if s.confidence >= self.min_confidence
-        ]
+        Resumes from the state saved by the previous analysis of the same
+        transcript, streams the lines appended since then and merges their
+        signals into the retained ones. Only complete lines are consumed; a
+        last line that is still being written is left for the next call.
+        The transcript is read again from the start if it was truncated or
+        replaced, or if the detector or selection settings changed.
 
-        logger.debug(
-            "After confidence filter (>= %.2f): %d signals",
-            self.min_confidence,
-            len(filtered_signals),
-        )
+        Signals are filtered (see _select) before the retained ones are
+        capped, so signals that are already captured never take the place
+        of weaker novel ones. Retained signals are checked again on every
+        call, as they may have been captured since.
 
-        # Filter by novelty if enabled
-        if check_novelty and filtered_signals:
-            checker = self._get_novelty_checker()
-            novel_signals = []
+        Args:
+            path: Validated transcript path.
+            state_dir: Directory holding the scan state.
+            check_novelty: Whether to drop signals that are already captured.
 
-            for signal in filtered_signals:
-                novelty = checker.check_signal_novelty(signal)
-                if novelty.is_novel:
-                    novel_signals.append(signal)
-                else:
-                    logger.debug(
-                        "Signal filtered (duplicate): %s... (novelty=%.2f)",
-                        signal.match[:30],
-                        novelty.novelty_score,
-                    )
+        Returns:
+            The strongest selected signals in the transcript so far (at
+            most TRANSCRIPT_STATE_MAX_SIGNALS), or None if the transcript is
+            not JSONL and has to be parsed in full.
+        """
+        from git_notes_memory.config import (
+            TRANSCRIPT_STATE_MAX_AGE_SECONDS,
+            TRANSCRIPT_STATE_MAX_SIGNALS,
+        )
+        from git_notes_memory.hooks import transcript_state
 
-            filtered_signals = novel_signals
-            logger.debug("After novelty filter: %d signals", len(filtered_signals))
+        detector = self._get_signal_detector()
+        detector_key = (
+            f"{detector.min_confidence}:{detector.context_window}:"
+            f"{self.min_confidence}:{int(check_novelty)}"
+        )
+        state_file = transcript_state.state_path(state_dir, path)
+        state = transcript_state.load_state(state_file)
+        if state is None:
+            transcript_state.prune_states(state_dir, TRANSCRIPT_STATE_MAX_AGE_SECONDS)
 
-        # Sort by confidence (highest first) and limit
-        filtered_signals.sort(key=lambda s: s.confidence, reverse=True)
-        result = filtered_signals[: self.max_signals]
+        signals: list[CaptureSignal] = []
+        offset = user_count = assistant_count = 0
+        try:
+            with path.open("rb") as f:
+                if (
+                    state is not None
+                    and state.detector_key == detector_key
+                    and state.offset <= os.fstat(f.fileno()).st_size
+                    and transcript_state.tail_digest(f, state.offset) == state.tail
+                ):
+                    signals = list(state.signals)
+                    offset = state.offset
+                    user_count = state.user_messages
+                    assistant_count = state.assistant_messages
+                f.seek(offset)
+
+                is_jsonl = offset > 0
+                for raw in f:
+                    line = raw.strip()
+                    if not is_jsonl and line:
+                        # Detect format: JSONL if first non-empty line starts with '{'
+                        if not line.startswith(b"{"):
+                            return None
+                        is_jsonl = True
+                    try:
+                        entry = json.loads(line) if line else None
+                    except ValueError:
+                        if not raw.endswith(b"\n"):
+                            break  # Last line is still being written
+                        entry = None
+                    offset += len(raw)
+
+                    parsed = self._parse_jsonl_entry(entry)
+                    if parsed is None:
+                        continue
+                    is_user, message = parsed
+                    if is_user:
+                        user_count += 1
+                    else:
+                        assistant_count += 1
+                    signals.extend(detector.detect(message))
+                    if len(signals) > 2 * TRANSCRIPT_STATE_MAX_SIGNALS:
+                        signals = self._strongest(
+                            self._select(signals, check_novelty=check_novelty),
+                            TRANSCRIPT_STATE_MAX_SIGNALS,
+                        )
+
+                if not is_jsonl:
+                    return None  # Nothing but blank lines yet
+                tail = transcript_state.tail_digest(f, offset)
+        except OSError as e:
+            logger.warning("Failed to read transcript: %s", e)
+            return []
 
-        logger.debug("Returning %d uncaptured signals", len(result))
-        return result
+        signals = self._strongest(
+            self._select(signals, check_novelty=check_novelty),
+            TRANSCRIPT_STATE_MAX_SIGNALS,
+        )
+        logger.debug(
+            "Scanned transcript up to byte %d (user: %d, assistant: %d), "
+            "%d signals retained",
+            offset,
+            user_count,
+            assistant_count,
+            len(signals),
+        )
+        try:
+            transcript_state.save_state(
+                state_file,
+                transcript_state.TranscriptState(
+                    transcript=str(path),
+                    offset=offset,
+                    tail=tail,
+                    detector_key=detector_key,
+                    signals=signals,
+                    user_messages=user_count,
+                    assistant_messages=assistant_count,
+                ),
+            )
+        except OSError as e:
+            logger.warning("Failed to save transcript state: %s", e)
+        return signals
+
+    @staticmethod
+    def _strongest(signals: list[CaptureSignal], limit: int) -> list[CaptureSignal]:
+        """Keep the highest-confidence signals, earliest first among ties."""
+        return sorted(signals, key=lambda s: s.confidence, reverse=True)[:limit]
 
     def analyze_content(
         self,
@@ -423,7 +637,12 @@ class SessionAnalyzer:
         # Filter by novelty
         if check_novelty and filtered:
             checker = self._get_novelty_checker()
-            filtered = [s for s in filtered if checker.check_signal_novelty(s).is_novel]
+            novelties = checker.batch_check_novelty(filtered)
+            filtered = [
+                s
+                for s, novelty in zip(filtered, novelties, strict=True)
+                if novelty.is_novel
+            ]
 
         # Sort and limit
         filtered.sort(key=lambda s: s.confidence, reverse=True)
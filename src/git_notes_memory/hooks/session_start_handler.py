@@ -24,6 +24,7 @@ Environment Variables:
     HOOK_ENABLED: Master switch for hooks (default: true)
     HOOK_SESSION_START_ENABLED: Enable this hook (default: true)
     HOOK_SESSION_START_FETCH_REMOTE: Fetch notes from remote on start (default: false)
+    HOOK_SESSION_START_SNAPSHOT: Serve context from its cached snapshot (default: true)
     HOOK_DEBUG: Enable debug logging (default: false)
 """
 
@@ -31,13 +32,10 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from git_notes_memory.config import HOOK_SESSION_START_TIMEOUT, get_project_index_path
-from git_notes_memory.git_ops import GitOps
 from git_notes_memory.hooks.config_loader import load_hook_config
-from git_notes_memory.hooks.context_builder import ContextBuilder
-from git_notes_memory.hooks.guidance_builder import GuidanceBuilder
 from git_notes_memory.hooks.hook_utils import (
     cancel_timeout,
     log_hook_input,
@@ -46,9 +44,11 @@ from git_notes_memory.hooks.hook_utils import (
     setup_timeout,
     timed_hook_execution,
 )
-from git_notes_memory.hooks.project_detector import detect_project
 from git_notes_memory.observability import get_logger
 
+if TYPE_CHECKING:
+    from git_notes_memory.git_ops import GitOps
+
 __all__ = ["main"]
 
 logger = get_logger(__name__)
@@ -158,6 +158,13 @@ def main() -> None:
                 timer.set_status("skipped")
                 sys.exit(0)
 
+            # Deferred until the hook is known to run: context building
+            # pulls in git_ops, the index schema and the XML builders
+            from git_notes_memory.git_ops import GitOps
+            from git_notes_memory.hooks.context_builder import ContextBuilder
+            from git_notes_memory.hooks.guidance_builder import GuidanceBuilder
+            from git_notes_memory.hooks.project_detector import detect_project
+
             # Extract working directory and session source
             cwd = input_data["cwd"]
             session_source = input_data.get("source", "startup")
@@ -198,23 +205,31 @@ def main() -> None:
             # This ensures we have the latest memories from collaborators
             if git_ops is not None and config.session_start_fetch_remote:
                 try:
-                    fetch_results = git_ops.fetch_notes_from_remote()
-                    merged_count = 0
-                    for ns, success in fetch_results.items():
-                        if success and git_ops.merge_notes_from_tracking(ns):
-                            merged_count += 1
-                    # Reindex to include fetched memories
-                    if merged_count > 0:
+                    # One fetch for all namespaces; unchanged ones are not merged
+                    merged: set[str] = set()
+                    git_ops.sync_notes_with_remote(push=False, merged=merged)
+                    # Reindex to include fetched memories, only if any arrived
+                    if merged:
                         from git_notes_memory.sync import get_sync_service as get_sync
 
                         sync_service = get_sync(repo_path=cwd)
                         sync_service.reindex()
                         logger.debug(
-                            "Fetched and merged %d namespaces from remote", merged_count
+                            "Fetched and merged %d namespaces from remote", len(merged)
                         )
                 except Exception as e:
                     logger.debug("Remote fetch on start skipped: %s", e)
 
+            # Keep services warm for subsequent hooks (opt-in)
+            if config.daemon_enabled:
+                try:
+                    from git_notes_memory.daemon import spawn_daemon
+
+                    if spawn_daemon(idle_timeout=config.daemon_idle_timeout):
+                        logger.debug("Spawned memory daemon")
+                except Exception as e:
+                    logger.debug("Memory daemon spawn skipped: %s", e)
+
             # Build response guidance if enabled
             guidance_xml = ""
             if config.session_start_include_guidance:
@@ -228,9 +243,9 @@ def main() -> None:
                     config.session_start_guidance_detail.value,
                 )
 
-            # Build memory context
+            # Build memory context (served from its snapshot while current)
             context_builder = ContextBuilder(config=config)
-            memory_context = context_builder.build_context(
+            memory_context = context_builder.get_context(
                 project=project_info.name,
                 session_source=session_source,
                 spec_id=project_info.spec_id,
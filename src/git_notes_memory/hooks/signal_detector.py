@@ -4,6 +4,10 @@ This module provides the SignalDetector class for identifying capture signals
 in user input text. It uses pre-compiled regex patterns to efficiently detect
 decision-making, learning moments, blockers, and other memorable content.
 
+All patterns are scanned in a single pass: they are combined into one
+alternation regex, so the text is searched once instead of once per
+pattern, with the same results as running each pattern's ``finditer``.
+
 The detector supports:
 - Pattern-based signal detection with confidence scoring
 - Automatic namespace classification based on signal type
@@ -21,6 +25,7 @@ Example::
 from __future__ import annotations
 
 import re
+from collections.abc import Iterator
 from typing import ClassVar
 
 from git_notes_memory.hooks.models import CaptureSignal, SignalType
@@ -167,6 +172,113 @@ BLOCK_PATTERN = re.compile(
 )
 
 
+# Leading global inline flags, e.g. "(?i)"; scoped to the pattern when combined
+_GLOBAL_FLAGS = re.compile(r"\(\?([aiLmsux]+)\)")
+
+
+class _PatternScanner:
+    """Single-pass scanner over a list of signal patterns.
+
+    The patterns are combined into one alternation, so the text is searched
+    once for the next position where any pattern matches instead of once
+    per pattern. Patterns starting with a word boundary share a single
+    ``\\b`` test, which rules out most positions before any pattern is
+    tried.
+
+    The search regex has no capture groups, because groups stop the regex
+    engine from skipping alternatives by their first character. At each
+    position it finds, a second copy of the alternation with one named
+    group per pattern tells which pattern matched first; the patterns
+    before it cannot match there, and the ones after it are checked
+    individually. Each pattern resumes after the end of its previous
+    match, as ``finditer`` does.
+
+    Attributes:
+        patterns: (signal type, compiled pattern, base confidence) in
+            definition order.
+    """
+
+    def __init__(
+        self,
+        patterns: list[tuple[SignalType, re.Pattern[str], float]],
+    ) -> None:
+        """Build the combined regexes.
+
+        Args:
+            patterns: (signal type, compiled pattern, base confidence) in
+                definition order.
+        """
+        self.patterns = patterns
+
+        other: list[int] = []
+        bounded: list[int] = []
+        bodies: dict[int, str] = {}
+        for index, (_, pattern, _) in enumerate(patterns):
+            source = pattern.pattern
+            flags = ""
+            leading = _GLOBAL_FLAGS.match(source)
+            if leading:
+                flags = leading.group(1)
+                source = source[leading.end() :]
+            # \b depends on the ASCII/locale flags, so only share it without them
+            if source.startswith(r"\b") and not {"a", "L"} & set(flags):
+                bounded.append(index)
+                source = source[2:]
+            else:
+                other.append(index)
+            bodies[index] = f"(?{flags}:{source})" if flags else f"(?:{source})"
+
+        def alternation(named: bool) -> str:
+            def body(index: int) -> str:
+                return f"(?P<_p{index}>{bodies[index]})" if named else bodies[index]
+
+            alternatives = [body(index) for index in other]
+            if bounded:
+                alternatives.append(
+                    r"\b(?:" + "|".join(body(index) for index in bounded) + ")"
+                )
+            return "|".join(alternatives)
+
+        self._search = re.compile(alternation(named=False))
+        self._identify = re.compile(alternation(named=True))
+
+        # Order the alternation tries patterns in, and each one's place in it
+        self._order = other + bounded
+        self._rank = {f"_p{index}": rank for rank, index in enumerate(self._order)}
+
+    def scan(self, text: str) -> Iterator[tuple[int, re.Match[str]]]:
+        """Find every pattern match in the text.
+
+        Yields the same matches as calling ``finditer`` on each pattern,
+        ordered by position and, at equal positions, by pattern order.
+
+        Args:
+            text: The text to scan.
+
+        Yields:
+            (pattern index, match) pairs.
+        """
+        resume_at = [0] * len(self.patterns)
+        pos = 0
+        while (candidate := self._search.search(text, pos)) is not None:
+            pos = candidate.start()
+            identified = self._identify.match(text, pos)
+            name = identified.lastgroup if identified else None
+            first = self._rank[name] if name else 0
+            hits: list[tuple[int, re.Match[str]]] = []
+            for index in self._order[first:]:
+                if pos < resume_at[index]:
+                    continue
+                match = self.patterns[index][1].match(text, pos)
+                if match is None:
+                    continue
+                resume_at[index] = max(match.end(), pos + 1)
+                hits.append((index, match))
+            hits.sort(key=lambda hit: hit[0])
+            yield from hits
+            pos += 1
+
+
 class SignalDetector:
     """Detector for capture signals in user prompts.
 
@@ -202,6 +314,7 @@ class SignalDetector:
     _compiled_patterns: ClassVar[
         dict[SignalType, list[tuple[re.Pattern[str], float]]]
     ] = {}
+    _scanner: ClassVar[_PatternScanner | None] = None
 
     def __init__(
         self,
@@ -220,15 +333,18 @@ class SignalDetector:
         self.min_confidence = min_confidence
 
         # Compile patterns if not already cached
-        if not SignalDetector._compiled_patterns:
+        if not SignalDetector._compiled_patterns or SignalDetector._scanner is None:
             self._compile_patterns()
 
     @classmethod
-    def _compile_patterns(cls) -> None:
+    def _compile_patterns(cls) -> _PatternScanner:
         """Compile all regex patterns and cache at class level.
 
         This is called once per class and cached for all instances.
         Pre-compilation significantly improves detection performance.
+
+        Returns:
+            The single-pass scanner built from the compiled patterns.
         """
         for signal_type, patterns in SIGNAL_PATTERNS.items():
             compiled = []
@@ -243,10 +359,19 @@ class SignalDetector:
                     )
             cls._compiled_patterns[signal_type] = compiled
 
+        cls._scanner = _PatternScanner(
+            [
+                (signal_type, pattern, confidence)
+                for signal_type, compiled in cls._compiled_patterns.items()
+                for pattern, confidence in compiled
+            ]
+        )
+
         logger.debug(
             "Compiled %d pattern groups",
             len(cls._compiled_patterns),
         )
+        return cls._scanner
 
     def detect(self, text: str) -> list[CaptureSignal]:
         """Detect capture signals in the given text.
@@ -285,7 +410,8 @@ class SignalDetector:
             text = text[:MAX_TEXT_LENGTH]
 
         signals: list[CaptureSignal] = []
-        block_positions: set[tuple[int, int]] = set()
+        # Block spans, in text order and non-overlapping
+        blocks: list[tuple[int, int]] = []
 
         # FIRST: Detect unicode block markers (▶ namespace ─── ... ────)
         for match in BLOCK_PATTERN.finditer(text):
@@ -315,42 +441,46 @@ class SignalDetector:
                 position=match.start(),
             )
             signals.append(signal)
-            block_positions.add((match.start(), match.end()))
-
-        logger.debug("Detected %d block markers in text", len(block_positions))
-
-        # SECOND: Detect inline patterns (skip positions covered by blocks)
-        for signal_type, patterns in self._compiled_patterns.items():
-            for pattern, base_confidence in patterns:
-                for match in pattern.finditer(text):
-                    # Skip if this position is inside a block we already captured
-                    pos = match.start()
-                    in_block = any(start <= pos < end for start, end in block_positions)
-                    if in_block:
-                        continue
-
-                    # Extract context around the match
-                    context = self._extract_context(text, match.start(), match.end())
-
-                    # Calculate final confidence (may be adjusted based on context)
-                    confidence = self.score_confidence(
-                        base_confidence,
-                        match.group(),
-                        context,
-                    )
+            blocks.append((match.start(), match.end()))
+
+        logger.debug("Detected %d block markers in text", len(blocks))
+
+        # SECOND: Detect inline patterns in one pass (skip positions covered
+        # by blocks). Matches arrive in position order, so the enclosing
+        # block is tracked with a pointer that only moves forward.
+        scanner = self._scanner or self._compile_patterns()
+        block = 0
+        for index, match in scanner.scan(text):
+            pos = match.start()
+            while block < len(blocks) and blocks[block][1] <= pos:
+                block += 1
+            if block < len(blocks) and blocks[block][0] <= pos:
+                continue
 
-                    if confidence < self.min_confidence:
-                        continue
+            signal_type, _, base_confidence = scanner.patterns[index]
 
-                    signal = CaptureSignal(
-                        type=signal_type,
-                        match=match.group(),
-                        confidence=confidence,
-                        context=context,
-                        suggested_namespace=signal_type.suggested_namespace,
-                        position=match.start(),
-                    )
-                    signals.append(signal)
+            # Extract context around the match
+            context = self._extract_context(text, match.start(), match.end())
+
+            # Calculate final confidence (may be adjusted based on context)
+            confidence = self.score_confidence(
+                base_confidence,
+                match.group(),
+                context,
+            )
+
+            if confidence < self.min_confidence:
+                continue
+
+            signal = CaptureSignal(
+                type=signal_type,
+                match=match.group(),
+                confidence=confidence,
+                context=context,
+                suggested_namespace=signal_type.suggested_namespace,
+                position=match.start(),
+            )
+            signals.append(signal)
 
         # De-duplicate overlapping signals
         signals = self._deduplicate_signals(signals)
@@ -0,0 +1,97 @@
+"""JSON state files kept by the hooks between invocations.
+
+The SessionStart context snapshot and the incremental transcript scan state
+are small JSON files that concurrent sessions may read and rewrite at once.
+Both are named by a hash of what they describe, carry a format version so
+files written by an older layout are ignored, and are replaced atomically so
+a reader sees either the old or the new file.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from git_notes_memory.observability import get_logger
+
+__all__ = [
+    "load_state_file",
+    "save_state_file",
+    "state_file_path",
+]
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def state_file_path(directory: Path, key: str) -> Path:
+    """Get the state file for a key.
+
+    Args:
+        directory: State directory.
+        key: What the state describes (e.g. a transcript path).
+
+    Returns:
+        Path of the state file, named by a hash of the key.
+    """
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return directory / f"{digest}.json"
+
+
+def load_state_file(
+    path: Path,
+    format_version: int,
+    build: Callable[[dict[str, Any]], T],
+) -> T | None:
+    """Load a state file.
+
+    Args:
+        path: State file.
+        format_version: Format version the file must have been written with.
+        build: Builds the state from the file's data; KeyError, TypeError
+            and ValueError mark the file as unreadable.
+
+    Returns:
+        The state, or None if the file is missing, unreadable or from
+        another format version.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if not isinstance(data, dict) or data.get("format") != format_version:
+            return None
+        return build(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.debug("Ignoring unreadable state file %s: %s", path, e)
+        return None
+
+
+def save_state_file(path: Path, format_version: int, data: dict[str, Any]) -> None:
+    """Write a state file atomically.
+
+    The data is written to a temporary file in the same directory and
+    renamed over the state file.
+
+    Args:
+        path: State file.
+        format_version: Format version recorded in the file.
+        data: JSON-serializable state.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"format": format_version, **data}, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
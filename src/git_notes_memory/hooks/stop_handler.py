@@ -4,7 +4,8 @@
 This handler performs session-end tasks including:
 1. Analyzing session transcript for uncaptured memorable content
 2. Prompting user to capture worthy content (if configured)
-3. Synchronizing the memory index
+3. Synchronizing the memory index (draining the deferred-indexing queue)
+4. Refreshing the SessionStart context snapshot for the next session
 
 Usage (by Claude Code):
     echo '{"cwd": "/path", "transcript_path": "...", ...}' | python stop.py
@@ -40,7 +41,7 @@ from pathlib import Path
 from typing import Any
 
 from git_notes_memory.config import HOOK_STOP_TIMEOUT
-from git_notes_memory.hooks.config_loader import load_hook_config
+from git_notes_memory.hooks.config_loader import HookConfig, load_hook_config
 from git_notes_memory.hooks.hook_utils import (
     cancel_timeout,
     get_hook_logger,
@@ -52,10 +53,6 @@ from git_notes_memory.hooks.hook_utils import (
 )
 from git_notes_memory.hooks.models import CaptureSignal
 from git_notes_memory.observability import get_logger
-from git_notes_memory.observability.exporters.otlp import (
-    export_metrics_if_configured,
-    export_traces_if_configured,
-)
 from git_notes_memory.observability.tracing import (
     clear_completed_spans,
     get_completed_spans,
@@ -105,12 +102,15 @@ def _analyze_session(transcript_path: str | None) -> list[CaptureSignal]:
         return []
 
     try:
+        from git_notes_memory.config import TRANSCRIPT_STATE_DIR_NAME, get_data_path
         from git_notes_memory.hooks.session_analyzer import SessionAnalyzer
 
+        # Only the lines appended since the previous Stop are scanned
         analyzer = SessionAnalyzer(
             min_confidence=0.7,
             max_signals=5,
             novelty_threshold=0.3,
+            state_dir=get_data_path() / TRANSCRIPT_STATE_DIR_NAME,
         )
 
         signals = analyzer.analyze(path, check_novelty=True)
@@ -135,6 +135,8 @@ def _sync_index() -> dict[str, Any]:
         from git_notes_memory.sync import SyncService, get_sync_service
 
         sync: SyncService = get_sync_service()
+        # Index memories captured with deferred indexing this session
+        drained = sync.drain_index_queue()
         # reindex(full=False) does incremental sync
         indexed = sync.reindex(full=False)
 
@@ -142,6 +144,7 @@ def _sync_index() -> dict[str, Any]:
             "success": True,
             "stats": {
                 "indexed": indexed,
+                "drained": drained,
             },
         }
 
@@ -152,10 +155,37 @@ def _sync_index() -> dict[str, Any]:
         return {"success": False, "error": str(e)}
 
 
+def _refresh_context_snapshot(cwd: str | None, config: HookConfig) -> None:
+    """Rebuild the SessionStart context snapshot after the index changed.
+
+    Sections whose namespaces did not change are reused, so this re-runs
+    only the queries for namespaces written this session, and does nothing
+    when the snapshot is still current.
+
+    Args:
+        cwd: Working directory of the session.
+        config: Hook configuration.
+    """
+    if not cwd or not config.session_start_snapshot:
+        return
+    try:
+        from git_notes_memory.config import get_project_index_path
+        from git_notes_memory.hooks.context_builder import ContextBuilder
+        from git_notes_memory.hooks.project_detector import detect_project
+
+        project_info = detect_project(cwd)
+        builder = ContextBuilder(config=config, index_path=get_project_index_path(cwd))
+        builder.get_context(project_info.name, spec_id=project_info.spec_id)
+    except Exception as e:
+        logger.debug("Context snapshot refresh skipped: %s", e)
+
+
 def _auto_capture_signals(
     signals: list[CaptureSignal],
     min_confidence: float,
     max_captures: int,
+    *,
+    defer_index: bool = True,
 ) -> tuple[list[dict[str, Any]], list[CaptureSignal]]:
     """Auto-capture high-confidence signals.
 
@@ -163,6 +193,8 @@ def _auto_capture_signals(
         signals: List of detected capture signals.
         min_confidence: Minimum confidence threshold for auto-capture.
         max_captures: Maximum number of signals to auto-capture.
+        defer_index: Queue the memories for the index sync that follows
+            instead of embedding and indexing them during capture.
 
     Returns:
         Tuple of (captured_results, remaining_signals).
@@ -187,49 +219,50 @@ def _auto_capture_signals(
 
     try:
         from git_notes_memory.capture import get_default_service
+        from git_notes_memory.models import CaptureRequest
 
         capture_service = get_default_service()
 
+        requests: list[CaptureRequest] = []
         for signal in to_capture:
-            try:
-                # Extract summary from first line or first 100 chars
-                content = signal.context or signal.match
-                lines = content.strip().split("\n")
-                summary = lines[0][:100] if lines else content[:100]
-
-                # Capture the memory
-                result = capture_service.capture(
+            # Extract summary from first line or first 100 chars
+            content = signal.context or signal.match
+            lines = content.strip().split("\n")
+            summary = lines[0][:100] if lines else content[:100]
+            requests.append(
+                CaptureRequest(
                     namespace=signal.suggested_namespace,
                     summary=summary,
                     content=content,
                 )
+            )
 
-                if result.success and result.memory:
-                    captured.append(
-                        {
-                            "memory_id": result.memory.id,
-                            "namespace": signal.suggested_namespace,
-                            "summary": summary[:50],
-                            "confidence": signal.confidence,
-                        }
-                    )
-                    logger.info(
-                        "Auto-captured memory: %s (confidence: %.2f)",
-                        result.memory.id,
-                        signal.confidence,
-                    )
-                else:
-                    # Capture failed, add back to remaining
-                    remaining.append(signal)
-                    logger.warning(
-                        "Auto-capture failed for signal: %s",
-                        result.warning or "Unknown error",
-                    )
-
-            except Exception as e:
+        # One lock and one note append per namespace for all signals;
+        # indexing is deferred to the queue drained by _sync_index
+        results = capture_service.capture_batch(requests, defer_index=defer_index)
+
+        for signal, request, result in zip(to_capture, requests, results, strict=True):
+            if result.success and result.memory:
+                captured.append(
+                    {
+                        "memory_id": result.memory.id,
+                        "namespace": signal.suggested_namespace,
+                        "summary": request.summary[:50],
+                        "confidence": signal.confidence,
+                    }
+                )
+                logger.info(
+                    "Auto-captured memory: %s (confidence: %.2f)",
+                    result.memory.id,
+                    signal.confidence,
+                )
+            else:
                 # Capture failed, add back to remaining
                 remaining.append(signal)
-                logger.warning("Auto-capture error: %s", e)
+                logger.warning(
+                    "Auto-capture failed for signal: %s",
+                    result.warning or "Unknown error",
+                )
 
     except ImportError as e:
         logger.warning("Capture service unavailable: %s", e)
@@ -253,6 +286,11 @@ def _flush_telemetry() -> dict[str, Any]:
     result: dict[str, Any] = {"traces": False, "metrics": False}
 
     try:
+        from git_notes_memory.observability.exporters.otlp import (
+            export_metrics_if_configured,
+            export_traces_if_configured,
+        )
+
         # Export traces
         spans = get_completed_spans()
         if spans:
@@ -485,6 +523,8 @@ def main() -> None:
                     detected_signals,
                     min_confidence=config.stop_auto_capture_min_confidence,
                     max_captures=config.stop_max_captures,
+                    # Without the index sync nothing would drain the queue
+                    defer_index=config.stop_sync_index,
                 )
                 hook_logger.info(
                     "Auto-capture result: %d captured, %d remaining",
@@ -515,6 +555,7 @@ def main() -> None:
                         "Index synced: %d memories indexed",
                         stats.get("indexed", 0),
                     )
+                    _refresh_context_snapshot(input_data.get("cwd"), config)
                 elif not sync_result.get("success"):
                     logger.warning("Index sync failed: %s", sync_result.get("error"))
 
@@ -0,0 +1,188 @@
+"""Incremental transcript scan state.
+
+The Stop and PreCompact hooks look for uncaptured signals in the session
+transcript, which only ever grows. Rather than re-reading and re-scanning
+the whole transcript on every invocation, SessionAnalyzer records per
+transcript how far it has read and the strongest signals found so far that
+are still worth reporting, and scans only the lines appended since.
+
+A state records the byte offset of the first unread line and a hash of the
+bytes just before it, so a transcript that was truncated or replaced is
+detected and read again from the start. The retained signals are capped
+(see TRANSCRIPT_STATE_MAX_SIGNALS), keeping the state and the memory used
+to maintain it bounded regardless of transcript size.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from git_notes_memory.hooks.models import CaptureSignal, SignalType
+from git_notes_memory.hooks.state_file import (
+    load_state_file,
+    save_state_file,
+    state_file_path,
+)
+
+__all__ = [
+    "TranscriptState",
+    "load_state",
+    "prune_states",
+    "save_state",
+    "state_path",
+    "tail_digest",
+]
+
+# Bumped when the state layout changes; older files are ignored
+_STATE_FORMAT = 1
+
+# Bytes before the offset that identify the part of a transcript already read
+_TAIL_BYTES = 64
+
+
+@dataclass(frozen=True)
+class TranscriptState:
+    """How far a transcript has been scanned, and what was found.
+
+    Attributes:
+        transcript: Path of the transcript.
+        offset: Byte offset of the first line not yet scanned.
+        tail: Digest of the bytes just before the offset (see tail_digest).
+        detector_key: Fingerprint of the detector and selection settings the
+            signals were found with.
+        signals: Strongest selected signals found so far (confident enough
+            and, if novelty was checked, not yet captured), highest
+            confidence first.
+        user_messages: User messages scanned so far.
+        assistant_messages: Assistant messages scanned so far.
+    """
+
+    transcript: str
+    offset: int
+    tail: str
+    detector_key: str
+    signals: list[CaptureSignal] = field(default_factory=list)
+    user_messages: int = 0
+    assistant_messages: int = 0
+
+
+def state_path(directory: Path, transcript: Path) -> Path:
+    """Get the state file for a transcript.
+
+    Args:
+        directory: State directory.
+        transcript: Transcript path.
+
+    Returns:
+        Path of the state file.
+    """
+    return state_file_path(directory, str(transcript))
+
+
+def tail_digest(f: BinaryIO, offset: int) -> str:
+    """Digest the bytes of a transcript just before an offset.
+
+    Args:
+        f: Transcript opened in binary mode; its position is changed.
+        offset: Byte offset.
+
+    Returns:
+        Hex digest of up to 64 bytes before the offset.
+    """
+    start = max(0, offset - _TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()[:16]
+
+
+def load_state(path: Path) -> TranscriptState | None:
+    """Load a state file.
+
+    Args:
+        path: State file.
+
+    Returns:
+        The state, or None if it is missing, unreadable or from another
+        format version.
+    """
+    return load_state_file(path, _STATE_FORMAT, _state_from_data)
+
+
+def _state_from_data(data: dict[str, Any]) -> TranscriptState:
+    """Build a state from the data of a state file."""
+    return TranscriptState(
+        transcript=data["transcript"],
+        offset=int(data["offset"]),
+        tail=data["tail"],
+        detector_key=data["detector_key"],
+        signals=[
+            CaptureSignal(
+                type=SignalType(s["type"]),
+                match=s["match"],
+                confidence=float(s["confidence"]),
+                context=s["context"],
+                suggested_namespace=s["suggested_namespace"],
+                position=int(s["position"]),
+            )
+            for s in data["signals"]
+        ],
+        user_messages=int(data["user_messages"]),
+        assistant_messages=int(data["assistant_messages"]),
+    )
+
+
+def save_state(path: Path, state: TranscriptState) -> None:
+    """Write a state file atomically.
+
+    Args:
+        path: State file.
+        state: State to write.
+    """
+    data = {
+        "transcript": state.transcript,
+        "offset": state.offset,
+        "tail": state.tail,
+        "detector_key": state.detector_key,
+        "signals": [
+            {
+                "type": s.type.value,
+                "match": s.match,
+                "confidence": s.confidence,
+                "context": s.context,
+                "suggested_namespace": s.suggested_namespace,
+                "position": s.position,
+            }
+            for s in state.signals
+        ],
+        "user_messages": state.user_messages,
+        "assistant_messages": state.assistant_messages,
+    }
+    save_state_file(path, _STATE_FORMAT, data)
+
+
+def prune_states(directory: Path, max_age_seconds: float) -> int:
+    """Remove state files not updated for a while.
+
+    Args:
+        directory: State directory.
+        max_age_seconds: Age after which a state file is removed.
+
+    Returns:
+        Number of files removed.
+    """
+    cutoff = time.time() - max_age_seconds
+    removed = 0
+    try:
+        entries = list(directory.glob("*.json"))
+    except OSError:
+        return 0
+    for entry in entries:
+        with contextlib.suppress(OSError):
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+                removed += 1
+    return removed
@@ -32,10 +32,9 @@ from __future__ import annotations
 
 import json
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from git_notes_memory.config import HOOK_USER_PROMPT_TIMEOUT
-from git_notes_memory.hooks.capture_decider import CaptureDecider
 from git_notes_memory.hooks.config_loader import load_hook_config
 from git_notes_memory.hooks.hook_utils import (
     cancel_timeout,
@@ -45,16 +44,15 @@ from git_notes_memory.hooks.hook_utils import (
     setup_timeout,
     timed_hook_execution,
 )
-from git_notes_memory.hooks.models import (
-    CaptureAction,
-    CaptureSignal,
-    SignalType,
-    SuggestedCapture,
-)
-from git_notes_memory.hooks.namespace_parser import NamespaceParser
-from git_notes_memory.hooks.signal_detector import SignalDetector
 from git_notes_memory.observability import get_logger
 
+if TYPE_CHECKING:
+    from git_notes_memory.hooks.models import (
+        CaptureAction,
+        CaptureSignal,
+        SuggestedCapture,
+    )
+
 __all__ = ["main"]
 
 logger = get_logger(__name__)
@@ -128,11 +126,15 @@ def _format_suggestions_xml(suggestions: list[SuggestedCapture]) -> str:
     return builder.to_string()
 
 
-def _capture_memory(suggestion: SuggestedCapture) -> dict[str, Any]:
+def _capture_memory(
+    suggestion: SuggestedCapture, *, defer_index: bool = True
+) -> dict[str, Any]:
     """Capture content as a memory (for AUTO action).
 
     Args:
         suggestion: The capture suggestion with pre-filled metadata.
+        defer_index: Write the note now and queue the memory for indexing
+            (by PostToolUse or the Stop hook) instead of embedding it here.
 
     Returns:
         Dict with capture result.
@@ -146,6 +148,8 @@ def _capture_memory(suggestion: SuggestedCapture) -> dict[str, Any]:
             content=suggestion.content,
             namespace=suggestion.namespace,
             tags=list(suggestion.tags),
+            # Write the note now; PostToolUse or the Stop hook indexes it
+            defer_index=defer_index,
         )
 
         if result.success and result.memory:
@@ -183,6 +187,8 @@ def _write_output(
         suggestions: List of capture suggestions (for SUGGEST action).
         captured: List of captured memory results (for AUTO action).
     """
+    from git_notes_memory.hooks.models import CaptureAction
+
     output: dict[str, Any] = {"continue": True}
 
     if action == CaptureAction.SKIP:
@@ -264,6 +270,16 @@ def main() -> None:
 
             prompt = input_data["prompt"]
 
+            # Deferred until the hook is known to run: the detection and
+            # decision modules are most of this hook's import time
+            from git_notes_memory.hooks.models import (
+                CaptureAction,
+                CaptureSignal,
+                SignalType,
+            )
+            from git_notes_memory.hooks.namespace_parser import NamespaceParser
+            from git_notes_memory.hooks.signal_detector import SignalDetector
+
             # Check for inline markers first (namespace-aware parsing)
             namespace_parser = NamespaceParser()
             parsed_marker = namespace_parser.parse(prompt)
@@ -306,7 +322,11 @@ def main() -> None:
                 sys.exit(0)
 
             # Decide what action to take
-            decider = CaptureDecider(config=config)
+            from git_notes_memory.hooks.capture_decider import CaptureDecider
+
+            # Loading the embedding model would hold up the prompt past its
+            # timeout; without a daemon, unchecked signals are only suggested
+            decider = CaptureDecider(config=config, load_model=False)
             decision = decider.decide(signals)
 
             logger.debug(
@@ -319,7 +339,9 @@ def main() -> None:
             if decision.action == CaptureAction.AUTO:
                 # Capture automatically
                 for suggestion in decision.suggested_captures:
-                    result = _capture_memory(suggestion)
+                    result = _capture_memory(
+                        suggestion, defer_index=config.stop_sync_index
+                    )
                     captured.append(result)
                     if result.get("success"):
                         logger.info(
@@ -6,6 +6,7 @@ with vector search capabilities using the sqlite-vec extension. It handles:
 - Database initialization and schema management
 - Memory CRUD operations (insert, get, update, delete)
 - Vector similarity search (KNN queries)
+- Full-text search (FTS5 with BM25 ranking)
 - Batch operations for efficiency
 - Statistics and health monitoring
 
@@ -15,16 +16,23 @@ with the index providing a queryable view.
 
 Architecture:
     - memories table: Stores memory metadata (id, commit_sha, namespace, etc.)
-    - vec_memories virtual table: Stores embeddings for KNN search
-    - Both tables are kept in sync via insert/update/delete operations
+    - vec_memories virtual table: Stores embeddings for KNN search (in
+      bit mode, quantized vectors plus full-precision ones for re-scoring)
+    - memories_fts virtual table: FTS5 index over summary and content
+    - Both tables are kept in sync via insert/update/delete operations;
+      memories_fts is maintained by triggers on the memories table
+    - namespace_versions table: per-namespace write counters bumped by
+      triggers, so caches derived from the index can tell when it changed
 """
 
 from __future__ import annotations
 
 import logging
+import re
 import sqlite3
 import struct
 import threading
+import uuid
 from contextlib import contextmanager
 from datetime import UTC, datetime
 from functools import lru_cache
@@ -33,11 +41,21 @@ from typing import TYPE_CHECKING
 
 import sqlite_vec
 
-from git_notes_memory.config import EMBEDDING_DIMENSIONS, get_index_path
+from git_notes_memory.config import (
+    EMBEDDING_DIMENSIONS,
+    INDEX_BULK_CACHE_KIB,
+    INDEX_BUSY_TIMEOUT_SECONDS,
+    INDEX_QUEUE_MAX_ATTEMPTS,
+    VECTOR_QUANTIZATION_MODES,
+    VECTOR_RESCORE_FACTOR,
+    get_index_path,
+    get_vector_quantization,
+)
 from git_notes_memory.exceptions import MemoryIndexError
 from git_notes_memory.observability.decorators import measure_duration
 from git_notes_memory.observability.metrics import get_metrics
 from git_notes_memory.observability.tracing import trace_operation
+from git_notes_memory.utils import make_memory_id, parse_memory_id
 
 logger = logging.getLogger(__name__)
 
@@ -74,7 +92,26 @@ __all__ = [
 # =============================================================================
 
 # Schema version for migrations
-SCHEMA_VERSION = 2
+SCHEMA_VERSION = 9
+
+# Schema version that rewrote abbreviated-commit memory IDs (see
+# _migrate_memory_ids); vec0 rows cannot be re-keyed by plain SQL
+_MEMORY_ID_MIGRATION_VERSION = 8
+
+# SQL matching rows keyed "namespace:<7-char commit>:index" and building
+# their canonical "namespace:<full commit>:index" ID (index starts after
+# the namespace, two colons and seven characters)
+_LEGACY_ID_SQL = """
+    length(commit_sha) > 7
+    AND id = namespace || ':' || substr(commit_sha, 1, 7) || ':'
+             || substr(id, length(namespace) + 10)
+"""
+_CANONICAL_ID_SQL = (
+    "namespace || ':' || commit_sha || ':' || substr(id, length(namespace) + 10)"
+)
+
+# Length of a full SHA-1 commit ID (SHA-256 IDs are longer)
+_FULL_SHA_LENGTH = 40
 
 # SQL statements for schema creation
 _CREATE_MEMORIES_TABLE = """
@@ -107,6 +144,52 @@ _CREATE_INDICES = [
     "CREATE INDEX IF NOT EXISTS idx_memories_namespace_timestamp ON memories(namespace, timestamp DESC)",
 ]
 
+# namespace/spec are vec0 metadata columns so filters are applied inside
+# the KNN scan and a filtered query still yields the true top-k. vec0
+# metadata cannot hold NULL, so a missing spec is stored as ''.
+_CREATE_VEC_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS vec_memories USING vec0(
+    id TEXT PRIMARY KEY,
+    embedding FLOAT[{EMBEDDING_DIMENSIONS}],
+    namespace TEXT,
+    spec TEXT
+)
+"""
+
+# Quantized storage (bit mode): the KNN scan runs over the compact
+# embedding column and the shortlist is re-scored against embedding_full, a
+# vec0 auxiliary column that is stored out of the scanned chunks but is
+# cheap to read per row. int8 is no longer offered (it was larger and slower
+# than float), but indexes built with it are still read and converted.
+_VEC_COLUMN_TYPES = {"int8": "INT8", "bit": "BIT"}
+
+# SQL expression quantizing a float32 vector for each quantized mode. "unit"
+# int8 scaling assumes components in [-1, 1], which holds for the
+# normalized embeddings produced by EmbeddingService.
+_VEC_QUANTIZE_EXPR = {
+    "int8": "vec_quantize_int8({}, 'unit')",
+    "bit": "vec_quantize_binary({})",
+}
+
+# sqlite-vec rejects KNN queries asking for more neighbors than this
+_VEC_KNN_MAX_K = 4096
+
+
+def _create_vec_table_sql(mode: str) -> str:
+    """Return the CREATE statement for vec_memories in a storage mode."""
+    if mode == "float":
+        return _CREATE_VEC_TABLE
+    return f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS vec_memories USING vec0(
+    id TEXT PRIMARY KEY,
+    embedding {_VEC_COLUMN_TYPES[mode]}[{EMBEDDING_DIMENSIONS}],
+    namespace TEXT,
+    spec TEXT,
+    +embedding_full BLOB
+)
+"""
+
+
 # Migration SQL for schema version upgrades
 _MIGRATIONS = {
     2: [
@@ -114,15 +197,80 @@ _MIGRATIONS = {
         "ALTER TABLE memories ADD COLUMN repo_path TEXT",
         "CREATE INDEX IF NOT EXISTS idx_memories_repo_path ON memories(repo_path)",
     ],
+    3: [
+        # Backfill the FTS5 index (table and triggers are created by the schema)
+        "INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')",
+    ],
+    4: [
+        # vec0 tables cannot gain columns in place (nor be renamed reliably):
+        # stage embeddings with their filter values in a plain table, then
+        # recreate vec_memories. The staging table survives an interrupted
+        # migration and is reused on the next attempt.
+        """
+        CREATE TABLE IF NOT EXISTS vec_memories_migration AS
+        SELECT v.id AS id, v.embedding AS embedding,
+               m.namespace AS namespace, COALESCE(m.spec, '') AS spec
+        FROM vec_memories v
+        JOIN memories m ON m.id = v.id
+        """,
+        "DROP TABLE vec_memories",
+        _CREATE_VEC_TABLE,
+        """
+        INSERT INTO vec_memories (id, embedding, namespace, spec)
+        SELECT id, embedding, namespace, spec FROM vec_memories_migration
+        """,
+        "DROP TABLE vec_memories_migration",
+    ],
+    5: [
+        # Indexes predating quantized storage hold full-precision vectors only
+        "INSERT OR IGNORE INTO metadata (key, value) "
+        "VALUES ('vector_quantization', 'float')",
+    ],
 }
 
-_CREATE_VEC_TABLE = f"""
-CREATE VIRTUAL TABLE IF NOT EXISTS vec_memories USING vec0(
-    id TEXT PRIMARY KEY,
-    embedding FLOAT[{EMBEDDING_DIMENSIONS}]
+# External-content FTS5 table over memories.summary/content, keyed by the
+# memories rowid. Triggers keep it in sync with every write path (insert,
+# insert_batch, update, delete, clear) so callers never touch it directly.
+_CREATE_FTS_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS memories_fts USING fts5(
+    summary,
+    content,
+    content='memories',
+    content_rowid='rowid',
+    tokenize='porter unicode61 remove_diacritics 2'
 )
 """
 
+_CREATE_FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ai AFTER INSERT ON memories BEGIN
+        INSERT INTO memories_fts(rowid, summary, content)
+        VALUES (new.rowid, new.summary, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_ad AFTER DELETE ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, summary, content)
+        VALUES ('delete', old.rowid, old.summary, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS memories_fts_au
+    AFTER UPDATE OF summary, content ON memories BEGIN
+        INSERT INTO memories_fts(memories_fts, rowid, summary, content)
+        VALUES ('delete', old.rowid, old.summary, old.content);
+        INSERT INTO memories_fts(rowid, summary, content)
+        VALUES (new.rowid, new.summary, new.content);
+    END
+    """,
+]
+
+# BM25 column weights: summary matches count more than content matches
+_FTS_BM25 = "bm25(memories_fts, 2.0, 1.0)"
+
+# Quoted phrases or bare terms (a trailing * on a bare term requests a prefix match)
+_FTS_TOKEN_PATTERN = re.compile(r'"([^"]*)"?|(\S+)')
+
 _CREATE_METADATA_TABLE = """
 CREATE TABLE IF NOT EXISTS metadata (
     key TEXT PRIMARY KEY,
@@ -130,6 +278,179 @@ CREATE TABLE IF NOT EXISTS metadata (
 )
 """
 
+# metadata key prefix for the notes ref commit each namespace was indexed at
+_NOTES_REF_KEY_PREFIX = "notes_ref:"
+
+# Memories captured with deferred indexing: their notes are written, and the
+# rows wait here until drained (embedded and written to memories). Same
+# columns as memories, plus drain bookkeeping.
+_CREATE_INDEX_QUEUE_TABLE = """
+CREATE TABLE IF NOT EXISTS index_queue (
+    id TEXT PRIMARY KEY,
+    commit_sha TEXT NOT NULL,
+    namespace TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    content TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    repo_path TEXT,
+    spec TEXT,
+    phase TEXT,
+    tags TEXT,
+    status TEXT DEFAULT 'active',
+    relates_to TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT
+)
+"""
+
+# Number of records in each note, keyed by the note blob it was counted in,
+# so capture can number a new record without re-reading the note. A row
+# whose note_oid no longer matches the note is stale and recounted.
+_CREATE_NOTE_COUNTS_TABLE = """
+CREATE TABLE IF NOT EXISTS note_counts (
+    namespace TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    note_oid TEXT NOT NULL,
+    record_count INTEGER NOT NULL,
+    PRIMARY KEY (namespace, commit_sha)
+)
+"""
+
+# Write counter per namespace, bumped by triggers on every insert, update
+# and delete of a memory (schema v9). Derived artifacts such as the
+# SessionStart context snapshot record the versions they were built from
+# and compare them with one small read instead of re-querying memories.
+_CREATE_NAMESPACE_VERSIONS_TABLE = """
+CREATE TABLE IF NOT EXISTS namespace_versions (
+    namespace TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+)
+"""
+
+_BUMP_NAMESPACE_VERSION = """
+    INSERT INTO namespace_versions (namespace, version) VALUES ({}, 1)
+    ON CONFLICT(namespace) DO UPDATE SET version = version + 1;
+"""
+
+_CREATE_NAMESPACE_VERSION_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_version_ai AFTER INSERT ON memories BEGIN
+        {_BUMP_NAMESPACE_VERSION.format("new.namespace")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_version_ad AFTER DELETE ON memories BEGIN
+        {_BUMP_NAMESPACE_VERSION.format("old.namespace")}
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_version_au AFTER UPDATE ON memories BEGIN
+        {_BUMP_NAMESPACE_VERSION.format("new.namespace")}
+    END
+    """,
+    # A memory moved between namespaces also changes the one it left
+    f"""
+    CREATE TRIGGER IF NOT EXISTS memories_version_au_moved
+    AFTER UPDATE OF namespace ON memories
+    WHEN old.namespace != new.namespace BEGIN
+        {_BUMP_NAMESPACE_VERSION.format("old.namespace")}
+    END
+    """,
+]
+
+_MEMORY_COLUMNS = """
+    id, commit_sha, namespace, summary, content,
+    timestamp, repo_path, spec, phase, tags, status,
+    relates_to, created_at, updated_at
+"""
+
+_INSERT_MEMORY_SQL = f"""
+INSERT INTO memories ({_MEMORY_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""  # nosec B608 - fixed column list
+
+# Re-queueing a memory resets its drain attempts
+_ENQUEUE_MEMORY_SQL = f"""
+INSERT OR REPLACE INTO index_queue ({_MEMORY_COLUMNS})
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""  # nosec B608 - fixed column list
+
+# Upsert keeps the original created_at of an existing memory
+_UPSERT_MEMORY_SQL = (
+    _INSERT_MEMORY_SQL
+    + """
+ON CONFLICT(id) DO UPDATE SET
+    commit_sha = excluded.commit_sha,
+    namespace = excluded.namespace,
+    summary = excluded.summary,
+    content = excluded.content,
+    timestamp = excluded.timestamp,
+    repo_path = excluded.repo_path,
+    spec = excluded.spec,
+    phase = excluded.phase,
+    tags = excluded.tags,
+    status = excluded.status,
+    relates_to = excluded.relates_to,
+    updated_at = excluded.updated_at
+"""  # nosec B608 - fixed column list
+)
+
+
+def _memory_row(memory: Memory, now: str) -> tuple[object, ...]:
+    """Build the _INSERT_MEMORY_SQL parameters for a memory."""
+    return (
+        memory.id,
+        memory.commit_sha,
+        memory.namespace,
+        memory.summary,
+        memory.content,
+        memory.timestamp.isoformat(),
+        memory.repo_path,
+        memory.spec,
+        memory.phase,
+        ",".join(memory.tags) if memory.tags else None,
+        memory.status,
+        ",".join(memory.relates_to) if memory.relates_to else None,
+        now,
+        now,
+    )
+
+
+def _build_fts_query(query: str, *, match_any: bool = False) -> str | None:
+    """Translate a user search string into a safe FTS5 MATCH expression.
+
+    Every term is emitted as a quoted FTS5 string so user input can never
+    inject operators or column filters. Supported syntax:
+
+    - ``word``: token match (stemmed, case-insensitive)
+    - ``"some phrase"``: adjacent-token phrase match
+    - ``pref*``: prefix match
+
+    Args:
+        query: Raw user query.
+        match_any: Combine terms with OR instead of the implicit AND.
+            Used for natural-language queries in hybrid search.
+
+    Returns:
+        FTS5 query string, or None if the query has no searchable terms.
+    """
+    parts: list[str] = []
+    for match in _FTS_TOKEN_PATTERN.finditer(query):
+        phrase, term = match.group(1), match.group(2)
+        prefix = False
+        if phrase is None:
+            prefix = term.endswith("*")
+            phrase = term.rstrip("*")
+        if not any(ch.isalnum() for ch in phrase):
+            continue
+        quoted = '"' + phrase.replace('"', '""') + '"'
+        parts.append(f"{quoted}*" if prefix else quoted)
+    if not parts:
+        return None
+    return (" OR " if match_any else " ").join(parts)
+
 
 # =============================================================================
 # IndexService
@@ -150,6 +471,7 @@ class IndexService:
 
     Attributes:
         db_path: Path to the SQLite database file.
+        quantization: Vector storage mode ("float" or "bit").
 
     Example:
         >>> index = IndexService()
@@ -159,18 +481,42 @@ class IndexService:
         >>> index.close()
     """
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        *,
+        quantization: str | None = None,
+    ) -> None:
         """Initialize the IndexService.
 
         Args:
             db_path: Path to the SQLite database. If None, uses the default
                 path from config.get_index_path().
+            quantization: Vector storage mode. "float" searches the
+                full-precision vectors directly; "bit" keeps a binary
+                quantized copy for the KNN scan and re-scores a shortlist at
+                full precision. If None, uses config.get_vector_quantization().
+                An existing index is converted on initialize().
+
+        Raises:
+            MemoryIndexError: If the quantization mode is unknown.
         """
         self.db_path = db_path or get_index_path()
+        self.quantization = quantization or get_vector_quantization()
+        if self.quantization not in VECTOR_QUANTIZATION_MODES:
+            raise MemoryIndexError(
+                f"Unknown vector quantization mode: {self.quantization}",
+                f"Use one of: {', '.join(VECTOR_QUANTIZATION_MODES)}",
+            )
         self._conn: sqlite3.Connection | None = None
         self._initialized = False
+        # Set during schema creation; False if SQLite was built without FTS5
+        self._fts_enabled = False
         # HIGH-011: Thread lock for concurrent access safety
         self._lock = threading.Lock()
+        # Open bulk_load() blocks; writes inside one defer their commit
+        self._bulk_depth = 0
+        self._bulk_failed = False
 
     @property
     def is_initialized(self) -> bool:
@@ -195,8 +541,11 @@ class IndexService:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
             # Connect to database
+            # Concurrent writers (captures, hooks, sync) wait on SQLite's
+            # write lock rather than failing with "database is locked"
             self._conn = sqlite3.connect(
                 str(self.db_path),
+                timeout=INDEX_BUSY_TIMEOUT_SECONDS,
                 check_same_thread=False,
             )
             self._conn.row_factory = sqlite3.Row
@@ -276,8 +625,12 @@ class IndexService:
 
         cursor = self._conn.cursor()
         for version in range(from_version + 1, to_version + 1):
+            if version == _MEMORY_ID_MIGRATION_VERSION:
+                self._migrate_memory_ids(cursor)
             if version in _MIGRATIONS:
                 for sql in _MIGRATIONS[version]:
+                    if "memories_fts" in sql and not self._fts_enabled:
+                        continue
                     try:
                         cursor.execute(sql)
                     except sqlite3.OperationalError as e:
@@ -286,6 +639,69 @@ class IndexService:
                             raise
         self._conn.commit()
 
+    def _migrate_memory_ids(self, cursor: sqlite3.Cursor) -> None:
+        """Rewrite memory IDs with an abbreviated commit to the canonical form.
+
+        Sync used to build IDs from the first 7 characters of the commit
+        while capture used the full SHA, so a memory could be indexed twice.
+        Rows are re-keyed in place: memories keeps its rowid (and so its
+        full-text entry), each stored vector is copied to the new ID, so
+        nothing is re-embedded, and queued memories are renamed alike.
+        Where the canonical row already exists the abbreviated duplicate is
+        dropped, keeping its vector only if the canonical row has none.
+        Vectors are in the stored quantization mode here; conversion to the
+        configured mode runs afterwards.
+
+        Args:
+            cursor: Active database cursor (the caller commits).
+        """
+        # Queued memories carry the same IDs; a later capture wins
+        cursor.execute(
+            f"UPDATE OR REPLACE index_queue SET id = {_CANONICAL_ID_SQL} "
+            f"WHERE {_LEGACY_ID_SQL}"  # nosec B608 - fixed SQL fragments
+        )
+        cursor.execute(
+            f"SELECT id, {_CANONICAL_ID_SQL} FROM memories WHERE {_LEGACY_ID_SQL}"  # nosec B608 - fixed SQL fragments
+        )
+        renames = [(old_id, new_id) for old_id, new_id in cursor.fetchall()]
+        if not renames:
+            return
+        logger.info("Migrating %d memory IDs to full commit SHAs", len(renames))
+
+        cursor.execute("SELECT value FROM metadata WHERE key = 'vector_quantization'")
+        row = cursor.fetchone()
+        stored = row[0] if row else "float"
+        if stored == "float":
+            read_vector = "SELECT embedding, namespace, spec FROM vec_memories"
+            write_vector = """
+                INSERT INTO vec_memories (embedding, namespace, spec, id)
+                VALUES (?, ?, ?, ?)
+            """
+        else:
+            quantized = _VEC_QUANTIZE_EXPR[stored].format("?1")
+            read_vector = "SELECT embedding_full, namespace, spec FROM vec_memories"
+            write_vector = f"""
+                INSERT INTO vec_memories
+                    (embedding, namespace, spec, id, embedding_full)
+                VALUES ({quantized}, ?2, ?3, ?4, ?1)
+            """  # nosec B608 - expression comes from a fixed mapping
+
+        for old_id, new_id in renames:
+            cursor.execute("SELECT 1 FROM memories WHERE id = ?", (new_id,))
+            if cursor.fetchone() is not None:
+                cursor.execute("DELETE FROM memories WHERE id = ?", (old_id,))
+            else:
+                cursor.execute(
+                    "UPDATE memories SET id = ? WHERE id = ?", (new_id, old_id)
+                )
+            cursor.execute(f"{read_vector} WHERE id = ?", (old_id,))  # nosec B608
+            vector = cursor.fetchone()
+            if vector is not None:
+                cursor.execute("DELETE FROM vec_memories WHERE id = ?", (old_id,))
+                cursor.execute("SELECT 1 FROM vec_memories WHERE id = ?", (new_id,))
+                if cursor.fetchone() is None:
+                    cursor.execute(write_vector, (*vector, new_id))
+
     def _create_schema(self) -> None:
         """Create database tables and indices, running migrations if needed."""
         if self._conn is None:
@@ -315,22 +731,45 @@ class IndexService:
                         labels={"location": "index.create_index_skipped"},
                     )
 
+            # Create full-text index and its sync triggers
+            self._fts_enabled = self._create_fts_schema(cursor)
+
             # Create vector table
             cursor.execute(_CREATE_VEC_TABLE)
 
             # Create metadata table
             cursor.execute(_CREATE_METADATA_TABLE)
 
+            # Create deferred-indexing queue (schema v6)
+            cursor.execute(_CREATE_INDEX_QUEUE_TABLE)
+
+            # Create note record counts (schema v7)
+            cursor.execute(_CREATE_NOTE_COUNTS_TABLE)
+
+            # Create namespace write counters and their triggers (schema v9)
+            cursor.execute(_CREATE_NAMESPACE_VERSIONS_TABLE)
+            for trigger_sql in _CREATE_NAMESPACE_VERSION_TRIGGERS:
+                cursor.execute(trigger_sql)
+
             # Run migrations if needed
             if 0 < current_version < SCHEMA_VERSION:
                 self._run_migrations(current_version, SCHEMA_VERSION)
 
+            # Convert vector storage if the configured mode changed
+            self._apply_quantization(cursor)
+
             # Set schema version
             cursor.execute(
                 "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
                 ("schema_version", str(SCHEMA_VERSION)),
             )
 
+            # Identify this index so caches can tell a rebuilt one apart
+            cursor.execute(
+                "INSERT OR IGNORE INTO metadata (key, value) VALUES (?, ?)",
+                ("index_id", uuid.uuid4().hex),
+            )
+
             # Set last sync to now (only if not already set)
             cursor.execute(
                 "INSERT OR IGNORE INTO metadata (key, value) VALUES (?, ?)",
@@ -345,6 +784,95 @@ class IndexService:
                 "Delete the index.db file and retry to recreate",
             ) from e
 
+    def _create_fts_schema(self, cursor: sqlite3.Cursor) -> bool:
+        """Create the FTS5 table and triggers.
+
+        Args:
+            cursor: Active database cursor.
+
+        Returns:
+            True if full-text search is available, False if this SQLite
+            build lacks FTS5 (text search then falls back to LIKE).
+        """
+        try:
+            cursor.execute(_CREATE_FTS_TABLE)
+        except sqlite3.OperationalError as e:
+            logger.warning("FTS5 unavailable, text search will use LIKE: %s", e)
+            get_metrics().increment(
+                "silent_failures_total",
+                labels={"location": "index.fts5_unavailable"},
+            )
+            return False
+        for trigger_sql in _CREATE_FTS_TRIGGERS:
+            cursor.execute(trigger_sql)
+        return True
+
+    def _apply_quantization(self, cursor: sqlite3.Cursor) -> None:
+        """Convert vec_memories to the configured storage mode if needed.
+
+        The mode an index was built with is recorded in metadata. On a
+        change, every vector is staged at full precision in a plain table,
+        vec_memories is recreated for the new mode and refilled (quantizing
+        where needed). Quantized modes keep the full-precision vectors, so
+        switching back to float is lossless. A staging table left by an
+        interrupted conversion is reused rather than rebuilt.
+
+        Args:
+            cursor: Active database cursor (the caller commits).
+        """
+        cursor.execute("SELECT value FROM metadata WHERE key = 'vector_quantization'")
+        row = cursor.fetchone()
+        stored = row[0] if row else "float"
+
+        if stored != self.quantization:
+            logger.info(
+                "Converting vector index from %s to %s storage",
+                stored,
+                self.quantization,
+            )
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'vec_memories_migration'"
+            )
+            if cursor.fetchone() is None:
+                full = "embedding" if stored == "float" else "embedding_full"
+                cursor.execute(
+                    f"""
+                    CREATE TABLE vec_memories_migration AS
+                    SELECT id, {full} AS embedding, namespace, spec
+                    FROM vec_memories
+                    """  # nosec B608 - column name comes from a fixed choice
+                )
+            cursor.execute("DROP TABLE vec_memories")
+            cursor.execute(_create_vec_table_sql(self.quantization))
+            if self.quantization == "float":
+                cursor.execute(
+                    """
+                    INSERT INTO vec_memories (id, embedding, namespace, spec)
+                    SELECT id, embedding, namespace, spec FROM vec_memories_migration
+                    """
+                )
+            else:
+                quantized = _VEC_QUANTIZE_EXPR[self.quantization].format("embedding")
+                cursor.execute(
+                    f"""
+                    INSERT INTO vec_memories
+                        (id, embedding, namespace, spec, embedding_full)
+                    SELECT id, {quantized}, namespace, spec, embedding
+                    FROM vec_memories_migration
+                    """  # nosec B608 - expression comes from a fixed mapping
+                )
+            cursor.execute("DROP TABLE vec_memories_migration")
+
+        cursor.execute(
+            "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+            ("vector_quantization", self.quantization),
+        )
+
+    @property
+    def _vec_full_column(self) -> str:
+        """vec_memories column holding full-precision vectors in this mode."""
+        return "embedding" if self.quantization == "float" else "embedding_full"
+
     @contextmanager
     def _cursor(self) -> Iterator[sqlite3.Cursor]:
         """Context manager for database cursor with error handling.
@@ -366,6 +894,78 @@ class IndexService:
         finally:
             cursor.close()
 
+    def _commit(self) -> None:
+        """Commit a write, unless it belongs to an open bulk_load()."""
+        if not self._bulk_depth:
+            self._conn.commit()  # type: ignore[union-attr]
+
+    def _rollback(self) -> None:
+        """Roll back a failed write, or fail the open bulk_load()."""
+        if self._bulk_depth:
+            self._bulk_failed = True
+            return
+        self._conn.rollback()  # type: ignore[union-attr]
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[None]:
+        """Run a block of writes as one transaction tuned for bulk loading.
+
+        Writes inside the block skip their per-call commit and the block
+        commits once on exit. While it is open the connection uses a larger
+        page cache and in-memory temp storage; both are restored afterwards.
+        If any write in the block fails, or the block raises, everything
+        written in it is rolled back. Nested blocks join the outer one.
+
+        Raises:
+            MemoryIndexError: If the database is not initialized, or a
+                write in the block failed.
+
+        Example:
+            >>> with index.bulk_load():
+            ...     for chunk in chunks:
+            ...         index.insert_batch(chunk, embeddings_for(chunk))
+        """
+        if self._conn is None:
+            raise MemoryIndexError(
+                "Database not initialized",
+                "Call initialize() before performing operations",
+            )
+        if self._bulk_depth:
+            self._bulk_depth += 1
+            try:
+                yield
+            finally:
+                self._bulk_depth -= 1
+            return
+
+        conn = self._conn
+        if conn.in_transaction:
+            conn.commit()
+        saved = {
+            pragma: int(conn.execute(f"PRAGMA {pragma}").fetchone()[0])
+            for pragma in ("cache_size", "temp_store")
+        }
+        conn.execute(f"PRAGMA cache_size = -{INDEX_BULK_CACHE_KIB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        self._bulk_depth = 1
+        self._bulk_failed = False
+        try:
+            yield
+            if self._bulk_failed:
+                raise MemoryIndexError(
+                    "Bulk load failed; its changes were rolled back",
+                    "Check the logged errors and retry",
+                )
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._bulk_depth = 0
+            self._bulk_failed = False
+            for pragma, value in saved.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+
     def close(self) -> None:
         """Close the database connection."""
         if self._conn is not None:
@@ -413,37 +1013,13 @@ class IndexService:
         ):
             try:
                 # Insert into memories table
-                cursor.execute(
-                    """
-                    INSERT INTO memories (
-                        id, commit_sha, namespace, summary, content,
-                        timestamp, repo_path, spec, phase, tags, status,
-                        relates_to, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        memory.id,
-                        memory.commit_sha,
-                        memory.namespace,
-                        memory.summary,
-                        memory.content,
-                        memory.timestamp.isoformat(),
-                        memory.repo_path,
-                        memory.spec,
-                        memory.phase,
-                        ",".join(memory.tags) if memory.tags else None,
-                        memory.status,
-                        ",".join(memory.relates_to) if memory.relates_to else None,
-                        now,
-                        now,
-                    ),
-                )
+                cursor.execute(_INSERT_MEMORY_SQL, _memory_row(memory, now))
 
                 # Insert embedding if provided
                 if embedding is not None:
-                    self._insert_embedding(cursor, memory.id, embedding)
+                    self._insert_embedding(cursor, memory, embedding)
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
 
                 metrics.increment(
                     "index_inserts_total",
@@ -453,13 +1029,13 @@ class IndexService:
                 return True
 
             except sqlite3.IntegrityError as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Memory with id '{memory.id}' already exists",
                     "Use update() to modify existing memories",
                 ) from e
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to insert memory: {e}",
                     "Check memory data and retry",
@@ -468,7 +1044,7 @@ class IndexService:
     def insert_batch(
         self,
         memories: Sequence[Memory],
-        embeddings: Sequence[Sequence[float]] | None = None,
+        embeddings: Sequence[Sequence[float] | None] | None = None,
     ) -> int:
         """Insert multiple memories in a single transaction.
 
@@ -477,7 +1053,8 @@ class IndexService:
         Args:
             memories: List of Memory objects to insert.
             embeddings: Optional list of embedding vectors (must match
-                memories length if provided).
+                memories length if provided). A None entry inserts that
+                memory without an embedding.
 
         Returns:
             Number of successfully inserted memories.
@@ -488,11 +1065,7 @@ class IndexService:
         if not memories:
             return 0
 
-        if embeddings is not None and len(embeddings) != len(memories):
-            raise MemoryIndexError(
-                "Embeddings count must match memories count",
-                "Provide matching lists or None for embeddings",
-            )
+        self._check_batch_embeddings(memories, embeddings)
 
         now = datetime.now(UTC).isoformat()
         inserted = 0
@@ -502,38 +1075,11 @@ class IndexService:
                 for i, memory in enumerate(memories):
                     try:
                         # CRIT-002: Include repo_path for per-repository isolation
-                        cursor.execute(
-                            """
-                            INSERT INTO memories (
-                                id, commit_sha, namespace, summary, content,
-                                timestamp, repo_path, spec, phase, tags, status,
-                                relates_to, created_at, updated_at
-                            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                            """,
-                            (
-                                memory.id,
-                                memory.commit_sha,
-                                memory.namespace,
-                                memory.summary,
-                                memory.content,
-                                memory.timestamp.isoformat(),
-                                memory.repo_path,
-                                memory.spec,
-                                memory.phase,
-                                ",".join(memory.tags) if memory.tags else None,
-                                memory.status,
-                                (
-                                    ",".join(memory.relates_to)
-                                    if memory.relates_to
-                                    else None
-                                ),
-                                now,
-                                now,
-                            ),
-                        )
+                        cursor.execute(_INSERT_MEMORY_SQL, _memory_row(memory, now))
 
-                        if embeddings is not None:
-                            self._insert_embedding(cursor, memory.id, embeddings[i])
+                        embedding = embeddings[i] if embeddings is not None else None
+                        if embedding is not None:
+                            self._insert_embedding(cursor, memory, embedding)
 
                         inserted += 1
 
@@ -541,43 +1087,163 @@ class IndexService:
                         # Skip duplicates in batch mode
                         continue
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
                 return inserted
 
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to insert batch: {e}",
                     "Check memory data and retry",
                 ) from e
 
+    def upsert_batch(
+        self,
+        memories: Sequence[Memory],
+        embeddings: Sequence[Sequence[float] | None] | None = None,
+    ) -> int:
+        """Insert or update multiple memories in a single transaction.
+
+        New memories are inserted; existing ones are updated in place and
+        keep their created_at. As with update(), a None embedding leaves an
+        existing memory's embedding unchanged.
+
+        Args:
+            memories: List of Memory objects to write.
+            embeddings: Optional list of embedding vectors (must match
+                memories length if provided).
+
+        Returns:
+            Number of memories written.
+
+        Raises:
+            MemoryIndexError: If the batch upsert fails.
+        """
+        if not memories:
+            return 0
+
+        self._check_batch_embeddings(memories, embeddings)
+
+        now = datetime.now(UTC).isoformat()
+
+        with self._cursor() as cursor:
+            try:
+                for i, memory in enumerate(memories):
+                    cursor.execute(_UPSERT_MEMORY_SQL, _memory_row(memory, now))
+
+                    embedding = embeddings[i] if embeddings is not None else None
+                    if embedding is not None:
+                        self._update_embedding(cursor, memory, embedding)
+                    else:
+                        cursor.execute(
+                            "UPDATE vec_memories SET namespace = ?, spec = ? "
+                            "WHERE id = ?",
+                            (memory.namespace, memory.spec or "", memory.id),
+                        )
+
+                self._commit()
+                return len(memories)
+
+            except Exception as e:
+                self._rollback()
+                raise MemoryIndexError(
+                    f"Failed to upsert batch: {e}",
+                    "Check memory data and retry",
+                ) from e
+
+    @staticmethod
+    def _check_batch_embeddings(
+        memories: Sequence[Memory],
+        embeddings: Sequence[Sequence[float] | None] | None,
+    ) -> None:
+        """Reject an embeddings list that does not pair up with memories."""
+        if embeddings is not None and len(embeddings) != len(memories):
+            raise MemoryIndexError(
+                "Embeddings count must match memories count",
+                "Provide matching lists or None for embeddings",
+            )
+
     def _insert_embedding(
         self,
         cursor: sqlite3.Cursor,
-        memory_id: str,
+        memory: Memory,
         embedding: Sequence[float],
     ) -> None:
         """Insert an embedding into the vector table.
 
         Args:
             cursor: Active database cursor.
-            memory_id: ID of the memory this embedding belongs to.
+            memory: The memory this embedding belongs to (supplies the
+                namespace/spec filter columns).
             embedding: The embedding vector.
         """
         # PERF-007: Use cached struct format for embedding packing
         blob = _get_struct_format(len(embedding)).pack(*embedding)
+        if self.quantization == "float":
+            cursor.execute(
+                """
+                INSERT INTO vec_memories (id, embedding, namespace, spec)
+                VALUES (?, ?, ?, ?)
+                """,
+                (memory.id, blob, memory.namespace, memory.spec or ""),
+            )
+            return
+
+        quantized = _VEC_QUANTIZE_EXPR[self.quantization].format("?")
         cursor.execute(
-            "INSERT INTO vec_memories (id, embedding) VALUES (?, ?)",
-            (memory_id, blob),
+            f"""
+            INSERT INTO vec_memories (id, embedding, namespace, spec, embedding_full)
+            VALUES (?, {quantized}, ?, ?, ?)
+            """,  # nosec B608 - expression comes from a fixed mapping
+            (memory.id, blob, memory.namespace, memory.spec or "", blob),
         )
 
     # =========================================================================
     # Read Operations
     # =========================================================================
 
+    def resolve_id(self, memory_id: str) -> str:
+        """Map a memory ID with an abbreviated commit to its canonical form.
+
+        IDs written before schema v8 abbreviated the commit SHA and may
+        still be held by callers (or in relates_to links). Such an ID is
+        expanded when exactly one indexed commit in its namespace has that
+        prefix. Canonical IDs are returned unchanged without a query.
+
+        Args:
+            memory_id: The memory ID to resolve.
+
+        Returns:
+            The canonical ID, or memory_id unchanged if it is already
+            canonical, malformed, or its prefix is unknown or ambiguous.
+        """
+        try:
+            namespace, commit_prefix, index = parse_memory_id(memory_id)
+        except ValueError:
+            return memory_id
+        if len(commit_prefix) >= _FULL_SHA_LENGTH:
+            return memory_id
+        prefix = commit_prefix.lower()
+        with self._cursor() as cursor:
+            # Hex digits sort below "g", so this range is the prefix match
+            cursor.execute(
+                """
+                SELECT DISTINCT commit_sha FROM memories
+                WHERE namespace = ? AND commit_sha >= ? AND commit_sha < ?
+                LIMIT 2
+                """,
+                (namespace, prefix, prefix + "g"),
+            )
+            rows = cursor.fetchall()
+        if len(rows) != 1:
+            return memory_id
+        return make_memory_id(namespace, rows[0][0], index)
+
     def get(self, memory_id: str) -> Memory | None:
         """Get a memory by ID.
 
+        Legacy IDs with an abbreviated commit are resolved (see resolve_id).
+
         Args:
             memory_id: The memory ID to retrieve.
 
@@ -587,13 +1253,22 @@ class IndexService:
         with self._cursor() as cursor:
             cursor.execute("SELECT * FROM memories WHERE id = ?", (memory_id,))
             row = cursor.fetchone()
-            if row is None:
+        if row is None:
+            canonical = self.resolve_id(memory_id)
+            if canonical == memory_id:
                 return None
-            return self._row_to_memory(row)
+            with self._cursor() as cursor:
+                cursor.execute("SELECT * FROM memories WHERE id = ?", (canonical,))
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+        return self._row_to_memory(row)
 
     def get_batch(self, memory_ids: Sequence[str]) -> list[Memory]:
         """Get multiple memories by IDs.
 
+        Legacy IDs with an abbreviated commit are resolved (see resolve_id).
+
         Args:
             memory_ids: List of memory IDs to retrieve.
 
@@ -603,6 +1278,21 @@ class IndexService:
         if not memory_ids:
             return []
 
+        memories = self._select_by_ids(memory_ids)
+        found = {memory.id for memory in memories}
+        legacy = {
+            canonical
+            for memory_id in memory_ids
+            if memory_id not in found
+            and (canonical := self.resolve_id(memory_id)) != memory_id
+            and canonical not in found
+        }
+        if legacy:
+            memories.extend(self._select_by_ids(sorted(legacy)))
+        return memories
+
+    def _select_by_ids(self, memory_ids: Sequence[str]) -> list[Memory]:
+        """Get the memories with exactly these IDs."""
         placeholders = ",".join("?" * len(memory_ids))
         with self._cursor() as cursor:
             # placeholders is only "?" chars - safe parameterized query
@@ -872,15 +1562,21 @@ class IndexService:
                 if cursor.rowcount == 0:
                     return False
 
-                # Update embedding if provided
+                # Update embedding if provided, else keep its filter columns
+                # in step with the memory
                 if embedding is not None:
-                    self._update_embedding(cursor, memory.id, embedding)
+                    self._update_embedding(cursor, memory, embedding)
+                else:
+                    cursor.execute(
+                        "UPDATE vec_memories SET namespace = ?, spec = ? WHERE id = ?",
+                        (memory.namespace, memory.spec or "", memory.id),
+                    )
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
                 return True
 
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to update memory: {e}",
                     "Check memory data and retry",
@@ -889,25 +1585,19 @@ class IndexService:
     def _update_embedding(
         self,
         cursor: sqlite3.Cursor,
-        memory_id: str,
+        memory: Memory,
         embedding: Sequence[float],
     ) -> None:
         """Update an embedding in the vector table.
 
         Args:
             cursor: Active database cursor.
-            memory_id: ID of the memory this embedding belongs to.
+            memory: The memory this embedding belongs to.
             embedding: The new embedding vector.
         """
-        # PERF-007: Use cached struct format for embedding packing
-        blob = _get_struct_format(len(embedding)).pack(*embedding)
-
         # Delete existing and insert new (sqlite-vec doesn't support UPDATE well)
-        cursor.execute("DELETE FROM vec_memories WHERE id = ?", (memory_id,))
-        cursor.execute(
-            "INSERT INTO vec_memories (id, embedding) VALUES (?, ?)",
-            (memory_id, blob),
-        )
+        cursor.execute("DELETE FROM vec_memories WHERE id = ?", (memory.id,))
+        self._insert_embedding(cursor, memory, embedding)
 
     def update_embedding(
         self,
@@ -923,16 +1613,17 @@ class IndexService:
         Returns:
             True if successful, False if memory not found.
         """
-        if not self.exists(memory_id):
+        memory = self.get(memory_id)
+        if memory is None:
             return False
 
         with self._cursor() as cursor:
             try:
-                self._update_embedding(cursor, memory_id, embedding)
-                self._conn.commit()  # type: ignore[union-attr]
+                self._update_embedding(cursor, memory, embedding)
+                self._commit()
                 return True
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to update embedding: {e}",
                     "Check embedding data and retry",
@@ -945,12 +1636,16 @@ class IndexService:
     def delete(self, memory_id: str) -> bool:
         """Delete a memory from the index.
 
+        Legacy IDs with an abbreviated commit are resolved (see resolve_id).
+
         Args:
             memory_id: ID of the memory to delete.
 
         Returns:
             True if deleted, False if not found.
         """
+        if not self.exists(memory_id):
+            memory_id = self.resolve_id(memory_id)
         with self._cursor() as cursor:
             try:
                 # Delete from memories table
@@ -960,11 +1655,11 @@ class IndexService:
                 # Delete from vec_memories table
                 cursor.execute("DELETE FROM vec_memories WHERE id = ?", (memory_id,))
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
                 return deleted
 
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to delete memory: {e}",
                     "Retry the operation",
@@ -1001,11 +1696,11 @@ class IndexService:
                     memory_ids,
                 )
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
                 return deleted
 
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to delete batch: {e}",
                     "Retry the operation",
@@ -1025,12 +1720,17 @@ class IndexService:
 
                 cursor.execute("DELETE FROM memories")
                 cursor.execute("DELETE FROM vec_memories")
+                # Forget indexed notes refs so the next reindex rescans
+                cursor.execute(
+                    "DELETE FROM metadata WHERE key LIKE ?",
+                    (f"{_NOTES_REF_KEY_PREFIX}%",),
+                )
 
-                self._conn.commit()  # type: ignore[union-attr]
+                self._commit()
                 return count
 
             except Exception as e:
-                self._conn.rollback()  # type: ignore[union-attr]
+                self._rollback()
                 raise MemoryIndexError(
                     f"Failed to clear index: {e}",
                     "Retry the operation",
@@ -1051,7 +1751,11 @@ class IndexService:
         """Search for similar memories using vector similarity.
 
         Uses KNN search via sqlite-vec to find the k nearest neighbors
-        to the query embedding.
+        to the query embedding. Namespace/spec filters are vec0 metadata
+        constraints evaluated during the scan, so selective filters still
+        return the true top-k rather than whatever survives a post-filter.
+        In bit mode the scan runs over the quantized vectors and the
+        shortlist is re-scored at full precision (see _knn_query).
 
         Args:
             query_embedding: The query embedding vector.
@@ -1073,25 +1777,14 @@ class IndexService:
                 try:
                     # Build parameterized query with optional filters
                     # Use single JOIN to eliminate N+1 query pattern
-                    params: list[object] = [blob, k * 3]
-
-                    sql = """
-                        SELECT m.*, v.distance
-                        FROM vec_memories v
-                        JOIN memories m ON v.id = m.id
-                        WHERE v.embedding MATCH ?
-                          AND k = ?
-                    """
-
-                    if namespace is not None:
-                        sql += " AND m.namespace = ?"
-                        params.append(namespace)
-                    if spec is not None:
-                        sql += " AND m.spec = ?"
-                        params.append(spec)
+                    knn_sql, params = self._knn_query(blob, k, namespace, spec)
 
-                    sql += " ORDER BY v.distance LIMIT ?"
-                    params.append(k)
+                    sql = f"""
+                        SELECT m.*, knn.distance
+                        FROM ({knn_sql}) knn
+                        JOIN memories m ON knn.id = m.id
+                        ORDER BY knn.distance
+                    """  # nosec B608 - KNN query built from fixed fragments
 
                     cursor.execute(sql, params)
 
@@ -1114,6 +1807,89 @@ class IndexService:
                         "Check embedding dimensions and retry",
                     ) from e
 
+    def search_vector_batch(
+        self,
+        query_embeddings: Sequence[Sequence[float]],
+        k: int = 10,
+        namespaces: Sequence[str | None] | None = None,
+        spec: str | None = None,
+    ) -> list[list[tuple[Memory, float]]]:
+        """Search for the nearest memories of several query embeddings.
+
+        Runs the same KNN as search_vector() for each embedding, all on one
+        cursor, and then loads the matched memories in a single query, so a
+        memory that is a neighbor of several queries is read once.
+
+        Args:
+            query_embeddings: The query embedding vectors.
+            k: Number of nearest neighbors to return per query.
+            namespaces: Optional namespace filter per query, aligned with
+                query_embeddings; None entries search every namespace.
+            spec: Optional specification filter for all queries.
+
+        Returns:
+            One list of (Memory, distance) tuples per query, in input order,
+            each sorted by distance ascending.
+
+        Raises:
+            MemoryIndexError: If the search fails.
+        """
+        if namespaces is None:
+            namespaces = [None] * len(query_embeddings)
+        if len(namespaces) != len(query_embeddings):
+            raise MemoryIndexError(
+                "Vector search failed: one namespace filter per query is required",
+                "Pass namespaces aligned with query_embeddings",
+            )
+        if not query_embeddings:
+            return []
+
+        metrics = get_metrics()
+
+        with trace_operation(
+            "index.search_vector_batch",
+            labels={"k": str(k), "queries": str(len(query_embeddings))},
+        ):
+            neighbors: list[list[tuple[str, float]]] = []
+            with self._cursor() as cursor:
+                try:
+                    for embedding, namespace in zip(
+                        query_embeddings, namespaces, strict=True
+                    ):
+                        # PERF-007: Use cached struct format for embedding packing
+                        blob = _get_struct_format(len(embedding)).pack(*embedding)
+                        knn_sql, params = self._knn_query(blob, k, namespace, spec)
+                        cursor.execute(knn_sql, params)
+                        neighbors.append(
+                            sorted(
+                                ((row["id"], row["distance"]) for row in cursor),
+                                key=lambda item: item[1],
+                            )
+                        )
+                except Exception as e:
+                    raise MemoryIndexError(
+                        f"Vector search failed: {e}",
+                        "Check embedding dimensions and retry",
+                    ) from e
+
+            ids = list(dict.fromkeys(mid for rows in neighbors for mid, _ in rows))
+            memories = (
+                {memory.id: memory for memory in self._select_by_ids(ids)}
+                if ids
+                else {}
+            )
+
+            metrics.increment(
+                "index_searches_total",
+                amount=float(len(query_embeddings)),
+                labels={"search_type": "vector"},
+            )
+
+            return [
+                [(memories[mid], distance) for mid, distance in rows if mid in memories]
+                for rows in neighbors
+            ]
+
     def search_text(
         self,
         query: str,
@@ -1123,8 +1899,9 @@ class IndexService:
     ) -> list[Memory]:
         """Search memories by text in summary and content.
 
-        Performs a simple LIKE-based text search. For semantic search,
-        use search_vector() with an embedding.
+        Uses the FTS5 index with BM25 ranking (best match first). Supports
+        quoted phrases and ``prefix*`` terms; see search_text_ranked().
+        For semantic search, use search_vector() with an embedding.
 
         Args:
             query: Text to search for.
@@ -1135,6 +1912,106 @@ class IndexService:
         Returns:
             List of matching Memory objects.
         """
+        return [
+            memory
+            for memory, _, _ in self.search_text_ranked(
+                query, limit=limit, namespace=namespace, spec=spec
+            )
+        ]
+
+    @measure_duration("index_search_text")
+    def search_text_ranked(
+        self,
+        query: str,
+        limit: int = 10,
+        namespace: str | None = None,
+        spec: str | None = None,
+        *,
+        snippet_tokens: int = 16,
+    ) -> list[tuple[Memory, float, str]]:
+        """Full-text search returning BM25 scores and highlighted snippets.
+
+        Query syntax: bare words must all match (stemmed, case-insensitive),
+        ``"quoted phrases"`` match adjacent tokens, and ``word*`` matches
+        any token starting with ``word``. Operators in user input are not
+        interpreted, so arbitrary text is safe to pass through.
+
+        Args:
+            query: Text to search for.
+            limit: Maximum number of results.
+            namespace: Optional namespace filter.
+            spec: Optional specification filter.
+            snippet_tokens: Approximate snippet length in tokens.
+
+        Returns:
+            List of (Memory, score, snippet) tuples sorted by score ascending.
+            Scores are SQLite BM25 values where lower means more relevant.
+            Matched terms in snippets are wrapped in ``[`` and ``]``.
+
+        Raises:
+            MemoryIndexError: If the search fails.
+        """
+        if not self._fts_enabled:
+            return [
+                (memory, 0.0, memory.summary)
+                for memory in self._search_text_like(query, limit, namespace, spec)
+            ]
+
+        match_expr = _build_fts_query(query)
+        if match_expr is None:
+            return []
+
+        sql = f"""
+            SELECT m.*,
+                   {_FTS_BM25} AS score,
+                   snippet(memories_fts, -1, '[', ']', '...', ?) AS snippet
+            FROM memories_fts
+            JOIN memories m ON m.rowid = memories_fts.rowid
+            WHERE memories_fts MATCH ?
+        """  # nosec B608 - _FTS_BM25 is a fixed expression
+        params: list[object] = [max(1, min(snippet_tokens, 64)), match_expr]
+
+        if namespace is not None:
+            sql += " AND m.namespace = ?"
+            params.append(namespace)
+
+        if spec is not None:
+            sql += " AND m.spec = ?"
+            params.append(spec)
+
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with (
+            trace_operation("index.search_text", labels={"limit": str(limit)}),
+            self._cursor() as cursor,
+        ):
+            try:
+                cursor.execute(sql, params)
+                results = [
+                    (self._row_to_memory(row), float(row["score"]), row["snippet"])
+                    for row in cursor.fetchall()
+                ]
+            except sqlite3.Error as e:
+                raise MemoryIndexError(
+                    f"Text search failed: {e}",
+                    "Simplify the query and retry",
+                ) from e
+
+        get_metrics().increment(
+            "index_searches_total",
+            labels={"search_type": "text"},
+        )
+        return results
+
+    def _search_text_like(
+        self,
+        query: str,
+        limit: int,
+        namespace: str | None,
+        spec: str | None,
+    ) -> list[Memory]:
+        """LIKE-based text search used when FTS5 is unavailable."""
         search_term = f"%{query}%"
 
         sql = """
@@ -1158,6 +2035,214 @@ class IndexService:
             cursor.execute(sql, params)
             return [self._row_to_memory(row) for row in cursor.fetchall()]
 
+    @staticmethod
+    def _vec_filters(
+        namespace: str | None,
+        spec: str | None,
+    ) -> tuple[str, list[object]]:
+        """Build KNN metadata-column constraints for vec_memories (alias v).
+
+        Returns:
+            Tuple of (SQL fragment starting with " AND", parameters).
+        """
+        sql = ""
+        params: list[object] = []
+        if namespace is not None:
+            sql += " AND v.namespace = ?"
+            params.append(namespace)
+        if spec is not None:
+            sql += " AND v.spec = ?"
+            params.append(spec)
+        return sql, params
+
+    def _knn_query(
+        self,
+        blob: bytes,
+        k: int,
+        namespace: str | None,
+        spec: str | None,
+    ) -> tuple[str, list[object]]:
+        """Build a subquery yielding the k nearest (id, distance) rows.
+
+        In float mode this is a plain KNN over vec_memories. In bit mode
+        the KNN scans the quantized vectors for VECTOR_RESCORE_FACTOR * k
+        candidates (at most sqlite-vec's k limit), which are re-scored with
+        the exact L2 distance against their full-precision vectors, so
+        returned distances are identical across modes. When k itself
+        reaches that limit, every vector is scored exactly instead.
+
+        Args:
+            blob: Packed float32 query embedding.
+            k: Number of rows to return.
+            namespace: Optional namespace filter.
+            spec: Optional specification filter.
+
+        Returns:
+            Tuple of (SQL, parameters). Rows are not guaranteed to be ordered.
+        """
+        filters, params = self._vec_filters(namespace, spec)
+        if k >= _VEC_KNN_MAX_K:
+            sql = f"""
+                SELECT v.id AS id,
+                       vec_distance_l2(v.{self._vec_full_column}, ?) AS distance
+                FROM vec_memories v
+                WHERE 1 = 1{filters}
+                ORDER BY distance
+                LIMIT ?
+            """  # nosec B608 - column name comes from a fixed choice
+            return sql, [blob, *params, k]
+
+        if self.quantization == "float":
+            sql = f"""
+                SELECT v.id AS id, v.distance AS distance
+                FROM vec_memories v
+                WHERE v.embedding MATCH ? AND k = ?{filters}
+            """  # nosec B608 - fixed filter fragments, values are bound
+            return sql, [blob, k, *params]
+
+        shortlist = min(k * VECTOR_RESCORE_FACTOR, _VEC_KNN_MAX_K)
+        quantized = _VEC_QUANTIZE_EXPR[self.quantization].format("?")
+        sql = f"""
+            SELECT id, distance
+            FROM (
+                SELECT v.id AS id,
+                       vec_distance_l2(v.embedding_full, ?) AS distance
+                FROM vec_memories v
+                WHERE v.embedding MATCH {quantized} AND k = ?{filters}
+            )
+            ORDER BY distance
+            LIMIT ?
+        """  # nosec B608 - expression comes from a fixed mapping
+        return sql, [blob, blob, shortlist, *params, k]
+
+    @measure_duration("index_search_hybrid")
+    def search_hybrid(
+        self,
+        query_text: str,
+        query_embedding: Sequence[float],
+        k: int = 10,
+        namespace: str | None = None,
+        spec: str | None = None,
+        *,
+        rrf_k: int = 60,
+    ) -> list[tuple[Memory, float, float | None, bool]]:
+        """Hybrid BM25 + vector search fused with Reciprocal Rank Fusion.
+
+        Both legs run inside a single SQL statement on this connection: the
+        KNN leg over vec_memories, the BM25 leg over memories_fts (terms
+        OR-ed, since queries are usually natural language). Each leg
+        contributes ``1 / (rrf_k + rank)`` per candidate. The exact vector
+        distance is returned for every fused candidate, including those
+        found only by the text leg.
+
+        Falls back to the vector leg alone when FTS5 is unavailable or the
+        query has no searchable terms.
+
+        Args:
+            query_text: Raw query text for the BM25 leg.
+            query_embedding: Query embedding for the KNN leg.
+            k: Number of fused results to return.
+            namespace: Optional namespace filter.
+            spec: Optional specification filter.
+            rrf_k: RRF damping constant (60 is the customary default).
+
+        Returns:
+            List of (Memory, fused_score, distance, lexical) tuples sorted
+            by fused score descending (higher is better). distance is None
+            for memories without an embedding; lexical is True for
+            memories whose text matches every query term, not just one.
+
+        Raises:
+            MemoryIndexError: If the search fails.
+        """
+        blob = _get_struct_format(len(query_embedding)).pack(*query_embedding)
+        candidates = k * 3
+        match_expr = (
+            _build_fts_query(query_text, match_any=True) if self._fts_enabled else None
+        )
+
+        knn_sql, params = self._knn_query(blob, candidates, namespace, spec)
+        filters = ""
+        filter_params: list[object] = []
+        if namespace is not None:
+            filters += " AND m.namespace = ?"
+            filter_params.append(namespace)
+        if spec is not None:
+            filters += " AND m.spec = ?"
+            filter_params.append(spec)
+
+        sql = f"""
+            WITH vec_leg AS (
+                SELECT id, row_number() OVER (ORDER BY distance) AS rnk
+                FROM ({knn_sql})
+            )"""  # nosec B608 - KNN query built from fixed fragments
+        legs = "SELECT id, rnk, 0 AS lexical FROM vec_leg"
+
+        if match_expr is not None:
+            sql += f""",
+            text_leg AS (
+                SELECT id, row_number() OVER (ORDER BY score) AS rnk, full_match
+                FROM (
+                    SELECT m.id AS id, {_FTS_BM25} AS score,
+                           memories_fts.rowid IN (
+                               SELECT rowid FROM memories_fts
+                               WHERE memories_fts MATCH ?
+                           ) AS full_match
+                    FROM memories_fts
+                    JOIN memories m ON m.rowid = memories_fts.rowid
+                    WHERE memories_fts MATCH ?{filters}
+                    ORDER BY score
+                    LIMIT ?
+                )
+            )"""  # nosec B608 - fixed filter fragments, values are bound
+            match_all = _build_fts_query(query_text)
+            params.extend([match_all, match_expr, *filter_params, candidates])
+            # A hit on one OR-ed term is too weak to pass min_similarity alone
+            legs += " UNION ALL SELECT id, rnk, full_match FROM text_leg"
+
+        sql += f""",
+            fused AS (
+                SELECT id, SUM(1.0 / (? + rnk)) AS score, MAX(lexical) AS lexical
+                FROM ({legs})
+                GROUP BY id
+            )
+            SELECT m.*, f.score AS fused_score, f.lexical AS lexical,
+                   vec_distance_l2(e.{self._vec_full_column}, ?) AS distance
+            FROM fused f
+            JOIN memories m ON m.id = f.id
+            LEFT JOIN vec_memories e ON e.id = f.id
+            ORDER BY f.score DESC
+            LIMIT ?
+        """  # nosec B608 - fixed leg fragments and column choice
+        params.extend([rrf_k, blob, k])
+
+        with (
+            trace_operation("index.search_hybrid", labels={"k": str(k)}),
+            self._cursor() as cursor,
+        ):
+            try:
+                cursor.execute(sql, params)
+                results = [
+                    (
+                        self._row_to_memory(row),
+                        float(row["fused_score"]),
+                        row["distance"],
+                        bool(row["lexical"]),
+                    )
+                    for row in cursor.fetchall()
+                ]
+            except sqlite3.Error as e:
+                raise MemoryIndexError(
+                    f"Hybrid search failed: {e}",
+                    "Check embedding dimensions and retry",
+                ) from e
+
+        get_metrics().increment(
+            "index_searches_total",
+            labels={"search_type": "hybrid"},
+        )
+        return results
+
     # =========================================================================
     # Statistics Operations
     # =========================================================================
@@ -1203,6 +2288,17 @@ class IndexService:
             row = cursor.fetchone()
             last_sync = datetime.fromisoformat(row[0]) if row else None
 
+            # Deferred-indexing queue: drainable and given-up entries
+            cursor.execute(
+                """
+                SELECT COALESCE(SUM(attempts < ?), 0),
+                       COALESCE(SUM(attempts >= ?), 0)
+                FROM index_queue
+                """,
+                (INDEX_QUEUE_MAX_ATTEMPTS, INDEX_QUEUE_MAX_ATTEMPTS),
+            )
+            queue_pending, queue_failed = cursor.fetchone()
+
             # Database size
             index_size = self.db_path.stat().st_size if self.db_path.exists() else 0
 
@@ -1212,6 +2308,8 @@ class IndexService:
                 by_spec=by_spec,
                 last_sync=last_sync,
                 index_size_bytes=index_size,
+                queue_pending=queue_pending,
+                queue_failed=queue_failed,
             )
 
     def count(
@@ -1251,20 +2349,240 @@ class IndexService:
                 "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
                 ("last_sync", datetime.now(UTC).isoformat()),
             )
-            self._conn.commit()  # type: ignore[union-attr]
+            self._commit()
+
+    def get_indexed_notes_ref(self, namespace: str) -> str | None:
+        """Get the notes ref commit a namespace was last indexed at.
+
+        Args:
+            namespace: Memory namespace.
+
+        Returns:
+            The notes commit SHA, or None if never recorded.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                "SELECT value FROM metadata WHERE key = ?",
+                (f"{_NOTES_REF_KEY_PREFIX}{namespace}",),
+            )
+            row = cursor.fetchone()
+            return str(row[0]) if row else None
+
+    def set_indexed_notes_ref(self, namespace: str, ref_sha: str) -> None:
+        """Record the notes ref commit a namespace is now indexed at.
+
+        Args:
+            namespace: Memory namespace.
+            ref_sha: Notes commit SHA whose notes are all in the index.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                (f"{_NOTES_REF_KEY_PREFIX}{namespace}", ref_sha),
+            )
+            self._commit()
+
+    # =========================================================================
+    # Deferred Indexing Queue
+    # =========================================================================
+
+    def enqueue(self, memory: Memory) -> None:
+        """Queue a captured memory to be embedded and indexed later.
+
+        Args:
+            memory: Memory whose note is already written.
+
+        Raises:
+            MemoryIndexError: If the queue write fails.
+        """
+        now = datetime.now(UTC).isoformat()
+        with self._cursor() as cursor:
+            try:
+                cursor.execute(_ENQUEUE_MEMORY_SQL, _memory_row(memory, now))
+                self._commit()
+            except Exception as e:
+                self._rollback()
+                raise MemoryIndexError(
+                    f"Failed to queue memory for indexing: {e}",
+                    "The note is saved; run /memory:sync to index it",
+                ) from e
+
+    def get_queued(self, limit: int) -> list[Memory]:
+        """Get queued memories in capture order.
+
+        Entries that failed INDEX_QUEUE_MAX_ATTEMPTS drains are left out.
+
+        Args:
+            limit: Maximum number of memories to return.
+
+        Returns:
+            Queued Memory objects, oldest first.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT * FROM index_queue
+                WHERE attempts < ?
+                ORDER BY created_at, rowid
+                LIMIT ?
+                """,
+                (INDEX_QUEUE_MAX_ATTEMPTS, limit),
+            )
+            return [self._row_to_memory(row) for row in cursor.fetchall()]
+
+    def dequeue_batch(self, memory_ids: Sequence[str]) -> int:
+        """Remove drained memories from the queue.
+
+        Inside bulk_load() this commits together with the index writes, so
+        a memory leaves the queue exactly when it lands in the index.
+
+        Args:
+            memory_ids: IDs of the drained memories.
+
+        Returns:
+            Number of queue entries removed.
+        """
+        if not memory_ids:
+            return 0
+
+        placeholders = ",".join("?" * len(memory_ids))
+        with self._cursor() as cursor:
+            try:
+                # placeholders is only "?" chars - safe parameterized query
+                cursor.execute(
+                    f"DELETE FROM index_queue WHERE id IN ({placeholders})",  # nosec B608
+                    memory_ids,
+                )
+                self._commit()
+                return cursor.rowcount
+            except Exception as e:
+                self._rollback()
+                raise MemoryIndexError(
+                    f"Failed to dequeue memories: {e}",
+                    "Retry the operation",
+                ) from e
+
+    def record_queue_failure(self, memory_ids: Sequence[str], error: str) -> None:
+        """Count a failed drain attempt against queued memories.
+
+        Args:
+            memory_ids: IDs of the memories that could not be indexed.
+            error: Failure description, kept for status displays.
+        """
+        if not memory_ids:
+            return
+
+        placeholders = ",".join("?" * len(memory_ids))
+        with self._cursor() as cursor:
+            # placeholders is only "?" chars - safe parameterized query
+            cursor.execute(
+                f"""
+                UPDATE index_queue
+                SET attempts = attempts + 1, last_error = ?
+                WHERE id IN ({placeholders})
+                """,  # nosec B608
+                [error, *memory_ids],
+            )
+            self._commit()
+
+    # =========================================================================
+    # Note Record Counts
+    # =========================================================================
+
+    def get_note_count(self, namespace: str, commit_sha: str) -> tuple[str, int] | None:
+        """Get the recorded number of records in a note.
+
+        Args:
+            namespace: Namespace of the note.
+            commit_sha: Commit the note is attached to.
+
+        Returns:
+            (note blob OID the count was taken at, record count), or None
+            if the note has not been counted.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                """
+                SELECT note_oid, record_count FROM note_counts
+                WHERE namespace = ? AND commit_sha = ?
+                """,
+                (namespace, commit_sha),
+            )
+            row = cursor.fetchone()
+            return (row[0], row[1]) if row else None
+
+    def set_note_count(
+        self,
+        namespace: str,
+        commit_sha: str,
+        note_oid: str,
+        record_count: int,
+    ) -> None:
+        """Record the number of records in a note.
+
+        Args:
+            namespace: Namespace of the note.
+            commit_sha: Commit the note is attached to.
+            note_oid: Blob OID of the note content that was counted.
+            record_count: Number of records in that content.
+        """
+        with self._cursor() as cursor:
+            cursor.execute(
+                """
+                INSERT OR REPLACE INTO note_counts
+                    (namespace, commit_sha, note_oid, record_count)
+                VALUES (?, ?, ?, ?)
+                """,
+                (namespace, commit_sha, note_oid, record_count),
+            )
+            self._commit()
+
+    # =========================================================================
+    # Namespace Versions
+    # =========================================================================
+
+    def get_namespace_versions(self) -> dict[str, int]:
+        """Get the write counter of every namespace that has been written.
+
+        A namespace's version increases with every insert, update and
+        delete of one of its memories; namespaces never written are absent
+        (version 0).
+
+        Returns:
+            Dict mapping namespace to version.
+        """
+        with self._cursor() as cursor:
+            cursor.execute("SELECT namespace, version FROM namespace_versions")
+            return {row[0]: row[1] for row in cursor.fetchall()}
 
     # =========================================================================
     # Utility Operations
     # =========================================================================
 
     def vacuum(self) -> None:
-        """Optimize the database by vacuuming."""
+        """Optimize the database by vacuuming.
+
+        VACUUM may renumber rowids of tables without an INTEGER PRIMARY KEY,
+        so the rowid-keyed FTS index is rebuilt afterwards.
+        """
         if self._conn is None:
             raise MemoryIndexError(
                 "Database not initialized",
                 "Call initialize() before performing operations",
             )
         self._conn.execute("VACUUM")
+        self.rebuild_text_index()
+
+    def rebuild_text_index(self) -> None:
+        """Rebuild the FTS5 index from the memories table.
+
+        No-op when FTS5 is unavailable.
+        """
+        if not self._fts_enabled:
+            return
+        with self._cursor() as cursor:
+            cursor.execute("INSERT INTO memories_fts(memories_fts) VALUES ('rebuild')")
+            self._commit()
 
     def has_embedding(self, memory_id: str) -> bool:
         """Check if a memory has an embedding.
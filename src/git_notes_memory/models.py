@@ -21,6 +21,7 @@ __all__ = [
     "HydratedMemory",
     "SpecContext",
     # Result Models
+    "CaptureRequest",
     "CaptureResult",
     "CaptureAccumulator",
     "IndexStats",
@@ -264,6 +265,31 @@ class SpecContext:
 # =============================================================================
 
 
+@dataclass(frozen=True)
+class CaptureRequest:
+    """One memory to capture with CaptureService.capture_batch().
+
+    Attributes:
+        namespace: Memory type (decisions, learnings, blockers, etc.)
+        summary: One-line summary (max 100 characters)
+        content: Full markdown content
+        spec: Specification slug this memory belongs to
+        tags: Categorization tags
+        phase: Lifecycle phase
+        status: Memory status (active, resolved, archived)
+        relates_to: IDs of related memories
+    """
+
+    namespace: str
+    summary: str
+    content: str
+    spec: str | None = None
+    tags: tuple[str, ...] = ()
+    phase: str | None = None
+    status: str = "active"
+    relates_to: tuple[str, ...] = ()
+
+
 @dataclass(frozen=True)
 class CaptureResult:
     """Result of a memory capture operation.
@@ -276,12 +302,14 @@ class CaptureResult:
         memory: The captured memory (if successful)
         indexed: Whether the memory was added to the search index
         warning: Optional warning message (e.g., embedding failed)
+        queued: Whether indexing was deferred to the index queue
     """
 
     success: bool
     memory: Memory | None = None
     indexed: bool = False
     warning: str | None = None
+    queued: bool = False
 
 
 @dataclass
@@ -361,6 +389,9 @@ class IndexStats:
         by_spec: Count per specification
         last_sync: Timestamp of last synchronization
         index_size_bytes: Size of the SQLite database
+        queue_pending: Captured memories waiting for deferred indexing
+        queue_failed: Queued memories whose drains kept failing (left for
+            reindex)
     """
 
     total_memories: int
@@ -368,6 +399,8 @@ class IndexStats:
     by_spec: tuple[tuple[str, int], ...] = field(default_factory=tuple)
     last_sync: datetime | None = None
     index_size_bytes: int = 0
+    queue_pending: int = 0
+    queue_failed: int = 0
 
     @property
     def by_namespace_dict(self) -> dict[str, int]:
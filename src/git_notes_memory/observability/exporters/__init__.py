@@ -12,19 +12,6 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-# Explicit imports for static analysis and runtime use
-from git_notes_memory.observability.exporters.json_exporter import export_json
-from git_notes_memory.observability.exporters.otlp import (
-    OTLPExporter,
-    export_metrics_if_configured,
-    export_traces_if_configured,
-    get_otlp_exporter,
-)
-from git_notes_memory.observability.exporters.prometheus import (
-    PrometheusExporter,
-    export_prometheus_text,
-)
-
 __all__ = [
     "export_prometheus_text",
     "export_json",
@@ -35,12 +22,53 @@ __all__ = [
     "export_metrics_if_configured",
 ]
 
-
-if TYPE_CHECKING:
-    # Re-export for type checkers
-    pass
+# Submodule providing each export; loaded on first access
+_EXPORTS: dict[str, str] = {
+    "export_json": "json_exporter",
+    "OTLPExporter": "otlp",
+    "get_otlp_exporter": "otlp",
+    "export_traces_if_configured": "otlp",
+    "export_metrics_if_configured": "otlp",
+    "PrometheusExporter": "prometheus",
+    "export_prometheus_text": "prometheus",
+}
 
 
 def __getattr__(name: str) -> Any:
-    """Lazy import fallback for any additional exports."""
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    """Lazy import implementation for public API.
+
+    Importing one exporter (as the Stop hook does for OTLP) does not load
+    the others.
+    """
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    module = importlib.import_module(f"{__name__}.{submodule}")
+    return getattr(module, name)
+
+
+if TYPE_CHECKING:
+    # Provide type hints for static analysis while keeping lazy imports at runtime
+    from git_notes_memory.observability.exporters.json_exporter import (
+        export_json as export_json,
+    )
+    from git_notes_memory.observability.exporters.otlp import (
+        OTLPExporter as OTLPExporter,
+    )
+    from git_notes_memory.observability.exporters.otlp import (
+        export_metrics_if_configured as export_metrics_if_configured,
+    )
+    from git_notes_memory.observability.exporters.otlp import (
+        export_traces_if_configured as export_traces_if_configured,
+    )
+    from git_notes_memory.observability.exporters.otlp import (
+        get_otlp_exporter as get_otlp_exporter,
+    )
+    from git_notes_memory.observability.exporters.prometheus import (
+        PrometheusExporter as PrometheusExporter,
+    )
+    from git_notes_memory.observability.exporters.prometheus import (
+        export_prometheus_text as export_prometheus_text,
+    )
@@ -23,8 +23,6 @@ from __future__ import annotations
 import json
 import logging
 import time
-import urllib.error
-import urllib.request
 from typing import TYPE_CHECKING, Any
 
 from git_notes_memory.observability.config import get_config
@@ -305,6 +303,10 @@ class OTLPExporter:
         Returns:
             True if request succeeded (2xx), False otherwise.
         """
+        # Deferred: urllib.request pulls in http.client, email and ssl
+        import urllib.error
+        import urllib.request
+
         try:
             data = json.dumps(payload).encode("utf-8")
             request = urllib.request.Request(
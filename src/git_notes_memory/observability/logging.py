@@ -19,7 +19,6 @@ from datetime import UTC, datetime
 from typing import Any
 
 from git_notes_memory.observability.config import LogFormat, LogLevel, get_config
-from git_notes_memory.observability.session import get_session_info
 from git_notes_memory.observability.tracing import (
     get_current_span_id,
     get_current_trace_id,
@@ -89,6 +88,9 @@ class StructuredLogger:
         # Add session context
         config = get_config()
         if config.enabled:
+            # Deferred: session identity needs socket, hashlib and uuid
+            from git_notes_memory.observability.session import get_session_info
+
             session = get_session_info()
             extra["session_id"] = session.short_id
 
@@ -111,6 +113,8 @@ class StructuredLogger:
         Supports both format-string style (msg % args) and structured kwargs.
         """
         self._ensure_configured()
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         extra = self._build_extra(**kwargs)
         self._logger.debug(msg, *args, extra={"structured": extra})
 
@@ -120,6 +124,8 @@ class StructuredLogger:
         Supports both format-string style (msg % args) and structured kwargs.
         """
         self._ensure_configured()
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         extra = self._build_extra(**kwargs)
         self._logger.info(msg, *args, extra={"structured": extra})
 
@@ -129,6 +135,8 @@ class StructuredLogger:
         Supports both format-string style (msg % args) and structured kwargs.
         """
         self._ensure_configured()
+        if not self._logger.isEnabledFor(logging.WARNING):
+            return
         extra = self._build_extra(**kwargs)
         self._logger.warning(msg, *args, extra={"structured": extra})
 
@@ -138,6 +146,8 @@ class StructuredLogger:
         Supports both format-string style (msg % args) and structured kwargs.
         """
         self._ensure_configured()
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         extra = self._build_extra(**kwargs)
         self._logger.error(msg, *args, extra={"structured": extra})
 
@@ -147,6 +157,8 @@ class StructuredLogger:
         Supports both format-string style (msg % args) and structured kwargs.
         """
         self._ensure_configured()
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         extra = self._build_extra(**kwargs)
         self._logger.exception(msg, *args, extra={"structured": extra})
 
@@ -0,0 +1,222 @@
+"""ONNX Runtime embedding backend.
+
+Runs the int8-quantized ONNX export of a sentence-transformers model with
+onnxruntime and the Rust ``tokenizers`` library, so embedding never imports
+torch. Loading takes a fraction of the time and memory of the torch backend,
+which matters most for short-lived hook processes on CPU-only hosts.
+
+The model exposes the subset of the SentenceTransformer interface that
+EmbeddingService uses (``encode`` and ``get_sentence_embedding_dimension``),
+and reproduces its pipeline: tokenize with truncation, run the transformer,
+mean-pool over the attention mask, then L2-normalize.
+
+Requires the optional extra: ``pip install git-notes-memory[onnx]``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import platform
+from collections.abc import Sequence
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+__all__ = [
+    "OnnxEmbeddingModel",
+    "default_onnx_model_file",
+]
+
+logger = logging.getLogger(__name__)
+
+# sentence-transformers' default for all-MiniLM-L6-v2 when the repo has no
+# sentence_bert_config.json
+_DEFAULT_MAX_SEQ_LENGTH = 256
+
+
+def default_onnx_model_file() -> str:
+    """Pick the quantized ONNX export matching this CPU architecture.
+
+    sentence-transformers model repos ship int8 exports tuned per
+    instruction set under ``onnx/``.
+
+    Returns:
+        Path of the ONNX file within the model repository.
+    """
+    machine = platform.machine().lower()
+    if machine in {"arm64", "aarch64"}:
+        return "onnx/model_qint8_arm64.onnx"
+    return "onnx/model_quint8_avx2.onnx"
+
+
+class OnnxEmbeddingModel:
+    """Sentence embedding model served by onnxruntime.
+
+    Use :meth:`from_pretrained` to download and load a model; the
+    constructor takes already-loaded components so it can be tested
+    without the optional dependencies.
+
+    Example:
+        >>> model = OnnxEmbeddingModel.from_pretrained(
+        ...     "all-MiniLM-L6-v2", cache_dir=Path("/tmp/models")
+        ... )
+        >>> model.encode("Hello").shape
+        (384,)
+    """
+
+    def __init__(
+        self,
+        session: Any,
+        tokenizer: Any,
+        dimensions: int,
+    ) -> None:
+        """Initialize from a loaded session and tokenizer.
+
+        Args:
+            session: An ``onnxruntime.InferenceSession``.
+            tokenizer: A ``tokenizers.Tokenizer`` with truncation and
+                padding enabled.
+            dimensions: Embedding dimensions (the model's hidden size).
+        """
+        self._session = session
+        self._tokenizer = tokenizer
+        self._dimensions = dimensions
+        self._input_names = {i.name for i in session.get_inputs()}
+
+    @classmethod
+    def from_pretrained(
+        cls,
+        model_name: str,
+        cache_dir: Path,
+        model_file: str | None = None,
+        revision: str | None = None,
+    ) -> OnnxEmbeddingModel:
+        """Download (if needed) and load a model from the Hugging Face Hub.
+
+        Args:
+            model_name: Model name; bare names resolve to the
+                ``sentence-transformers/`` organization.
+            cache_dir: Directory for downloaded model files.
+            model_file: ONNX file within the repo. Defaults to the
+                quantized export for this CPU (see default_onnx_model_file).
+            revision: Repository commit to download; None follows the
+                main branch.
+
+        Returns:
+            The loaded model.
+
+        Raises:
+            ImportError: If the ``onnx`` extra is not installed.
+        """
+        import onnxruntime as ort
+        from huggingface_hub import snapshot_download
+        from tokenizers import Tokenizer
+
+        repo_id = (
+            model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        )
+        model_file = model_file or default_onnx_model_file()
+        model_dir = Path(
+            snapshot_download(
+                repo_id,
+                revision=revision,
+                cache_dir=str(cache_dir),
+                allow_patterns=[
+                    model_file,
+                    "tokenizer.json",
+                    "config.json",
+                    "sentence_bert_config.json",
+                ],
+            )
+        )
+
+        config = json.loads((model_dir / "config.json").read_text())
+        max_seq_length = _DEFAULT_MAX_SEQ_LENGTH
+        st_config_path = model_dir / "sentence_bert_config.json"
+        if st_config_path.exists():
+            st_config = json.loads(st_config_path.read_text())
+            max_seq_length = int(st_config.get("max_seq_length", max_seq_length))
+
+        tokenizer = Tokenizer.from_file(str(model_dir / "tokenizer.json"))
+        tokenizer.enable_truncation(max_length=max_seq_length)
+        tokenizer.enable_padding()
+
+        session = ort.InferenceSession(
+            str(model_dir / model_file),
+            providers=["CPUExecutionProvider"],
+        )
+        logger.debug("Loaded ONNX model %s (%s)", repo_id, model_file)
+        return cls(session, tokenizer, int(config["hidden_size"]))
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the embedding dimensions."""
+        return self._dimensions
+
+    def encode(
+        self,
+        sentences: str | Sequence[str],
+        batch_size: int = 32,
+        show_progress_bar: bool = False,  # noqa: ARG002 - interface parity
+        convert_to_numpy: bool = True,  # noqa: ARG002 - always numpy
+        normalize_embeddings: bool = True,
+    ) -> NDArray[np.float32]:
+        """Embed one text or a batch of texts.
+
+        Mirrors ``SentenceTransformer.encode``: a single string yields a 1-D
+        vector, a sequence yields a 2-D array with one row per text.
+
+        Args:
+            sentences: Text or texts to embed.
+            batch_size: Texts per inference call.
+            show_progress_bar: Accepted for interface parity; ignored.
+            convert_to_numpy: Accepted for interface parity; always numpy.
+            normalize_embeddings: L2-normalize each embedding.
+
+        Returns:
+            The embedding(s) as float32.
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if isinstance(sentences, str) else list(sentences)
+        batches = [
+            self._encode_batch(texts[start : start + batch_size])
+            for start in range(0, len(texts), batch_size)
+        ]
+        embeddings = (
+            np.concatenate(batches)
+            if batches
+            else np.zeros((0, self._dimensions), dtype=np.float32)
+        )
+        if normalize_embeddings:
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings = embeddings / np.clip(norms, 1e-12, None)
+        return embeddings[0] if single else embeddings
+
+    def _encode_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        """Tokenize, run the model and mean-pool one batch."""
+        encodings = self._tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encodings], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encodings], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.array(
+                [e.type_ids for e in encodings], dtype=np.int64
+            )
+        feeds = {
+            name: value for name, value in feeds.items() if name in self._input_names
+        }
+
+        token_embeddings = np.asarray(
+            self._session.run(None, feeds)[0], dtype=np.float32
+        )
+
+        # Mean pooling over real (non-padding) tokens, as sentence-transformers does
+        mask = attention_mask[..., np.newaxis].astype(np.float32)
+        summed = (token_embeddings * mask).sum(axis=1)
+        counts = np.clip(mask.sum(axis=1), 1e-9, None)
+        pooled: NDArray[np.float32] = (summed / counts).astype(np.float32)
+        return pooled
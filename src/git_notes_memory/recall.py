@@ -17,8 +17,12 @@ import logging
 from collections.abc import Sequence
 from typing import TYPE_CHECKING
 
-from git_notes_memory.config import TOKENS_PER_CHAR, get_project_index_path
-from git_notes_memory.exceptions import RecallError
+from git_notes_memory.config import (
+    MAX_HYDRATION_FILES,
+    TOKENS_PER_CHAR,
+    get_project_index_path,
+)
+from git_notes_memory.exceptions import RecallError, ValidationError
 from git_notes_memory.models import (
     CommitInfo,
     HydratedMemory,
@@ -45,6 +49,13 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+# Distance assigned to hybrid hits without an embedding: the maximum L2
+# distance between unit vectors, i.e. "no semantic similarity".
+_NO_VECTOR_DISTANCE = 2.0
+
+# Reciprocal Rank Fusion damping constant for hybrid search
+_RRF_K = 60
+
 
 # =============================================================================
 # RecallService
@@ -229,6 +240,222 @@ class RecallService:
                     "Check query text and try again",
                 ) from e
 
+    @measure_duration("memory_search_batch")
+    def search_batch(
+        self,
+        queries: Sequence[str],
+        k: int = 10,
+        *,
+        namespaces: Sequence[str | None] | None = None,
+        spec: str | None = None,
+        min_similarity: float | None = None,
+    ) -> list[list[MemoryResult]]:
+        """Search for memories similar to each of several queries.
+
+        Same as calling search() per query, but the queries are embedded
+        with one embed_batch() call and looked up in one index pass
+        (IndexService.search_vector_batch), so the model runs once for the
+        whole batch.
+
+        Args:
+            queries: The search query texts.
+            k: Maximum number of results per query.
+            namespaces: Optional namespace filter per query, aligned with
+                queries; None entries search every namespace.
+            spec: Optional spec identifier to filter results.
+            min_similarity: Minimum similarity threshold (0-1).
+
+        Returns:
+            One MemoryResult list per query, in input order, each sorted by
+            relevance. Empty queries get an empty list.
+
+        Raises:
+            RecallError: If the search operation fails.
+        """
+        if namespaces is None:
+            namespaces = [None] * len(queries)
+        if len(namespaces) != len(queries):
+            raise RecallError(
+                "Search failed: one namespace filter per query is required",
+                "Pass namespaces aligned with queries",
+            )
+
+        batch: list[list[MemoryResult]] = [[] for _ in queries]
+        positions = [i for i, query in enumerate(queries) if query and query.strip()]
+        if not positions:
+            return batch
+
+        metrics = get_metrics()
+
+        with trace_operation("search", labels={"search_type": "semantic_batch"}):
+            try:
+                with trace_operation("search.embed_query"):
+                    embeddings = self._get_embedding().embed_batch(
+                        [queries[i] for i in positions]
+                    )
+
+                with trace_operation("search.vector_search"):
+                    raw_batch = self._get_index().search_vector_batch(
+                        embeddings,
+                        k=k,
+                        namespaces=[namespaces[i] for i in positions],
+                        spec=spec,
+                    )
+
+                retrieved = 0
+                for i, raw_results in zip(positions, raw_batch, strict=True):
+                    for memory, distance in raw_results:
+                        similarity = 1.0 / (1.0 + distance) if distance >= 0 else 0.0
+                        if min_similarity is not None and similarity < min_similarity:
+                            continue
+                        batch[i].append(MemoryResult(memory=memory, distance=distance))
+                    retrieved += len(batch[i])
+
+                metrics.increment(
+                    "memories_retrieved_total",
+                    amount=float(retrieved),
+                    labels={"search_type": "semantic"},
+                )
+
+                logger.debug(
+                    "Batch search of %d queries returned %d results (k=%d, spec=%s)",
+                    len(positions),
+                    retrieved,
+                    k,
+                    spec,
+                )
+
+                return batch
+
+            except Exception as e:
+                raise RecallError(
+                    f"Search failed: {e}",
+                    "Check query text and try again",
+                ) from e
+
+    @measure_duration("memory_search_hybrid")
+    def search_hybrid(
+        self,
+        query: str,
+        k: int = 10,
+        *,
+        namespace: str | None = None,
+        spec: str | None = None,
+        min_similarity: float | None = None,
+        target_spec: str | None = None,
+        target_tags: list[str] | None = None,
+    ) -> list[MemoryResult]:
+        """Search using both BM25 keyword matching and vector similarity.
+
+        Pure vector search misses exact identifiers (function names, error
+        codes) that a keyword match finds trivially. This runs both legs
+        in one index query, fuses them with Reciprocal Rank Fusion, and
+        passes the fused list through ResultReranker for recency,
+        namespace, spec and tag boosts.
+
+        Returned MemoryResults carry the true vector distance.
+        min_similarity filters every result except memories whose text
+        matches all query terms: a match on an exact identifier is often
+        far from the query in embedding space, and dropping it would leave
+        plain vector search. A memory sharing only some of the terms must
+        pass the floor like a vector-only hit.
+
+        Args:
+            query: The search query text.
+            k: Maximum number of results to return.
+            namespace: Optional namespace to filter results.
+            spec: Optional spec identifier to filter results.
+            min_similarity: Minimum vector similarity threshold (0-1) for
+                memories that do not match every query term.
+            target_spec: Spec to boost during re-ranking.
+            target_tags: Tags to boost during re-ranking.
+
+        Returns:
+            List of MemoryResult objects, best match first.
+
+        Raises:
+            RecallError: If the search operation fails.
+
+        Examples:
+            >>> results = service.search_hybrid("ERR_CONN_RESET retry policy")
+        """
+        if not query or not query.strip():
+            return []
+
+        metrics = get_metrics()
+
+        with trace_operation("search", labels={"search_type": "hybrid"}):
+            try:
+                with trace_operation("search.embed_query"):
+                    query_embedding = self._get_embedding().embed(query)
+
+                # Fetch a wider fused pool so re-ranking can promote results
+                with trace_operation("search.hybrid_search"):
+                    fused = self._get_index().search_hybrid(
+                        query,
+                        query_embedding,
+                        k=k * 2,
+                        namespace=namespace,
+                        spec=spec,
+                        rrf_k=_RRF_K,
+                    )
+
+                candidates: list[MemoryResult] = []
+                rank_inputs: list[MemoryResult] = []
+                for memory, score, distance, lexical in fused:
+                    true_distance = (
+                        distance if distance is not None else _NO_VECTOR_DISTANCE
+                    )
+                    similarity = 1.0 / (1.0 + true_distance)
+                    if (
+                        min_similarity is not None
+                        and not lexical
+                        and similarity < min_similarity
+                    ):
+                        continue
+                    candidates.append(
+                        MemoryResult(memory=memory, distance=true_distance)
+                    )
+                    # Reranker treats lower scores as better; express the
+                    # fused score as a pseudo-distance (~0.5 for a memory
+                    # ranked first by both legs, ~1.0 for first by one leg)
+                    rank_inputs.append(
+                        MemoryResult(memory=memory, distance=1.0 / (score * _RRF_K))
+                    )
+
+                from git_notes_memory.search import SearchQuery, get_optimizer
+
+                ranked = get_optimizer().rerank_results(
+                    rank_inputs,
+                    SearchQuery(original=query),
+                    target_spec=target_spec,
+                    target_namespace=namespace,
+                    target_tags=target_tags,
+                )
+                by_id = {r.id: r for r in candidates}
+                results = [by_id[r.result.id] for r in ranked[:k]]
+
+                metrics.increment(
+                    "memories_retrieved_total",
+                    amount=float(len(results)),
+                    labels={"search_type": "hybrid"},
+                )
+
+                logger.debug(
+                    "Hybrid search for '%s' returned %d results (k=%d)",
+                    query[:50],
+                    len(results),
+                    k,
+                )
+
+                return results
+
+            except Exception as e:
+                raise RecallError(
+                    f"Hybrid search failed: {e}",
+                    "Check query text and try again",
+                ) from e
+
     @measure_duration("memory_search_text")
     def search_text(
         self,
@@ -506,7 +733,9 @@ class RecallService:
             files: tuple[tuple[str, str], ...] = ()
 
             if level == HydrationLevel.FILES:
-                files = self._load_files_at_commit(memory.commit_sha)
+                files = self._load_files_at_commits([memory.commit_sha]).get(
+                    memory.commit_sha, ()
+                )
 
             return HydratedMemory(
                 result=result,
@@ -583,6 +812,22 @@ class RecallService:
         for ns, commit_shas in namespace_commits.items():
             note_contents[ns] = git_ops.show_notes_batch(ns, commit_shas)
 
+        # Batch fetch commit metadata for all unique commits
+        commit_infos: dict[str, CommitInfo] = {}
+        if level.value >= HydrationLevel.FULL.value:
+            unique_commits = list(dict.fromkeys(r.memory.commit_sha for r in results))
+            try:
+                commit_infos = git_ops.get_commit_info_batch(unique_commits)
+            except Exception as e:
+                logger.debug("Failed to get commit info batch: %s", e)
+
+        # Batch load file snapshots for all unique commits
+        commit_files: dict[str, tuple[tuple[str, str], ...]] = {}
+        if level == HydrationLevel.FILES:
+            commit_files = self._load_files_at_commits(
+                list(dict.fromkeys(r.memory.commit_sha for r in results))
+            )
+
         # Build hydrated memories using cached contents
         hydrated: list[HydratedMemory] = []
         for r in results:
@@ -596,16 +841,10 @@ class RecallService:
                 ns_contents = note_contents.get(memory.namespace, {})
                 full_content = ns_contents.get(memory.commit_sha)
 
-                # Get commit info (not batched - less critical for perf)
-                try:
-                    commit_info = git_ops.get_commit_info(memory.commit_sha)
-                except Exception as e:
-                    logger.debug(
-                        "Failed to get commit info for %s: %s", memory.commit_sha, e
-                    )
+                commit_info = commit_infos.get(memory.commit_sha)
 
             if level == HydrationLevel.FILES:
-                files = self._load_files_at_commit(memory.commit_sha)
+                files = commit_files.get(memory.commit_sha, ())
 
             hydrated.append(
                 HydratedMemory(
@@ -618,38 +857,54 @@ class RecallService:
 
         return hydrated
 
-    def _load_files_at_commit(self, commit_sha: str) -> tuple[tuple[str, str], ...]:
-        """Load file snapshots at a specific commit.
+    def _load_files_at_commits(
+        self, commit_shas: Sequence[str]
+    ) -> dict[str, tuple[tuple[str, str], ...]]:
+        """Load file snapshots for several commits.
+
+        Changed files come from one ``git diff-tree`` and their contents
+        from one cat-file stream (see GitOps.get_files_at_commits), capped
+        at MAX_HYDRATION_FILES per commit, MAX_FILE_SIZE per file and
+        MAX_HYDRATION_TOTAL_BYTES overall. Binary files are skipped.
 
         Args:
-            commit_sha: The commit SHA to load files from.
+            commit_shas: The commit SHAs to load files from.
 
         Returns:
-            Tuple of (path, content) pairs for changed files.
+            Dict mapping commit SHA to (path, content) pairs for its changed
+            files. Commits whose files could not be loaded are omitted.
         """
+        from git_notes_memory.git_ops import validate_path
+
         try:
             git_ops = self._get_git_ops()
-
-            # Get list of changed files in the commit
-            changed_files = git_ops.get_changed_files(commit_sha)
-
-            # Load content for each file
-            files: list[tuple[str, str]] = []
-            for path in changed_files:
-                try:
-                    content = git_ops.get_file_at_commit(path, commit_sha)
-                    if content is not None:
-                        files.append((path, content))
-                except Exception as e:
-                    logger.debug(
-                        "Failed to load file %s at %s: %s", path, commit_sha, e
-                    )
-
-            return tuple(files)
+            changed = git_ops.get_changed_files_batch(commit_shas)
+
+            requests: list[tuple[str, str]] = []
+            for sha in commit_shas:
+                paths = changed.get(sha, [])[:MAX_HYDRATION_FILES]
+                for path in paths:
+                    try:
+                        validate_path(path)
+                    except ValidationError:
+                        logger.debug("Skipping file %s at %s", path, sha)
+                        continue
+                    requests.append((sha, path))
+
+            contents = git_ops.get_files_at_commits(requests)
+            return {
+                sha: tuple(
+                    (path, contents[(sha, path)])
+                    for path in changed[sha][:MAX_HYDRATION_FILES]
+                    if (sha, path) in contents
+                )
+                for sha in commit_shas
+                if sha in changed
+            }
 
         except Exception as e:
-            logger.debug("Failed to load files at commit %s: %s", commit_sha, e)
-            return ()
+            logger.debug("Failed to load files at commits %s: %s", commit_shas, e)
+            return {}
 
     # -------------------------------------------------------------------------
     # Context Aggregation
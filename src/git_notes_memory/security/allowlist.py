@@ -12,8 +12,6 @@ from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from git_notes_memory.registry import ServiceRegistry
 from git_notes_memory.security.exceptions import AllowlistError
 from git_notes_memory.security.models import AllowlistEntry
@@ -111,6 +109,8 @@ class AllowlistManager:
         entries: dict[str, AllowlistEntry] = {}
 
         if file_path.exists():
+            import yaml
+
             try:
                 with file_path.open() as f:
                     data = yaml.safe_load(f)
@@ -212,6 +212,8 @@ class AllowlistManager:
             "entries": yaml_entries,
         }
 
+        import yaml
+
         try:
             with file_path.open("w") as f:
                 yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
@@ -11,8 +11,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from git_notes_memory.security.models import FilterStrategy
 
 __all__ = [
@@ -166,6 +164,8 @@ def _load_from_yaml(path: Path) -> dict[str, object]:
     if not path.exists():
         return config
 
+    import yaml
+
     with path.open() as f:
         data = yaml.safe_load(f)
 
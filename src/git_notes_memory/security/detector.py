@@ -9,9 +9,6 @@ from __future__ import annotations
 import hashlib
 from typing import TYPE_CHECKING
 
-from detect_secrets.core.scan import scan_line
-from detect_secrets.settings import transient_settings
-
 from git_notes_memory.registry import ServiceRegistry
 from git_notes_memory.security.models import SecretDetection, SecretType
 
@@ -243,6 +240,10 @@ class DetectSecretsAdapter:
         Returns:
             List of PotentialSecret objects found.
         """
+        # Deferred: detect-secrets loads its plugin registry on import
+        from detect_secrets.core.scan import scan_line
+        from detect_secrets.settings import transient_settings
+
         # Use transient_settings to apply our custom plugin configuration
         with transient_settings(settings):
             return list(scan_line(line))
@@ -5,7 +5,8 @@ synchronized with the authoritative git notes storage.
 
 Key Operations:
     - sync_note_to_index: Index a single note by commit
-    - reindex: Rebuild entire index from git notes
+    - drain_index_queue: Index memories captured with deferred indexing
+    - reindex: Rebuild the index, incrementally from notes ref diffs
     - verify_consistency: Check index vs notes for drift
     - collect_notes: Gather all notes across namespaces
 """
@@ -17,10 +18,16 @@ import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from git_notes_memory.config import NAMESPACES, get_project_index_path
+from git_notes_memory.config import (
+    INDEX_BULK_BATCH_SIZE,
+    NAMESPACES,
+    get_project_index_path,
+)
+from git_notes_memory.embedding import memory_embedding_text
 from git_notes_memory.exceptions import RecallError
 from git_notes_memory.models import Memory, NoteRecord, VerificationResult
 from git_notes_memory.observability.metrics import get_metrics
+from git_notes_memory.utils import make_memory_id, parse_memory_id
 
 if TYPE_CHECKING:
     from git_notes_memory.embedding import EmbeddingService
@@ -147,30 +154,28 @@ class SyncService:
             logger.warning("Failed to parse note at %s: %s", commit, e)
             return 0
 
-        # Convert to memories and index
-        indexed = 0
-        for i, record in enumerate(records):
-            memory = self._record_to_memory(record, commit, namespace, i)
-
-            # Generate embedding
-            embed_vector = None
-            try:
-                text_for_embedding = f"{memory.summary}\n{memory.content}"
-                embed_vector = embedding.embed(text_for_embedding)
-            except Exception as e:
-                logger.warning("Embedding failed for %s: %s", memory.id, e)
+        if not records:
+            return 0
 
-            # Insert into index
-            try:
-                if index.exists(memory.id):
-                    index.update(memory, embedding=embed_vector)
-                else:
-                    index.insert(memory, embedding=embed_vector)
-                indexed += 1
-            except Exception as e:
-                logger.warning("Failed to index memory %s: %s", memory.id, e)
+        # Convert to memories and embed them in one batch (PERF-002)
+        memories = [
+            self._record_to_memory(record, commit, namespace, i)
+            for i, record in enumerate(records)
+        ]
+        texts = [memory_embedding_text(m.summary, m.content) for m in memories]
+        embed_vectors: list[list[float]] | list[None]
+        try:
+            embed_vectors = embedding.embed_batch(texts)
+        except Exception as e:
+            logger.warning("Embedding failed for %s/%s: %s", namespace, commit, e)
+            embed_vectors = [None] * len(memories)
 
-        return indexed
+        # Insert new memories and update existing ones in one transaction
+        try:
+            return index.upsert_batch(memories, embed_vectors)
+        except Exception as e:
+            logger.warning("Failed to index note %s/%s: %s", namespace, commit, e)
+            return 0
 
     def _record_to_memory(
         self,
@@ -192,8 +197,7 @@ class SyncService:
         """
         from datetime import UTC, datetime
 
-        # Generate deterministic ID
-        memory_id = f"{namespace}:{commit[:7]}:{index}"
+        memory_id = make_memory_id(namespace, commit, index)
 
         # Parse timestamp or use current time
         timestamp = record.timestamp
@@ -217,7 +221,7 @@ class SyncService:
     def collect_notes(self) -> list[NoteRecord]:
         """Collect all notes across all namespaces.
 
-        Iterates through all namespaces, lists notes, and parses
+        Enumerates the notes of every namespace in one pass and parses
         their content into NoteRecord objects.
 
         Uses batch git operations (PERF-001) for efficient retrieval.
@@ -229,23 +233,10 @@ class SyncService:
         parser = self._get_note_parser()
         all_records: list[NoteRecord] = []
 
-        for namespace in NAMESPACES:
-            try:
-                notes_list = git_ops.list_notes(namespace)
-            except Exception as e:
-                logger.debug("No notes in namespace %s: %s", namespace, e)
-                continue
-
-            if not notes_list:
-                continue
-
-            # PERF-001: Batch fetch all notes for this namespace
-            commit_shas = [commit_sha for _note_sha, commit_sha in notes_list]
-            contents = git_ops.show_notes_batch(namespace, commit_shas)
-
-            for _note_sha, commit_sha in notes_list:
+        # PERF-001: Stream every namespace's notes through one cat-file process
+        try:
+            for namespace, commit_sha, content in git_ops.iter_all_notes():
                 try:
-                    content = contents.get(commit_sha)
                     if content:
                         # Pass commit_sha and namespace so NoteRecord has them
                         records = parser.parse_many(
@@ -261,12 +252,24 @@ class SyncService:
                         commit_sha,
                         e,
                     )
+        except Exception as e:
+            logger.warning("Failed to read notes: %s", e)
 
         return all_records
 
     def reindex(self, *, full: bool = False) -> int:
         """Rebuild the index from git notes.
 
+        Incremental runs are driven by notes ref changes: the index records
+        the notes commit each namespace was last indexed at, and the next
+        run diffs the old and new notes trees to apply only added, changed
+        and removed notes. All notes refs are resolved with one
+        ``for-each-ref``, so namespaces without notes or with unchanged
+        refs cost nothing more.
+        Namespaces with no recorded commit (new indexes, or indexes built
+        before refs were recorded) fall back to listing every note and
+        adding those not yet indexed.
+
         Uses batch git operations (PERF-001) and batch embedding (PERF-002)
         for efficient retrieval and vectorization.
 
@@ -280,92 +283,251 @@ class SyncService:
             StorageError: If git operations fail.
             RecallError: If indexing fails.
         """
-        git_ops = self._get_git_ops()
         index = self._get_index()
-        embedding_service = self._get_embedding_service()
-        parser = self._get_note_parser()
 
         if full:
             logger.info("Starting full reindex - clearing existing index")
             index.clear()
 
+        try:
+            refs = self._get_git_ops().list_notes_refs()
+        except Exception as e:
+            logger.debug("Cannot resolve notes refs: %s", e)
+            refs = {}
+
         indexed = 0
         for namespace in NAMESPACES:
-            try:
-                notes_list = git_ops.list_notes(namespace)
-            except Exception as e:
-                logger.debug("No notes in namespace %s: %s", namespace, e)
-                continue
+            ref_sha = refs.get(namespace)
+            if ref_sha is not None:
+                indexed += self._reindex_namespace(namespace, ref_sha, full=full)
 
-            if not notes_list:
-                continue
+        logger.info("Reindex complete: %d memories indexed", indexed)
+        return indexed
 
-            # PERF-001: Batch fetch all notes for this namespace
-            commit_shas = [commit_sha for _note_sha, commit_sha in notes_list]
-            contents = git_ops.show_notes_batch(namespace, commit_shas)
+    def _reindex_namespace(self, namespace: str, ref_sha: str, *, full: bool) -> int:
+        """Bring one namespace of the index up to date with its notes ref.
 
-            # First pass: collect all memories and texts for batch embedding
-            memories_to_index: list[Memory] = []
-            texts_to_embed: list[str] = []
+        The namespace's notes commit is recorded only when every note was
+        applied, so notes that failed are retried on the next run.
 
-            for _note_sha, commit_sha in notes_list:
-                try:
-                    content = contents.get(commit_sha)
-                    if not content:
-                        continue
-
-                    records = parser.parse_many(content)
-                    for i, record in enumerate(records):
-                        memory = self._record_to_memory(
-                            record, commit_sha, namespace, i
-                        )
-
-                        # Skip if already exists and not full reindex
-                        if not full and index.exists(memory.id):
-                            continue
-
-                        memories_to_index.append(memory)
-                        texts_to_embed.append(f"{memory.summary}\n{memory.content}")
+        Args:
+            namespace: Memory namespace.
+            ref_sha: Current commit of the namespace's notes ref.
+            full: True when the index was just cleared.
 
-                except Exception as e:
-                    logger.warning(
-                        "Failed to process note %s/%s: %s",
-                        namespace,
-                        commit_sha,
-                        e,
-                    )
+        Returns:
+            Number of memories indexed.
+        """
+        git_ops = self._get_git_ops()
+        index = self._get_index()
+        parser = self._get_note_parser()
 
-            if not memories_to_index:
-                continue
+        indexed_sha = None if full else index.get_indexed_notes_ref(namespace)
+        if ref_sha == indexed_sha:
+            return 0
 
-            # PERF-002: Batch generate all embeddings at once
-            embeddings: list[list[float]] | list[None] = []
+        # Notes whose existing memories are replaced (changed) or dropped
+        # (removed); when rescanning everything, existing memories are kept
+        replace = False
+        changed: list[str] = []
+        removed: list[str] = []
+        if indexed_sha is not None:
             try:
-                embeddings = embedding_service.embed_batch(texts_to_embed)
+                changed, removed = git_ops.diff_notes(indexed_sha, ref_sha)
+                replace = True
             except Exception as e:
                 logger.warning(
-                    "Batch embedding failed for namespace %s: %s",
+                    "Cannot diff %s notes since %s, rescanning: %s",
                     namespace,
+                    indexed_sha[:8],
                     e,
                 )
-                # Fall back to None embeddings for all
-                embeddings = [None] * len(memories_to_index)
+        if not replace:
+            try:
+                changed = [commit for _note, commit in git_ops.list_notes(namespace)]
+            except Exception as e:
+                logger.debug("No notes in namespace %s: %s", namespace, e)
+                return 0
+
+        # PERF-001: Stream the notes to apply from one cat-file process and
+        # write them in chunks, so memory is bounded by a chunk of notes
+        complete = True
+        indexed = 0
+        chunk_commits: list[str] = []
+        chunk: list[Memory] = []
+        try:
+            if replace and removed:
+                index.delete_batch(self._note_memory_ids(namespace, removed))
 
-            # Second pass: insert memories with their embeddings
-            for memory, embed_vector in zip(memories_to_index, embeddings, strict=True):
+            for commit_sha, content in git_ops.iter_notes_batch(namespace, changed):
+                if content is None:
+                    complete = False
+                    continue
                 try:
-                    index.insert(memory, embedding=embed_vector)
-                    indexed += 1
+                    records = parser.parse_many(content)
+                    memories = [
+                        self._record_to_memory(record, commit_sha, namespace, i)
+                        for i, record in enumerate(records)
+                    ]
                 except Exception as e:
+                    complete = False
                     logger.warning(
-                        "Failed to index memory %s: %s",
-                        memory.id,
+                        "Failed to process note %s/%s: %s",
+                        namespace,
+                        commit_sha,
                         e,
                     )
+                    continue
 
-        logger.info("Reindex complete: %d memories indexed", indexed)
+                chunk_commits.append(commit_sha)
+                for memory in memories:
+                    # A rescan only adds memories that are not indexed yet
+                    if not full and not replace and index.exists(memory.id):
+                        continue
+                    chunk.append(memory)
+
+                if len(chunk) >= INDEX_BULK_BATCH_SIZE:
+                    indexed += self._write_chunk(
+                        namespace, chunk_commits, chunk, replace=replace
+                    )
+                    chunk_commits, chunk = [], []
+
+            indexed += self._write_chunk(
+                namespace, chunk_commits, chunk, replace=replace
+            )
+        except Exception as e:
+            logger.warning("Failed to index namespace %s: %s", namespace, e)
+            return indexed
+
+        if complete:
+            index.set_indexed_notes_ref(namespace, ref_sha)
         return indexed
 
+    def _note_memory_ids(self, namespace: str, commit_shas: list[str]) -> list[str]:
+        """Get the indexed memory IDs of the given notes in a namespace."""
+        index = self._get_index()
+        return [
+            memory.id
+            for commit_sha in commit_shas
+            for memory in index.get_by_commit(commit_sha)
+            if memory.namespace == namespace
+        ]
+
+    def _write_chunk(
+        self,
+        namespace: str,
+        commit_shas: list[str],
+        memories: list[Memory],
+        *,
+        replace: bool,
+    ) -> int:
+        """Embed a chunk of memories and write it in one bulk transaction.
+
+        Inference runs before the transaction opens, so captures are not
+        blocked on the index while the model works.
+
+        Args:
+            namespace: Memory namespace.
+            commit_shas: Notes the memories were parsed from.
+            memories: Memories to write.
+            replace: Upsert the memories and delete memories of these notes
+                that the notes no longer produce. Otherwise insert only.
+
+        Returns:
+            Number of memories written.
+        """
+        if not memories and not (replace and commit_shas):
+            return 0
+        index = self._get_index()
+        embeddings = self._embed_chunk(
+            [memory_embedding_text(m.summary, m.content) for m in memories],
+            namespace,
+        )
+        with index.bulk_load():
+            if not replace:
+                return index.insert_batch(memories, embeddings)
+            fresh_ids = {memory.id for memory in memories}
+            stale_ids = [
+                memory_id
+                for memory_id in self._note_memory_ids(namespace, commit_shas)
+                if memory_id not in fresh_ids
+            ]
+            if stale_ids:
+                index.delete_batch(stale_ids)
+            return index.upsert_batch(memories, embeddings)
+
+    def _embed_chunk(
+        self,
+        texts: list[str],
+        namespace: str,
+    ) -> list[list[float]] | list[None]:
+        """Embed a chunk of memory texts, or return no embeddings on failure.
+
+        Args:
+            texts: Texts to embed.
+            namespace: Namespace being indexed (for logging).
+
+        Returns:
+            One embedding per text, or None for every text if embedding
+            failed; memories are still indexed and can be embedded later.
+        """
+        if not texts:
+            return []
+        # PERF-002: Batch generate all embeddings at once
+        try:
+            return self._get_embedding_service().embed_batch(texts)
+        except Exception as e:
+            logger.warning(
+                "Batch embedding failed for namespace %s: %s",
+                namespace,
+                e,
+            )
+            return [None] * len(texts)
+
+    def drain_index_queue(self, limit: int | None = None) -> int:
+        """Embed and index memories queued by deferred captures.
+
+        Queued memories are embedded in INDEX_BULK_BATCH_SIZE chunks and
+        each chunk is written and removed from the queue in one bulk
+        transaction. A chunk that fails to write stays queued with its
+        attempt count raised, and draining stops.
+
+        Args:
+            limit: Maximum number of memories to drain, or None for all.
+
+        Returns:
+            Number of memories indexed.
+        """
+        index = self._get_index()
+        drained = 0
+        while limit is None or drained < limit:
+            batch_size = INDEX_BULK_BATCH_SIZE
+            if limit is not None:
+                batch_size = min(batch_size, limit - drained)
+            memories = index.get_queued(batch_size)
+            if not memories:
+                break
+
+            ids = [memory.id for memory in memories]
+            embeddings = self._embed_chunk(
+                [memory_embedding_text(m.summary, m.content) for m in memories],
+                "queue",
+            )
+            try:
+                with index.bulk_load():
+                    index.upsert_batch(memories, embeddings)
+                    index.dequeue_batch(ids)
+            except Exception as e:
+                logger.warning("Failed to index %d queued memories: %s", len(ids), e)
+                index.record_queue_failure(ids, str(e))
+                break
+            drained += len(memories)
+
+        if drained:
+            get_metrics().increment("index_queue_drained_total", drained)
+            logger.info("Drained %d memories from the index queue", drained)
+        return drained
+
     def verify_consistency(self) -> VerificationResult:
         """Check index consistency against git notes.
 
@@ -385,28 +547,16 @@ class SyncService:
         expected_ids: set[str] = set()
         memory_hashes: dict[str, str] = {}  # id -> content hash
 
-        for namespace in NAMESPACES:
-            try:
-                notes_list = git_ops.list_notes(namespace)
-            except Exception:
-                continue
-
-            if not notes_list:
-                continue
-
-            # PERF-001: Batch fetch all notes for this namespace
-            commit_shas = [commit_sha for _note_sha, commit_sha in notes_list]
-            contents = git_ops.show_notes_batch(namespace, commit_shas)
-
-            for _note_sha, commit_sha in notes_list:
+        # PERF-001: Stream every namespace's notes through one cat-file process
+        try:
+            for namespace, commit_sha, content in git_ops.iter_all_notes():
                 try:
-                    content = contents.get(commit_sha)
                     if not content:
                         continue
 
                     records = parser.parse_many(content)
                     for i, record in enumerate(records):
-                        memory_id = f"{namespace}:{commit_sha[:7]}:{i}"
+                        memory_id = make_memory_id(namespace, commit_sha, i)
                         expected_ids.add(memory_id)
                         # Store hash of content for mismatch detection
                         content_str = f"{record.summary}|{record.body}"
@@ -415,6 +565,8 @@ class SyncService:
                         ).hexdigest()
                 except Exception as e:
                     logger.debug("Error processing note: %s", e)
+        except Exception as e:
+            logger.debug("Failed to read notes: %s", e)
 
         # Get all memory IDs from index
         try:
@@ -495,26 +647,46 @@ class SyncService:
             except Exception as e:
                 logger.warning("Failed to remove %s: %s", memory_id, e)
 
-        # Re-index missing and mismatched entries
+        # Re-index missing and mismatched entries, resolving commits with one
+        # listing of all namespaces and re-reading each note once
         to_reindex = set(verification.missing_in_index) | set(verification.mismatched)
+        prefixes: dict[str, list[str]] = {}
         for memory_id in to_reindex:
-            # Parse memory_id to get namespace and commit
-            parts = memory_id.split(":")
-            if len(parts) >= 2:
-                namespace = parts[0]
-                commit_prefix = parts[1]
-                # We need to find the full commit SHA
-                # For now, sync the note which will re-add this memory
-                try:
-                    git_ops = self._get_git_ops()
-                    notes_list = git_ops.list_notes(namespace)
-                    for _note_sha, commit_sha in notes_list:
-                        if commit_sha.startswith(commit_prefix):
-                            self.sync_note_to_index(commit_sha, namespace)
-                            repairs += 1
-                            break
-                except Exception as e:
-                    logger.warning("Failed to repair %s: %s", memory_id, e)
+            try:
+                namespace, commit_prefix, _index = parse_memory_id(memory_id)
+            except ValueError:
+                logger.debug("Skipping unparseable memory ID: %s", memory_id)
+                continue
+            prefixes.setdefault(namespace, []).append(commit_prefix)
+
+        notes_to_sync: dict[tuple[str, str], int] = {}
+        listing: dict[str, list[tuple[str, str]]] = {}
+        if prefixes:
+            try:
+                listing = self._get_git_ops().list_all_notes()
+            except Exception as e:
+                logger.warning("Failed to list notes for repair: %s", e)
+        for namespace, commit_prefixes in prefixes.items():
+            commits = [commit for _note, commit in listing.get(namespace, [])]
+            for commit_prefix in commit_prefixes:
+                commit_sha = next(
+                    (c for c in commits if c.startswith(commit_prefix)), None
+                )
+                if commit_sha is not None:
+                    key = (namespace, commit_sha)
+                    notes_to_sync[key] = notes_to_sync.get(key, 0) + 1
+
+        # Each note is embedded and then written in its own transaction, so
+        # inference never holds the index write lock and a failing note
+        # does not undo the others
+        for (namespace, commit_sha), count in notes_to_sync.items():
+            try:
+                if self.sync_note_to_index(commit_sha, namespace):
+                    repairs += count
+            except Exception as e:
+                logger.warning(
+                    "Failed to re-index note %s/%s: %s", namespace, commit_sha, e
+                )
 
         logger.info("Repair complete: %d changes made", repairs)
         return repairs
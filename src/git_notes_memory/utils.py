@@ -4,6 +4,7 @@ Provides shared utilities for:
 - Temporal decay calculations for memory relevance
 - Timestamp parsing and age calculations
 - Input validation helpers
+- Memory ID construction and parsing
 
 All functions are pure and stateless where possible.
 """
@@ -35,6 +36,9 @@ __all__ = [
     "validate_git_ref",
     "is_valid_namespace",
     "is_valid_git_ref",
+    # Memory IDs
+    "make_memory_id",
+    "parse_memory_id",
 ]
 
 
@@ -334,3 +338,55 @@ def validate_git_ref(ref: str) -> None:
             f"Invalid git ref '{ref}'. Refs must not contain shell "
             "metacharacters, path traversal sequences, or special git syntax."
         )
+
+
+# =============================================================================
+# Memory IDs
+# =============================================================================
+
+# namespace:commit:index, where commit may be abbreviated in legacy IDs
+_MEMORY_ID_PATTERN = re.compile(r"^([a-z_]+):([0-9a-fA-F]{4,64}):(\d+)$")
+
+
+def make_memory_id(namespace: str, commit_sha: str, index: int) -> str:
+    """Build the canonical ID of a memory.
+
+    The ID is derived from where the memory lives, the index-th record of
+    the namespace's note on commit_sha, so capture and sync produce the
+    same ID for the same record. The commit is used unabbreviated:
+    abbreviations are ambiguous and were the source of duplicate rows.
+
+    Args:
+        namespace: Memory namespace.
+        commit_sha: Full SHA of the commit the note is attached to.
+        index: Position of the record within the note.
+
+    Returns:
+        The ID in format "namespace:commit_sha:index".
+    """
+    return f"{namespace}:{commit_sha}:{index}"
+
+
+def parse_memory_id(memory_id: str) -> tuple[str, str, int]:
+    """Split a memory ID into its parts.
+
+    Legacy IDs with an abbreviated commit are accepted; the commit is
+    returned as written.
+
+    Args:
+        memory_id: ID in format "namespace:commit_sha:index".
+
+    Returns:
+        Tuple of (namespace, commit_sha, index).
+
+    Raises:
+        ValueError: If the ID is not in that format.
+    """
+    match = _MEMORY_ID_PATTERN.match(memory_id)
+    if match is None:
+        raise ValueError(
+            f"Invalid memory ID '{memory_id}'. "
+            "Expected format: namespace:commit_sha:index"
+        )
+    namespace, commit_sha, index = match.groups()
+    return namespace, commit_sha, int(index)
@@ -7,6 +7,7 @@ index/embedding services.
 
 from __future__ import annotations
 
+import subprocess
 import threading
 import time
 from pathlib import Path
@@ -25,6 +26,8 @@ from git_notes_memory.capture import (
 )
 from git_notes_memory.config import MAX_CONTENT_BYTES, MAX_SUMMARY_CHARS, NAMESPACES
 from git_notes_memory.exceptions import CaptureError, ValidationError
+from git_notes_memory.git_ops import GitOps
+from git_notes_memory.models import CaptureRequest
 
 if TYPE_CHECKING:
     pass
@@ -248,6 +251,158 @@ class TestAcquireLock:
         with _acquire_lock(lock_path, timeout=0.5):
             pass  # Should succeed without timeout
 
+    def test_lock_wait_recorded(self, tmp_path: Path) -> None:
+        """Test lock wait time is observed in the wait histogram."""
+        metrics = MagicMock()
+
+        with patch("git_notes_memory.capture.get_metrics", return_value=metrics):
+            with _acquire_lock(tmp_path / "decisions.lock"):
+                pass
+
+        name, wait_ms = metrics.observe.call_args.args
+        assert name == "capture_lock_wait_ms"
+        assert wait_ms >= 0
+        assert metrics.observe.call_args.kwargs["labels"] == {"lock": "decisions"}
+
+    def test_lock_timeout_recorded(self, tmp_path: Path) -> None:
+        """Test a timed-out wait is observed and counted."""
+        import fcntl
+        import os
+
+        lock_path = tmp_path / "decisions.lock"
+        fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        metrics = MagicMock()
+
+        try:
+            with (
+                patch("git_notes_memory.capture.get_metrics", return_value=metrics),
+                pytest.raises(CaptureError),
+            ):
+                with _acquire_lock(lock_path, timeout=0.1):
+                    pass
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+        name, wait_ms = metrics.observe.call_args.args
+        assert name == "capture_lock_wait_ms"
+        assert wait_ms >= 100
+        metrics.increment.assert_called_once_with(
+            "capture_lock_timeouts_total", labels={"lock": "decisions"}
+        )
+
+
+class TestCaptureLockScope:
+    """Tests for (repository, namespace) scoped capture locks."""
+
+    @pytest.fixture
+    def mock_git_ops(self, tmp_path: Path) -> MagicMock:
+        """Create a mock GitOps instance."""
+        mock = MagicMock()
+        mock.get_commit_info.return_value = MagicMock(sha="abc123def456")
+        mock.show_note.return_value = None
+        mock.get_common_dir.return_value = tmp_path / ".git"
+        return mock
+
+    def test_other_namespace_not_blocked(
+        self, mock_git_ops: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a held namespace lock does not block another namespace."""
+        service = CaptureService(git_ops=mock_git_ops, repo_path=tmp_path)
+
+        with _acquire_lock(service._note_lock_path("decisions")):
+            result = service.capture(
+                namespace="learnings", summary="Unblocked", content="Content"
+            )
+
+        assert result.success is True
+
+    def test_other_repository_not_blocked(
+        self, mock_git_ops: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a held lock in one repository does not block another."""
+        other_git_ops = MagicMock()
+        other_git_ops.get_commit_info.return_value = MagicMock(sha="abc123def456")
+        other_git_ops.show_note.return_value = None
+        other_git_ops.get_common_dir.return_value = tmp_path / "b" / ".git"
+        first = CaptureService(git_ops=mock_git_ops)
+        second = CaptureService(git_ops=other_git_ops)
+
+        assert first._note_lock_path("decisions") != second._note_lock_path("decisions")
+        with _acquire_lock(first._note_lock_path("decisions")):
+            result = second.capture(
+                namespace="decisions", summary="Unblocked", content="Content"
+            )
+
+        assert result.success is True
+
+    def test_lock_shared_across_subdirectories_and_worktrees(
+        self, git_repo: Path, tmp_path: Path
+    ) -> None:
+        """Test every path into one repository resolves to the same lock."""
+        subdir = git_repo / "pkg"
+        subdir.mkdir()
+        worktree = tmp_path / "worktree"
+        subprocess.run(
+            ["git", "-C", str(git_repo), "worktree", "add", "-q", str(worktree)],
+            check=True,
+            capture_output=True,
+        )
+        link = tmp_path / "link"
+        link.symlink_to(git_repo)
+
+        expected = CaptureService(git_ops=GitOps(git_repo))._note_lock_path("decisions")
+        for path in (subdir, worktree, link):
+            service = CaptureService(git_ops=GitOps(path))
+            assert service._note_lock_path("decisions") == expected
+
+    def test_same_namespace_blocked(
+        self, mock_git_ops: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test a held lock times out a capture into the same notes ref."""
+        service = CaptureService(git_ops=mock_git_ops, repo_path=tmp_path)
+
+        with (
+            _acquire_lock(service._note_lock_path("decisions")),
+            patch(
+                "git_notes_memory.capture._acquire_lock",
+                side_effect=lambda path: _acquire_lock(path, timeout=0.1),
+            ),
+            pytest.raises(CaptureError, match="timed out"),
+        ):
+            service.capture(namespace="decisions", summary="Blocked", content="C")
+
+        mock_git_ops.append_note.assert_not_called()
+
+    def test_index_write_outside_lock(
+        self, mock_git_ops: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test the lock is released before the memory is indexed."""
+        import fcntl
+        import os
+
+        index = MagicMock()
+        service = CaptureService(
+            git_ops=mock_git_ops, index_service=index, repo_path=tmp_path
+        )
+        lock_path = service._note_lock_path("decisions")
+
+        def insert(*_args: object) -> None:
+            fd = os.open(str(lock_path), os.O_RDWR)
+            try:
+                # Raises BlockingIOError if the capture still held the lock
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+        index.insert.side_effect = insert
+
+        result = service.capture(namespace="decisions", summary="S", content="C")
+
+        assert result.indexed is True
+
 
 # =============================================================================
 # CaptureService Tests
@@ -385,8 +540,10 @@ class TestCaptureServiceCapture:
         self, capture_service: CaptureService, mock_git_ops: MagicMock
     ) -> None:
         """Test index increments for existing notes."""
-        # Simulate existing note with one entry (has one pair of "---")
-        mock_git_ops.show_note.return_value = "---\nfirst note\n---\ncontent"
+        # Simulate existing note with one entry
+        mock_git_ops.show_note.return_value = (
+            "---\ntype: decisions\nsummary: First note\n---\n\ncontent"
+        )
 
         result = capture_service.capture(
             namespace="decisions",
@@ -498,7 +655,8 @@ class TestCaptureWithIndexing:
         assert result.indexed is True
         assert result.warning is None
 
-        mock_embedding.embed.assert_called_once()
+        # Same text the reindex path embeds, so the embedding cache hits
+        mock_embedding.embed.assert_called_once_with("Test\nContent")
         mock_index.insert.assert_called_once()
 
     def test_capture_graceful_embedding_failure(
@@ -561,6 +719,252 @@ class TestCaptureWithIndexing:
         assert result.warning is not None
         assert "Indexing failed" in result.warning
 
+    def test_capture_deferred_queues_without_embedding(
+        self,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test deferred capture writes the note and queues the memory."""
+        service = CaptureService(
+            git_ops=mock_git_ops,
+            index_service=mock_index,
+            embedding_service=mock_embedding,
+            repo_path=tmp_path,
+        )
+
+        result = service.capture(
+            namespace="decisions",
+            summary="Test",
+            content="Content",
+            skip_lock=True,
+            defer_index=True,
+        )
+
+        assert result.success is True
+        assert result.queued is True
+        assert result.indexed is False
+        mock_git_ops.append_note.assert_called_once()
+        mock_index.enqueue.assert_called_once_with(result.memory)
+        mock_embedding.embed.assert_not_called()
+        mock_index.insert.assert_not_called()
+
+    def test_capture_deferred_queue_failure(
+        self,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test a failed queue write still succeeds with a warning."""
+        mock_index.enqueue.side_effect = Exception("database is locked")
+        service = CaptureService(
+            git_ops=mock_git_ops,
+            index_service=mock_index,
+            repo_path=tmp_path,
+        )
+
+        result = service.capture(
+            namespace="decisions",
+            summary="Test",
+            content="Content",
+            skip_lock=True,
+            defer_index=True,
+        )
+
+        assert result.success is True
+        assert result.queued is False
+        assert result.warning is not None
+        assert "Queueing for indexing failed" in result.warning
+
+
+# =============================================================================
+# Batch Capture Tests
+# =============================================================================
+
+
+class TestCaptureBatch:
+    """Tests for CaptureService.capture_batch."""
+
+    @pytest.fixture
+    def mock_git_ops(self) -> MagicMock:
+        """Create a mock GitOps instance."""
+        mock = MagicMock()
+        mock.get_commit_info.return_value = MagicMock(sha="abc123def456")
+        mock.show_note.return_value = None
+        return mock
+
+    @pytest.fixture
+    def mock_index(self) -> MagicMock:
+        """Create a mock IndexService."""
+        return MagicMock()
+
+    @pytest.fixture
+    def mock_embedding(self) -> MagicMock:
+        """Create a mock EmbeddingService."""
+        mock = MagicMock()
+        mock.embed_batch.side_effect = lambda texts: [[0.1] * 384 for _ in texts]
+        return mock
+
+    @pytest.fixture
+    def service(
+        self,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        tmp_path: Path,
+    ) -> CaptureService:
+        """Create a CaptureService with mocked dependencies."""
+        return CaptureService(
+            git_ops=mock_git_ops,
+            index_service=mock_index,
+            embedding_service=mock_embedding,
+            repo_path=tmp_path,
+        )
+
+    def test_one_append_per_namespace(
+        self,
+        service: CaptureService,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test the commit is resolved once and each namespace appended once."""
+        mock_git_ops.show_note.side_effect = lambda ns, _sha: (
+            "---\ntype: decisions\n---\n\nold" if ns == "decisions" else None
+        )
+
+        results = service.capture_batch(
+            [
+                CaptureRequest("decisions", "First", "One"),
+                CaptureRequest("learnings", "Second", "Two"),
+                CaptureRequest("decisions", "Third", "Three"),
+            ],
+            skip_lock=True,
+        )
+
+        assert [r.memory.id for r in results if r.memory] == [
+            "decisions:abc123def456:1",
+            "learnings:abc123def456:0",
+            "decisions:abc123def456:2",
+        ]
+        assert all(r.success and r.indexed for r in results)
+        mock_git_ops.get_commit_info.assert_called_once_with("HEAD")
+        assert mock_git_ops.show_note.call_count == 2
+        assert mock_git_ops.append_note.call_count == 2
+        ns, note, sha = mock_git_ops.append_note.call_args_list[0].args
+        assert (ns, sha) == ("decisions", "abc123def456")
+        assert note.index("First") < note.index("Third")
+        mock_embedding.embed_batch.assert_called_once_with(
+            ["First\nOne", "Third\nThree", "Second\nTwo"]
+        )
+        mock_embedding.embed.assert_not_called()
+        mock_index.insert_batch.assert_called_once()
+        mock_index.insert.assert_not_called()
+
+    def test_invalid_requests_fail_individually(
+        self, service: CaptureService, mock_git_ops: MagicMock
+    ) -> None:
+        """Test a request failing validation does not stop the batch."""
+        results = service.capture_batch(
+            [
+                CaptureRequest("invalid-namespace", "Bad", "Content"),
+                CaptureRequest("decisions", "Good", "Content"),
+            ],
+            skip_lock=True,
+        )
+
+        assert results[0].success is False
+        assert results[0].warning is not None
+        assert "namespace" in results[0].warning.lower()
+        assert results[1].success is True
+        assert results[1].memory is not None
+        assert results[1].memory.id == "decisions:abc123def456:0"
+        mock_git_ops.append_note.assert_called_once()
+
+    def test_failed_append_fails_only_its_namespace(
+        self, service: CaptureService, mock_git_ops: MagicMock
+    ) -> None:
+        """Test a failed note write marks only that namespace's requests."""
+        from git_notes_memory.exceptions import StorageError
+
+        def append(namespace: str, _content: str, _sha: str) -> None:
+            if namespace == "learnings":
+                raise StorageError("ref lock", "retry")
+
+        mock_git_ops.append_note.side_effect = append
+
+        results = service.capture_batch(
+            [
+                CaptureRequest("learnings", "Lost", "Content"),
+                CaptureRequest("decisions", "Kept", "Content"),
+            ],
+            skip_lock=True,
+        )
+
+        assert results[0].success is False
+        assert results[0].warning is not None
+        assert "Failed to write git note" in results[0].warning
+        assert results[1].success is True
+
+    def test_deferred_batch_queues_without_embedding(
+        self,
+        service: CaptureService,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test defer_index queues every memory and embeds nothing."""
+        results = service.capture_batch(
+            [
+                CaptureRequest("decisions", "First", "One"),
+                CaptureRequest("learnings", "Second", "Two"),
+            ],
+            skip_lock=True,
+            defer_index=True,
+        )
+
+        assert all(r.success and r.queued and not r.indexed for r in results)
+        assert mock_index.enqueue.call_count == 2
+        mock_embedding.embed_batch.assert_not_called()
+        mock_index.insert_batch.assert_not_called()
+
+    def test_embedding_failure_still_indexes(
+        self,
+        service: CaptureService,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test a failed batch embedding indexes without vectors."""
+        mock_embedding.embed_batch.side_effect = Exception("Embedding error")
+
+        (result,) = service.capture_batch(
+            [CaptureRequest("decisions", "First", "One")], skip_lock=True
+        )
+
+        assert result.success is True
+        assert result.indexed is True
+        assert result.warning is not None
+        assert "Embedding failed" in result.warning
+        assert mock_index.insert_batch.call_args.args[1] is None
+
+    def test_unresolvable_commit_raises(
+        self, service: CaptureService, mock_git_ops: MagicMock
+    ) -> None:
+        """Test the batch fails as a whole when the commit cannot be resolved."""
+        mock_git_ops.get_commit_info.side_effect = Exception("bad revision")
+
+        with pytest.raises(CaptureError):
+            service.capture_batch(
+                [CaptureRequest("decisions", "First", "One")], skip_lock=True
+            )
+
+    def test_empty_batch(
+        self, service: CaptureService, mock_git_ops: MagicMock
+    ) -> None:
+        """Test an empty batch does no git work."""
+        assert service.capture_batch([]) == []
+        mock_git_ops.get_commit_info.assert_not_called()
+
 
 # =============================================================================
 # Convenience Method Tests
@@ -950,6 +1354,155 @@ class TestCaptureServiceIntegration:
         assert show_result.returncode == 0
         assert "Use Python" in show_result.stdout
 
+    def test_deferred_capture_drained_into_index(self, git_repo: Path) -> None:
+        """Test a deferred capture is queued in the project index and drained."""
+        from git_notes_memory.config import get_project_index_path
+        from git_notes_memory.index import IndexService
+        from git_notes_memory.sync import SyncService
+
+        service = CaptureService(repo_path=git_repo)
+        result = service.capture(
+            namespace="learnings",
+            summary="Deferred learning",
+            content="Indexed later",
+            skip_lock=True,
+            defer_index=True,
+        )
+        assert result.queued is True
+        assert result.memory is not None
+
+        index = IndexService(get_project_index_path(git_repo))
+        index.initialize()
+        try:
+            assert index.get_stats().queue_pending == 1
+            embedding = MagicMock()
+            embedding.embed_batch.return_value = [[0.1] * 384]
+            sync = SyncService(git_repo, index=index, embedding_service=embedding)
+
+            assert sync.drain_index_queue() == 1
+
+            assert index.get(result.memory.id) is not None
+            assert index.has_embedding(result.memory.id)
+            assert index.get_stats().queue_pending == 0
+        finally:
+            index.close()
+
+    def test_capture_batch_matches_sequential_captures(self, git_repo: Path) -> None:
+        """Test a batched append yields the records and IDs of single appends."""
+        import subprocess
+
+        from git_notes_memory.config import get_git_namespace
+        from git_notes_memory.note_parser import parse_multi_note
+
+        service = CaptureService(repo_path=git_repo)
+        first = service.capture(
+            namespace="decisions",
+            summary="Before batch",
+            content="Single capture",
+            skip_lock=True,
+        )
+        results = service.capture_batch(
+            [
+                CaptureRequest("decisions", "Batched one", "First\n\nparagraph"),
+                CaptureRequest("decisions", "Batched two", "Second", tags=("a",)),
+            ]
+        )
+        last = service.capture(
+            namespace="decisions",
+            summary="After batch",
+            content="Single capture",
+            skip_lock=True,
+        )
+
+        assert first.memory is not None and last.memory is not None
+        assert [r.memory.id.rsplit(":", 1)[1] for r in results if r.memory] == [
+            "1",
+            "2",
+        ]
+        assert last.memory.id.endswith(":3")
+
+        note = subprocess.run(
+            ["git", "notes", f"--ref={get_git_namespace()}/decisions", "show"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        parsed = parse_multi_note(note)
+        assert [p.summary for p in parsed] == [
+            "Before batch",
+            "Batched one",
+            "Batched two",
+            "After batch",
+        ]
+        assert parsed[1].body == "First\n\nparagraph"
+        assert parsed[2].front_matter["tags"] == ["a"]
+
+    def test_note_index_tracked_without_rereading(
+        self, git_repo: Path, tmp_path: Path
+    ) -> None:
+        """Test later captures number records from the tracked count."""
+        from git_notes_memory.config import get_git_namespace
+        from git_notes_memory.index import IndexService
+
+        index = IndexService(tmp_path / "index.db")
+        index.initialize()
+        service = CaptureService(repo_path=git_repo, index_service=index)
+        first = service.capture(
+            namespace="decisions", summary="First", content="One", skip_lock=True
+        )
+
+        with patch.object(
+            service.git_ops, "show_note", wraps=service.git_ops.show_note
+        ) as show_note:
+            second = service.capture(
+                namespace="decisions", summary="Second", content="Two", skip_lock=True
+            )
+            show_note.assert_not_called()
+
+            # A record added behind the service's back changes the note's
+            # blob, so the count is rebuilt from the parsed note
+            subprocess.run(
+                [
+                    "git",
+                    "notes",
+                    f"--ref={get_git_namespace()}/decisions",
+                    "append",
+                    "-m",
+                    "---\ntype: decisions\nsummary: External\n---\n\nThree",
+                ],
+                cwd=git_repo,
+                capture_output=True,
+                check=True,
+            )
+            fourth = service.capture(
+                namespace="decisions", summary="Fourth", content="Four", skip_lock=True
+            )
+            show_note.assert_called_once()
+
+        assert [
+            r.memory.id.rsplit(":", 1)[1] for r in (first, second, fourth) if r.memory
+        ] == [
+            "0",
+            "1",
+            "3",
+        ]
+
+    def test_capture_without_index_creates_none(self, git_repo: Path) -> None:
+        """Test a service without an index counts notes by parsing them."""
+        service = CaptureService(repo_path=git_repo)
+
+        results = [
+            service.capture(namespace="decisions", summary=s, content=s)
+            for s in ("First", "Second")
+        ]
+
+        assert [r.memory.id.rsplit(":", 1)[1] for r in results if r.memory] == [
+            "0",
+            "1",
+        ]
+        assert not (git_repo / ".memory").exists()
+
     def test_capture_multiple_to_same_commit(self, git_repo: Path) -> None:
         """Test multiple captures append to same commit."""
         service = CaptureService(repo_path=git_repo)
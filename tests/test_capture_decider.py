@@ -38,6 +38,9 @@ def mock_novelty_checker() -> MagicMock:
         similar_memory_ids=[],
         highest_similarity=0.2,
     )
+    mock.batch_check_novelty.side_effect = lambda signals: [
+        mock.check_signal_novelty(signal) for signal in signals
+    ]
     return mock
 
 
@@ -137,7 +140,16 @@ class TestCaptureDeciderInit:
             mock_class.return_value = MagicMock()
             checker = decider._get_novelty_checker()
             assert checker is not None
-            mock_class.assert_called_once_with(novelty_threshold=0.3)
+            mock_class.assert_called_once_with(novelty_threshold=0.3, load_model=True)
+
+    def test_load_model_passed_to_novelty_checker(self) -> None:
+        """CaptureDecider forwards load_model to the NoveltyChecker it creates."""
+        decider = CaptureDecider(load_model=False)
+        with patch(
+            "git_notes_memory.hooks.novelty_checker.NoveltyChecker"
+        ) as mock_class:
+            decider._get_novelty_checker()
+            mock_class.assert_called_once_with(novelty_threshold=0.3, load_model=False)
 
 
 # =============================================================================
@@ -398,7 +410,7 @@ class TestNoveltyChecking:
         decision = decider.decide([signal], check_novelty=False)
 
         assert decision.action == CaptureAction.AUTO
-        mock_novelty_checker.check_signal_novelty.assert_not_called()
+        mock_novelty_checker.batch_check_novelty.assert_not_called()
 
     def test_novelty_check_enabled_per_call(
         self, mock_novelty_checker: MagicMock
@@ -452,6 +464,64 @@ class TestNoveltyChecking:
             0.735, rel=0.01
         )
 
+    def test_deferred_signal_not_auto_captured(
+        self, mock_novelty_checker: MagicMock, decider: CaptureDecider
+    ) -> None:
+        """A high-confidence signal with a deferred check is only suggested."""
+        mock_novelty_checker.check_signal_novelty.return_value = NoveltyResult(
+            novelty_score=1.0, is_novel=True, deferred=True
+        )
+        decision = decider.decide([make_signal(confidence=0.98)])
+
+        assert decision.action == CaptureAction.SUGGEST
+        assert len(decision.suggested_captures) == 1
+        assert "novelty not checked" in decision.reason
+
+    def test_deferred_signal_caps_mixed_batch(
+        self, mock_novelty_checker: MagicMock, decider: CaptureDecider
+    ) -> None:
+        """One unchecked signal keeps the whole decision at SUGGEST."""
+        mock_novelty_checker.batch_check_novelty.side_effect = None
+        mock_novelty_checker.batch_check_novelty.return_value = [
+            NoveltyResult(novelty_score=0.9, is_novel=True),
+            NoveltyResult(novelty_score=1.0, is_novel=True, deferred=True),
+        ]
+        decision = decider.decide(
+            [
+                make_signal(confidence=0.98),
+                make_signal(confidence=0.8, match="I learned that X"),
+            ]
+        )
+
+        assert decision.action == CaptureAction.SUGGEST
+        assert len(decision.suggested_captures) == 2
+
+    def test_deferred_explicit_signal_auto_captured(
+        self, mock_novelty_checker: MagicMock, decider: CaptureDecider
+    ) -> None:
+        """An explicit capture request is captured even if its check was deferred."""
+        mock_novelty_checker.check_signal_novelty.return_value = NoveltyResult(
+            novelty_score=1.0, is_novel=True, deferred=True
+        )
+        decision = decider.decide(
+            [make_signal(signal_type=SignalType.EXPLICIT, confidence=0.98)]
+        )
+
+        assert decision.action == CaptureAction.AUTO
+        assert len(decision.suggested_captures) == 1
+
+    def test_deferred_signal_suggested(
+        self, mock_novelty_checker: MagicMock, decider: CaptureDecider
+    ) -> None:
+        """A deferred signal below the auto threshold is suggested."""
+        mock_novelty_checker.check_signal_novelty.return_value = NoveltyResult(
+            novelty_score=1.0, is_novel=True, deferred=True
+        )
+        decision = decider.decide([make_signal(confidence=0.8)])
+
+        assert decision.action == CaptureAction.SUGGEST
+        assert len(decision.suggested_captures) == 1
+
 
 # =============================================================================
 # decide_single() Tests
@@ -484,7 +554,7 @@ class TestDecideSingle:
         decision = decider.decide_single(signal, check_novelty=False)
 
         assert decision.action == CaptureAction.AUTO
-        mock_novelty_checker.check_signal_novelty.assert_not_called()
+        mock_novelty_checker.batch_check_novelty.assert_not_called()
 
 
 # =============================================================================
@@ -0,0 +1,232 @@
+"""Tests for git_notes_memory.cat_file module.
+
+Tests response framing, the persistent cat-file process (pipelining,
+restart and timeout) and the per-repository process pool.
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from git_notes_memory import cat_file
+from git_notes_memory.cat_file import (
+    CatFileObject,
+    CatFileProcess,
+    close_all,
+    get_cat_file,
+    read_batch_object,
+)
+from git_notes_memory.exceptions import StorageError
+
+
+@pytest.fixture(autouse=True)
+def _close_pool() -> Iterator[None]:
+    """Stop pooled processes started by a test."""
+    yield
+    close_all()
+
+
+# =============================================================================
+# Response Framing Tests
+# =============================================================================
+
+
+class TestReadBatchObject:
+    """Tests for read_batch_object."""
+
+    def test_frames_by_size(self) -> None:
+        """Test objects are framed by header size, not by lines."""
+        stream = io.BytesIO(
+            b"abc blob 6\na\r\n\nb\n\n"
+            b"refs/notes/mem/decisions:def missing\n"
+            b"ghi blob 3\nxyz\n"
+        )
+
+        assert read_batch_object(stream) == CatFileObject(
+            "abc", "blob", 6, b"a\r\n\nb\n"
+        )
+        assert read_batch_object(stream) is None
+        assert read_batch_object(stream) == CatFileObject("ghi", "blob", 3, b"xyz")
+        with pytest.raises(EOFError):
+            read_batch_object(stream)
+
+    def test_truncated_raises(self) -> None:
+        """Test a truncated object is reported rather than returned short."""
+        with pytest.raises(EOFError):
+            read_batch_object(io.BytesIO(b"abc blob 10\nshort"))
+
+    def test_missing_name_with_spaces(self) -> None:
+        """Test a missing path containing spaces is not mistaken for a header."""
+        stream = io.BytesIO(b"HEAD:my notes.md missing\n")
+
+        assert read_batch_object(stream) is None
+
+    def test_header_only(self) -> None:
+        """Test --batch-check responses carry no content."""
+        stream = io.BytesIO(b"abc tree 120\nHEAD:x ambiguous\n")
+
+        assert read_batch_object(stream, with_content=False) == CatFileObject(
+            "abc", "tree", 120
+        )
+        assert read_batch_object(stream, with_content=False) is None
+
+    def test_malformed_header_raises(self) -> None:
+        """Test an unexpected header is reported as a protocol error."""
+        with pytest.raises(ValueError):
+            read_batch_object(io.BytesIO(b"abc blob many\n"))
+
+
+# =============================================================================
+# CatFileProcess Tests
+# =============================================================================
+
+
+class TestCatFileProcess:
+    """Tests for CatFileProcess against a real repository."""
+
+    def test_request_reads_objects(self, git_repo: Path) -> None:
+        """Test contents and missing names come back in request order."""
+        proc = CatFileProcess(git_repo)
+
+        head, missing, readme = proc.request(
+            ["HEAD", "HEAD:does-not-exist", "HEAD:README.md"]
+        )
+
+        assert head is not None and head.type == "commit"
+        assert missing is None
+        assert readme is not None and readme.content == b"# Test Repository\n"
+        proc.close()
+
+    def test_check_mode_reads_headers(self, git_repo: Path) -> None:
+        """Test --batch-check returns object IDs without content."""
+        proc = CatFileProcess(git_repo, check=True)
+        expected = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+
+        (head,) = proc.request(["HEAD"])
+
+        assert head is not None
+        assert (head.oid, head.type, head.content) == (expected, "commit", b"")
+        proc.close()
+
+    def test_process_is_reused(self, git_repo: Path) -> None:
+        """Test consecutive requests share one git process."""
+        proc = CatFileProcess(git_repo)
+        proc.request(["HEAD"])
+        first = proc._proc
+
+        proc.request(["HEAD"])
+
+        assert proc._proc is first
+        proc.close()
+
+    def test_large_request_is_pipelined(self, git_repo: Path) -> None:
+        """Test requests larger than the pipe buffer do not deadlock."""
+        proc = CatFileProcess(git_repo)
+
+        objects = proc.request(["HEAD:README.md"] * 5000)
+
+        assert len(objects) == 5000
+        assert all(obj is not None and obj.type == "blob" for obj in objects)
+        proc.close()
+
+    def test_sees_objects_written_after_start(self, git_repo: Path) -> None:
+        """Test refs and objects created after startup are visible."""
+        proc = CatFileProcess(git_repo, check=True)
+        assert proc.request(["refs/heads/later"]) == [None]
+
+        subprocess.run(
+            ["git", "branch", "later"], cwd=git_repo, capture_output=True, check=True
+        )
+
+        (later,) = proc.request(["refs/heads/later"])
+        assert later is not None and later.type == "commit"
+        proc.close()
+
+    def test_restarts_after_process_dies(self, git_repo: Path) -> None:
+        """Test a dead process is replaced and the request retried."""
+        proc = CatFileProcess(git_repo)
+        proc.request(["HEAD"])
+        first = proc._proc
+        assert first is not None
+        first.kill()
+        first.wait()
+
+        (head,) = proc.request(["HEAD"])
+
+        assert head is not None and head.type == "commit"
+        assert proc._proc is not first
+        proc.close()
+
+    def test_timeout_raises(self, git_repo: Path) -> None:
+        """Test a request past its timeout kills git and raises."""
+        proc = CatFileProcess(git_repo, timeout=0.05)
+
+        def stalled(
+            process: subprocess.Popen[bytes], _payload: bytes, _count: int
+        ) -> list[CatFileObject | None]:
+            process.wait()
+            raise EOFError("killed")
+
+        with (
+            patch.object(proc, "_exchange", side_effect=stalled),
+            pytest.raises(StorageError, match="timed out"),
+        ):
+            proc.request(["HEAD"])
+
+        # The next request starts a fresh process
+        (head,) = proc.request(["HEAD"])
+        assert head is not None
+        proc.close()
+
+    def test_not_a_repository_raises(self, tmp_path: Path) -> None:
+        """Test git failing on every attempt surfaces as StorageError."""
+        proc = CatFileProcess(tmp_path)
+
+        with pytest.raises(StorageError):
+            proc.request(["HEAD"])
+
+    def test_newline_in_name_rejected(self, git_repo: Path) -> None:
+        """Test names that would desynchronize the protocol are rejected."""
+        proc = CatFileProcess(git_repo)
+
+        with pytest.raises(ValueError):
+            proc.request(["HEAD\nHEAD"])
+
+
+# =============================================================================
+# Process Pool Tests
+# =============================================================================
+
+
+class TestProcessPool:
+    """Tests for get_cat_file and close_all."""
+
+    def test_shared_per_repository_and_mode(self, git_repo: Path) -> None:
+        """Test one process per (repository, mode)."""
+        batch = get_cat_file(git_repo)
+
+        assert get_cat_file(git_repo) is batch
+        assert get_cat_file(git_repo, check=True) is not batch
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test the pool closes the oldest process beyond its limit."""
+        with patch.object(cat_file, "GIT_CAT_FILE_MAX_PROCESSES", 2):
+            first = get_cat_file(tmp_path / "a")
+            get_cat_file(tmp_path / "b")
+            with patch.object(first, "close") as mock_close:
+                get_cat_file(tmp_path / "c")
+
+            mock_close.assert_called_once()
+            assert get_cat_file(tmp_path / "a") is not first
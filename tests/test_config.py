@@ -29,6 +29,7 @@ def clean_env() -> Iterator[None]:
         "MEMORY_PLUGIN_DATA_DIR",
         "MEMORY_PLUGIN_GIT_NAMESPACE",
         "MEMORY_PLUGIN_EMBEDDING_MODEL",
+        "MEMORY_PLUGIN_EMBEDDING_MODEL_REVISION",
         "MEMORY_PLUGIN_AUTO_CAPTURE",
         "XDG_DATA_HOME",
     ]
@@ -180,6 +181,16 @@ class TestPathConfiguration:
         expected = config.get_data_path() / ".capture.lock"
         assert path == expected
 
+    def test_get_lock_path_scoped(self, clean_env: None, tmp_path: Path) -> None:
+        """Test locks are scoped by repository and namespace."""
+        decisions = config.get_lock_path(tmp_path / "a", "decisions")
+
+        assert decisions.name == "decisions.lock"
+        assert decisions.parent.parent == config.get_data_path() / "locks"
+        assert decisions == config.get_lock_path(str(tmp_path / "a"), "decisions")
+        assert decisions != config.get_lock_path(tmp_path / "a", "learnings")
+        assert decisions != config.get_lock_path(tmp_path / "b", "decisions")
+
 
 # =============================================================================
 # Git Root Detection Tests
@@ -308,6 +319,22 @@ class TestEmbeddingConfiguration:
         os.environ["MEMORY_PLUGIN_EMBEDDING_MODEL"] = "custom-model"
         assert config.get_embedding_model() == "custom-model"
 
+    def test_default_model_revision_pinned(self, clean_env: None) -> None:
+        """Test the default model downloads at a pinned commit."""
+        revision = config.get_embedding_model_revision("all-MiniLM-L6-v2")
+        assert revision == config.DEFAULT_EMBEDDING_MODEL_REVISION
+        assert len(revision) == 40
+        assert all(c in "0123456789abcdef" for c in revision)
+
+    def test_other_model_revision_unpinned(self, clean_env: None) -> None:
+        """Test a non-default model has no pinned commit."""
+        assert config.get_embedding_model_revision("custom-model") is None
+
+    def test_model_revision_override(self, clean_env: None) -> None:
+        """Test get_embedding_model_revision respects environment override."""
+        os.environ["MEMORY_PLUGIN_EMBEDDING_MODEL_REVISION"] = "abc1234"
+        assert config.get_embedding_model_revision("custom-model") == "abc1234"
+
 
 # =============================================================================
 # Limits and Thresholds Tests
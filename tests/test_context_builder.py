@@ -9,12 +9,14 @@ This module tests all aspects of the ContextBuilder, including:
 - Project complexity analysis
 - Memory filtering based on budget
 - XML output formatting
+- Session context snapshots (get_context)
 - Edge cases and error handling
 """
 
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
@@ -1393,6 +1395,139 @@ class TestEdgeCases:
 # =============================================================================
 # Test: Integration
 # =============================================================================
+# Test: Session Context Snapshots
+# =============================================================================
+
+
+class TestGetContext:
+    """Tests for serving the context from its snapshot."""
+
+    @pytest.fixture
+    def index_path(self, tmp_path: Path) -> Path:
+        """Create an empty project index."""
+        from git_notes_memory.index import IndexService
+
+        path = tmp_path / ".memory" / "index.db"
+        index = IndexService(path)
+        index.initialize()
+        index.close()
+        return path
+
+    @pytest.fixture
+    def recall(
+        self,
+        mock_recall_service: MagicMock,
+        mock_learning_memory: Memory,
+        mock_pattern_memory: Memory,
+    ) -> MagicMock:
+        """Recall service that can also re-read memories by ID."""
+        known = {m.id: m for m in (mock_learning_memory, mock_pattern_memory)}
+        mock_recall_service.get_batch.side_effect = lambda ids: [
+            known[i] for i in ids if i in known
+        ]
+        return mock_recall_service
+
+    def _builder(
+        self,
+        recall: MagicMock,
+        index_path: Path,
+        config: HookConfig | None = None,
+    ) -> ContextBuilder:
+        return ContextBuilder(
+            recall_service=recall,
+            index_service=MagicMock(),
+            config=config or HookConfig(session_start_budget_mode=BudgetMode.FIXED),
+            index_path=index_path,
+        )
+
+    def test_served_from_snapshot(self, recall: MagicMock, index_path: Path) -> None:
+        """Test an unchanged index is served without querying memories."""
+        first = self._builder(recall, index_path).get_context("proj", spec_id="S1")
+        assert len(list((index_path.parent / "session_context").iterdir())) == 1
+        recall.reset_mock()
+
+        second = self._builder(recall, index_path).get_context("proj", spec_id="S1")
+
+        assert second == first
+        recall.get_by_namespace.assert_not_called()
+        recall.search.assert_not_called()
+
+    def test_changed_namespace_rebuilds_only_its_section(
+        self,
+        recall: MagicMock,
+        index_path: Path,
+        mock_blocker_memory: Memory,
+        mock_learning_memory: Memory,
+    ) -> None:
+        """Test a capture into one namespace re-queries only that section."""
+        from git_notes_memory.index import IndexService
+
+        self._builder(recall, index_path).get_context("proj")
+        recall.reset_mock()
+        index = IndexService(index_path)
+        index.initialize()
+        index.insert(mock_blocker_memory)
+        index.close()
+
+        result = self._builder(recall, index_path).get_context("proj")
+
+        assert [c.args[0] for c in recall.get_by_namespace.call_args_list] == [
+            "blockers"
+        ]
+        recall.search.assert_not_called()
+        assert mock_learning_memory.summary in result
+        assert 'relevance="0.67"' in result
+
+    def test_expired_snapshot_reuses_sections(
+        self, recall: MagicMock, index_path: Path
+    ) -> None:
+        """Test an old snapshot is rebuilt from its sections, not re-queried."""
+        self._builder(recall, index_path).get_context("proj")
+        recall.reset_mock()
+
+        with patch(
+            "git_notes_memory.hooks.context_builder."
+            "SESSION_CONTEXT_SNAPSHOT_MAX_AGE_SECONDS",
+            0,
+        ):
+            self._builder(recall, index_path).get_context("proj")
+
+        recall.get_by_namespace.assert_not_called()
+        recall.search.assert_not_called()
+        recall.get_batch.assert_called()
+
+    def test_settings_change_rebuilds(
+        self, recall: MagicMock, index_path: Path
+    ) -> None:
+        """Test a snapshot built with other settings is not reused."""
+        self._builder(recall, index_path).get_context("proj")
+        recall.reset_mock()
+
+        config = HookConfig(
+            session_start_budget_mode=BudgetMode.FIXED,
+            session_start_max_memories=12,
+        )
+        self._builder(recall, index_path, config).get_context("proj")
+
+        assert recall.get_by_namespace.call_count == 3
+        assert recall.search.call_count == 2
+
+    def test_disabled_or_missing_index_builds_live(
+        self, recall: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test no snapshot is used or written without an index or when disabled."""
+        missing = tmp_path / "none" / "index.db"
+        self._builder(recall, missing).get_context("proj")
+        config = HookConfig(
+            session_start_budget_mode=BudgetMode.FIXED, session_start_snapshot=False
+        )
+        self._builder(recall, missing, config).get_context("proj")
+
+        assert recall.search.call_count == 4
+        assert not (tmp_path / "none").exists()
+
+
+# =============================================================================
 
 
 class TestIntegration:
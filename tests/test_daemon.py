@@ -0,0 +1,316 @@
+"""Tests for the persistent memory daemon and its client."""
+
+from __future__ import annotations
+
+import shutil
+import sqlite3
+import tempfile
+import threading
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from git_notes_memory.daemon import (
+    DaemonClient,
+    DaemonError,
+    MemoryDaemon,
+    _memory_from_dict,
+    _memory_to_dict,
+    get_daemon_client,
+)
+from git_notes_memory.embedding import EmbeddingService
+from git_notes_memory.exceptions import EmbeddingError
+from git_notes_memory.index import IndexService
+from git_notes_memory.models import Memory
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def socket_dir() -> Iterator[Path]:
+    """Short temporary directory (AF_UNIX paths are limited to ~104 bytes)."""
+    path = Path(tempfile.mkdtemp(prefix="memd-", dir="/tmp"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(
+    socket_dir: Path, mock_embedding_service: Any
+) -> Iterator[MemoryDaemon]:
+    """Run a daemon in a background thread with a mock embedding model."""
+    mock_embedding_service.backend = "torch"
+    daemon = MemoryDaemon(
+        socket_dir / "memoryd.sock",
+        idle_timeout=0,
+        embedding_service=mock_embedding_service,
+    )
+    daemon.bind()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.stop()
+    thread.join(timeout=5)
+
+
+@pytest.fixture
+def populated_index(tmp_path: Path, mock_embedding_service: Any) -> Path:
+    """Create a project index containing two embedded memories."""
+    (tmp_path / ".git").mkdir()
+    db_path = tmp_path / ".memory" / "index.db"
+    index = IndexService(db_path)
+    index.initialize()
+    for i, summary in enumerate(["Use SQLite for storage", "Deploy on Fridays"]):
+        memory = Memory(
+            id=f"decisions:abc{i}:0",
+            commit_sha=f"abc{i}",
+            namespace="decisions",
+            summary=summary,
+            content=summary,
+            timestamp=datetime(2024, 1, 15, tzinfo=UTC),
+            tags=("t",),
+        )
+        index.insert(memory, mock_embedding_service.embed(summary))
+    index.close()
+    return db_path
+
+
+# =============================================================================
+# Protocol Tests
+# =============================================================================
+
+
+class TestDaemonProtocol:
+    """Tests for request/response handling over the socket."""
+
+    def test_ping_reports_version(self, running_daemon: MemoryDaemon) -> None:
+        from git_notes_memory import __version__
+
+        client = DaemonClient(running_daemon.socket_path)
+        info = client.request("ping")
+        assert info["version"] == __version__
+        assert client.is_alive() is True
+
+    def test_embed_uses_warm_service(
+        self, running_daemon: MemoryDaemon, mock_embedding_service: Any
+    ) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        vectors = client.embed_batch(["hello", "b"], model="mock-model")
+        assert vectors[0] == mock_embedding_service.embed("hello")
+        assert len(vectors) == 2
+
+    def test_embed_rejects_other_model(self, running_daemon: MemoryDaemon) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="serves model"):
+            client.embed_batch(["hello"], model="other-model")
+        with pytest.raises(DaemonError, match="serves backend"):
+            client.embed_batch(["hello"], backend="onnx")
+
+    def test_search_round_trips_memories(
+        self, running_daemon: MemoryDaemon, populated_index: Path
+    ) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        results = client.search(
+            "Use SQLite for storage", index_path=populated_index, k=2
+        )
+        assert results
+        assert results[0].memory.id == "decisions:abc0:0"
+        assert results[0].memory.tags == ("t",)
+
+    def test_search_batch_round_trips_memories(
+        self, running_daemon: MemoryDaemon, populated_index: Path
+    ) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        batch = client.search_batch(
+            ["Use SQLite for storage", "Deploy on Fridays"],
+            index_path=populated_index,
+            k=1,
+            namespaces=["decisions", None],
+        )
+        assert [results[0].memory.id for results in batch] == [
+            "decisions:abc0:0",
+            "decisions:abc1:0",
+        ]
+
+    def test_search_rejects_missing_index(
+        self, running_daemon: MemoryDaemon, tmp_path: Path
+    ) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="index not found"):
+            client.search("q", index_path=tmp_path / "missing.db")
+
+    def test_search_rejects_non_index_location(
+        self, running_daemon: MemoryDaemon, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "notes.txt"
+        target.write_text("not an index")
+        client = DaemonClient(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="not a memory index location"):
+            client.search("q", index_path=target)
+        assert target.read_text() == "not an index"
+
+    def test_search_does_not_initialize_foreign_database(
+        self, running_daemon: MemoryDaemon, tmp_path: Path
+    ) -> None:
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".memory").mkdir()
+        db_path = tmp_path / ".memory" / "index.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE other (x)")
+        conn.commit()
+        conn.close()
+
+        client = DaemonClient(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="not a memory index"):
+            client.search("q", index_path=db_path)
+
+        conn = sqlite3.connect(db_path)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        conn.close()
+        assert tables == {"other"}
+
+    def test_open_indexes_are_bounded(
+        self,
+        socket_dir: Path,
+        tmp_path: Path,
+        mock_embedding_service: Any,
+    ) -> None:
+        paths = []
+        for name in ("a", "b", "c"):
+            repo = tmp_path / name
+            (repo / ".git").mkdir(parents=True)
+            db_path = repo / ".memory" / "index.db"
+            IndexService(db_path).initialize()
+            paths.append(str(db_path))
+
+        daemon = MemoryDaemon(
+            socket_dir / "memoryd.sock",
+            embedding_service=mock_embedding_service,
+            max_indexes=2,
+        )
+        try:
+            first = daemon._get_index(paths[0])
+            daemon._get_index(paths[1])
+            daemon._get_index(paths[0])  # most recently used again
+            daemon._get_index(paths[2])
+            assert list(daemon._indexes) == [paths[0], paths[2]]
+            assert daemon._get_index(paths[0]) is first
+        finally:
+            daemon.close()
+
+    def test_unknown_op_is_error(self, running_daemon: MemoryDaemon) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="unknown op"):
+            client.request("bogus")
+
+    def test_shutdown_stops_server(self, running_daemon: MemoryDaemon) -> None:
+        client = DaemonClient(running_daemon.socket_path)
+        client.shutdown()
+        # Socket is removed once the serve loop exits
+        for _ in range(50):
+            if not running_daemon.socket_path.exists():
+                break
+            threading.Event().wait(0.1)
+        assert not running_daemon.socket_path.exists()
+
+
+# =============================================================================
+# Embedding Delegation Tests
+# =============================================================================
+
+
+class TestEmbeddingDelegation:
+    """Tests for EmbeddingService embedding through a running daemon."""
+
+    def test_embeds_without_loading_model(
+        self,
+        running_daemon: MemoryDaemon,
+        mock_embedding_service: Any,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        monkeypatch.setenv(
+            "MEMORY_PLUGIN_DAEMON_SOCKET", str(running_daemon.socket_path)
+        )
+        service = EmbeddingService(
+            model_name="mock-model", backend="torch", cache_dir=tmp_path
+        )
+        with patch.object(EmbeddingService, "load") as load:
+            assert service.embed("hello") == mock_embedding_service.embed("hello")
+            assert service.embed_batch(["a", "", "b"])[2] == (
+                mock_embedding_service.embed("b")
+            )
+        load.assert_not_called()
+        assert service.is_loaded is False
+
+    def test_falls_back_when_daemon_serves_other_model(
+        self,
+        running_daemon: MemoryDaemon,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+    ) -> None:
+        monkeypatch.setenv(
+            "MEMORY_PLUGIN_DAEMON_SOCKET", str(running_daemon.socket_path)
+        )
+        service = EmbeddingService(
+            model_name="other-model", backend="torch", cache_dir=tmp_path
+        )
+        with (
+            patch.object(
+                EmbeddingService, "load", side_effect=EmbeddingError("no model", "")
+            ) as load,
+            pytest.raises(EmbeddingError),
+        ):
+            service.embed_batch(["hello"])
+        load.assert_called_once()
+
+
+# =============================================================================
+# Lifecycle and Client Tests
+# =============================================================================
+
+
+class TestDaemonLifecycle:
+    """Tests for binding, stale sockets and client fallback."""
+
+    def test_bind_replaces_stale_socket(self, socket_dir: Path) -> None:
+        stale = socket_dir / "memoryd.sock"
+        stale.write_text("")
+        daemon = MemoryDaemon(stale, idle_timeout=0)
+        daemon.bind()
+        try:
+            assert stale.is_socket()
+            assert stale.stat().st_mode & 0o077 == 0
+        finally:
+            daemon.close()
+
+    def test_bind_refuses_second_daemon(self, running_daemon: MemoryDaemon) -> None:
+        second = MemoryDaemon(running_daemon.socket_path)
+        with pytest.raises(DaemonError, match="already running"):
+            second.bind()
+
+    def test_idle_timeout_exits(self, socket_dir: Path) -> None:
+        daemon = MemoryDaemon(socket_dir / "memoryd.sock", idle_timeout=0.2)
+        daemon.serve_forever()
+        assert not daemon.socket_path.exists()
+
+    def test_client_without_daemon_raises(self, socket_dir: Path) -> None:
+        client = DaemonClient(socket_dir / "absent.sock", timeout=0.2)
+        assert client.is_alive() is False
+        with pytest.raises(DaemonError, match="unavailable"):
+            client.request("ping")
+
+    def test_get_daemon_client_none_without_socket(
+        self, monkeypatch: pytest.MonkeyPatch, socket_dir: Path
+    ) -> None:
+        monkeypatch.setenv("MEMORY_PLUGIN_DAEMON_SOCKET", str(socket_dir / "x.sock"))
+        assert get_daemon_client() is None
+
+    def test_memory_serialization_round_trip(self, sample_memory: Memory) -> None:
+        assert _memory_from_dict(_memory_to_dict(sample_memory)) == sample_memory
@@ -663,3 +663,52 @@ class TestSessionStartHookExecution:
         if output:
             parsed = json.loads(output)
             assert isinstance(parsed, dict)
+
+    @pytest.mark.parametrize("merged_namespaces", [set(), {"decisions"}])
+    def test_remote_fetch_reindexes_only_after_merge(
+        self, tmp_path: Path, merged_namespaces: set[str]
+    ) -> None:
+        """Test SessionStart reindexes only when the fetch merged new notes."""
+        import io
+        import os
+        from unittest.mock import MagicMock, patch
+
+        from git_notes_memory.config import NAMESPACES
+        from git_notes_memory.git_ops import GitOps
+
+        def sync_notes_with_remote(
+            *_args: object, merged: set[str] | None = None, **_kwargs: object
+        ) -> dict[str, bool]:
+            if merged is not None:
+                merged.update(merged_namespaces)
+            # Skipped namespaces report success too
+            return dict.fromkeys(NAMESPACES, True)
+
+        sync_service = MagicMock()
+        input_data = json.dumps({"cwd": str(tmp_path), "source": "startup"})
+
+        with (
+            patch("sys.stdin", io.StringIO(input_data)),
+            patch("sys.stdout", io.StringIO()),
+            patch.dict(
+                os.environ,
+                {
+                    "MEMORY_PLUGIN_DATA_DIR": str(tmp_path),
+                    "HOOK_ENABLED": "true",
+                    "HOOK_SESSION_START_ENABLED": "true",
+                    "HOOK_SESSION_START_FETCH_REMOTE": "true",
+                },
+            ),
+            patch.object(GitOps, "ensure_sync_configured", return_value=True),
+            patch.object(GitOps, "migrate_fetch_config", return_value=False),
+            patch.object(
+                GitOps, "sync_notes_with_remote", side_effect=sync_notes_with_remote
+            ),
+            patch("git_notes_memory.sync.get_sync_service", return_value=sync_service),
+        ):
+            from git_notes_memory.hooks.session_start_handler import main
+
+            with contextlib.suppress(SystemExit):
+                main()
+
+        assert sync_service.reindex.called is bool(merged_namespaces)
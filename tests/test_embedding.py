@@ -5,6 +5,7 @@ Tests cover:
 - Single text embedding
 - Batch embedding
 - Similarity calculation
+- Persistent embedding cache
 - Error handling
 - Singleton access
 
@@ -22,6 +23,7 @@ import numpy as np
 import pytest
 
 from git_notes_memory.embedding import EmbeddingService, get_default_service
+from git_notes_memory.embedding_cache import EmbeddingCache
 from git_notes_memory.exceptions import EmbeddingError
 
 # =============================================================================
@@ -461,6 +463,149 @@ class TestSimilarity:
         assert "dimensions must match" in str(exc_info.value)
 
 
+# =============================================================================
+# Test: Backend Selection
+# =============================================================================
+
+
+class TestBackendSelection:
+    """Test choosing between the torch and ONNX backends."""
+
+    def test_backend_from_environment(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        assert EmbeddingService(cache_dir=cache_dir).backend == "torch"
+        monkeypatch.setenv("MEMORY_PLUGIN_EMBEDDING_BACKEND", "ONNX")
+        assert EmbeddingService(cache_dir=cache_dir).backend == "onnx"
+
+    def test_unknown_backend_raises(self, cache_dir: Path) -> None:
+        with pytest.raises(EmbeddingError, match="Unknown embedding backend"):
+            EmbeddingService(cache_dir=cache_dir, backend="tensorflow")
+
+    def test_onnx_backend_loads_without_sentence_transformers(
+        self, cache_dir: Path, mock_model: MagicMock
+    ) -> None:
+        service = EmbeddingService(
+            model_name="test-model", cache_dir=cache_dir, backend="onnx"
+        )
+        with (
+            patch(
+                "git_notes_memory.onnx_embedding.OnnxEmbeddingModel.from_pretrained",
+                return_value=mock_model,
+            ) as from_pretrained,
+            patch.dict("sys.modules", {"sentence_transformers": None}),
+        ):
+            result = service.embed("Hello")
+
+        assert len(result) == 384
+        assert from_pretrained.call_args.args[0] == "test-model"
+        assert from_pretrained.call_args.kwargs["revision"] is None
+        assert service.is_loaded is True
+
+    def test_onnx_backend_missing_extra_raises_with_hint(self, cache_dir: Path) -> None:
+        service = EmbeddingService(cache_dir=cache_dir, backend="onnx")
+        with (
+            patch(
+                "git_notes_memory.onnx_embedding.OnnxEmbeddingModel.from_pretrained",
+                side_effect=ImportError("No module named 'onnxruntime'"),
+            ),
+            pytest.raises(EmbeddingError) as exc_info,
+        ):
+            service.load()
+
+        assert "onnx" in exc_info.value.recovery_action
+
+    def test_backends_keep_separate_cache_entries(
+        self, cache_dir: Path, mock_model: MagicMock
+    ) -> None:
+        torch_service = EmbeddingService(
+            model_name="test-model", cache_dir=cache_dir, backend="torch"
+        )
+        torch_service._model = mock_model
+        torch_service.embed("Hello")
+
+        onnx_service = EmbeddingService(
+            model_name="test-model", cache_dir=cache_dir, backend="onnx"
+        )
+        onnx_service._model = mock_model
+        onnx_service.embed("Hello")
+
+        assert mock_model.encode.call_count == 2
+
+
+# =============================================================================
+# Test: Embedding Cache
+# =============================================================================
+
+
+class TestEmbeddingCacheUse:
+    """Test that cached vectors bypass the model."""
+
+    @pytest.fixture
+    def cached_service(
+        self, cache_dir: Path, mock_model: MagicMock
+    ) -> EmbeddingService:
+        service = EmbeddingService(model_name="test-model", cache_dir=cache_dir)
+        service._model = mock_model
+        return service
+
+    def test_cache_created_in_cache_dir(self, cache_dir: Path) -> None:
+        service = EmbeddingService(cache_dir=cache_dir)
+        assert service.embedding_cache is not None
+        assert service.embedding_cache.db_path == cache_dir / "embeddings.db"
+
+    def test_cache_disabled_by_environment(
+        self, cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("MEMORY_PLUGIN_EMBEDDING_CACHE", "off")
+        assert EmbeddingService(cache_dir=cache_dir).embedding_cache is None
+
+    def test_embed_hit_skips_model(
+        self, cached_service: EmbeddingService, mock_model: MagicMock
+    ) -> None:
+        first = cached_service.embed("Hello")
+        second = cached_service.embed("Hello")
+
+        assert second == pytest.approx(first)
+        assert mock_model.encode.call_count == 1
+
+    def test_hit_does_not_load_model(
+        self, cached_service: EmbeddingService, cache_dir: Path
+    ) -> None:
+        expected = cached_service.embed("Hello")
+
+        fresh = EmbeddingService(model_name="test-model", cache_dir=cache_dir)
+        with patch.object(fresh, "load", side_effect=AssertionError("loaded")):
+            assert fresh.embed("Hello") == pytest.approx(expected)
+            assert fresh.embed_batch(["Hello", ""])[0] == pytest.approx(expected)
+        assert fresh.is_loaded is False
+
+    def test_embed_batch_encodes_only_misses(
+        self, cached_service: EmbeddingService, mock_model: MagicMock
+    ) -> None:
+        cached_service.embed("cached")
+        mock_model.encode.reset_mock()
+
+        result = cached_service.embed_batch(["cached", "new", "", "new"])
+
+        assert len(result) == 4
+        assert result[2] == [0.0] * 384
+        mock_model.encode.assert_called_once()
+        assert mock_model.encode.call_args[0][0] == ["new"]
+
+    def test_explicit_cache_is_used(
+        self, tmp_path: Path, cache_dir: Path, mock_model: MagicMock
+    ) -> None:
+        cache = EmbeddingCache(tmp_path / "shared.db")
+        service = EmbeddingService(
+            model_name="test-model", cache_dir=cache_dir, embedding_cache=cache
+        )
+        service._model = mock_model
+        service.embed_batch(["a", "b"])
+        assert len(cache) == 2
+        cache.close()
+
+
 # =============================================================================
 # Test: Unload
 # =============================================================================
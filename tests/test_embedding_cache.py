@@ -0,0 +1,94 @@
+"""Tests for the persistent embedding cache."""
+
+from __future__ import annotations
+
+import sqlite3
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from git_notes_memory.embedding_cache import EmbeddingCache, cache_key
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> Iterator[EmbeddingCache]:
+    """Create a cache in a temporary directory."""
+    embedding_cache = EmbeddingCache(tmp_path / "embeddings.db")
+    yield embedding_cache
+    embedding_cache.close()
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestCacheKey:
+    """Tests for cache key derivation."""
+
+    def test_key_depends_on_model_and_text(self) -> None:
+        assert cache_key("m1", "text") == cache_key("m1", "text")
+        assert cache_key("m1", "text") != cache_key("m2", "text")
+        assert cache_key("m1", "text") != cache_key("m1", "text ")
+
+    def test_key_separates_model_from_text(self) -> None:
+        assert cache_key("ab", "c") != cache_key("a", "bc")
+
+
+class TestEmbeddingCache:
+    """Tests for get/put/eviction behavior."""
+
+    def test_round_trip_preserves_order_and_misses(self, cache: EmbeddingCache) -> None:
+        cache.put_many("model", {"a": [0.5, -0.25], "b": [1.0, 0.0]})
+
+        result = cache.get_many("model", ["b", "missing", "a", "b"])
+
+        assert result == [[1.0, 0.0], None, [0.5, -0.25], [1.0, 0.0]]
+        assert cache.get_many("other-model", ["a"]) == [None]
+
+    def test_dimension_mismatch_is_a_miss(self, cache: EmbeddingCache) -> None:
+        cache.put_many("model", {"a": [0.5, 0.5]})
+        assert cache.get_many("model", ["a"], dimensions=3) == [None]
+        assert cache.get_many("model", ["a"], dimensions=2) == [[0.5, 0.5]]
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        first = EmbeddingCache(tmp_path / "embeddings.db")
+        first.put_many("model", {"a": [0.25]})
+        first.close()
+
+        second = EmbeddingCache(tmp_path / "embeddings.db")
+        assert second.get_many("model", ["a"]) == [[0.25]]
+        assert len(second) == 1
+        second.close()
+
+    def test_evicts_oldest_beyond_max_entries(self, tmp_path: Path) -> None:
+        cache = EmbeddingCache(tmp_path / "embeddings.db", max_entries=2)
+        cache.put_many("model", {"old": [0.0]})
+        cache.put_many("model", {"mid": [0.5]})
+        cache.put_many("model", {"new": [1.0]})
+
+        assert len(cache) == 2
+        assert cache.get_many("model", ["old", "mid", "new"]) == [None, [0.5], [1.0]]
+        cache.close()
+
+    def test_clear(self, cache: EmbeddingCache) -> None:
+        cache.put_many("model", {"a": [0.5]})
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.get_many("model", ["a"]) == [None]
+
+    def test_database_errors_degrade_to_misses(
+        self, cache: EmbeddingCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def broken() -> sqlite3.Connection:
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(cache, "_connect", broken)
+
+        cache.put_many("model", {"a": [0.5]})  # Does not raise
+        assert cache.get_many("model", ["a", "b"]) == [None, None]
@@ -6,7 +6,9 @@ Also includes integration tests that work with real git repositories.
 
 from __future__ import annotations
 
+import os
 import subprocess
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
@@ -14,8 +16,13 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from git_notes_memory import config
+from git_notes_memory.cat_file import CatFileObject
 from git_notes_memory.exceptions import StorageError, ValidationError
-from git_notes_memory.git_ops import CommitInfo, GitOps, validate_path
+from git_notes_memory.git_ops import (
+    CommitInfo,
+    GitOps,
+    validate_path,
+)
 
 if TYPE_CHECKING:
     pass
@@ -374,48 +381,108 @@ class TestGitOpsNoteOperationsMocked:
             assert "New learning" in args
 
     def test_show_note_returns_content(self, tmp_path: Path) -> None:
-        """Test show_note returns note content."""
+        """Test show_note resolves the commit and reads the note blob."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(returncode=0, stdout="Note content")
+        commit = "c" * 40
+        responses = [
+            [CatFileObject("t" * 40, "tree", 0), CatFileObject(commit, "commit", 0)],
+            [CatFileObject("n" * 40, "blob", 12, b"Note content"), None, None],
+        ]
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", side_effect=responses) as mock_cat:
             result = git.show_note("decisions", "HEAD")
 
             assert result == "Note content"
+            assert mock_cat.call_args_list[0].args[0] == [
+                "refs/notes/mem/decisions^{tree}",
+                "HEAD",
+            ]
+            assert mock_cat.call_args_list[1].args[0] == [
+                f"{'t' * 40}:{commit}",
+                f"{'t' * 40}:cc/{commit[2:]}",
+                f"{'t' * 40}:cc/cc/{commit[4:]}",
+            ]
 
     def test_show_note_returns_none_when_missing(self, tmp_path: Path) -> None:
         """Test show_note returns None when note doesn't exist."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(returncode=1, stdout="")
+        responses = [
+            [CatFileObject("t" * 40, "tree", 0), CatFileObject("c" * 40, "commit", 0)],
+            [None, None, None],
+        ]
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", side_effect=responses):
             result = git.show_note("decisions", "HEAD")
 
             assert result is None
 
-    def test_list_notes_parses_output(self, tmp_path: Path) -> None:
-        """Test list_notes parses git output correctly."""
+    def test_show_note_returns_none_without_notes_ref(self, tmp_path: Path) -> None:
+        """Test show_note skips the lookup when the namespace has no notes."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(
-            returncode=0,
-            stdout="abc123 def456\n789xyz 012abc\n",
-        )
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[None, None]) as mock_cat:
+            result = git.show_note("decisions", "HEAD")
+
+            assert result is None
+            assert mock_cat.call_count == 1
+
+    def test_list_notes_walks_fanout_tree(self, tmp_path: Path) -> None:
+        """Test list_notes reads flat and fan-out entries from the notes tree."""
+        git = GitOps(tmp_path)
+        flat, nested = "1" * 40, "ab" + "2" * 38
+
+        def entry(mode: str, name: str, oid: str) -> bytes:
+            return f"{mode} {name}".encode() + b"\0" + bytes.fromhex(oid)
+
+        root = entry("100644", flat, "a" * 40) + entry("40000", "ab", "d" * 40)
+        subtree = entry("100644", "2" * 38, "b" * 40)
+        responses = [
+            [CatFileObject("r" * 40, "tree", len(root), root)],
+            [CatFileObject("d" * 40, "tree", len(subtree), subtree)],
+        ]
+
+        with patch.object(GitOps, "_cat_file", side_effect=responses) as mock_cat:
             result = git.list_notes("decisions")
 
-            assert result == [("abc123", "def456"), ("789xyz", "012abc")]
+            assert result == [("a" * 40, flat), ("b" * 40, nested)]
+            assert mock_cat.call_args_list[1].args[0] == ["d" * 40]
 
     def test_list_notes_empty_when_no_notes(self, tmp_path: Path) -> None:
         """Test list_notes returns empty list when no notes."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(returncode=1, stdout="")
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[None]):
             result = git.list_notes("decisions")
 
             assert result == []
 
+    def test_list_notes_refs_parses_for_each_ref(self, tmp_path: Path) -> None:
+        """Test list_notes_refs maps known namespaces to their notes commits."""
+        git = GitOps(tmp_path)
+        stdout = (
+            f"{'a' * 40} refs/notes/mem/decisions\n"
+            f"{'b' * 40} refs/notes/mem/learnings\n"
+            f"{'c' * 40} refs/notes/mem/scratch\n"
+        )
+        mock_result = MagicMock(returncode=0, stdout=stdout)
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            refs = git.list_notes_refs()
+
+            args = mock_run.call_args[0][0]
+            assert "for-each-ref" in args
+            assert mock_run.call_count == 1
+
+        assert refs == {"decisions": "a" * 40, "learnings": "b" * 40}
+
+    def test_list_notes_refs_empty_on_failure(self, tmp_path: Path) -> None:
+        """Test list_notes_refs returns empty dict when git fails."""
+        git = GitOps(tmp_path)
+        mock_result = MagicMock(returncode=128, stdout="")
+
+        with patch("subprocess.run", return_value=mock_result):
+            assert git.list_notes_refs() == {}
+
     def test_remove_note_returns_true_on_success(self, tmp_path: Path) -> None:
         """Test remove_note returns True on success."""
         git = GitOps(tmp_path)
@@ -436,10 +503,27 @@ class TestGitOpsNoteOperationsMocked:
 
             assert result is False
 
+    # =============================================================================
+    # GitOps Commit Operations Tests (Mocked)
+    # =============================================================================
 
-# =============================================================================
-# GitOps Commit Operations Tests (Mocked)
-# =============================================================================
+    def test_diff_notes_collapses_fanout_moves(self, tmp_path: Path) -> None:
+        """Test a note moved into a fan-out directory is reported as changed."""
+        git = GitOps(tmp_path)
+        moved = "ab" + "c" * 38
+        deleted = "d" * 40
+        stdout = f"D\t{moved}\nA\tab/{moved[2:]}\nD\t{deleted}\nM\tREADME\n"
+        mock_result = MagicMock(returncode=0, stdout=stdout)
+
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
+            changed, removed = git.diff_notes("1" * 40, "2" * 40)
+
+            args = mock_run.call_args[0][0]
+            assert "diff-tree" in args
+            assert "--no-renames" in args
+
+        assert changed == [moved]
+        assert removed == [deleted]
 
 
 class TestGitOpsCommitOperationsMocked:
@@ -448,25 +532,41 @@ class TestGitOpsCommitOperationsMocked:
     def test_get_commit_sha(self, tmp_path: Path) -> None:
         """Test get_commit_sha returns SHA."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(
-            returncode=0,
-            stdout="abc123def456789\n",
-        )
+        obj = CatFileObject("abc123def456789", "commit", 200)
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[obj]) as mock_cat:
             result = git.get_commit_sha("HEAD")
 
             assert result == "abc123def456789"
+            mock_cat.assert_called_once_with(["HEAD"], check=True)
+
+    def test_get_commit_sha_unresolved_raises(self, tmp_path: Path) -> None:
+        """Test get_commit_sha raises when the ref does not resolve."""
+        git = GitOps(tmp_path)
+
+        with (
+            patch.object(GitOps, "_cat_file", return_value=[None]),
+            pytest.raises(StorageError),
+        ):
+            git.get_commit_sha("HEAD")
 
     def test_get_commit_info_parses_output(self, tmp_path: Path) -> None:
-        """Test get_commit_info parses git log output."""
+        """Test get_commit_info parses the raw commit object like git log."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(
-            returncode=0,
-            stdout="abc123def456\nTest Author\ntest@example.com\n2024-01-15T10:30:00+00:00\nTest commit message\n",
+        content = (
+            b"tree " + b"t" * 40 + b"\n"
+            b"parent " + b"p" * 40 + b"\n"
+            b"author Test Author <test@example.com> 1705314600 +0000\n"
+            b"committer Other <other@example.com> 1705314700 +0100\n"
+            b"\n"
+            b"Test commit message  \n"
+            b"wrapped subject\n"
+            b"\n"
+            b"Body text\n"
         )
+        obj = CatFileObject("abc123def456", "commit", len(content), content)
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[obj]) as mock_cat:
             result = git.get_commit_info("HEAD")
 
             assert isinstance(result, CommitInfo)
@@ -474,31 +574,104 @@ class TestGitOpsCommitOperationsMocked:
             assert result.author_name == "Test Author"
             assert result.author_email == "test@example.com"
             assert result.date == "2024-01-15T10:30:00+00:00"
-            assert result.message == "Test commit message"
+            assert result.message == "Test commit message wrapped subject"
+            mock_cat.assert_called_once_with(["HEAD^{commit}"])
+
+    def test_get_commit_info_keeps_author_timezone(self, tmp_path: Path) -> None:
+        """Test the date is rendered in the author's offset, as %aI does."""
+        git = GitOps(tmp_path)
+        content = b"author A <a@b> 1705314600 -0530\n\nmsg\n"
+        obj = CatFileObject("abc", "commit", len(content), content)
+
+        with patch.object(GitOps, "_cat_file", return_value=[obj]):
+            result = git.get_commit_info("HEAD")
+
+            assert result.date == "2024-01-15T05:00:00-05:30"
+
+    def test_get_commit_info_batch_reads_once_and_caches(self, tmp_path: Path) -> None:
+        """Test uncached commits are read in one request, then cached by SHA."""
+        git = GitOps(tmp_path)
+        first, second = "e1" * 20, "e2" * 20
+
+        def commit(oid: str, subject: str) -> CatFileObject:
+            content = f"author A <a@b> 1705314600 +0000\n\n{subject}\n".encode()
+            return CatFileObject(oid, "commit", len(content), content)
+
+        objects = [commit(first, "First"), commit(second, "Second"), None]
+        with patch.object(GitOps, "_cat_file", return_value=objects) as mock_cat:
+            infos = git.get_commit_info_batch([first, second, first, "abc1234"])
+
+            mock_cat.assert_called_once_with(
+                [f"{first}^{{commit}}", f"{second}^{{commit}}", "abc1234^{commit}"]
+            )
+            assert {sha: info.message for sha, info in infos.items()} == {
+                first: "First",
+                second: "Second",
+            }
+
+        with patch.object(GitOps, "_cat_file") as mock_cat:
+            cached = GitOps(tmp_path).get_commit_info_batch([second, first])
+
+            mock_cat.assert_not_called()
+            assert cached == {second: infos[second], first: infos[first]}
+
+    def test_get_files_at_commits_reads_shared_blob_once(self, tmp_path: Path) -> None:
+        """Test snapshots of the same blob at different commits share a read."""
+        git = GitOps(tmp_path)
+        blob = "b" * 40
+        headers = [CatFileObject(blob, "blob", 4), CatFileObject(blob, "blob", 4)]
+        contents = [CatFileObject(blob, "blob", 4, b"text")]
+
+        with patch.object(
+            GitOps, "_cat_file", side_effect=[headers, contents]
+        ) as mock_cat:
+            files = git.get_files_at_commits([("c1", "a.py"), ("c2", "a.py")])
+
+            assert files == {("c1", "a.py"): "text", ("c2", "a.py"): "text"}
+            assert mock_cat.call_args_list[1].args[0] == [blob]
+
+    def test_get_commit_info_missing_raises(self, tmp_path: Path) -> None:
+        """Test get_commit_info raises for an unknown commit."""
+        git = GitOps(tmp_path)
+
+        with (
+            patch.object(GitOps, "_cat_file", return_value=[None]),
+            pytest.raises(StorageError),
+        ):
+            git.get_commit_info("HEAD")
 
     def test_get_file_at_commit_returns_content(self, tmp_path: Path) -> None:
         """Test get_file_at_commit returns file content."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(
-            returncode=0,
-            stdout="file content here",
-        )
+        obj = CatFileObject("f" * 40, "blob", 17, b"file content here")
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[obj]) as mock_cat:
             result = git.get_file_at_commit("src/main.py", "HEAD")
 
             assert result == "file content here"
+            mock_cat.assert_called_once_with(["HEAD:src/main.py"])
 
     def test_get_file_at_commit_returns_none_when_missing(self, tmp_path: Path) -> None:
         """Test get_file_at_commit returns None when file doesn't exist."""
         git = GitOps(tmp_path)
-        mock_result = MagicMock(returncode=1, stdout="")
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch.object(GitOps, "_cat_file", return_value=[None]):
             result = git.get_file_at_commit("nonexistent.py", "HEAD")
 
             assert result is None
 
+    def test_get_file_at_commit_returns_none_for_directory(
+        self, tmp_path: Path
+    ) -> None:
+        """Test get_file_at_commit returns None when the path is a tree."""
+        git = GitOps(tmp_path)
+        obj = CatFileObject("d" * 40, "tree", 0)
+
+        with patch.object(GitOps, "_cat_file", return_value=[obj]):
+            result = git.get_file_at_commit("src", "HEAD")
+
+            assert result is None
+
     def test_get_changed_files(self, tmp_path: Path) -> None:
         """Test get_changed_files parses output."""
         git = GitOps(tmp_path)
@@ -898,6 +1071,339 @@ class TestGitOpsIntegration:
         assert root.exists()
         assert (root / ".git").exists()
 
+    def test_iter_notes_batch_real(self, git_repo: Path) -> None:
+        """Test streamed notes round-trip exactly and keep input order."""
+        git = GitOps(git_repo)
+        first_commit = git.get_commit_sha("HEAD")
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Second commit"],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+        )
+        second_commit = git.get_commit_sha("HEAD")
+        missing_commit = "0" * 40
+
+        crlf_note = "---\r\nsummary: CRLF\r\n---\r\n\r\nBody \u00e9\u4e2d\r\n\n\n"
+        # -C stores the blob verbatim (no whitespace cleanup)
+        blob = (
+            subprocess.run(
+                ["git", "hash-object", "-w", "--stdin"],
+                cwd=git_repo,
+                input=crlf_note.encode("utf-8"),
+                check=True,
+                capture_output=True,
+            )
+            .stdout.decode()
+            .strip()
+        )
+        subprocess.run(
+            [
+                "git",
+                "notes",
+                "--ref=refs/notes/mem/decisions",
+                "add",
+                "-C",
+                blob,
+                first_commit,
+            ],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+        )
+        git.add_note("decisions", "Plain note", second_commit)
+
+        results = list(
+            git.iter_notes_batch(
+                "decisions", [second_commit, missing_commit, first_commit]
+            )
+        )
+
+        assert [sha for sha, _ in results] == [
+            second_commit,
+            missing_commit,
+            first_commit,
+        ]
+        assert results[0][1] == "Plain note\n"
+        assert results[1][1] is None
+        assert results[2][1] == crlf_note
+        assert git.show_notes_batch("decisions", [first_commit]) == {
+            first_commit: crlf_note
+        }
+
+    def test_iter_notes_batch_invalid_utf8_real(self, git_repo: Path) -> None:
+        """Test notes that are not valid UTF-8 are decoded with replacement."""
+        git = GitOps(git_repo)
+        commit = git.get_commit_sha("HEAD")
+        note_file = git_repo / "note.bin"
+        note_file.write_bytes(b"caf\xe9 latin-1\n")
+        subprocess.run(
+            [
+                "git",
+                "notes",
+                "--ref=refs/notes/mem/decisions",
+                "add",
+                "-F",
+                str(note_file),
+                commit,
+            ],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+        )
+
+        [(sha, content)] = list(git.iter_notes_batch("decisions", [commit]))
+
+        assert sha == commit
+        assert content == "caf\ufffd latin-1\n"
+
+    def test_iter_notes_batch_stops_early_real(self, git_repo: Path) -> None:
+        """Test abandoning the stream part-way leaves git reads working."""
+        git = GitOps(git_repo)
+        commit = git.get_commit_sha("HEAD")
+        git.add_note("decisions", "Note", commit)
+
+        stream = git.iter_notes_batch("decisions", [commit] * 5000)
+        assert next(stream) == (commit, "Note\n")
+        stream.close()
+
+        # The pooled reader is left in a usable state
+        assert git.show_note("decisions", commit) == "Note\n"
+
+    def test_notes_fanout_real(self, git_repo: Path) -> None:
+        """Test notes are found after git fans the notes tree out."""
+        count = 300
+        stream = [
+            f"commit refs/heads/fanout\nmark :{i + 1}\n"
+            f"committer T <t@example.com> {1700000000 + i} +0000\n"
+            f"data <<EOM\ncommit {i}\nEOM\n"
+            for i in range(count)
+        ]
+        stream.append(
+            "commit refs/notes/mem/decisions\n"
+            "committer T <t@example.com> 1700000000 +0000\n"
+            "data <<EOM\nnotes\nEOM\n"
+        )
+        stream.extend(
+            f"N inline :{i + 1}\ndata <<EOM\nnote {i}\nEOM\n" for i in range(count)
+        )
+        subprocess.run(
+            ["git", "fast-import", "--quiet"],
+            cwd=git_repo,
+            input="".join(stream),
+            text=True,
+            check=True,
+        )
+        expected = subprocess.run(
+            ["git", "notes", "--ref=refs/notes/mem/decisions", "list"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        git = GitOps(git_repo)
+
+        notes = git.list_notes("decisions")
+        assert [part for note in notes for part in note] == expected
+        assert len(notes) == count
+
+        commits = [commit for _note, commit in notes]
+        contents = git.show_notes_batch("decisions", commits)
+        assert sum(1 for c in contents.values() if c and c.startswith("note ")) == count
+        assert git.show_note("decisions", commits[0]) == contents[commits[0]]
+        assert git.get_note_oid("decisions", commits[0]) == notes[0][0]
+
+    def test_get_note_oid_real(self, git_repo: Path) -> None:
+        """Test the note blob OID is read without the note and tracks edits."""
+        git = GitOps(git_repo)
+        commit = git.get_commit_sha("HEAD")
+        assert git.get_note_oid("decisions", commit) is None
+
+        git.add_note("decisions", "First", commit)
+        first = git.get_note_oid("decisions", commit)
+        assert first == git.list_notes("decisions")[0][0]
+
+        git.append_note("decisions", "Second", commit)
+        assert git.get_note_oid("decisions", commit) not in (None, first)
+        assert git.get_note_oid("learnings", commit) is None
+        with pytest.raises(ValidationError):
+            git.get_note_oid("decisions", "HEAD")
+
+    def test_list_all_notes_real(self, git_repo: Path) -> None:
+        """Test all namespaces are listed and streamed in one pass."""
+        git = GitOps(git_repo)
+        commit = git.get_commit_sha("HEAD")
+        git.add_note("decisions", "A decision", commit)
+        git.add_note("learnings", "A learning", commit)
+        # A notes ref whose notes were all removed lists nothing
+        git.add_note("blockers", "Resolved", commit)
+        git.remove_note("blockers", commit)
+
+        assert git.list_notes_refs().keys() == {"decisions", "learnings", "blockers"}
+        listing = git.list_all_notes()
+        assert listing == {
+            "decisions": git.list_notes("decisions"),
+            "learnings": git.list_notes("learnings"),
+        }
+        assert sorted(git.iter_all_notes()) == [
+            ("decisions", commit, "A decision\n"),
+            ("learnings", commit, "A learning\n"),
+        ]
+
+    def test_list_all_notes_without_notes_real(self, git_repo: Path) -> None:
+        """Test a repository without notes refs lists nothing."""
+        git = GitOps(git_repo)
+
+        assert git.list_notes_refs() == {}
+        assert git.list_all_notes() == {}
+        assert list(git.iter_all_notes()) == []
+
+    def test_get_changed_files_batch_real(self, git_repo_with_history: Path) -> None:
+        """Test batch changed files match per-commit git show output."""
+        shas = subprocess.run(
+            ["git", "rev-list", "HEAD"],
+            cwd=git_repo_with_history,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        git = GitOps(git_repo_with_history)
+
+        changed = git.get_changed_files_batch(["HEAD", *shas, "0" * 40])
+
+        assert set(changed) == {"HEAD", *shas}
+        assert changed["HEAD"] == changed[shas[0]]
+        assert all(changed[sha] == git.get_changed_files(sha) for sha in shas)
+        assert changed[shas[-1]] == ["README.md"]
+
+    def test_get_files_at_commits_real(self, git_repo: Path) -> None:
+        """Test snapshots honor size caps and skip binary and missing files."""
+        (git_repo / "small.txt").write_text("small\n")
+        (git_repo / "large.txt").write_text("x" * 200)
+        (git_repo / "image.bin").write_bytes(b"\x89PNG\0\0data")
+        subprocess.run(["git", "add", "."], cwd=git_repo, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add files"],
+            cwd=git_repo,
+            capture_output=True,
+            check=True,
+        )
+        git = GitOps(git_repo)
+        head = git.get_commit_sha("HEAD")
+
+        files = git.get_files_at_commits(
+            [
+                ("HEAD", "small.txt"),
+                (head, "small.txt"),
+                ("HEAD", "large.txt"),
+                ("HEAD", "image.bin"),
+                ("HEAD", "missing.txt"),
+                ("HEAD~1", "README.md"),
+            ],
+            max_file_bytes=100,
+        )
+
+        assert files == {
+            ("HEAD", "small.txt"): "small\n",
+            (head, "small.txt"): "small\n",
+            ("HEAD~1", "README.md"): "# Test Repo\n",
+        }
+
+        # The total budget is spent in request order
+        files = git.get_files_at_commits(
+            [("HEAD", "large.txt"), ("HEAD", "small.txt")], max_total_bytes=200
+        )
+        assert list(files) == [("HEAD", "large.txt")]
+
+    def test_get_commit_info_batch_real(self, git_repo_with_history: Path) -> None:
+        """Test batch commit info matches per-commit lookups."""
+        shas = subprocess.run(
+            ["git", "rev-list", "HEAD"],
+            cwd=git_repo_with_history,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.split()
+        git = GitOps(git_repo_with_history)
+
+        infos = git.get_commit_info_batch([*shas, "0" * 40])
+
+        assert list(infos) == shas
+        assert all(infos[sha] == git.get_commit_info(sha) for sha in shas)
+
+    def test_get_commit_info_matches_git_log_real(self, git_repo: Path) -> None:
+        """Test commit info parsed from the raw object matches git log."""
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Subject line\nwraps\n\nBody"],
+            cwd=git_repo,
+            env={
+                **os.environ,
+                "GIT_AUTHOR_NAME": "Ada Lovelace",
+                "GIT_AUTHOR_DATE": "1700000000 +0530",
+            },
+            check=True,
+        )
+        expected = subprocess.run(
+            ["git", "log", "-1", "--format=%H%n%an%n%ae%n%aI%n%s"],
+            cwd=git_repo,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.splitlines()
+        git = GitOps(git_repo)
+
+        info = git.get_commit_info("HEAD")
+
+        assert [
+            info.sha,
+            info.author_name,
+            info.author_email,
+            info.date,
+            info.message,
+        ] == expected
+
+    def test_get_notes_ref_sha_real(self, git_repo: Path) -> None:
+        """Test notes ref resolution tracks note writes."""
+        git = GitOps(git_repo)
+        assert git.get_notes_ref_sha("decisions") is None
+
+        git.add_note("decisions", "A decision", "HEAD")
+        first = git.get_notes_ref_sha("decisions")
+        assert first is not None
+        assert len(first) == 40
+
+        git.append_note("decisions", "More detail", "HEAD")
+        assert git.get_notes_ref_sha("decisions") not in (None, first)
+
+    def test_diff_notes_real(self, git_repo: Path) -> None:
+        """Test diff_notes reports added, modified and removed notes."""
+        git = GitOps(git_repo)
+        first_commit = git.get_commit_sha("HEAD")
+        subprocess.run(
+            ["git", "commit", "--allow-empty", "-m", "Second commit"],
+            cwd=git_repo,
+            check=True,
+            capture_output=True,
+        )
+        second_commit = git.get_commit_sha("HEAD")
+
+        git.add_note("decisions", "First", first_commit)
+        ref1 = git.get_notes_ref_sha("decisions")
+        git.append_note("decisions", "Amended", first_commit)
+        git.add_note("decisions", "Second", second_commit)
+        ref2 = git.get_notes_ref_sha("decisions")
+        git.remove_note("decisions", first_commit)
+        ref3 = git.get_notes_ref_sha("decisions")
+        assert ref1 and ref2 and ref3
+
+        changed, removed = git.diff_notes(ref1, ref2)
+        assert sorted(changed) == sorted([first_commit, second_commit])
+        assert removed == []
+
+        changed, removed = git.diff_notes(ref2, ref3)
+        assert changed == []
+        assert removed == [first_commit]
+
 
 # =============================================================================
 # GitOps Migration Tests (Mocked)
@@ -993,66 +1499,109 @@ class TestGitOpsRemoteSyncMocked:
     """Tests for remote sync methods with mocked subprocess."""
 
     def test_fetch_notes_from_remote_success(self, tmp_path: Path) -> None:
-        """Test fetch_notes_from_remote with successful fetch."""
+        """Test fetch_notes_from_remote fetches all namespaces in one call."""
         git = GitOps(tmp_path)
         mock_result = MagicMock(returncode=0)
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.run", return_value=mock_result) as mock_run:
             result = git.fetch_notes_from_remote(["decisions", "learnings"])
 
             assert result["decisions"] is True
             assert result["learnings"] is True
+            assert mock_run.call_count == 1
+            args = mock_run.call_args[0][0]
+            assert "+refs/notes/mem/*:refs/notes/origin/mem/*" in args
 
-    def test_fetch_notes_from_remote_partial_failure(self, tmp_path: Path) -> None:
-        """Test fetch_notes_from_remote with some failures."""
+    def test_fetch_notes_from_remote_failure(self, tmp_path: Path) -> None:
+        """Test a failed fetch marks every namespace as failed."""
         git = GitOps(tmp_path)
-        call_count = 0
-
-        def mock_run(args: list[str], **kwargs):
-            nonlocal call_count
-            call_count += 1
-            result = MagicMock()
-            # First call succeeds, second fails
-            result.returncode = 0 if call_count == 1 else 1
-            return result
+        mock_result = MagicMock(returncode=1)
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch("subprocess.run", return_value=mock_result):
             result = git.fetch_notes_from_remote(["decisions", "learnings"])
 
-            # First succeeds, second fails
-            assert result["decisions"] is True
-            assert result["learnings"] is False
+            assert result == {"decisions": False, "learnings": False}
 
-    def test_merge_notes_from_tracking_success(self, tmp_path: Path) -> None:
-        """Test merge_notes_from_tracking with successful merge."""
-        git = GitOps(tmp_path)
+    @staticmethod
+    def sync_refs_run(
+        refs: dict[str, str], calls: list[str]
+    ) -> Callable[..., MagicMock]:
+        """Build a subprocess.run side effect listing the given refs."""
 
-        def mock_run(args: list[str], **kwargs):
-            result = MagicMock(returncode=0)
-            if "rev-parse" in " ".join(str(a) for a in args):
-                result.stdout = "abc123"  # Tracking ref exists
+        def mock_run(args: list[str], **kwargs: object) -> MagicMock:
+            subcommand = args[3]
+            calls.append(subcommand)
+            result = MagicMock(returncode=0, stdout="")
+            if subcommand == "for-each-ref":
+                result.stdout = "".join(f"{sha} {ref}\n" for ref, sha in refs.items())
             return result
 
-        with patch("subprocess.run", side_effect=mock_run):
+        return mock_run
+
+    def test_merge_notes_from_tracking_success(self, tmp_path: Path) -> None:
+        """Test merge_notes_from_tracking merges and records the tracking ref."""
+        git = GitOps(tmp_path)
+        calls: list[str] = []
+        refs = {"refs/notes/origin/mem/decisions": "a" * 40}
+
+        with patch("subprocess.run", side_effect=self.sync_refs_run(refs, calls)):
             result = git.merge_notes_from_tracking("decisions")
-            assert result is True
+
+        assert result is True
+        assert calls == ["for-each-ref", "notes", "update-ref"]
 
     def test_merge_notes_from_tracking_no_tracking_ref(self, tmp_path: Path) -> None:
         """Test merge_notes_from_tracking when no tracking ref."""
         git = GitOps(tmp_path)
+        calls: list[str] = []
 
-        def mock_run(args: list[str], **kwargs):
-            result = MagicMock()
-            if "rev-parse" in " ".join(str(a) for a in args):
-                result.returncode = 1  # Tracking ref doesn't exist
-            else:
-                result.returncode = 0
+        with patch("subprocess.run", side_effect=self.sync_refs_run({}, calls)):
+            result = git.merge_notes_from_tracking("decisions")
+
+        # Should return True (no-op when no tracking ref)
+        assert result is True
+        assert calls == ["for-each-ref"]
+
+    def test_merge_skips_unchanged_tracking_ref(self, tmp_path: Path) -> None:
+        """Test namespaces already merged at their tracking commit are skipped."""
+        git = GitOps(tmp_path)
+        calls: list[str] = []
+        refs = {
+            "refs/notes/mem/decisions": "b" * 40,
+            "refs/notes/origin/mem/decisions": "a" * 40,
+            "refs/notes/origin/merged/decisions": "a" * 40,
+            "refs/notes/origin/mem/learnings": "c" * 40,
+        }
+
+        merged: set[str] = set()
+        with patch("subprocess.run", side_effect=self.sync_refs_run(refs, calls)):
+            result = git.merge_notes_from_tracking_batch(
+                ["decisions", "learnings", "progress"], merged=merged
+            )
+
+        assert result == {"decisions": True, "learnings": True, "progress": True}
+        assert calls.count("notes") == 1
+        # Skipped and tracking-less namespaces are successes, not merges
+        assert merged == {"learnings"}
+
+    def test_merge_failure_not_recorded(self, tmp_path: Path) -> None:
+        """Test a failed merge is retried next sync instead of recorded."""
+        git = GitOps(tmp_path)
+
+        def mock_run(args: list[str], **kwargs: object) -> MagicMock:
+            result = MagicMock(returncode=0, stdout="")
+            if args[3] == "for-each-ref":
+                result.stdout = f"{'a' * 40} refs/notes/origin/mem/decisions\n"
+            elif args[3] == "notes":
+                result.returncode = 1
+            elif args[3] == "update-ref":
+                pytest.fail("failed merge was recorded")
             return result
 
         with patch("subprocess.run", side_effect=mock_run):
-            result = git.merge_notes_from_tracking("decisions")
-            # Should return True (no-op when no tracking ref)
-            assert result is True
+            assert git.merge_notes_from_tracking_batch(["decisions"]) == {
+                "decisions": False
+            }
 
     def test_merge_notes_invalid_namespace_raises(self, tmp_path: Path) -> None:
         """Test merge_notes_from_tracking with invalid namespace."""
@@ -1082,50 +1631,56 @@ class TestGitOpsRemoteSyncMocked:
     def test_sync_notes_with_remote_full_workflow(self, tmp_path: Path) -> None:
         """Test sync_notes_with_remote orchestrates fetch→merge→push."""
         git = GitOps(tmp_path)
-        call_sequence: list[str] = []
-
-        def mock_run(args: list[str], **kwargs):
-            args_str = " ".join(str(a) for a in args)
-            result = MagicMock(returncode=0)
-
-            if "fetch" in args_str:
-                call_sequence.append("fetch")
-            elif "rev-parse" in args_str:
-                result.stdout = "abc123"
-                call_sequence.append("rev-parse")
-            elif "notes" in args_str and "merge" in args_str:
-                call_sequence.append("merge")
-            elif "push" in args_str:
-                call_sequence.append("push")
-            return result
+        calls: list[str] = []
+        refs = {
+            "refs/notes/mem/decisions": "b" * 40,
+            "refs/notes/origin/mem/decisions": "a" * 40,
+        }
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch("subprocess.run", side_effect=self.sync_refs_run(refs, calls)):
             result = git.sync_notes_with_remote(["decisions"])
 
-            assert result["decisions"] is True
-            # Verify workflow order: fetch → rev-parse → merge → push
-            assert "fetch" in call_sequence
-            assert "push" in call_sequence
+        assert result["decisions"] is True
+        # Verify workflow order: fetch → merge → push → record pushed refs
+        assert calls == [
+            "fetch",
+            "for-each-ref",
+            "notes",
+            "update-ref",
+            "for-each-ref",
+            "push",
+            "update-ref",
+        ]
 
     def test_sync_notes_with_remote_no_push(self, tmp_path: Path) -> None:
         """Test sync_notes_with_remote with push=False."""
         git = GitOps(tmp_path)
-        push_called = []
-
-        def mock_run(args: list[str], **kwargs):
-            args_str = " ".join(str(a) for a in args)
-            result = MagicMock(returncode=0)
-            if "push" in args_str:
-                push_called.append(True)
-            elif "rev-parse" in args_str:
-                result.stdout = "abc123"
-            return result
+        calls: list[str] = []
+        refs = {"refs/notes/origin/mem/decisions": "a" * 40}
 
-        with patch("subprocess.run", side_effect=mock_run):
+        with patch("subprocess.run", side_effect=self.sync_refs_run(refs, calls)):
             git.sync_notes_with_remote(["decisions"], push=False)
 
-            # Push should not have been called
-            assert len(push_called) == 0
+        # Push should not have been called
+        assert "push" not in calls
+
+    def test_sync_skips_push_when_up_to_date(self, tmp_path: Path) -> None:
+        """Test nothing is pushed when local notes match the remote."""
+        git = GitOps(tmp_path)
+        calls: list[str] = []
+        refs = {
+            "refs/notes/mem/decisions": "a" * 40,
+            "refs/notes/origin/mem/decisions": "a" * 40,
+            "refs/notes/origin/merged/decisions": "a" * 40,
+        }
+
+        merged: set[str] = set()
+        with patch("subprocess.run", side_effect=self.sync_refs_run(refs, calls)):
+            result = git.sync_notes_with_remote(merged=merged)
+
+        assert all(result.values())
+        assert merged == set()
+        assert calls == ["fetch", "for-each-ref", "for-each-ref"]
 
 
 # =============================================================================
@@ -1480,6 +2035,54 @@ class TestGitOpsDivergedNotesIntegration:
         assert note is not None
         assert "Initial learning" in note
 
+    def test_sync_all_namespaces_real(
+        self, git_repo_with_remote: tuple, tmp_path: Path
+    ) -> None:
+        """Test one fetch syncs every namespace and a repeat sync is a no-op."""
+        local_path, remote_path = git_repo_with_remote
+        collaborator = tmp_path / "collaborator"
+        subprocess.run(
+            ["git", "clone", str(remote_path), str(collaborator)],
+            check=True,
+            capture_output=True,
+        )
+        for key, value in (("user.email", "other@example.com"), ("user.name", "O")):
+            subprocess.run(
+                ["git", "config", key, value],
+                cwd=collaborator,
+                check=True,
+                capture_output=True,
+            )
+        remote_git = GitOps(collaborator)
+        for ns in ("decisions", "learnings", "blockers"):
+            remote_git.add_note(ns, f"Remote {ns}", "HEAD")
+        assert remote_git.push_notes_to_remote() is True
+
+        git = GitOps(local_path)
+        git.add_note("decisions", "Local decision", "HEAD")
+        run_git = git._run_git
+        with patch.object(git, "_run_git", wraps=run_git) as mock_run:
+            results = git.sync_notes_with_remote()
+
+            subcommands = [c.args[0][0] for c in mock_run.call_args_list]
+            assert subcommands.count("fetch") == 1
+            assert subcommands.count("notes") == 3
+
+        assert all(results.values())
+        assert git.show_note("learnings", "HEAD") == "Remote learnings\n"
+        decision = git.show_note("decisions", "HEAD")
+        assert decision is not None
+        assert "Remote decisions" in decision and "Local decision" in decision
+        # Merged local notes were pushed back
+        assert GitOps(remote_path).list_notes_refs() == git.list_notes_refs()
+
+        with patch.object(git, "_run_git", wraps=run_git) as mock_run:
+            assert all(git.sync_notes_with_remote().values())
+
+            subcommands = [c.args[0][0] for c in mock_run.call_args_list]
+            assert "notes" not in subcommands
+            assert "push" not in subcommands
+
     def test_migration_from_old_to_new_pattern(
         self, git_repo_with_remote: tuple
     ) -> None:
@@ -355,6 +355,27 @@ class TestUserPromptHandler:
         assert set(result["tags"]) == {"database", "architecture"}
         assert result["confidence"] == 0.85
 
+    @pytest.mark.parametrize("defer_index", [True, False])
+    def test_capture_memory_defer_index(self, defer_index: bool) -> None:
+        """Test AUTO captures only defer indexing when asked to."""
+        from git_notes_memory.hooks.models import SuggestedCapture
+        from git_notes_memory.hooks.user_prompt_handler import _capture_memory
+
+        suggestion = SuggestedCapture(
+            namespace="decisions",
+            summary="Use PostgreSQL",
+            content="Decided to use PostgreSQL for database",
+        )
+        with patch("git_notes_memory.capture.get_default_service") as mock:
+            mock.return_value.capture.return_value = MagicMock(
+                success=True, memory=MagicMock(id="decisions:abc:0")
+            )
+            result = _capture_memory(suggestion, defer_index=defer_index)
+
+        assert result["success"] is True
+        call = mock.return_value.capture.call_args
+        assert call.kwargs["defer_index"] is defer_index
+
     def test_format_suggestions_xml_empty(self) -> None:
         """Test XML formatting with empty suggestions."""
         from git_notes_memory.hooks.user_prompt_handler import _format_suggestions_xml
@@ -659,18 +680,83 @@ class TestStopHandler:
             mock_result.success = True
             mock_result.memory = MagicMock()
             mock_result.memory.id = "decisions:abc123:0"
-            mock_service.capture.return_value = mock_result
+            mock_service.capture_batch.return_value = [mock_result]
             mock.return_value = mock_service
 
             captured, remaining = _auto_capture_signals(signals, 0.8, 5)
 
-            # Only high confidence should be captured
+            # Only high confidence should be captured, in one batch
             assert len(captured) == 1
             assert captured[0]["namespace"] == "decisions"
+            (requests,) = mock_service.capture_batch.call_args.args
+            assert [r.namespace for r in requests] == ["decisions"]
+            assert mock_service.capture_batch.call_args.kwargs["defer_index"] is True
             # Low confidence should remain
             assert len(remaining) == 1
             assert remaining[0].confidence == 0.5
 
+    def test_auto_capture_signals_indexes_without_sync(self) -> None:
+        """Test captures are indexed immediately when no sync will drain them."""
+        from git_notes_memory.hooks.models import CaptureSignal, SignalType
+        from git_notes_memory.hooks.stop_handler import _auto_capture_signals
+
+        signals = [
+            CaptureSignal(
+                type=SignalType.DECISION,
+                match="Decision",
+                confidence=0.95,
+                context="A decision",
+                suggested_namespace="decisions",
+            )
+        ]
+        with patch("git_notes_memory.capture.get_default_service") as mock:
+            mock_service = MagicMock()
+            mock_service.capture_batch.return_value = [
+                MagicMock(success=True, memory=MagicMock(id="decisions:abc:0"))
+            ]
+            mock.return_value = mock_service
+
+            captured, _ = _auto_capture_signals(signals, 0.8, 5, defer_index=False)
+
+        assert len(captured) == 1
+        assert mock_service.capture_batch.call_args.kwargs["defer_index"] is False
+
+    def test_auto_capture_signals_failed_items_remain(self) -> None:
+        """Test signals whose capture failed are returned as remaining."""
+        from git_notes_memory.hooks.models import CaptureSignal, SignalType
+        from git_notes_memory.hooks.stop_handler import _auto_capture_signals
+        from git_notes_memory.models import CaptureResult
+
+        signals = [
+            CaptureSignal(
+                type=SignalType.DECISION,
+                match="First",
+                confidence=0.95,
+                context="First decision",
+                suggested_namespace="decisions",
+            ),
+            CaptureSignal(
+                type=SignalType.LEARNING,
+                match="Second",
+                confidence=0.9,
+                context="Second learning",
+                suggested_namespace="learnings",
+            ),
+        ]
+
+        with patch("git_notes_memory.capture.get_default_service") as mock:
+            mock_service = MagicMock()
+            mock_service.capture_batch.return_value = [
+                CaptureResult(success=True, memory=MagicMock(id="decisions:abc:0")),
+                CaptureResult(success=False, warning="Summary too long"),
+            ]
+            mock.return_value = mock_service
+
+            captured, remaining = _auto_capture_signals(signals, 0.8, 5)
+
+        assert [c["memory_id"] for c in captured] == ["decisions:abc:0"]
+        assert remaining == [signals[1]]
+
     def test_write_output_with_captured(self) -> None:
         """Test output with auto-captured memories."""
         from git_notes_memory.hooks.stop_handler import _write_output
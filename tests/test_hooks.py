@@ -12,7 +12,9 @@ Tests the hook infrastructure including:
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from pathlib import Path
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -34,6 +36,7 @@ from git_notes_memory.hooks.novelty_checker import NoveltyChecker
 from git_notes_memory.hooks.session_analyzer import SessionAnalyzer, TranscriptContent
 from git_notes_memory.hooks.signal_detector import SignalDetector
 from git_notes_memory.hooks.xml_formatter import XMLBuilder
+from git_notes_memory.models import Memory, MemoryResult
 
 # =============================================================================
 # Test Fixtures
@@ -240,6 +243,13 @@ class TestHookConfig:
         config = load_hook_config(env)
         assert config.session_start_fetch_remote is False
 
+    def test_load_config_session_start_snapshot(self) -> None:
+        """Test the SessionStart snapshot is on by default and can be disabled."""
+        assert HookConfig().session_start_snapshot is True
+        env = {"HOOK_SESSION_START_SNAPSHOT": "false"}
+        config = load_hook_config(env)
+        assert config.session_start_snapshot is False
+
     def test_load_config_stop_push_remote_enabled(self) -> None:
         """Test loading stop_push_remote from environment."""
         env = {"HOOK_STOP_PUSH_REMOTE": "true"}
@@ -454,6 +464,113 @@ class TestNoveltyChecker:
         checker = NoveltyChecker(novelty_threshold=0.5)
         assert checker.novelty_threshold == 0.5
 
+    def test_batch_check_novelty_searches_once(
+        self, sample_decision_signal: CaptureSignal
+    ) -> None:
+        """Test a batch is checked with one search and scored per signal."""
+        memory = Memory(
+            id="decisions:abc:0",
+            commit_sha="abc",
+            namespace="decisions",
+            summary="Use PostgreSQL",
+            content="Use PostgreSQL",
+            timestamp=datetime.now(UTC),
+        )
+        recall = MagicMock()
+        recall.search_batch.return_value = [
+            [MemoryResult(memory=memory, distance=0.1)],
+            [],
+        ]
+        other = CaptureSignal(
+            type=SignalType.LEARNING,
+            match="TIL",
+            confidence=0.9,
+            context="",
+            suggested_namespace="learnings",
+        )
+        checker = NoveltyChecker(novelty_threshold=0.3, recall_service=recall)
+
+        duplicate, novel = checker.batch_check_novelty([sample_decision_signal, other])
+
+        recall.search_batch.assert_called_once_with(
+            [sample_decision_signal.context, "TIL"],
+            k=5,
+            namespaces=["decisions", "learnings"],
+            min_similarity=0.0,
+        )
+        recall.search.assert_not_called()
+        assert duplicate.highest_similarity == pytest.approx(1 / 1.1)
+        assert duplicate.novelty_score == pytest.approx(1 - 1 / 1.1)
+        assert duplicate.is_novel is False
+        assert duplicate.similar_memory_ids == ["decisions:abc:0"]
+        assert novel == NoveltyResult(novelty_score=1.0, is_novel=True)
+
+    def test_novelty_checked_when_model_not_loaded(self) -> None:
+        """Test an unloaded embedding model no longer skips the check."""
+        embedding = MagicMock()
+        embedding.is_loaded = False
+        recall = MagicMock()
+        recall.search_batch.return_value = [[]]
+        checker = NoveltyChecker(recall_service=recall, embedding_service=embedding)
+
+        result = checker.check_novelty("I decided to use SQLite")
+
+        recall.search_batch.assert_called_once()
+        assert result.is_novel is True
+
+    def test_novelty_deferred_without_model_load(self) -> None:
+        """Test load_model=False defers instead of loading the model."""
+        embedding = MagicMock()
+        embedding.is_loaded = False
+        recall = MagicMock()
+        checker = NoveltyChecker(
+            recall_service=recall, embedding_service=embedding, load_model=False
+        )
+
+        results = checker._check_batch(["I decided to use SQLite", ""], [None, None])
+
+        recall.search_batch.assert_not_called()
+        embedding.load.assert_not_called()
+        assert results[0].deferred is True
+        assert results[0].is_novel is True
+        # Empty text has nothing to check, so it is not deferred
+        assert results[1].deferred is False
+
+    def test_novelty_checked_without_model_load_when_loaded(self) -> None:
+        """Test load_model=False still checks with a model already loaded."""
+        embedding = MagicMock()
+        embedding.is_loaded = True
+        recall = MagicMock()
+        recall.search_batch.return_value = [[]]
+        checker = NoveltyChecker(
+            recall_service=recall, embedding_service=embedding, load_model=False
+        )
+
+        result = checker.check_novelty("I decided to use SQLite")
+
+        recall.search_batch.assert_called_once()
+        assert result.deferred is False
+
+    def test_novelty_uses_daemon_without_model_load(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test load_model=False checks through a running daemon."""
+        index_path = tmp_path / "index.db"
+        index_path.touch()
+        client = MagicMock()
+        client.search_batch.return_value = [[]]
+        monkeypatch.setattr("git_notes_memory.daemon.get_daemon_client", lambda: client)
+        monkeypatch.setattr(
+            "git_notes_memory.config.get_project_index_path", lambda: index_path
+        )
+        checker = NoveltyChecker(load_model=False)
+
+        result = checker.check_novelty("I decided to use SQLite")
+
+        client.search_batch.assert_called_once()
+        assert result.deferred is False
+        assert result.is_novel is True
+
     def test_novelty_result_is_novel_flag(self) -> None:
         """Test NoveltyResult is_novel flag."""
         # High novelty score should be novel
@@ -555,6 +672,25 @@ class TestCaptureDecider:
         assert len(decision.suggested_captures) > 0
         assert decision.suggested_captures[0].namespace == "learnings"
 
+    def test_decide_suggests_when_novelty_deferred(
+        self, sample_decision_signal: CaptureSignal
+    ) -> None:
+        """Test signals are still suggested when novelty could not be checked."""
+        embedding = MagicMock()
+        embedding.is_loaded = False
+        recall = MagicMock()
+        checker = NoveltyChecker(
+            recall_service=recall, embedding_service=embedding, load_model=False
+        )
+        decider = CaptureDecider(novelty_checker=checker)
+
+        decision = decider.decide([sample_decision_signal])
+
+        recall.search_batch.assert_not_called()
+        assert decision.action == CaptureAction.SUGGEST
+        assert len(decision.suggested_captures) == 1
+        assert decision.suggested_captures[0].namespace == "decisions"
+
 
 # =============================================================================
 # SessionAnalyzer Tests
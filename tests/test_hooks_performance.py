@@ -420,3 +420,77 @@ class TestMemoryUsage:
                 builder.add_element("root", f"item_{i}", text=f"value_{i}")
             builder.to_string()
             # Builder goes out of scope, memory should be freed
+
+
+# ============================================================================
+# Hook Startup Tests
+# ============================================================================
+
+
+class TestHookStartup:
+    """Import-time regression tests for hook handlers.
+
+    Budgets in wall-clock terms live in scripts/bench_hook_startup.py; these
+    tests pin the machine-independent part: handlers must not load heavy
+    optional dependencies before they know they have work to do.
+    """
+
+    HEAVY_MODULES = frozenset(
+        {
+            "yaml",
+            "detect_secrets",
+            "sqlite_vec",
+            "numpy",
+            "sentence_transformers",
+            "urllib.request",
+            "git_notes_memory.hooks.capture_decider",
+            "git_notes_memory.hooks.context_builder",
+        }
+    )
+
+    @staticmethod
+    def _imported_modules(module: str) -> set[str]:
+        """Import a module under -X importtime and return what it loaded."""
+        import subprocess
+        import sys
+
+        src = Path(__file__).resolve().parent.parent / "src"
+        env = dict(os.environ)
+        env["PYTHONPATH"] = os.pathsep.join(
+            p for p in (str(src), env.get("PYTHONPATH", "")) if p
+        )
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            env=env,
+            check=True,
+        )
+        return {
+            line.rsplit("|", 1)[1].strip()
+            for line in result.stderr.splitlines()
+            if line.startswith("import time:") and line.count("|") == 2
+        }
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "git_notes_memory.hooks.session_start_handler",
+            "git_notes_memory.hooks.user_prompt_handler",
+            "git_notes_memory.hooks.post_tool_use_handler",
+            "git_notes_memory.hooks.pre_compact_handler",
+            "git_notes_memory.hooks.stop_handler",
+        ],
+    )
+    def test_handler_import_is_light(self, module: str) -> None:
+        """Test importing a handler loads no heavy dependencies."""
+        loaded = self._imported_modules(module)
+
+        assert module in loaded
+        assert not loaded & self.HEAVY_MODULES
+
+    def test_security_service_defers_scanners(self) -> None:
+        """Test the secrets service loads YAML and detect-secrets on use."""
+        loaded = self._imported_modules("git_notes_memory.security.service")
+
+        assert not loaded & {"yaml", "detect_secrets"}
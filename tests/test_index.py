@@ -153,7 +153,7 @@ class TestInitialization:
         cursor.execute("SELECT value FROM metadata WHERE key = 'schema_version'")
         row = cursor.fetchone()
         assert row is not None
-        assert row[0] == "2"  # Schema v2 adds repo_path column
+        assert row[0] == "9"  # Schema v9 adds namespace write counters
 
         service.close()
 
@@ -415,6 +415,193 @@ class TestBatchInsertOperations:
 
         assert "must match" in exc_info.value.message
 
+    def test_insert_batch_with_missing_embeddings(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test a None embedding inserts that memory without a vector."""
+        memories = [
+            Memory(
+                id=f"test:{i}:0",
+                commit_sha=f"sha{i}",
+                namespace="learnings",
+                summary=f"Memory {i}",
+                content=f"Content {i}",
+                timestamp=datetime.now(UTC),
+            )
+            for i in range(2)
+        ]
+
+        count = index_service.insert_batch(memories, [[0.1] * 384, None])
+
+        assert count == 2
+        assert index_service.has_embedding("test:0:0")
+        assert not index_service.has_embedding("test:1:0")
+
+    def test_upsert_batch_inserts_and_updates(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+        sample_embedding: list[float],
+    ) -> None:
+        """Test upsert inserts new memories and updates existing ones."""
+        index_service.insert(sample_memory, embedding=sample_embedding)
+        with index_service._cursor() as cursor:
+            cursor.execute(
+                "SELECT created_at FROM memories WHERE id = ?", (sample_memory.id,)
+            )
+            created_at = cursor.fetchone()[0]
+
+        edited = Memory(
+            id=sample_memory.id,
+            commit_sha=sample_memory.commit_sha,
+            namespace="decisions",
+            summary="Edited summary",
+            content="Edited content",
+            timestamp=sample_memory.timestamp,
+        )
+        new = Memory(
+            id="decisions:new1234:0",
+            commit_sha="new1234",
+            namespace="decisions",
+            summary="New memory",
+            content="New content",
+            timestamp=datetime.now(UTC),
+        )
+
+        count = index_service.upsert_batch([edited, new], [None, [0.2] * 384])
+
+        assert count == 2
+        updated = index_service.get(sample_memory.id)
+        assert updated is not None
+        assert updated.summary == "Edited summary"
+        # None keeps the existing embedding, as update() does
+        assert index_service.has_embedding(sample_memory.id)
+        assert index_service.has_embedding(new.id)
+        assert index_service.count() == 2
+        with index_service._cursor() as cursor:
+            cursor.execute(
+                "SELECT created_at FROM memories WHERE id = ?", (sample_memory.id,)
+            )
+            assert cursor.fetchone()[0] == created_at
+
+    def test_upsert_batch_replaces_embedding(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test upsert with an embedding replaces the stored vector."""
+        index_service.insert(sample_memory, embedding=[1.0] + [0.0] * 383)
+
+        index_service.upsert_batch([sample_memory], [[0.0, 1.0] + [0.0] * 382])
+
+        results = index_service.search_vector([0.0, 1.0] + [0.0] * 382, k=1)
+        assert results[0][0].id == sample_memory.id
+        assert results[0][1] < 0.01
+
+
+# =============================================================================
+# Test: Bulk Load
+# =============================================================================
+
+
+class TestBulkLoad:
+    """Test grouping writes with bulk_load()."""
+
+    @staticmethod
+    def _memories(count: int) -> list[Memory]:
+        return [
+            Memory(
+                id=f"learnings:bulk{i}:0",
+                commit_sha=f"bulk{i}",
+                namespace="learnings",
+                summary=f"Memory {i}",
+                content="",
+                timestamp=datetime.now(UTC),
+            )
+            for i in range(count)
+        ]
+
+    def test_bulk_load_commits_once(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test writes in the block share one transaction."""
+        memories = self._memories(4)
+
+        with index_service.bulk_load():
+            index_service.insert_batch(memories[:2])
+            assert index_service._conn is not None
+            assert index_service._conn.in_transaction
+            index_service.insert_batch(memories[2:])
+            assert index_service._conn.in_transaction
+
+        assert not index_service._conn.in_transaction
+        assert index_service.count() == 4
+
+    def test_bulk_load_restores_pragmas(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test bulk pragmas apply only inside the block."""
+        conn = index_service._conn
+        assert conn is not None
+        before = (
+            conn.execute("PRAGMA cache_size").fetchone()[0],
+            conn.execute("PRAGMA temp_store").fetchone()[0],
+        )
+
+        with index_service.bulk_load():
+            assert conn.execute("PRAGMA cache_size").fetchone()[0] < 0
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+
+        after = (
+            conn.execute("PRAGMA cache_size").fetchone()[0],
+            conn.execute("PRAGMA temp_store").fetchone()[0],
+        )
+        assert after == before
+
+    def test_bulk_load_rolls_back_on_error(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test an exception in the block discards all of its writes."""
+        with pytest.raises(RuntimeError), index_service.bulk_load():
+            index_service.insert_batch(self._memories(3))
+            raise RuntimeError("boom")
+
+        assert index_service.count() == 0
+
+    def test_bulk_load_fails_if_a_write_failed(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test a swallowed write failure still rolls the block back."""
+        index_service.insert(sample_memory)
+
+        with pytest.raises(MemoryIndexError), index_service.bulk_load():
+            index_service.insert_batch(self._memories(2))
+            with pytest.raises(MemoryIndexError):
+                index_service.insert(sample_memory)  # duplicate id
+
+        assert index_service.count() == 1
+
+    def test_nested_bulk_load_joins_outer(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test a nested block commits with the outer one."""
+        memories = self._memories(2)
+
+        with index_service.bulk_load():
+            with index_service.bulk_load():
+                index_service.insert_batch(memories)
+            assert index_service._conn is not None
+            assert index_service._conn.in_transaction
+
+        assert index_service.count() == 2
+
 
 # =============================================================================
 # Test: Read Operations
@@ -1027,6 +1214,288 @@ class TestVectorSearch:
         # Identical vectors should have zero distance
         assert results[0][1] < 0.01
 
+    def test_search_vector_batch_matches_single_searches(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test batched KNN returns what search_vector returns per query."""
+        now = datetime.now(UTC)
+        for i, namespace in enumerate(["decisions", "learnings", "decisions"]):
+            index_service.insert(
+                Memory(
+                    id=f"{namespace}:sha{i}:0",
+                    commit_sha=f"sha{i}",
+                    namespace=namespace,
+                    summary=f"Memory {i}",
+                    content="Content",
+                    timestamp=now,
+                ),
+                [0.1 + 0.4 * i] * 384,
+            )
+
+        queries = [[0.1] * 384, [0.9] * 384, [0.5] * 384]
+        namespaces = [None, "decisions", "learnings"]
+        batch = index_service.search_vector_batch(queries, k=2, namespaces=namespaces)
+
+        assert len(batch) == 3
+        for query, namespace, results in zip(queries, namespaces, batch, strict=True):
+            expected = index_service.search_vector(query, k=2, namespace=namespace)
+            assert [(m.id, d) for m, d in results] == [(m.id, d) for m, d in expected]
+
+    def test_search_vector_batch_requires_aligned_namespaces(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test a namespace list of the wrong length is rejected."""
+        with pytest.raises(MemoryIndexError):
+            index_service.search_vector_batch(
+                [[0.1] * 384, [0.2] * 384], namespaces=["decisions"]
+            )
+
+    def test_selective_filter_returns_full_top_k(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Filtered KNN finds k matches even when all nearer vectors are filtered."""
+        now = datetime.now(UTC)
+        memories = []
+        embeddings = []
+        for i in range(60):
+            in_spec = i >= 55
+            memories.append(
+                Memory(
+                    id=f"learnings:{i}:0",
+                    commit_sha=f"sha{i}",
+                    namespace="learnings",
+                    summary=f"Memory {i}",
+                    content="Content",
+                    timestamp=now,
+                    spec="small-spec" if in_spec else "big-spec",
+                )
+            )
+            # The small spec's vectors are the farthest from the query
+            embeddings.append([1.0 if in_spec else 0.1] * 384)
+        index_service.insert_batch(memories, embeddings)
+
+        results = index_service.search_vector([0.0] * 384, k=5, spec="small-spec")
+
+        assert len(results) == 5
+        assert {m.spec for m, _ in results} == {"small-spec"}
+
+    def test_update_moves_filter_columns(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Changing namespace via update() is reflected in filtered KNN."""
+        index_service.insert(sample_memory, [0.5] * 384)
+        moved = Memory(
+            id=sample_memory.id,
+            commit_sha=sample_memory.commit_sha,
+            namespace="learnings",
+            summary=sample_memory.summary,
+            content=sample_memory.content,
+            timestamp=sample_memory.timestamp,
+        )
+        index_service.update(moved)
+
+        assert index_service.search_vector([0.5] * 384, namespace="decisions") == []
+        results = index_service.search_vector([0.5] * 384, namespace="learnings")
+        assert [m.id for m, _ in results] == [sample_memory.id]
+
+    def test_migration_copies_embeddings_into_filtered_table(
+        self,
+        db_path: Path,
+        sample_memory: Memory,
+    ) -> None:
+        """A v3 index keeps its embeddings and gains filter columns."""
+        import sqlite3
+
+        import sqlite_vec
+
+        service = IndexService(db_path)
+        service.initialize()
+        service.insert(sample_memory)
+        service.close()
+
+        # Recreate the pre-v4 vector table by hand
+        conn = sqlite3.connect(db_path)
+        conn.enable_load_extension(True)
+        sqlite_vec.load(conn)
+        conn.execute("DROP TABLE vec_memories")
+        conn.execute(
+            "CREATE VIRTUAL TABLE vec_memories USING vec0("
+            "id TEXT PRIMARY KEY, embedding FLOAT[384])"
+        )
+        conn.execute(
+            "INSERT INTO vec_memories (id, embedding) VALUES (?, ?)",
+            (sample_memory.id, sqlite_vec.serialize_float32([0.5] * 384)),
+        )
+        conn.execute("UPDATE metadata SET value = '3' WHERE key = 'schema_version'")
+        conn.commit()
+        conn.close()
+
+        upgraded = IndexService(db_path)
+        upgraded.initialize()
+        results = upgraded.search_vector(
+            [0.5] * 384, namespace=sample_memory.namespace, spec=sample_memory.spec
+        )
+        assert [m.id for m, _ in results] == [sample_memory.id]
+        upgraded.close()
+
+
+class TestQuantizedStorage:
+    """Test bit quantized vector storage with full-precision re-scoring."""
+
+    @staticmethod
+    def _unit_vectors(count: int, seed: int = 7) -> list[list[float]]:
+        import math
+        import random
+
+        rng = random.Random(seed)  # noqa: S311 - deterministic test data
+        vectors = []
+        for _ in range(count):
+            vec = [rng.gauss(0.0, 1.0) for _ in range(384)]
+            norm = math.sqrt(sum(x * x for x in vec))
+            vectors.append([x / norm for x in vec])
+        return vectors
+
+    @classmethod
+    def _populate(cls, service: IndexService, count: int = 40) -> list[list[float]]:
+        now = datetime.now(UTC)
+        vectors = cls._unit_vectors(count)
+        memories = [
+            Memory(
+                id=f"learnings:{i}:0",
+                commit_sha=f"sha{i}",
+                namespace="learnings" if i % 2 else "decisions",
+                summary=f"Memory {i}",
+                content="Content",
+                timestamp=now,
+            )
+            for i in range(len(vectors))
+        ]
+        service.insert_batch(memories, vectors)
+        return vectors
+
+    def test_rescored_results_match_float(self, tmp_path: Path) -> None:
+        """With the whole set in the shortlist, results equal exact search."""
+        exact = IndexService(tmp_path / "float.db", quantization="float")
+        exact.initialize()
+        quantized = IndexService(tmp_path / "bit.db", quantization="bit")
+        quantized.initialize()
+        query = self._populate(exact)[3]
+        self._populate(quantized)
+
+        for namespace in (None, "learnings"):
+            expected = exact.search_vector(query, k=5, namespace=namespace)
+            actual = quantized.search_vector(query, k=5, namespace=namespace)
+            assert [m.id for m, _ in actual] == [m.id for m, _ in expected]
+            for (_, d_actual), (_, d_expected) in zip(actual, expected, strict=True):
+                assert d_actual == pytest.approx(d_expected, abs=1e-5)
+
+        hybrid = quantized.search_hybrid("Memory", query, k=3)
+        assert hybrid[0][0].id == "learnings:3:0"
+        exact.close()
+        quantized.close()
+
+    def test_mode_switch_converts_existing_index(self, db_path: Path) -> None:
+        """Reopening with another mode converts vectors without losing precision."""
+        service = IndexService(db_path, quantization="float")
+        service.initialize()
+        query = self._populate(service)[5]
+        expected = service.search_vector(query, k=5)
+        service.close()
+
+        for mode in ("bit", "float"):
+            reopened = IndexService(db_path, quantization=mode)
+            reopened.initialize()
+            cursor = reopened._conn.cursor()
+            cursor.execute(
+                "SELECT value FROM metadata WHERE key = 'vector_quantization'"
+            )
+            assert cursor.fetchone()[0] == mode
+            assert reopened.has_embedding("learnings:1:0")
+            assert reopened.search_vector(query, k=5) == expected
+            reopened.close()
+
+    def test_legacy_int8_index_is_converted(self, db_path: Path) -> None:
+        """Indexes built in the dropped int8 mode convert without loss."""
+        service = IndexService(db_path, quantization="float")
+        service.initialize()
+        query = self._populate(service)[5]
+        expected = service.search_vector(query, k=5)
+        # Rebuild the vector table the way the int8 mode stored it
+        service.quantization = "int8"
+        cursor = service._conn.cursor()
+        service._apply_quantization(cursor)
+        service._conn.commit()
+        service.close()
+
+        for mode in ("bit", "float"):
+            reopened = IndexService(db_path, quantization=mode)
+            reopened.initialize()
+            assert reopened.search_vector(query, k=5) == expected
+            reopened.close()
+
+    def test_int8_mode_is_rejected(self, db_path: Path) -> None:
+        """int8 storage is no longer offered."""
+        with pytest.raises(MemoryIndexError, match="quantization"):
+            IndexService(db_path, quantization="int8")
+
+    @pytest.mark.parametrize("mode", ["float", "bit"])
+    def test_large_k_stays_under_knn_limit(self, db_path: Path, mode: str) -> None:
+        """k values past sqlite-vec's KNN limit fall back to an exact scan."""
+        service = IndexService(db_path, quantization=mode)
+        service.initialize()
+        vectors = self._populate(service, count=100)
+        query = vectors[7]
+
+        for k in (600, 4096, 5000):
+            results = service.search_vector(query, k=k)
+            assert len(results) == 100
+            assert results[0][0].id == "learnings:7:0"
+            distances = [d for _, d in results]
+            assert distances == sorted(distances)
+            filtered = service.search_vector(query, k=k, namespace="learnings")
+            assert len(filtered) == 50
+            assert all(m.namespace == "learnings" for m, _ in filtered)
+
+        hybrid = service.search_hybrid("Memory", query, k=2000)
+        assert len(hybrid) == 100
+        distances = {m.id: distance for m, _, distance, _ in hybrid}
+        assert distances["learnings:7:0"] == pytest.approx(0.0, abs=1e-5)
+        service.close()
+
+    def test_delete_and_update_in_quantized_mode(self, db_path: Path) -> None:
+        """Write paths keep the quantized table consistent."""
+        service = IndexService(db_path, quantization="bit")
+        service.initialize()
+        vectors = self._populate(service)
+
+        assert service.delete("learnings:3:0") is True
+        assert not service.has_embedding("learnings:3:0")
+        assert service.update_embedding("learnings:1:0", vectors[3]) is True
+
+        results = service.search_vector(vectors[3], k=1)
+        assert results[0][0].id == "learnings:1:0"
+        assert results[0][1] == pytest.approx(0.0, abs=1e-5)
+        service.close()
+
+    def test_unknown_mode_raises(self, db_path: Path) -> None:
+        """An unsupported quantization mode is rejected up front."""
+        with pytest.raises(MemoryIndexError, match="quantization"):
+            IndexService(db_path, quantization="float16")
+
+    def test_mode_from_environment(
+        self, db_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The default mode comes from MEMORY_PLUGIN_VECTOR_QUANTIZATION."""
+        monkeypatch.setenv("MEMORY_PLUGIN_VECTOR_QUANTIZATION", "BIT")
+        assert IndexService(db_path).quantization == "bit"
+        monkeypatch.setenv("MEMORY_PLUGIN_VECTOR_QUANTIZATION", "bogus")
+        assert IndexService(db_path).quantization == "float"
+
 
 class TestTextSearch:
     """Test text-based search."""
@@ -1131,6 +1600,208 @@ class TestTextSearch:
         assert len(results) == 1
 
 
+class TestFullTextSearch:
+    """Test FTS5-backed text search: ranking, syntax, snippets and sync."""
+
+    @pytest.fixture
+    def populated(self, index_service: IndexService) -> IndexService:
+        now = datetime.now(UTC)
+        index_service.insert_batch(
+            [
+                Memory(
+                    id="decisions:a:0",
+                    commit_sha="a",
+                    namespace="decisions",
+                    summary="Use connection pooling",
+                    content="The database driver opens a pool of connections.",
+                    timestamp=now,
+                ),
+                Memory(
+                    id="decisions:b:0",
+                    commit_sha="b",
+                    namespace="decisions",
+                    summary="Database migrations",
+                    content="Run database migrations on deploy. The database "
+                    "schema is versioned.",
+                    timestamp=now,
+                ),
+                Memory(
+                    id="learnings:c:0",
+                    commit_sha="c",
+                    namespace="learnings",
+                    summary="Authentication tokens",
+                    content="Tokens expire after one hour.",
+                    timestamp=now,
+                ),
+            ]
+        )
+        return index_service
+
+    def test_bm25_ranks_best_match_first(self, populated: IndexService) -> None:
+        results = populated.search_text("database")
+        assert [m.id for m in results] == ["decisions:b:0", "decisions:a:0"]
+
+    def test_phrase_query(self, populated: IndexService) -> None:
+        results = populated.search_text('"database migrations"')
+        assert [m.id for m in results] == ["decisions:b:0"]
+
+    def test_prefix_query(self, populated: IndexService) -> None:
+        assert populated.search_text("auth") == []
+        results = populated.search_text("auth*")
+        assert [m.id for m in results] == ["learnings:c:0"]
+
+    def test_terms_are_anded(self, populated: IndexService) -> None:
+        results = populated.search_text("database pool")
+        assert [m.id for m in results] == ["decisions:a:0"]
+
+    def test_ranked_returns_scores_and_snippets(self, populated: IndexService) -> None:
+        results = populated.search_text_ranked("tokens")
+        assert len(results) == 1
+        memory, score, snippet = results[0]
+        assert memory.id == "learnings:c:0"
+        assert score < 0  # SQLite bm25: lower is better
+        assert "[tokens]" in snippet
+
+    def test_operators_in_input_are_literal(self, populated: IndexService) -> None:
+        # Would be a syntax error or column filter if passed through raw
+        assert populated.search_text("summary: OR NOT (") == []
+        assert populated.search_text("***") == []
+
+    def test_index_follows_update_and_delete(self, populated: IndexService) -> None:
+        memory = populated.get("learnings:c:0")
+        assert memory is not None
+        updated = Memory(
+            id=memory.id,
+            commit_sha=memory.commit_sha,
+            namespace=memory.namespace,
+            summary="Session cookies",
+            content="Cookies are rotated daily.",
+            timestamp=memory.timestamp,
+        )
+        populated.update(updated)
+        assert populated.search_text("tokens") == []
+        assert [m.id for m in populated.search_text("cookies")] == ["learnings:c:0"]
+
+        populated.delete("learnings:c:0")
+        assert populated.search_text("cookies") == []
+
+        populated.clear()
+        assert populated.search_text("database") == []
+
+    def test_vacuum_keeps_index_consistent(self, populated: IndexService) -> None:
+        populated.delete("decisions:a:0")
+        populated.vacuum()
+        results = populated.search_text("database")
+        assert [m.id for m in results] == ["decisions:b:0"]
+
+    def test_migration_backfills_existing_rows(self, db_path: Path) -> None:
+        """A v2 database gains a populated FTS index on upgrade."""
+        service = IndexService(db_path)
+        service.initialize()
+        service.insert(
+            Memory(
+                id="decisions:x:0",
+                commit_sha="x",
+                namespace="decisions",
+                summary="Legacy memory",
+                content="Stored before full-text search existed",
+                timestamp=datetime.now(UTC),
+            )
+        )
+        conn = service._conn
+        assert conn is not None
+        conn.execute("DROP TABLE memories_fts")
+        for name in ("memories_fts_ai", "memories_fts_ad", "memories_fts_au"):
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("UPDATE metadata SET value = '2' WHERE key = 'schema_version'")
+        conn.commit()
+        service.close()
+
+        upgraded = IndexService(db_path)
+        upgraded.initialize()
+        results = upgraded.search_text("legacy")
+        assert [m.id for m in results] == ["decisions:x:0"]
+        upgraded.close()
+
+
+class TestHybridSearch:
+    """Test fused BM25 + vector search."""
+
+    @staticmethod
+    def _unit(axis: int) -> list[float]:
+        vec = [0.0] * 384
+        vec[axis] = 1.0
+        return vec
+
+    @pytest.fixture
+    def populated(self, index_service: IndexService) -> IndexService:
+        now = datetime.now(UTC)
+        rows = [
+            ("decisions:a:0", "decisions", "Retry policy", "Back off on errors", 0),
+            ("decisions:b:0", "decisions", "Timeouts", "Raise ERR_DB_LOCKED", 1),
+            ("learnings:c:0", "learnings", "Locking", "SQLite ERR_DB_LOCKED", 2),
+        ]
+        memories = [
+            Memory(
+                id=mid,
+                commit_sha=mid.split(":")[1],
+                namespace=ns,
+                summary=summary,
+                content=content,
+                timestamp=now,
+            )
+            for mid, ns, summary, content, _ in rows
+        ]
+        index_service.insert_batch(memories, [self._unit(r[4]) for r in rows])
+        return index_service
+
+    def test_text_leg_surfaces_exact_identifier(self, populated: IndexService) -> None:
+        """A keyword hit is fused in even when its vector is far away."""
+        results = populated.search_hybrid("ERR_DB_LOCKED", self._unit(0), k=3)
+        ids = [m.id for m, _, _, _ in results]
+        assert set(ids) == {"decisions:a:0", "decisions:b:0", "learnings:c:0"}
+        # Memories found by both legs outrank the vector-only hit
+        assert ids[-1] == "decisions:a:0"
+        scores = [score for _, score, _, _ in results]
+        assert scores == sorted(scores, reverse=True)
+        lexical = {m.id: hit for m, _, _, hit in results}
+        assert lexical == {
+            "decisions:a:0": False,
+            "decisions:b:0": True,
+            "learnings:c:0": True,
+        }
+
+    def test_returns_exact_vector_distance(self, populated: IndexService) -> None:
+        results = populated.search_hybrid("ERR_DB_LOCKED", self._unit(1), k=3)
+        distances = {m.id: d for m, _, d, _ in results}
+        assert distances["decisions:b:0"] == pytest.approx(0.0)
+        assert distances["learnings:c:0"] == pytest.approx(2**0.5)
+
+    def test_filters_apply_to_both_legs(self, populated: IndexService) -> None:
+        results = populated.search_hybrid(
+            "ERR_DB_LOCKED", self._unit(2), k=3, namespace="decisions"
+        )
+        assert {m.id for m, _, _, _ in results} == {"decisions:a:0", "decisions:b:0"}
+
+    def test_partial_term_match_not_lexical(self, populated: IndexService) -> None:
+        """Sharing one OR-ed term fuses a memory in but is not a full match."""
+        results = populated.search_hybrid("retry ERR_DB_LOCKED", self._unit(2), k=3)
+        lexical = {m.id: hit for m, _, _, hit in results}
+        assert lexical == {
+            "decisions:a:0": False,
+            "decisions:b:0": False,
+            "learnings:c:0": False,
+        }
+        results = populated.search_hybrid("sqlite err_db_locked", self._unit(0), k=3)
+        lexical = {m.id: hit for m, _, _, hit in results}
+        assert lexical["learnings:c:0"] is True
+        assert lexical["decisions:b:0"] is False
+
+    def test_query_without_terms_uses_vector_leg(self, populated: IndexService) -> None:
+        results = populated.search_hybrid("???", self._unit(0), k=1)
+        assert [m.id for m, _, _, _ in results] == ["decisions:a:0"]
+
+
 # =============================================================================
 # Test: Statistics Operations
 # =============================================================================
@@ -1270,6 +1941,218 @@ class TestStatisticsOperations:
         assert index_service.count(namespace="learnings", spec="project-a") == 1
 
 
+# =============================================================================
+# Test: Deferred Indexing Queue
+# =============================================================================
+
+
+class TestIndexQueue:
+    """Test the deferred-indexing queue."""
+
+    def test_enqueue_round_trips_memory(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test a queued memory comes back intact and is not yet indexed."""
+        index_service.enqueue(sample_memory)
+
+        assert index_service.get_queued(10) == [sample_memory]
+        assert index_service.get(sample_memory.id) is None
+
+    def test_get_queued_in_capture_order(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test queued memories are drained oldest first, up to the limit."""
+        for i in range(3):
+            index_service.enqueue(
+                Memory(
+                    id=f"learnings:sha:{i}",
+                    commit_sha="sha",
+                    namespace="learnings",
+                    summary=f"Learning {i}",
+                    content="",
+                    timestamp=datetime.now(UTC),
+                )
+            )
+
+        queued = index_service.get_queued(2)
+
+        assert [m.id for m in queued] == ["learnings:sha:0", "learnings:sha:1"]
+
+    def test_dequeue_batch(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test dequeued memories leave the queue."""
+        index_service.enqueue(sample_memory)
+
+        assert index_service.dequeue_batch([sample_memory.id]) == 1
+        assert index_service.get_queued(10) == []
+
+    def test_dequeue_rolls_back_with_bulk_load(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test a failed drain transaction keeps the memory queued."""
+        index_service.enqueue(sample_memory)
+
+        with pytest.raises(RuntimeError), index_service.bulk_load():
+            index_service.upsert_batch([sample_memory])
+            index_service.dequeue_batch([sample_memory.id])
+            raise RuntimeError("embedding write failed")
+
+        assert index_service.get_queued(10) == [sample_memory]
+        assert index_service.get(sample_memory.id) is None
+
+    def test_failures_exhaust_attempts(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test memories that keep failing stop being drained."""
+        index_service.enqueue(sample_memory)
+
+        with patch("git_notes_memory.index.INDEX_QUEUE_MAX_ATTEMPTS", 2):
+            index_service.record_queue_failure([sample_memory.id], "disk full")
+            assert index_service.get_queued(10) == [sample_memory]
+            stats = index_service.get_stats()
+            assert (stats.queue_pending, stats.queue_failed) == (1, 0)
+
+            index_service.record_queue_failure([sample_memory.id], "disk full")
+            assert index_service.get_queued(10) == []
+            stats = index_service.get_stats()
+            assert (stats.queue_pending, stats.queue_failed) == (0, 1)
+
+    def test_enqueue_resets_attempts(
+        self,
+        index_service: IndexService,
+        sample_memory: Memory,
+    ) -> None:
+        """Test re-queueing a memory makes it drainable again."""
+        index_service.enqueue(sample_memory)
+        with patch("git_notes_memory.index.INDEX_QUEUE_MAX_ATTEMPTS", 1):
+            index_service.record_queue_failure([sample_memory.id], "error")
+            index_service.enqueue(sample_memory)
+
+            assert index_service.get_queued(10) == [sample_memory]
+
+
+class TestNoteCounts:
+    """Test note record count bookkeeping."""
+
+    def test_unknown_note(self, index_service: IndexService) -> None:
+        """Test a note that was never counted has no entry."""
+        assert index_service.get_note_count("decisions", "sha") is None
+
+    def test_set_replaces_count(self, index_service: IndexService) -> None:
+        """Test the latest count and note OID replace the previous ones."""
+        index_service.set_note_count("decisions", "sha", "oid1", 1)
+        index_service.set_note_count("decisions", "sha", "oid2", 3)
+        index_service.set_note_count("learnings", "sha", "oid3", 1)
+
+        assert index_service.get_note_count("decisions", "sha") == ("oid2", 3)
+        assert index_service.get_note_count("learnings", "sha") == ("oid3", 1)
+
+
+class TestNamespaceVersions:
+    """Test the per-namespace write counters."""
+
+    def test_writes_bump_their_namespace(
+        self, index_service: IndexService, sample_memory: Memory
+    ) -> None:
+        """Test insert, update and delete each bump only the memory's namespace."""
+        from dataclasses import replace
+
+        assert index_service.get_namespace_versions() == {}
+        index_service.insert(sample_memory)
+        index_service.update(replace(sample_memory, summary="Changed"))
+        assert index_service.get_namespace_versions() == {"decisions": 2}
+
+        index_service.delete(sample_memory.id)
+        index_service.insert_batch(
+            [replace(sample_memory, id="learnings:abc123:0", namespace="learnings")]
+        )
+        assert index_service.get_namespace_versions() == {
+            "decisions": 3,
+            "learnings": 1,
+        }
+
+
+class TestMemoryIds:
+    """Test legacy ID resolution and the schema v8 ID migration."""
+
+    SHA = "abc1234" + "0" * 33
+
+    def _memory(self, memory_id: str, summary: str = "Legacy") -> Memory:
+        return Memory(
+            id=memory_id,
+            commit_sha=self.SHA,
+            namespace="decisions",
+            summary=summary,
+            content="Indexed by an older sync",
+            timestamp=datetime(2024, 1, 15, tzinfo=UTC),
+        )
+
+    @staticmethod
+    def _downgrade(db_path: Path) -> None:
+        import sqlite3
+
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE metadata SET value = '7' WHERE key = 'schema_version'")
+        conn.commit()
+        conn.close()
+
+    def test_resolve_abbreviated_id(self, index_service: IndexService) -> None:
+        """Test an abbreviated commit resolves to the indexed memory."""
+        canonical = f"decisions:{self.SHA}:0"
+        index_service.insert(self._memory(canonical))
+
+        assert index_service.resolve_id("decisions:abc1234:0") == canonical
+        assert index_service.resolve_id("learnings:abc1234:0") == (
+            "learnings:abc1234:0"
+        )
+        assert index_service.get("decisions:abc1234:0").id == canonical
+        assert [m.id for m in index_service.get_batch(["decisions:abc1234:0"])] == [
+            canonical
+        ]
+        assert index_service.delete("decisions:abc1234:0") is True
+        assert not index_service.exists(canonical)
+
+    @pytest.mark.parametrize("mode", ["float", "bit"])
+    def test_migration_rewrites_ids_in_place(self, db_path: Path, mode: str) -> None:
+        """Test short IDs are re-keyed and duplicates dropped without re-embedding."""
+        service = IndexService(db_path, quantization=mode)
+        service.initialize()
+        service.insert(self._memory("decisions:abc1234:0"), embedding=[0.5] * 384)
+        service.insert(self._memory("decisions:abc1234:1"), embedding=[0.1] * 384)
+        service.insert(self._memory(f"decisions:{self.SHA}:1", summary="Captured"))
+        service.enqueue(self._memory("decisions:abc1234:2"))
+        service.close()
+        self._downgrade(db_path)
+
+        upgraded = IndexService(db_path, quantization=mode)
+        upgraded.initialize()
+
+        assert sorted(upgraded.get_all_ids()) == [
+            f"decisions:{self.SHA}:0",
+            f"decisions:{self.SHA}:1",
+        ]
+        # The capture-side row wins; the duplicate's vector fills its gap
+        assert upgraded.get(f"decisions:{self.SHA}:1").summary == "Captured"
+        assert upgraded.has_embedding(f"decisions:{self.SHA}:1")
+        assert not upgraded.has_embedding("decisions:abc1234:1")
+        results = upgraded.search_vector([0.5] * 384, k=1)
+        assert results[0][0].id == f"decisions:{self.SHA}:0"
+        assert results[0][1] == pytest.approx(0.0, abs=1e-5)
+        assert upgraded.search_text("Legacy")[0].id == f"decisions:{self.SHA}:0"
+        assert [m.id for m in upgraded.get_queued(10)] == [f"decisions:{self.SHA}:2"]
+        upgraded.close()
+
+
 # =============================================================================
 # Test: Utility Operations
 # =============================================================================
@@ -1372,6 +2255,23 @@ class TestUtilityOperations:
         assert updated_stats.last_sync is not None
         assert updated_stats.last_sync > initial_sync
 
+    def test_indexed_notes_ref(
+        self,
+        index_service: IndexService,
+    ) -> None:
+        """Test notes refs are recorded per namespace and reset by clear."""
+        assert index_service.get_indexed_notes_ref("decisions") is None
+
+        index_service.set_indexed_notes_ref("decisions", "a" * 40)
+        index_service.set_indexed_notes_ref("decisions", "b" * 40)
+        index_service.set_indexed_notes_ref("learnings", "c" * 40)
+        assert index_service.get_indexed_notes_ref("decisions") == "b" * 40
+        assert index_service.get_indexed_notes_ref("learnings") == "c" * 40
+
+        index_service.clear()
+        assert index_service.get_indexed_notes_ref("decisions") is None
+        assert index_service.get_stats().total_memories == 0
+
     def test_vacuum(
         self,
         index_service: IndexService,
@@ -0,0 +1,167 @@
+"""Tests for the ONNX Runtime embedding backend.
+
+The unit tests drive OnnxEmbeddingModel with a fake session and tokenizer,
+so they run without the optional onnx extra. The equivalence test against
+the torch backend needs both backends and network access and is marked slow.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from git_notes_memory.onnx_embedding import (
+    OnnxEmbeddingModel,
+    default_onnx_model_file,
+)
+
+# =============================================================================
+# Fakes
+# =============================================================================
+
+
+@dataclass
+class FakeEncoding:
+    ids: list[int]
+    attention_mask: list[int]
+    type_ids: list[int] = field(default_factory=list)
+
+
+class FakeTokenizer:
+    """Tokenizes on whitespace into word lengths, padding to the longest text."""
+
+    def encode_batch(self, texts: list[str]) -> list[FakeEncoding]:
+        tokens = [[len(word) for word in text.split()] for text in texts]
+        width = max(len(t) for t in tokens)
+        return [
+            FakeEncoding(
+                ids=t + [0] * (width - len(t)),
+                attention_mask=[1] * len(t) + [0] * (width - len(t)),
+                type_ids=[0] * width,
+            )
+            for t in tokens
+        ]
+
+
+@dataclass
+class FakeInput:
+    name: str
+
+
+class FakeSession:
+    """Emits token embeddings [id, 1, 0] so pooling results are predictable."""
+
+    def __init__(self, inputs: tuple[str, ...]) -> None:
+        self._inputs = inputs
+        self.feeds: list[dict[str, Any]] = []
+
+    def get_inputs(self) -> list[FakeInput]:
+        return [FakeInput(name) for name in self._inputs]
+
+    def run(self, _outputs: Any, feeds: dict[str, Any]) -> list[Any]:
+        self.feeds.append(feeds)
+        ids = feeds["input_ids"].astype(np.float32)
+        # Padding tokens get a large value that must not leak into the mean
+        first = np.where(feeds["attention_mask"] == 1, ids, 1000.0)
+        return [np.stack([first, np.ones_like(ids), np.zeros_like(ids)], axis=-1)]
+
+
+@pytest.fixture
+def session() -> FakeSession:
+    return FakeSession(("input_ids", "attention_mask", "token_type_ids"))
+
+
+@pytest.fixture
+def model(session: FakeSession) -> OnnxEmbeddingModel:
+    return OnnxEmbeddingModel(session, FakeTokenizer(), dimensions=3)
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestOnnxEmbeddingModel:
+    """Tests for pooling, normalization and batching."""
+
+    def test_mean_pooling_ignores_padding(self, model: OnnxEmbeddingModel) -> None:
+        result = model.encode(["ab abcd", "abcdef"], normalize_embeddings=False)
+
+        assert result.shape == (2, 3)
+        np.testing.assert_allclose(result[0], [3.0, 1.0, 0.0])
+        np.testing.assert_allclose(result[1], [6.0, 1.0, 0.0])
+
+    def test_single_text_returns_normalized_vector(
+        self, model: OnnxEmbeddingModel
+    ) -> None:
+        result = model.encode("abc")
+
+        assert result.shape == (3,)
+        assert result.dtype == np.float32
+        assert np.linalg.norm(result) == pytest.approx(1.0)
+
+    def test_batches_by_batch_size(
+        self, model: OnnxEmbeddingModel, session: FakeSession
+    ) -> None:
+        result = model.encode(["a", "bb", "ccc"], batch_size=2)
+
+        assert result.shape == (3, 3)
+        assert len(session.feeds) == 2
+
+    def test_feeds_only_declared_inputs(self) -> None:
+        session = FakeSession(("input_ids", "attention_mask"))
+        model = OnnxEmbeddingModel(session, FakeTokenizer(), dimensions=3)
+
+        model.encode(["a b"])
+
+        assert set(session.feeds[0]) == {"input_ids", "attention_mask"}
+        assert session.feeds[0]["input_ids"].dtype == np.int64
+
+    def test_empty_batch(self, model: OnnxEmbeddingModel) -> None:
+        assert model.encode([]).shape == (0, 3)
+        assert model.get_sentence_embedding_dimension() == 3
+
+    @pytest.mark.parametrize(
+        ("machine", "expected"),
+        [
+            ("x86_64", "onnx/model_quint8_avx2.onnx"),
+            ("aarch64", "onnx/model_qint8_arm64.onnx"),
+            ("arm64", "onnx/model_qint8_arm64.onnx"),
+        ],
+    )
+    def test_default_model_file_per_architecture(
+        self, machine: str, expected: str
+    ) -> None:
+        with patch("platform.machine", return_value=machine):
+            assert default_onnx_model_file() == expected
+
+
+@pytest.mark.slow
+class TestOnnxTorchEquivalence:
+    """The quantized ONNX backend must agree with the torch backend."""
+
+    def test_embeddings_match_torch_within_tolerance(self, tmp_path: Path) -> None:
+        pytest.importorskip("onnxruntime")
+        pytest.importorskip("sentence_transformers")
+        from git_notes_memory.embedding import EmbeddingService
+
+        texts = [
+            "Use PostgreSQL for the primary datastore",
+            "The deploy failed because the migration timed out",
+            "short",
+        ]
+        torch_vectors = EmbeddingService(
+            cache_dir=tmp_path, backend="torch"
+        ).embed_batch(texts)
+        onnx_vectors = EmbeddingService(cache_dir=tmp_path, backend="onnx").embed_batch(
+            texts
+        )
+
+        for torch_vec, onnx_vec in zip(torch_vectors, onnx_vectors, strict=True):
+            cosine = float(np.dot(torch_vec, onnx_vec))
+            assert cosine > 0.99
@@ -14,7 +14,8 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass
 from io import StringIO
-from typing import TYPE_CHECKING
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -25,6 +26,7 @@ from git_notes_memory.hooks.post_tool_use_handler import (
     TRIGGERING_TOOLS,
     _auto_capture_signals,
     _detect_signals,
+    _drain_index_queue,
     _extract_content,
     _extract_file_path,
     _format_memories_xml,
@@ -73,6 +75,7 @@ def mock_hook_config() -> MagicMock:
     config.post_tool_use_timeout = 5
     config.post_tool_use_auto_capture = True
     config.post_tool_use_auto_capture_min_confidence = 0.8
+    config.post_tool_use_drain_limit = 0
     return config
 
 
@@ -248,7 +251,7 @@ class TestSearchRelatedMemories:
     def test_successful_search(self, sample_memories: list[MockMemoryResult]) -> None:
         """Test successful memory search."""
         mock_recall = MagicMock()
-        mock_recall.search.return_value = sample_memories
+        mock_recall.search_hybrid.return_value = sample_memories
 
         with patch(
             "git_notes_memory.recall.get_default_service",
@@ -261,7 +264,7 @@ class TestSearchRelatedMemories:
             )
 
         assert len(results) == 2
-        mock_recall.search.assert_called_once_with(
+        mock_recall.search_hybrid.assert_called_once_with(
             query="auth jwt",
             k=3,
             min_similarity=0.6,
@@ -284,7 +287,7 @@ class TestSearchRelatedMemories:
     def test_exception_returns_empty(self) -> None:
         """Test that other exceptions return empty list."""
         mock_recall = MagicMock()
-        mock_recall.search.side_effect = RuntimeError("Search failed")
+        mock_recall.search_hybrid.side_effect = RuntimeError("Search failed")
 
         with patch(
             "git_notes_memory.recall.get_default_service",
@@ -328,10 +331,18 @@ class TestFormatMemoriesXml:
     ) -> None:
         """Test that similarity score is included."""
         xml = _format_memories_xml(sample_memories, "/path/file.py")
-        # distance=0.2 -> similarity=0.8
-        assert 'similarity="0.80"' in xml
-        # distance=0.3 -> similarity=0.7
-        assert 'similarity="0.70"' in xml
+        # distance=0.2 -> similarity=1/1.2
+        assert 'similarity="0.83"' in xml
+        # distance=0.3 -> similarity=1/1.3
+        assert 'similarity="0.77"' in xml
+
+    def test_similarity_never_negative(
+        self, sample_memories: list[MockMemoryResult]
+    ) -> None:
+        """A distant keyword match is not rendered with a negative similarity."""
+        far = MockMemoryResult(memory=sample_memories[0].memory, distance=1.408)
+        xml = _format_memories_xml([far], "/path/file.py")
+        assert 'similarity="0.42"' in xml
 
     def test_includes_tags(self, sample_memories: list[MockMemoryResult]) -> None:
         """Test that tags are included."""
@@ -502,7 +513,7 @@ class TestMain:
     ) -> None:
         """Test that Read tool triggers the hook and injects memories."""
         mock_recall = MagicMock()
-        mock_recall.search.return_value = sample_memories
+        mock_recall.search_hybrid.return_value = sample_memories
 
         input_data = json.dumps(sample_read_input)
 
@@ -561,7 +572,7 @@ class TestMain:
     ) -> None:
         """Test successful memory context injection."""
         mock_recall = MagicMock()
-        mock_recall.search.return_value = sample_memories
+        mock_recall.search_hybrid.return_value = sample_memories
 
         input_data = json.dumps(sample_write_input)
 
@@ -594,7 +605,7 @@ class TestMain:
     ) -> None:
         """Test when no related memories are found."""
         mock_recall = MagicMock()
-        mock_recall.search.return_value = []
+        mock_recall.search_hybrid.return_value = []
 
         input_data = json.dumps(sample_write_input)
 
@@ -802,6 +813,89 @@ class TestAutoCapture:
         assert result[0]["namespace"] == "decisions"
 
 
+class TestDrainIndexQueue:
+    """Tests for indexing deferred captures from PostToolUse."""
+
+    def test_deferred_capture_becomes_searchable(
+        self,
+        git_repo: Path,
+        isolated_env: Path,
+        mock_embedding_service: Any,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test a deferred capture is indexed without the Stop hook's sync."""
+        from git_notes_memory.capture import CaptureService
+        from git_notes_memory.config import get_project_index_path
+        from git_notes_memory.index import IndexService
+        from git_notes_memory.sync import SyncService
+
+        monkeypatch.chdir(git_repo)
+        index = IndexService(get_project_index_path(git_repo))
+        index.initialize()
+        capture = CaptureService(repo_path=git_repo, index_service=index)
+        result = capture.capture(
+            namespace="decisions",
+            summary="Use SQLite for the index",
+            content="Embedded, no server to run.",
+            defer_index=True,
+        )
+        assert result.queued is True
+        assert result.memory is not None
+        assert not index.exists(result.memory.id)
+
+        sync = SyncService(
+            repo_path=git_repo,
+            index=index,
+            embedding_service=mock_embedding_service,
+        )
+        with patch("git_notes_memory.sync.get_sync_service", return_value=sync):
+            assert _drain_index_queue(10) == 1
+
+        query = mock_embedding_service.embed(
+            "Use SQLite for the index\nEmbedded, no server to run."
+        )
+        hits = index.search_vector(query, k=1)
+        assert [memory.id for memory, _ in hits] == [result.memory.id]
+        assert index.get_stats().queue_pending == 0
+        index.close()
+
+    def test_drain_disabled_by_zero_limit(self) -> None:
+        """Test a zero limit leaves the queue alone."""
+        with patch("git_notes_memory.sync.get_sync_service") as get_sync:
+            assert _drain_index_queue(0) == 0
+        get_sync.assert_not_called()
+
+    def test_main_drains_with_configured_limit(
+        self,
+        mock_hook_config: MagicMock,
+        sample_read_input: dict,
+    ) -> None:
+        """Test every triggering tool use drains up to the configured limit."""
+        mock_hook_config.post_tool_use_drain_limit = 7
+        mock_recall = MagicMock()
+        mock_recall.search_hybrid.return_value = []
+
+        with (
+            patch(
+                "git_notes_memory.hooks.post_tool_use_handler.load_hook_config",
+                return_value=mock_hook_config,
+            ),
+            patch("sys.stdin", StringIO(json.dumps(sample_read_input))),
+            patch(
+                "git_notes_memory.hooks.post_tool_use_handler._drain_index_queue",
+                return_value=0,
+            ) as drain,
+            patch(
+                "git_notes_memory.recall.get_default_service",
+                return_value=mock_recall,
+            ),
+            pytest.raises(SystemExit),
+        ):
+            main()
+
+        drain.assert_called_once_with(7)
+
+
 class TestWriteOutputWithCapture:
     """Tests for _write_output with capture data."""
 
@@ -23,7 +23,7 @@ from git_notes_memory.hooks.hook_utils import read_json_input
 from git_notes_memory.hooks.models import CaptureSignal, SignalType
 from git_notes_memory.hooks.pre_compact_handler import (
     DEFAULT_TIMEOUT,
-    _capture_memory,
+    _capture_memories,
     _extract_summary,
     _report_captures,
     _report_suggestions,
@@ -215,37 +215,61 @@ class TestExtractSummary:
 # =============================================================================
 
 
-class TestCaptureMemory:
-    """Test _capture_memory function."""
+class TestCaptureMemories:
+    """Test _capture_memories function."""
 
     def test_successful_capture(self, sample_signal: CaptureSignal) -> None:
         """Test successful memory capture."""
         mock_capture = MagicMock()
         mock_memory = MockMemory(id="decisions:abc123:0", summary="Test summary")
         mock_result = MockCaptureResult(success=True, memory=mock_memory)
-        mock_capture.capture.return_value = mock_result
+        mock_capture.capture_batch.return_value = [mock_result]
 
         with patch(
             "git_notes_memory.capture.get_default_service",
             return_value=mock_capture,
         ):
-            result = _capture_memory(sample_signal, "decisions")
+            (result,) = _capture_memories([sample_signal])
 
         assert result["success"] is True
         assert result["memory_id"] == "decisions:abc123:0"
         assert result["summary"] == "Test summary"
+        (requests,) = mock_capture.capture_batch.call_args.args
+        assert requests[0].namespace == sample_signal.suggested_namespace
+        assert requests[0].tags == ("auto-captured", "pre-compact")
+
+    def test_captures_all_signals_in_one_batch(
+        self, sample_signals: list[CaptureSignal]
+    ) -> None:
+        """Test every signal goes into a single capture_batch call."""
+        mock_capture = MagicMock()
+        mock_capture.capture_batch.side_effect = lambda requests: [
+            MockCaptureResult(success=True, memory=MockMemory(id=f"x:{i}", summary="s"))
+            for i in range(len(requests))
+        ]
+
+        with patch(
+            "git_notes_memory.capture.get_default_service",
+            return_value=mock_capture,
+        ):
+            results = _capture_memories(sample_signals)
+
+        mock_capture.capture_batch.assert_called_once()
+        mock_capture.capture.assert_not_called()
+        assert len(results) == len(sample_signals)
+        assert all(r["success"] for r in results)
 
     def test_capture_failure(self, sample_signal: CaptureSignal) -> None:
         """Test capture failure handling."""
         mock_capture = MagicMock()
         mock_result = MockCaptureResult(success=False, warning="Duplicate content")
-        mock_capture.capture.return_value = mock_result
+        mock_capture.capture_batch.return_value = [mock_result]
 
         with patch(
             "git_notes_memory.capture.get_default_service",
             return_value=mock_capture,
         ):
-            result = _capture_memory(sample_signal, "decisions")
+            (result,) = _capture_memories([sample_signal])
 
         assert result["success"] is False
         assert "Duplicate content" in result["error"]
@@ -256,7 +280,7 @@ class TestCaptureMemory:
             "git_notes_memory.capture.get_default_service",
             side_effect=ImportError("Module not found"),
         ):
-            result = _capture_memory(sample_signal, "decisions")
+            (result,) = _capture_memories([sample_signal])
 
         assert result["success"] is False
         assert "not installed" in result["error"]
@@ -264,13 +288,13 @@ class TestCaptureMemory:
     def test_exception_handling(self, sample_signal: CaptureSignal) -> None:
         """Test general exception handling."""
         mock_capture = MagicMock()
-        mock_capture.capture.side_effect = RuntimeError("Unexpected error")
+        mock_capture.capture_batch.side_effect = RuntimeError("Unexpected error")
 
         with patch(
             "git_notes_memory.capture.get_default_service",
             return_value=mock_capture,
         ):
-            result = _capture_memory(sample_signal, "decisions")
+            (result,) = _capture_memories([sample_signal])
 
         assert result["success"] is False
         assert "Unexpected error" in result["error"]
@@ -561,7 +585,7 @@ class TestMain:
         mock_capture = MagicMock()
         mock_memory = MockMemory(id="decisions:abc123:0", summary="Test summary")
         mock_result = MockCaptureResult(success=True, memory=mock_memory)
-        mock_capture.capture.return_value = mock_result
+        mock_capture.capture_batch.return_value = [mock_result] * len(sample_signals)
 
         input_data = json.dumps(sample_input_data)
 
@@ -687,7 +711,7 @@ class TestMain:
         assert "Auto-captured" not in captured.err
 
         # Capture should NOT have been called
-        mock_capture.capture.assert_not_called()
+        mock_capture.capture_batch.assert_not_called()
 
     def test_suggestion_mode_does_not_capture(
         self,
@@ -724,4 +748,4 @@ class TestMain:
             main()
 
         # Capture should NOT have been called in suggestion mode
-        mock_capture.capture.assert_not_called()
+        mock_capture.capture_batch.assert_not_called()
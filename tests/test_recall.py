@@ -127,8 +127,12 @@ def mock_git_ops() -> MagicMock:
         date=datetime.now(UTC).isoformat(),
         message="Test commit",
     )
-    mock.get_changed_files.return_value = ["file1.py", "file2.py"]
-    mock.get_file_at_commit.return_value = "# File content"
+    mock.get_changed_files_batch.side_effect = lambda commits: {
+        sha: ["file1.py", "file2.py"] for sha in commits
+    }
+    mock.get_files_at_commits.side_effect = lambda paths: dict.fromkeys(
+        paths, "# File content"
+    )
     return mock
 
 
@@ -350,6 +354,176 @@ class TestRecallServiceSearch:
         assert "Search failed" in exc_info.value.message
 
 
+class TestRecallServiceSearchBatch:
+    """Tests for RecallService.search_batch method."""
+
+    def test_embeds_once_and_searches_once(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memory: Memory,
+    ) -> None:
+        """Test all queries share one embed_batch call and one index pass."""
+        mock_embedding.embed_batch.return_value = [[0.1] * 384, [0.2] * 384]
+        mock_index.search_vector_batch.return_value = [
+            [(sample_memory, 0.5)],
+            [(sample_memory, 5.0)],
+        ]
+        service = RecallService(
+            index_service=mock_index,
+            embedding_service=mock_embedding,
+        )
+
+        batch = service.search_batch(
+            ["", "first", "second"],
+            k=3,
+            namespaces=[None, "decisions", None],
+            min_similarity=0.5,
+        )
+
+        mock_embedding.embed_batch.assert_called_once_with(["first", "second"])
+        mock_embedding.embed.assert_not_called()
+        mock_index.search_vector_batch.assert_called_once_with(
+            [[0.1] * 384, [0.2] * 384],
+            k=3,
+            namespaces=["decisions", None],
+            spec=None,
+        )
+        # Empty query gets no results; distance 5.0 is below min_similarity
+        assert [len(results) for results in batch] == [0, 1, 0]
+        assert batch[1][0].memory is sample_memory
+
+    def test_search_batch_error_handling(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test index failures are raised as RecallError."""
+        mock_embedding.embed_batch.return_value = [[0.1] * 384]
+        mock_index.search_vector_batch.side_effect = Exception("Database error")
+        service = RecallService(
+            index_service=mock_index,
+            embedding_service=mock_embedding,
+        )
+
+        with pytest.raises(RecallError) as exc_info:
+            service.search_batch(["test"])
+        assert "Search failed" in exc_info.value.message
+
+
+class TestRecallServiceSearchHybrid:
+    """Tests for RecallService.search_hybrid method."""
+
+    def test_returns_true_distances_in_fused_order(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Fused order is kept; results carry the vector distance."""
+        mock_index.search_hybrid.return_value = [
+            (sample_memories[0], 0.032, 0.9, True),
+            (sample_memories[1], 0.016, 0.3, False),
+        ]
+        service = RecallService(
+            index_service=mock_index, embedding_service=mock_embedding
+        )
+
+        results = service.search_hybrid("ERR_DB_LOCKED", k=2)
+
+        assert [r.id for r in results] == [sample_memories[0].id, sample_memories[1].id]
+        assert results[0].distance == 0.9
+        mock_index.search_hybrid.assert_called_once()
+        args, kwargs = mock_index.search_hybrid.call_args
+        assert args[0] == "ERR_DB_LOCKED"
+        assert kwargs["k"] == 4  # wider pool for re-ranking
+
+    def test_min_similarity_uses_vector_distance(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memories: list[Memory],
+    ) -> None:
+        """Vector-only hits below the threshold are dropped."""
+        mock_index.search_hybrid.return_value = [
+            (sample_memories[0], 0.032, None, False),
+            (sample_memories[1], 0.016, 0.2, False),
+            (sample_memories[2], 0.016, 1.5, False),
+        ]
+        service = RecallService(
+            index_service=mock_index, embedding_service=mock_embedding
+        )
+
+        results = service.search_hybrid("query", min_similarity=0.5)
+
+        assert [r.id for r in results] == [sample_memories[1].id]
+
+    def test_min_similarity_keeps_keyword_matches(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memories: list[Memory],
+    ) -> None:
+        """A match on every query term survives the threshold despite its distance."""
+        mock_index.search_hybrid.return_value = [
+            (sample_memories[0], 0.032, 1.8, True),
+            (sample_memories[1], 0.016, None, True),
+            (sample_memories[2], 0.016, 1.8, False),
+        ]
+        service = RecallService(
+            index_service=mock_index, embedding_service=mock_embedding
+        )
+
+        results = service.search_hybrid("ERR_DB_LOCKED", min_similarity=0.6)
+
+        assert [r.id for r in results] == [sample_memories[0].id, sample_memories[1].id]
+        assert results[0].distance == 1.8
+
+    def test_reranker_boosts_target_spec(
+        self,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memories: list[Memory],
+    ) -> None:
+        """ResultReranker runs over the fused list."""
+        other = Memory(
+            id="decisions:zzz:0",
+            commit_sha="zzz",
+            namespace="decisions",
+            timestamp=sample_memories[0].timestamp,
+            summary="Other spec",
+            content="Other spec content",
+            spec="SPEC-OTHER",
+        )
+        # Nearly tied fused scores; spec boost should decide
+        mock_index.search_hybrid.return_value = [
+            (other, 0.0330, 0.5, False),
+            (sample_memories[0], 0.0328, 0.5, False),
+        ]
+        service = RecallService(
+            index_service=mock_index, embedding_service=mock_embedding
+        )
+
+        results = service.search_hybrid("query", target_spec="SPEC-001")
+
+        assert results[0].id == sample_memories[0].id
+
+    def test_empty_query(self, mock_index: MagicMock) -> None:
+        service = RecallService(index_service=mock_index)
+        assert service.search_hybrid("   ") == []
+        mock_index.search_hybrid.assert_not_called()
+
+    def test_error_raises_recall_error(
+        self, mock_index: MagicMock, mock_embedding: MagicMock
+    ) -> None:
+        mock_index.search_hybrid.side_effect = Exception("boom")
+        service = RecallService(
+            index_service=mock_index, embedding_service=mock_embedding
+        )
+        with pytest.raises(RecallError, match="Hybrid search failed"):
+            service.search_hybrid("query")
+
+
 class TestRecallServiceSearchText:
     """Tests for RecallService.search_text method."""
 
@@ -681,8 +855,10 @@ class TestRecallServiceHydrate:
         assert result.files[0] == ("file1.py", "# File content")
         assert result.files[1] == ("file2.py", "# File content")
 
-        mock_git_ops.get_changed_files.assert_called_once()
-        assert mock_git_ops.get_file_at_commit.call_count == 2
+        mock_git_ops.get_changed_files_batch.assert_called_once_with(["abc123"])
+        mock_git_ops.get_files_at_commits.assert_called_once_with(
+            [("abc123", "file1.py"), ("abc123", "file2.py")]
+        )
 
     def test_hydrate_accepts_memory_result(
         self,
@@ -765,6 +941,81 @@ class TestRecallServiceHydrateBatch:
         results = recall_service.hydrate_batch([], HydrationLevel.SUMMARY)
         assert results == []
 
+    def test_hydrate_batch_full_batches_commit_info(
+        self,
+        recall_service: RecallService,
+        sample_memories: list[Memory],
+        mock_git_ops: MagicMock,
+    ) -> None:
+        """Test FULL hydration fetches commit metadata in one batch call."""
+        info = mock_git_ops.get_commit_info.return_value
+        mock_git_ops.show_notes_batch.return_value = {}
+        mock_git_ops.get_commit_info_batch.return_value = {"abc123": info}
+
+        results = recall_service.hydrate_batch(sample_memories, HydrationLevel.FULL)
+
+        mock_git_ops.get_commit_info_batch.assert_called_once_with(["abc123", "def456"])
+        mock_git_ops.get_commit_info.assert_not_called()
+        assert [r.commit_info for r in results] == [info, info, None]
+
+    def test_hydrate_batch_files_loads_all_commits_at_once(
+        self,
+        recall_service: RecallService,
+        sample_memories: list[Memory],
+        mock_git_ops: MagicMock,
+    ) -> None:
+        """Test FILES hydration loads snapshots for every commit in one pass."""
+        mock_git_ops.show_notes_batch.return_value = {}
+        mock_git_ops.get_commit_info_batch.return_value = {}
+        mock_git_ops.get_changed_files_batch.side_effect = None
+        mock_git_ops.get_changed_files_batch.return_value = {
+            "abc123": ["file1.py", "bad;name.py"],
+            "def456": ["file2.py"],
+        }
+
+        results = recall_service.hydrate_batch(sample_memories, HydrationLevel.FILES)
+
+        mock_git_ops.get_changed_files_batch.assert_called_once_with(
+            ["abc123", "def456"]
+        )
+        mock_git_ops.get_files_at_commits.assert_called_once_with(
+            [("abc123", "file1.py"), ("def456", "file2.py")]
+        )
+        assert [r.files for r in results] == [
+            (("file1.py", "# File content"),),
+            (("file1.py", "# File content"),),
+            (("file2.py", "# File content"),),
+        ]
+
+    def test_hydrate_batch_files_failure(
+        self,
+        recall_service: RecallService,
+        sample_memories: list[Memory],
+        mock_git_ops: MagicMock,
+    ) -> None:
+        """Test FILES hydration returns no files when git fails."""
+        mock_git_ops.show_notes_batch.return_value = {}
+        mock_git_ops.get_changed_files_batch.side_effect = Exception("Git error")
+
+        results = recall_service.hydrate_batch(sample_memories, HydrationLevel.FILES)
+
+        assert all(r.files == () for r in results)
+
+    def test_hydrate_batch_commit_info_failure(
+        self,
+        recall_service: RecallService,
+        sample_memories: list[Memory],
+        mock_git_ops: MagicMock,
+    ) -> None:
+        """Test FULL hydration continues without commit info on git errors."""
+        mock_git_ops.show_notes_batch.return_value = {"abc123": "content"}
+        mock_git_ops.get_commit_info_batch.side_effect = Exception("Git error")
+
+        results = recall_service.hydrate_batch(sample_memories, HydrationLevel.FULL)
+
+        assert all(r.commit_info is None for r in results)
+        assert results[0].full_content == "content"
+
 
 # =============================================================================
 # Context Aggregation Tests
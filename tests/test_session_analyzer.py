@@ -7,6 +7,7 @@ Tests the session transcript analyzer including:
 - analyze() - Full analysis workflow
 - analyze_content() - Direct content analysis
 - has_uncaptured_content() - Detection of uncaptured content
+- Incremental analysis with a scan state directory
 - TranscriptContent dataclass
 
 The analyzer detects uncaptured memorable content in session transcripts
@@ -32,6 +33,14 @@ from git_notes_memory.hooks.session_analyzer import (
 # =============================================================================
 
 
+def _check_each(mock: MagicMock) -> MagicMock:
+    """Route a mock checker's batch_check_novelty through check_signal_novelty."""
+    mock.batch_check_novelty.side_effect = lambda signals: [
+        mock.check_signal_novelty(signal) for signal in signals
+    ]
+    return mock
+
+
 @pytest.fixture
 def analyzer() -> SessionAnalyzer:
     """Create a SessionAnalyzer with default settings."""
@@ -77,7 +86,7 @@ def mock_novelty_checker() -> MagicMock:
         similar_memory_ids=[],
         highest_similarity=0.0,
     )
-    return mock
+    return _check_each(mock)
 
 
 @pytest.fixture
@@ -648,7 +657,7 @@ class TestAnalyze:
     def test_filters_by_novelty(self, tmp_path: Path) -> None:
         """Test non-novel signals are filtered out."""
         # Mock that returns non-novel results
-        mock_novelty = MagicMock()
+        mock_novelty = _check_each(MagicMock())
         mock_novelty.check_signal_novelty.return_value = NoveltyResult(
             novelty_score=0.1,
             is_novel=False,
@@ -709,7 +718,7 @@ class TestAnalyze:
 
         result = analyzer.analyze(str(transcript), check_novelty=False)
         # Novelty checker should not be called
-        assert not mock_novelty.check_signal_novelty.called
+        assert not mock_novelty.batch_check_novelty.called
         # Signal should be returned (not filtered by novelty)
         assert len(result) == 1
 
@@ -866,7 +875,7 @@ class TestAnalyzeContent:
         )
 
         analyzer.analyze_content("content", check_novelty=False)
-        assert not mock_novelty.check_signal_novelty.called
+        assert not mock_novelty.batch_check_novelty.called
 
 
 # =============================================================================
@@ -928,7 +937,7 @@ class TestHasUncapturedContent:
 
     def test_respects_check_novelty_parameter(self, tmp_path: Path) -> None:
         """Test check_novelty parameter is passed to analyze."""
-        mock_novelty = MagicMock()
+        mock_novelty = _check_each(MagicMock())
         mock_novelty.check_signal_novelty.return_value = NoveltyResult(
             novelty_score=0.1,
             is_novel=False,
@@ -1089,3 +1098,163 @@ class TestSessionAnalyzerIntegration:
         signals = analyzer.analyze(str(transcript), check_novelty=False)
         assert isinstance(signals, list)
         assert all(isinstance(s, CaptureSignal) for s in signals)
+
+
+# =============================================================================
+# Incremental Analysis Tests
+# =============================================================================
+
+
+def _entry(message: str, user_type: str = "human") -> str:
+    """Serialize one JSONL transcript line."""
+    return json.dumps({"userType": user_type, "message": message, "type": ""}) + "\n"
+
+
+class TestIncrementalAnalysis:
+    """Test analyze() with a state directory."""
+
+    @pytest.fixture
+    def state_dir(self, tmp_path: Path) -> Path:
+        """Directory for transcript scan state."""
+        return tmp_path / "state"
+
+    def _analyzer(self, state_dir: Path, detector: MagicMock) -> SessionAnalyzer:
+        detector.min_confidence = 0.5
+        detector.context_window = 100
+        return SessionAnalyzer(signal_detector=detector, state_dir=state_dir)
+
+    def test_only_appended_lines_scanned(
+        self, tmp_path: Path, state_dir: Path, mock_signal_detector: MagicMock
+    ) -> None:
+        """Test a second analysis scans only lines appended since the first."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(_entry("first") + _entry("second"))
+        analyzer = self._analyzer(state_dir, mock_signal_detector)
+
+        analyzer.analyze(transcript, check_novelty=False)
+        assert mock_signal_detector.detect.call_count == 2
+
+        with transcript.open("a") as f:
+            f.write(_entry("third", "assistant"))
+        mock_signal_detector.detect.reset_mock()
+        analyzer.analyze(transcript, check_novelty=False)
+        mock_signal_detector.detect.assert_called_once_with("third")
+
+    def test_retained_signals_returned_without_new_lines(
+        self, tmp_path: Path, state_dir: Path
+    ) -> None:
+        """Test signals found earlier are still reported on later calls."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(_entry("I decided to use PostgreSQL for storage"))
+        analyzer = SessionAnalyzer(state_dir=state_dir)
+
+        first = analyzer.analyze(transcript, check_novelty=False)
+        second = SessionAnalyzer(state_dir=state_dir).analyze(
+            transcript, check_novelty=False
+        )
+        assert first
+        assert second == first
+
+    def test_incomplete_last_line_left_for_next_call(
+        self, tmp_path: Path, state_dir: Path, mock_signal_detector: MagicMock
+    ) -> None:
+        """Test a line still being written is scanned once it is complete."""
+        transcript = tmp_path / "transcript.jsonl"
+        line = _entry("partial")
+        transcript.write_text(_entry("first") + line[:10])
+        analyzer = self._analyzer(state_dir, mock_signal_detector)
+
+        analyzer.analyze(transcript, check_novelty=False)
+        mock_signal_detector.detect.assert_called_once_with("first")
+
+        with transcript.open("a") as f:
+            f.write(line[10:])
+        mock_signal_detector.detect.reset_mock()
+        analyzer.analyze(transcript, check_novelty=False)
+        mock_signal_detector.detect.assert_called_once_with("partial")
+
+    def test_rewritten_transcript_rescanned(
+        self, tmp_path: Path, state_dir: Path, mock_signal_detector: MagicMock
+    ) -> None:
+        """Test a transcript replaced by other content is read from the start."""
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(_entry("first") + _entry("second"))
+        analyzer = self._analyzer(state_dir, mock_signal_detector)
+        analyzer.analyze(transcript, check_novelty=False)
+
+        transcript.write_text(_entry("other") + _entry("content") + _entry("here"))
+        mock_signal_detector.detect.reset_mock()
+        analyzer.analyze(transcript, check_novelty=False)
+        assert [c.args[0] for c in mock_signal_detector.detect.call_args_list] == [
+            "other",
+            "content",
+            "here",
+        ]
+
+    def test_plain_text_transcript_parsed_in_full(
+        self, plain_text_transcript_file: Path, state_dir: Path
+    ) -> None:
+        """Test plain text transcripts fall back to a full parse."""
+        incremental = SessionAnalyzer(state_dir=state_dir).analyze(
+            plain_text_transcript_file, check_novelty=False
+        )
+        full = SessionAnalyzer().analyze(
+            plain_text_transcript_file, check_novelty=False
+        )
+        assert incremental == full
+        assert not list(state_dir.glob("*.json"))
+
+    def test_retained_signals_bounded(
+        self, tmp_path: Path, state_dir: Path, mock_signal_detector: MagicMock
+    ) -> None:
+        """Test the signals kept between calls are capped."""
+        from git_notes_memory.config import TRANSCRIPT_STATE_MAX_SIGNALS
+        from git_notes_memory.hooks.transcript_state import load_state, state_path
+
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(
+            "".join(_entry(f"message {i}") for i in range(200)), encoding="utf-8"
+        )
+        analyzer = self._analyzer(state_dir, mock_signal_detector)
+        analyzer.analyze(transcript, check_novelty=False)
+
+        state = load_state(state_path(state_dir, transcript))
+        assert state is not None
+        assert state.user_messages == 200
+        assert len(state.signals) == TRANSCRIPT_STATE_MAX_SIGNALS
+
+    def test_captured_signals_do_not_crowd_out_novel_ones(
+        self, tmp_path: Path, state_dir: Path
+    ) -> None:
+        """Test the retained cap applies after the novelty filter."""
+        from git_notes_memory.config import TRANSCRIPT_STATE_MAX_SIGNALS
+
+        def check(signal: CaptureSignal) -> NoveltyResult:
+            captured = "decided" in signal.match
+            return NoveltyResult(
+                novelty_score=0.0 if captured else 1.0,
+                is_novel=not captured,
+                similar_memory_ids=[],
+                highest_similarity=1.0 if captured else 0.0,
+            )
+
+        checker = _check_each(MagicMock())
+        checker.check_signal_novelty.side_effect = check
+        transcript = tmp_path / "transcript.jsonl"
+        transcript.write_text(
+            "".join(
+                _entry(f"I decided to use option {i} for the parser")
+                for i in range(TRANSCRIPT_STATE_MAX_SIGNALS + 10)
+            )
+        )
+        analyzer = SessionAnalyzer(novelty_checker=checker, state_dir=state_dir)
+        assert analyzer.analyze(transcript) == []
+
+        with transcript.open("a") as f:
+            f.write(_entry("It turns out the cache was never invalidated"))
+        incremental = analyzer.analyze(transcript)
+        full = SessionAnalyzer(novelty_checker=checker).analyze(transcript)
+
+        assert [s.match for s in incremental] == [s.match for s in full]
+        assert len(incremental) == 1
+        assert "turns out" in incremental[0].match.lower()
@@ -1104,3 +1104,76 @@ class TestUnicodeBlockMarkers:
         signals = detector.detect(text)
         assert len(signals) == 1
         assert signals[0].confidence >= 0.95
+
+
+# =============================================================================
+# Single-Pass Scanning Tests
+# =============================================================================
+
+
+def _scan_each_pattern(detector: SignalDetector, text: str) -> list[tuple[int, str]]:
+    """Reference result: every pattern's finditer, in position order."""
+    matches = [
+        (match.start(), match.group())
+        for patterns in detector._compiled_patterns.values()
+        for pattern, _ in patterns
+        for match in pattern.finditer(text)
+    ]
+    return sorted(matches, key=lambda item: item[0])
+
+
+class TestSinglePassScanning:
+    """Tests that the combined scanner matches per-pattern scanning."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "I decided to use PostgreSQL. TIL that it supports JSON. Fixed the issue.",
+            "We went with Redis; turns out it's fast. [decision] [d] [learned]",
+            "I can't get this to work because the config can not load because x",
+            "Important: remember this. Note that the pattern: is reusable.",
+            "No signals here at all",
+            "",
+        ],
+    )
+    def test_matches_per_pattern_scanning(
+        self, detector: SignalDetector, text: str
+    ) -> None:
+        """Test that the scanner finds exactly what each pattern finds."""
+        scanner = detector._compile_patterns()
+        found = [(match.start(), match.group()) for _, match in scanner.scan(text)]
+        assert found == _scan_each_pattern(detector, text)
+
+    def test_patterns_at_same_position_all_reported(
+        self, detector: SignalDetector
+    ) -> None:
+        """Test that several patterns matching at one position are all found."""
+        scanner = detector._compile_patterns()
+        text = "I can't get the build to pass because of the cache."
+        matches = [
+            scanner.patterns[index][1].pattern
+            for index, match in scanner.scan(text)
+            if match.start() == text.index("can't")
+        ]
+        assert len(matches) == 2
+
+    def test_inline_patterns_inside_block_skipped(
+        self, detector: SignalDetector
+    ) -> None:
+        """Test that inline matches inside a block marker are not reported."""
+        text = (
+            "TIL about blocks.\n"
+            "▶ decision ─────────────────────────────────────\n"
+            "I decided to use SQLite\n"
+            "────────────────────────────────────────────────\n"
+            "Then I decided to ship it."
+        )
+        signals = detector.detect(text)
+        block_start = text.index("▶")
+        block_end = text.index("\nThen")
+        assert any(s.type == SignalType.LEARNING for s in signals)
+        assert [s.position for s in signals if s.type == SignalType.DECISION] == [
+            block_start,
+            text.index("I decided to ship"),
+        ]
+        assert not any(block_start < s.position < block_end for s in signals)
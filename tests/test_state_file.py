@@ -0,0 +1,80 @@
+"""Tests for the hooks' JSON state files."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from git_notes_memory.hooks.state_file import (
+    load_state_file,
+    save_state_file,
+    state_file_path,
+)
+
+
+def _build(data: dict[str, Any]) -> int:
+    return int(data["value"])
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestStateFilePath:
+    """Test state_file_path()."""
+
+    def test_stable_per_key(self, tmp_path: Path) -> None:
+        assert state_file_path(tmp_path, "a") == state_file_path(tmp_path, "a")
+        assert state_file_path(tmp_path, "a") != state_file_path(tmp_path, "b")
+
+    def test_hashed_name(self, tmp_path: Path) -> None:
+        path = state_file_path(tmp_path, "/some/transcript.jsonl")
+        assert path.parent == tmp_path
+        assert path.suffix == ".json"
+        assert len(path.stem) == 16
+
+
+class TestLoadSaveStateFile:
+    """Test load_state_file() and save_state_file()."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "nested" / "state.json"
+        save_state_file(path, 1, {"value": 7})
+
+        assert json.loads(path.read_text()) == {"format": 1, "value": 7}
+        assert load_state_file(path, 1, _build) == 7
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert load_state_file(tmp_path / "missing.json", 1, _build) is None
+
+    def test_other_format_ignored(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        save_state_file(path, 1, {"value": 7})
+        assert load_state_file(path, 2, _build) is None
+
+    @pytest.mark.parametrize(
+        "content",
+        ["not json", "[1, 2]", '{"format": 1}', '{"format": 1, "value": "x"}'],
+    )
+    def test_unreadable_file(self, tmp_path: Path, content: str) -> None:
+        path = tmp_path / "state.json"
+        path.write_text(content)
+        assert load_state_file(path, 1, _build) is None
+
+    def test_failed_write_keeps_old_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "state.json"
+        save_state_file(path, 1, {"value": 7})
+
+        with (
+            patch("json.dump", side_effect=OSError("disk full")),
+            pytest.raises(OSError),
+        ):
+            save_state_file(path, 1, {"value": 8})
+
+        assert load_state_file(path, 1, _build) == 7
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
@@ -7,7 +7,8 @@ and real services for integration tests.
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+import subprocess
+from collections.abc import Callable, Iterator, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -15,7 +16,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from git_notes_memory.exceptions import RecallError
+from git_notes_memory.config import NAMESPACES
+from git_notes_memory.exceptions import RecallError, StorageError
 from git_notes_memory.models import (
     Memory,
     NoteRecord,
@@ -78,6 +80,45 @@ def make_note_record(
     )
 
 
+def stream_notes(
+    contents: dict[str, str | None],
+) -> Callable[[str, Sequence[str]], Iterator[tuple[str, str | None]]]:
+    """Build an iter_notes_batch side effect streaming the given note contents."""
+
+    def iter_notes_batch(
+        _namespace: str, commit_shas: Sequence[str]
+    ) -> Iterator[tuple[str, str | None]]:
+        for sha in commit_shas:
+            yield sha, contents.get(sha)
+
+    return iter_notes_batch
+
+
+def compose_all_notes(git_ops: MagicMock) -> None:
+    """Derive the all-namespace GitOps reads from the per-namespace mocks.
+
+    Tests stub list_notes, get_notes_ref_sha and iter_notes_batch per
+    namespace; list_notes_refs, list_all_notes and iter_all_notes combine
+    them the way GitOps does, so those stubs keep working.
+    """
+
+    def list_notes_refs() -> dict[str, str]:
+        return {ns: sha for ns in NAMESPACES if (sha := git_ops.get_notes_ref_sha(ns))}
+
+    def list_all_notes() -> dict[str, list[tuple[str, str]]]:
+        return {ns: notes for ns in NAMESPACES if (notes := git_ops.list_notes(ns))}
+
+    def iter_all_notes() -> Iterator[tuple[str, str, str | None]]:
+        for ns, notes in list_all_notes().items():
+            commits = [commit for _note, commit in notes]
+            for commit, content in git_ops.iter_notes_batch(ns, commits):
+                yield ns, commit, content
+
+    git_ops.list_notes_refs.side_effect = list_notes_refs
+    git_ops.list_all_notes.side_effect = list_all_notes
+    git_ops.iter_all_notes.side_effect = iter_all_notes
+
+
 @pytest.fixture
 def sample_note_record() -> NoteRecord:
     """Create a sample NoteRecord for testing."""
@@ -134,6 +175,9 @@ def mock_index() -> MagicMock:
     index = MagicMock()
     index.exists.return_value = False
     index.get_all_ids.return_value = []
+    index.get_indexed_notes_ref.return_value = None
+    index.insert_batch.side_effect = lambda memories, *_: len(memories)
+    index.upsert_batch.side_effect = lambda memories, *_: len(memories)
     return index
 
 
@@ -143,8 +187,10 @@ def mock_git_ops() -> MagicMock:
     git_ops = MagicMock()
     git_ops.list_notes.return_value = []
     git_ops.show_note.return_value = None
-    # PERF-001: Also mock show_notes_batch for batch operations
-    git_ops.show_notes_batch.return_value = {}
+    # PERF-001: Notes are streamed with iter_notes_batch
+    git_ops.iter_notes_batch.side_effect = stream_notes({})
+    git_ops.get_notes_ref_sha.return_value = "f" * 40
+    compose_all_notes(git_ops)
     return git_ops
 
 
@@ -330,7 +376,8 @@ class TestSyncNoteToIndex:
         result = sync_service.sync_note_to_index("abc1234567890", "decisions")
 
         assert result == 1
-        mock_index.insert.assert_called_once()
+        mock_index.upsert_batch.assert_called_once()
+        mock_index.insert.assert_not_called()
 
     def test_sync_updates_existing_memory(
         self,
@@ -347,8 +394,10 @@ class TestSyncNoteToIndex:
 
         result = sync_service.sync_note_to_index("abc1234567890", "decisions")
 
+        # Existing memories are updated in place by the upsert
         assert result == 1
-        mock_index.update.assert_called_once()
+        memories = mock_index.upsert_batch.call_args[0][0]
+        assert [m.id for m in memories] == ["decisions:abc1234567890:0"]
 
     def test_sync_multiple_records_in_note(
         self,
@@ -356,16 +405,21 @@ class TestSyncNoteToIndex:
         mock_git_ops: MagicMock,
         mock_note_parser: MagicMock,
         mock_index: MagicMock,
+        mock_embedding: MagicMock,
         sample_note_records: list[NoteRecord],
     ) -> None:
         """Test syncing note with multiple records."""
         mock_git_ops.show_note.return_value = "---\ntype: decisions\n---"
         mock_note_parser.parse_many.return_value = sample_note_records
+        mock_embedding.embed_batch.return_value = [[0.1] * 384, [0.2] * 384]
 
         result = sync_service.sync_note_to_index("abc1234567890", "decisions")
 
+        # One batch write and one batch embedding for the whole note
         assert result == 2
-        assert mock_index.insert.call_count == 2
+        mock_index.upsert_batch.assert_called_once()
+        assert len(mock_index.upsert_batch.call_args[0][0]) == 2
+        mock_embedding.embed_batch.assert_called_once()
 
     def test_sync_parse_failure_returns_zero(
         self,
@@ -393,13 +447,13 @@ class TestSyncNoteToIndex:
         """Test embedding failure doesn't block indexing."""
         mock_git_ops.show_note.return_value = "---\ntype: decisions\n---"
         mock_note_parser.parse_many.return_value = [sample_note_record]
-        mock_embedding.embed.side_effect = Exception("Embedding failed")
+        mock_embedding.embed_batch.side_effect = Exception("Embedding failed")
 
         result = sync_service.sync_note_to_index("abc1234567890", "decisions")
 
         # Should still index without embedding
         assert result == 1
-        mock_index.insert.assert_called_once()
+        assert mock_index.upsert_batch.call_args[0][1] == [None]
 
     def test_sync_index_failure_logged(
         self,
@@ -412,7 +466,7 @@ class TestSyncNoteToIndex:
         """Test index failure is logged and doesn't crash."""
         mock_git_ops.show_note.return_value = "---\ntype: decisions\n---"
         mock_note_parser.parse_many.return_value = [sample_note_record]
-        mock_index.insert.side_effect = Exception("Index error")
+        mock_index.upsert_batch.side_effect = Exception("Index error")
 
         result = sync_service.sync_note_to_index("abc1234567890", "decisions")
 
@@ -458,7 +512,7 @@ class TestRecordToMemory:
             index=0,
         )
 
-        assert memory.id == "decisions:abc1234:0"
+        assert memory.id == "decisions:abc1234567890:0"
 
     def test_handles_none_timestamp(
         self,
@@ -560,9 +614,9 @@ class TestCollectNotes:
             [("note_sha", "commit_sha")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "commit_sha": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"commit_sha": "---\ntype: decisions\n---"}
+        )
         mock_note_parser.parse_many.return_value = [sample_note_record]
 
         result = sync_service.collect_notes()
@@ -581,7 +635,9 @@ class TestCollectNotes:
             [("note1", "commit1")] if ns in ["decisions", "learnings"] else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {"commit1": "---\ntype: test\n---"}
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"commit1": "---\ntype: test\n---"}
+        )
 
         record1 = make_note_record(namespace="decisions")
         record2 = make_note_record(namespace="learnings")
@@ -612,10 +668,10 @@ class TestCollectNotes:
         mock_git_ops.list_notes.side_effect = lambda ns: (
             [("note_sha", "abc123")] if ns == "decisions" else []
         )
-        # PERF-001: Mock show_notes_batch for batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc123": "---\ntype: decisions\n---"
-        }
+        # PERF-001: Mock streamed batch operations
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc123": "---\ntype: decisions\n---"}
+        )
 
         # Create record that will be returned (with commit_sha set)
         record = make_note_record(commit_sha="abc123", namespace="decisions")
@@ -693,9 +749,9 @@ class TestReindex:
             [("note_sha", "abc123")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc123": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc123": "---\ntype: decisions\n---"}
+        )
         # PERF-002: Mock batch embedding
         mock_embedding.embed_batch.return_value = [[0.1] * 384]
 
@@ -705,7 +761,8 @@ class TestReindex:
         result = sync_service.reindex()
 
         assert result == 1
-        mock_index.insert.assert_called_once()
+        mock_index.insert_batch.assert_called_once()
+        mock_index.insert.assert_not_called()
 
     def test_reindex_full_clears_index(
         self,
@@ -740,7 +797,7 @@ class TestReindex:
         result = sync_service.reindex(full=False)
 
         assert result == 0
-        mock_index.insert.assert_not_called()
+        mock_index.insert_batch.assert_not_called()
 
     def test_reindex_full_includes_existing(
         self,
@@ -755,9 +812,9 @@ class TestReindex:
             [("note_sha", "abc123")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc123": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc123": "---\ntype: decisions\n---"}
+        )
         # PERF-002: Mock batch embedding
         mock_embedding.embed_batch.return_value = [[0.1] * 384]
 
@@ -769,7 +826,7 @@ class TestReindex:
 
         # Should still insert even though exists
         assert result == 1
-        mock_index.insert.assert_called_once()
+        mock_index.insert_batch.assert_called_once()
 
     def test_reindex_multiple_notes(
         self,
@@ -784,10 +841,12 @@ class TestReindex:
             [("note1", "commit1"), ("note2", "commit2")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations with both commits
-        mock_git_ops.show_notes_batch.return_value = {
-            "commit1": "---\ntype: decisions\n---",
-            "commit2": "---\ntype: decisions\n---",
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {
+                "commit1": "---\ntype: decisions\n---",
+                "commit2": "---\ntype: decisions\n---",
+            }
+        )
         # PERF-002: Mock batch embedding for 2 notes
         mock_embedding.embed_batch.return_value = [[0.1] * 384, [0.1] * 384]
 
@@ -796,8 +855,10 @@ class TestReindex:
 
         result = sync_service.reindex()
 
+        # Both notes are written in a single batch
         assert result == 2
-        assert mock_index.insert.call_count == 2
+        mock_index.insert_batch.assert_called_once()
+        assert len(mock_index.insert_batch.call_args[0][0]) == 2
 
     def test_reindex_handles_note_errors(
         self,
@@ -813,10 +874,12 @@ class TestReindex:
         )
 
         # PERF-001: Mock batch operations - commit2 returns None (error)
-        mock_git_ops.show_notes_batch.return_value = {
-            "commit1": "---\ntype: decisions\n---",
-            "commit2": None,  # Simulates read error
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {
+                "commit1": "---\ntype: decisions\n---",
+                "commit2": None,  # Simulates read error
+            }
+        )
         # PERF-002: Mock batch embedding for 1 note (only commit1 succeeds)
         mock_embedding.embed_batch.return_value = [[0.1] * 384]
 
@@ -827,6 +890,233 @@ class TestReindex:
 
         assert result == 1  # Only first succeeded
 
+    def test_reindex_writes_in_chunks(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_note_parser: MagicMock,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test streamed notes are embedded and written chunk by chunk."""
+        commits = [f"commit{i}" for i in range(5)]
+        mock_git_ops.list_notes.side_effect = lambda ns: (
+            [("note", c) for c in commits] if ns == "decisions" else []
+        )
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            dict.fromkeys(commits, "note")
+        )
+        mock_note_parser.parse_many.return_value = [make_note_record()]
+        mock_embedding.embed_batch.side_effect = lambda texts: (
+            [[0.1] * 384] * len(texts)
+        )
+
+        with patch("git_notes_memory.sync.INDEX_BULK_BATCH_SIZE", 2):
+            result = sync_service.reindex()
+
+        assert result == 5
+        sizes = [len(c.args[0]) for c in mock_index.insert_batch.call_args_list]
+        assert sizes == [2, 2, 1]
+        assert mock_index.bulk_load.call_count == 3
+
+    def test_reindex_skips_unchanged_notes_ref(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test namespaces whose notes ref is unchanged cost no note reads."""
+        mock_index.get_indexed_notes_ref.return_value = "f" * 40
+
+        result = sync_service.reindex()
+
+        assert result == 0
+        mock_git_ops.list_notes.assert_not_called()
+        mock_git_ops.diff_notes.assert_not_called()
+        mock_git_ops.iter_notes_batch.assert_not_called()
+        mock_index.set_indexed_notes_ref.assert_not_called()
+
+    def test_reindex_applies_notes_diff(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_note_parser: MagicMock,
+        mock_index: MagicMock,
+        sample_memory: Memory,
+    ) -> None:
+        """Test changed notes are replaced and removed notes deleted."""
+        mock_index.get_indexed_notes_ref.side_effect = lambda ns: (
+            "a" * 40 if ns == "decisions" else "f" * 40
+        )
+        mock_git_ops.diff_notes.return_value = (["changed123"], ["removed456"])
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes({"changed123": "note"})
+        mock_note_parser.parse_many.return_value = [make_note_record()]
+        mock_index.get_by_commit.side_effect = lambda sha: [
+            Memory(
+                id=f"decisions:{sha}:0",
+                commit_sha=sha,
+                namespace="decisions",
+                summary="old",
+                content="",
+                timestamp=sample_memory.timestamp,
+            )
+        ]
+        mock_index.exists.return_value = True
+
+        result = sync_service.reindex()
+
+        assert result == 1
+        mock_git_ops.diff_notes.assert_called_once_with("a" * 40, "f" * 40)
+        mock_git_ops.list_notes.assert_not_called()
+        mock_git_ops.iter_notes_batch.assert_called_once_with(
+            "decisions", ["changed123"]
+        )
+        # The changed note's memory is overwritten in place; only memories
+        # no note produces any more are deleted
+        mock_index.delete_batch.assert_called_once_with(["decisions:removed456:0"])
+        upserted = mock_index.upsert_batch.call_args[0][0]
+        assert [m.id for m in upserted] == ["decisions:changed123:0"]
+        mock_index.set_indexed_notes_ref.assert_called_once_with("decisions", "f" * 40)
+
+    def test_reindex_records_notes_ref(
+        self,
+        sync_service: SyncService,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test each namespace's notes ref is recorded after indexing."""
+        sync_service.reindex()
+
+        recorded = {
+            c.args[0]: c.args[1]
+            for c in mock_index.set_indexed_notes_ref.call_args_list
+        }
+        assert recorded["decisions"] == "f" * 40
+
+    def test_reindex_skips_namespaces_without_refs(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test one ref listing drives reindex and empty namespaces cost nothing."""
+        mock_git_ops.list_notes_refs.side_effect = None
+        mock_git_ops.list_notes_refs.return_value = {"decisions": "f" * 40}
+
+        sync_service.reindex(full=True)
+
+        mock_git_ops.list_notes_refs.assert_called_once_with()
+        mock_git_ops.get_notes_ref_sha.assert_not_called()
+        mock_git_ops.list_notes.assert_called_once_with("decisions")
+        recorded = [c.args[0] for c in mock_index.set_indexed_notes_ref.call_args_list]
+        assert recorded == ["decisions"]
+
+    def test_reindex_retries_failed_notes(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test the notes ref is not recorded when a note could not be read."""
+        mock_git_ops.list_notes.side_effect = lambda ns: (
+            [("note_sha", "abc123")] if ns == "decisions" else []
+        )
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes({"abc123": None})
+
+        sync_service.reindex()
+
+        recorded = [c.args[0] for c in mock_index.set_indexed_notes_ref.call_args_list]
+        assert "decisions" not in recorded
+
+    def test_reindex_rescans_when_diff_fails(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_note_parser: MagicMock,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test an undiffable old notes commit falls back to a full listing."""
+        mock_index.get_indexed_notes_ref.return_value = "a" * 40
+        mock_git_ops.diff_notes.side_effect = StorageError("pruned", "refetch")
+        mock_git_ops.list_notes.side_effect = lambda ns: (
+            [("note_sha", "abc123")] if ns == "decisions" else []
+        )
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes({"abc123": "note"})
+        mock_note_parser.parse_many.return_value = [make_note_record()]
+
+        result = sync_service.reindex()
+
+        assert result == 1
+        mock_index.insert_batch.assert_called_once()
+
+
+# =============================================================================
+# drain_index_queue Tests
+# =============================================================================
+
+
+class TestDrainIndexQueue:
+    """Tests for SyncService.drain_index_queue."""
+
+    def test_drain_embeds_indexes_and_dequeues(
+        self,
+        sync_service: SyncService,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+        sample_memory: Memory,
+    ) -> None:
+        """Test queued memories are embedded in one batch and written."""
+        mock_index.get_queued.side_effect = [[sample_memory], []]
+
+        result = sync_service.drain_index_queue()
+
+        assert result == 1
+        mock_embedding.embed_batch.assert_called_once_with(
+            [f"{sample_memory.summary}\n{sample_memory.content}"]
+        )
+        mock_index.upsert_batch.assert_called_once_with([sample_memory], [[0.1] * 384])
+        mock_index.dequeue_batch.assert_called_once_with([sample_memory.id])
+        mock_index.bulk_load.assert_called_once()
+
+    def test_drain_empty_queue(
+        self,
+        sync_service: SyncService,
+        mock_index: MagicMock,
+        mock_embedding: MagicMock,
+    ) -> None:
+        """Test an empty queue does no embedding work."""
+        mock_index.get_queued.return_value = []
+
+        assert sync_service.drain_index_queue() == 0
+        mock_embedding.embed_batch.assert_not_called()
+
+    def test_drain_respects_limit(
+        self,
+        sync_service: SyncService,
+        mock_index: MagicMock,
+        sample_memory: Memory,
+    ) -> None:
+        """Test no more than limit memories are requested."""
+        mock_index.get_queued.return_value = [sample_memory]
+
+        assert sync_service.drain_index_queue(limit=1) == 1
+        mock_index.get_queued.assert_called_once_with(1)
+
+    def test_drain_failure_keeps_memories_queued(
+        self,
+        sync_service: SyncService,
+        mock_index: MagicMock,
+        sample_memory: Memory,
+    ) -> None:
+        """Test a failed write records the attempt and stops draining."""
+        mock_index.get_queued.return_value = [sample_memory]
+        mock_index.upsert_batch.side_effect = Exception("database is locked")
+
+        assert sync_service.drain_index_queue() == 0
+        mock_index.record_queue_failure.assert_called_once_with(
+            [sample_memory.id], "database is locked"
+        )
+        assert mock_index.get_queued.call_count == 1
+
 
 # =============================================================================
 # verify_consistency Tests
@@ -865,9 +1155,9 @@ class TestVerifyConsistency:
             [("note_sha", "abc1234")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc1234": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc1234": "---\ntype: decisions\n---"}
+        )
 
         record = make_note_record(
             commit_sha="abc1234",
@@ -882,6 +1172,27 @@ class TestVerifyConsistency:
 
         assert result.is_consistent is True
 
+    def test_verify_matches_captured_ids(
+        self,
+        sync_service: SyncService,
+        mock_git_ops: MagicMock,
+        mock_note_parser: MagicMock,
+        mock_index: MagicMock,
+    ) -> None:
+        """Test memories captured with full-SHA IDs are neither missing nor orphaned."""
+        sha = "ab" * 20
+        mock_git_ops.list_notes.side_effect = lambda ns: (
+            [("note_sha", sha)] if ns == "decisions" else []
+        )
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes({sha: "note"})
+        mock_note_parser.parse_many.return_value = [make_note_record()]
+        mock_index.get_all_ids.return_value = [f"decisions:{sha}:0"]
+
+        result = sync_service.verify_consistency()
+
+        assert result.missing_in_index == ()
+        assert result.orphaned_in_index == ()
+
     def test_verify_missing_in_index(
         self,
         sync_service: SyncService,
@@ -894,9 +1205,9 @@ class TestVerifyConsistency:
             [("note_sha", "abc1234")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc1234": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc1234": "---\ntype: decisions\n---"}
+        )
 
         record = make_note_record()
         mock_note_parser.parse_many.return_value = [record]
@@ -936,9 +1247,9 @@ class TestVerifyConsistency:
             [("note_sha", "abc1234")] if ns == "decisions" else []
         )
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {
-            "abc1234": "---\ntype: decisions\n---"
-        }
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"abc1234": "---\ntype: decisions\n---"}
+        )
 
         # Note has different content than indexed
         record = make_note_record(
@@ -1198,6 +1509,63 @@ class TestSyncServiceIntegration:
 
         assert result == 0  # Nothing to repair in empty index
 
+    def test_repair_isolates_notes_with_real_index(
+        self,
+        real_index_service: IndexService,
+        tmp_path: Path,
+    ) -> None:
+        """Test repair embeds outside transactions and isolates failing notes."""
+        from git_notes_memory.note_parser import NoteParser
+
+        good_sha, bad_sha = "a" * 40, "b" * 40
+        mock_git_ops = MagicMock()
+        mock_git_ops.list_all_notes.return_value = {
+            "decisions": [("n1", good_sha), ("n2", bad_sha)]
+        }
+        mock_git_ops.show_note.return_value = (
+            "---\ntype: decisions\nsummary: Repaired decision\n---\n\nBody.\n"
+        )
+
+        in_transaction: list[bool] = []
+
+        def embed_batch(texts: list[str]) -> list[list[float]]:
+            in_transaction.append(real_index_service._conn.in_transaction)
+            return [[0.1] * 384 for _ in texts]
+
+        mock_embedding = MagicMock()
+        mock_embedding.embed_batch.side_effect = embed_batch
+
+        service = SyncService(
+            repo_path=tmp_path,
+            index=real_index_service,
+            git_ops=mock_git_ops,
+            embedding_service=mock_embedding,
+            note_parser=NoteParser(),
+        )
+
+        upsert_batch = real_index_service.upsert_batch
+
+        def failing_upsert(memories: list[Memory], embeddings: Sequence) -> int:
+            if memories[0].commit_sha == bad_sha:
+                raise RecallError("write failed", "")
+            return upsert_batch(memories, embeddings)
+
+        verification = VerificationResult(
+            is_consistent=False,
+            missing_in_index=(f"decisions:{good_sha}:0", f"decisions:{bad_sha}:0"),
+            orphaned_in_index=(),
+            mismatched=(),
+        )
+        with patch.object(
+            real_index_service, "upsert_batch", side_effect=failing_upsert
+        ):
+            result = service.repair(verification)
+
+        assert result == 1
+        assert in_transaction == [False, False]
+        assert real_index_service.exists(f"decisions:{good_sha}:0")
+        assert not real_index_service.exists(f"decisions:{bad_sha}:0")
+
     def test_sync_note_with_real_index(
         self,
         real_index_service: IndexService,
@@ -1213,7 +1581,7 @@ class TestSyncServiceIntegration:
         parser = NoteParser()
 
         mock_embedding = MagicMock()
-        mock_embedding.embed.return_value = [0.1] * 384
+        mock_embedding.embed_batch.return_value = [[0.1] * 384]
 
         service = SyncService(
             repo_path=tmp_path,
@@ -1239,7 +1607,7 @@ Test body content.
 
         assert result == 1
         # Verify it was indexed
-        assert real_index_service.exists("decisions:abc1234:0")
+        assert real_index_service.exists("decisions:abc1234567890:0")
 
     def test_reindex_with_real_index(
         self,
@@ -1251,6 +1619,8 @@ Test body content.
         mock_git_ops.list_notes.side_effect = lambda ns: (
             [("note_sha", "def7890123456")] if ns == "decisions" else []
         )
+        mock_git_ops.get_notes_ref_sha.return_value = "f" * 40
+        compose_all_notes(mock_git_ops)
 
         note_content = """---
 type: decisions
@@ -1262,7 +1632,9 @@ summary: Another decision
 Body for reindex test.
 """
         # PERF-001: Mock batch operations
-        mock_git_ops.show_notes_batch.return_value = {"def7890123456": note_content}
+        mock_git_ops.iter_notes_batch.side_effect = stream_notes(
+            {"def7890123456": note_content}
+        )
 
         from git_notes_memory.note_parser import NoteParser
 
@@ -1284,4 +1656,56 @@ Body for reindex test.
         result = service.reindex(full=True)
 
         assert result == 1
-        assert real_index_service.exists("decisions:def7890:0")
+        assert real_index_service.exists("decisions:def7890123456:0")
+
+    def test_incremental_reindex_follows_note_edits(
+        self,
+        real_index_service: IndexService,
+        tmp_path: Path,
+    ) -> None:
+        """Test incremental reindex picks up added, edited and removed notes."""
+        from git_notes_memory.git_ops import GitOps
+        from git_notes_memory.note_parser import NoteParser
+
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (
+            ["init"],
+            ["config", "user.email", "test@example.com"],
+            ["config", "user.name", "Test User"],
+            ["commit", "--allow-empty", "-m", "Initial commit"],
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+        git_ops = GitOps(repo)
+        commit = git_ops.get_commit_sha("HEAD")
+        memory_id = f"decisions:{commit}:0"
+
+        def note(summary: str) -> str:
+            return f"---\ntype: decisions\nsummary: {summary}\n---\n\nBody.\n"
+
+        mock_embedding = MagicMock()
+        mock_embedding.embed_batch.side_effect = lambda texts: (
+            [[0.1] * 384] * len(texts)
+        )
+        service = SyncService(
+            repo_path=repo,
+            index=real_index_service,
+            git_ops=git_ops,
+            embedding_service=mock_embedding,
+            note_parser=NoteParser(),
+        )
+
+        git_ops.add_note("decisions", note("Original"), commit)
+        assert service.reindex() == 1
+        assert service.reindex() == 0
+
+        git_ops.add_note("decisions", note("Edited"), commit, force=True)
+        assert service.reindex() == 1
+        edited = real_index_service.get(memory_id)
+        assert edited is not None
+        assert edited.summary == "Edited"
+
+        git_ops.remove_note("decisions", commit)
+        assert service.reindex() == 0
+        assert real_index_service.get(memory_id) is None
@@ -528,6 +528,38 @@ class TestValidateGitRef:
             utils.validate_git_ref("ref;echo pwned")
 
 
+class TestMemoryIds:
+    """Tests for make_memory_id and parse_memory_id."""
+
+    def test_make_uses_full_sha(self) -> None:
+        """Test the canonical ID keeps the commit unabbreviated."""
+        sha = "a" * 40
+        assert utils.make_memory_id("decisions", sha, 2) == f"decisions:{sha}:2"
+
+    def test_round_trip(self) -> None:
+        """Test parsing a canonical ID returns its parts."""
+        sha = "0123456789abcdef" * 4
+        memory_id = utils.make_memory_id("learnings", sha, 11)
+        assert utils.parse_memory_id(memory_id) == ("learnings", sha, 11)
+
+    def test_parse_accepts_abbreviated_commit(self) -> None:
+        """Test legacy IDs with a short commit still parse."""
+        assert utils.parse_memory_id("blockers:abc1234:0") == (
+            "blockers",
+            "abc1234",
+            0,
+        )
+
+    @pytest.mark.parametrize(
+        "memory_id",
+        ["", "decisions", "decisions:abc1234", "decisions:xyz:0", ":abc1234:0"],
+    )
+    def test_parse_invalid_raises(self, memory_id: str) -> None:
+        """Test malformed IDs raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid memory ID"):
+            utils.parse_memory_id(memory_id)
+
+
 # =============================================================================
 # Module Export Tests
 # =============================================================================
@@ -559,3 +591,8 @@ class TestModuleExports:
         assert "validate_git_ref" in utils.__all__
         assert "is_valid_namespace" in utils.__all__
         assert "is_valid_git_ref" in utils.__all__
+
+    def test_memory_id_functions_exported(self) -> None:
+        """Test memory ID functions are exported."""
+        assert "make_memory_id" in utils.__all__
+        assert "parse_memory_id" in utils.__all__